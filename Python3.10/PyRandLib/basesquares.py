@@ -21,6 +21,13 @@ SOFTWARE.
 """
 
 #=============================================================================
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
 from .baserandom       import BaseRandom
 from .annotation_types import SeedStateType, Numerical, StatesList
 from .splitmix         import SplitMix32
@@ -90,6 +97,19 @@ class BaseSquares( BaseRandom ):
                                         # MUST be implemented in inheriting classes
 
  
+    #-------------------------------------------------------------------------
+    def advance(self, _delta: int, /) -> None:
+        """Jumps the internal state of this generator _delta steps ahead.
+
+        Squares output values are evaluated from the sole values of the
+        counter and of the key,  so the counter is just incremented by _delta,
+        modulo 2^64.  A negative _delta steps this generator back.
+        """
+        if not isinstance(_delta, int):
+            raise TypeError(f"the advance delta must be an int (currently is {type(_delta)})")
+        self._counter = (self._counter + _delta) & 0xffff_ffff_ffff_ffff
+
+
     #-------------------------------------------------------------------------
     def getstate(self) -> StatesList:
         """Returns an object capturing the current internal state of the generator.
@@ -140,6 +160,54 @@ class BaseSquares( BaseRandom ):
                 raise ValueError(f"Incorrect size for initializing state (should be 2 integers, currently is {len(_state)})")
 
 
+    #-------------------------------------------------------------------------
+    def next_array(self, n: int, /) -> 'np.ndarray | array':  # type: ignore
+        """Returns the next n pseudo-random integer values at once.
+
+        Squares output values are evaluated from the sole values of the 
+        counter and of the key. Inheriting classes take benefit of this to
+        evaluate them all at once with numpy vectorized arithmetic. Should 
+        numpy not be available, this method falls back on method next_n().
+        """
+        return self.next_n( n )
+
+
+    #-------------------------------------------------------------------------
+    def random_array(self, n: int, /, dtype: str = 'float64', bits: int | None = None) -> 'np.ndarray | array':  # type: ignore
+        """Returns the next n pseudo-random float values in [0.0, 1.0) at once.
+
+        With the default arguments,  same values as n successive  calls  to 
+        random(),  in a numpy array of float64 values evaluated with method
+        next_array(),  or in an array of typecode 'd' when numpy is not
+        available. See BaseRandom.random_array() for the other arguments.
+        """
+        if bits is not None or dtype != 'float64':
+            return super().random_array( n, dtype, bits )
+        elif np is None:
+            return array('d', [v * self._NORMALIZE for v in self.next_n( n )])
+        else:
+            return np.asarray( self.next_array( n ) ) * self._NORMALIZE
+
+
+    #-------------------------------------------------------------------------
+    def spawn(self, n: int, /) -> 'list[BaseSquares]':
+        """Returns n new generators of the same class, each one with its own key.
+
+        Squares generators with distinct keys provide independent sequences
+        (see [9] in file README.md).  The children are seeded as with base
+        class BaseRandom,  their counters being then 0,  and their keys are
+        derived again until they differ from each other and from the key of
+        this generator.
+        """
+        children = super().spawn( n )
+        keys = { self._key }
+        for child in children:
+            while child._key in keys:  # type: ignore
+                child._key = child._initKey( child._key )  # type: ignore
+            keys.add( child._key )  # type: ignore
+        return children  # type: ignore
+
+
     #-------------------------------------------------------------------------
     def _initKey(self, _seed: int = None, /) -> int:  # type: ignore
         """Initalizes the attribute _key according to the original recommendations - see [9].
@@ -21,6 +21,9 @@ SOFTWARE.
 """
 
 #=============================================================================
+from array  import array
+from typing import Final
+
 from .baselfib64       import BaseLFib64
 from .annotation_types import SeedStateType
 
@@ -108,6 +111,10 @@ class LFib668( BaseLFib64 ):
     should definitively pass.
     """
 
+    #-------------------------------------------------------------------------
+    _LAGS: Final[tuple[int, ...]] = (273, 607)  # lags of the recurrence
+
+
     #-------------------------------------------------------------------------
     def __init__(self, _seed: SeedStateType = None, /) -> None:  # type: ignore
         """Constructor.
@@ -123,18 +130,41 @@ class LFib668( BaseLFib64 ):
     def next(self) -> int:
         """This is the core of the pseudo-random generator.
         """
+        state = self._state  # notice: the local binding speeds up the accesses to the internal state
+        i = self._index
         # evaluates indexes in suite for the i-273 and i-607 -th values
         
-        if (k273 := self._index-273) < 0:
+        if (k273 := i - 273) < 0:
             k273 += self._STATE_SIZE  # notice: attribute _STATE_SIZE is set in base class
         
         # then evaluates current value
-        self._state[self._index] = (myValue := (self._state[k273] + self._state[self._index]) & 0xffff_ffff_ffff_ffff)  # type: ignore
+        state[i] = (myValue := (state[k273] + state[i]) & 0xffff_ffff_ffff_ffff)  # type: ignore
         
         # next index
-        self._index = (self._index+1) % self._STATE_SIZE
+        self._index = (i + 1) % self._STATE_SIZE
         
         return myValue
 
 
+    #-------------------------------------------------------------------------
+    def next_n(self, count: int, /) -> array:
+        """Returns the next count pseudo-random values, as would count calls to next().
+        """
+        assert count >= 0, "the count of generated values must not be negative"
+        state = self._state
+        i = self._index
+        values = [0] * count
+        for n in range(count):
+            # evaluates index in suite for the i-273 -th value
+            if (k273 := i - 273) < 0:
+                k273 += 607
+            # then evaluates current value
+            values[n] = state[i] = (state[k273] + state[i]) & 0xffff_ffff_ffff_ffff
+            # next index
+            if (i := i + 1) == 607:
+                i = 0
+        self._index = i
+        return array('Q', values)
+
+
 #=====   end of module   lfib668.py   =======================================
@@ -21,6 +21,9 @@ SOFTWARE.
 """
 
 #=============================================================================
+from array  import array
+from typing import Iterable
+
 from .baserandom       import BaseRandom
 from .annotation_types import Numerical, SeedStateType, StateType
 
@@ -36,9 +39,15 @@ class ListIndexState( BaseRandom ):
         This module is part of library PyRandLib.
         
         Copyright (c) 2025 Philippe Schmouker
+
+        The internal list of integers may be stored in a compact array of
+        machine words instead, see method compact_state().
     """
     
 
+    #-------------------------------------------------------------------------
+    _stateTypecode: str | None = None  # the typecode of the array that stores the internal state, or None for a list
+
     #-------------------------------------------------------------------------
     def __init__(self, _initRandClass, _stateSize: int, _seedState: SeedStateType = None, /) -> None:  # type: ignore
         """Constructor.
@@ -63,6 +72,27 @@ class ListIndexState( BaseRandom ):
             # since it internally calls self.setstate().
 
 
+    #-------------------------------------------------------------------------
+    def compact_state(self, compact: bool = True, /) -> None:
+        """Stores the internal state of this generator in a compact array of machine words, or back in a list.
+
+        The internal list of integers costs a pointer and a boxed integer per
+        word (about 36 to 44 bytes),  while an array of typecode 'I' (32-bits
+        words, e.g. the WELLs and the MRGs) or 'Q' (64-bits words, e.g. the
+        MELGs and the LFibs) costs 4 or 8 bytes per word.  This is valuable
+        when many generators are kept alive at once.  The generated values
+        are the same with both storages,  and so are the states that are
+        returned by getstate().  The children spawned by a generator get the
+        same storage as their parent.
+        Notice: the 64-bits words of an array get boxed on each read,  so that
+        method next() runs slower with compact internal states of 'Q' words.
+        Inheriting classes with small internal states may keep them in lists
+        (see BaseXoroshiro).
+        """
+        self._stateTypecode = ('I' if self._OUT_BITS <= 32 else 'Q') if compact else None
+        self._state = self._statewords( self._state )
+
+
     #-------------------------------------------------------------------------
     def getstate(self) -> StateType:
         """Returns a tuple capturing the current internal state of the generator.
@@ -71,7 +101,24 @@ class ListIndexState( BaseRandom ):
         tuple  containing a list of self._STATE_SIZE integers and an index in 
         this list (index value being then in range(0,self._STATE_SIZE).
         """
-        return (self._state, self._index)  # type: ignore
+        if self._stateTypecode is None:
+            return (self._state[:], self._index)  # type: ignore
+        else:
+            return (self._state.tolist(), self._index)  # type: ignore
+
+
+    #-------------------------------------------------------------------------
+    def restore(self, _state: StateType, /, trusted: bool = True) -> None:
+        """Restores the internal state of the generator from a state returned by getstate().
+
+        See BaseRandom.restore().  Should trusted be True,  the values of the
+        internal state are just copied, without any validation.
+        """
+        if trusted:
+            self._state = self._statewords( _state[0] )  # type: ignore
+            self._index = _state[1]  # type: ignore
+        else:
+            self.setstate( _state )
 
 
     #-------------------------------------------------------------------------
@@ -120,10 +167,10 @@ class ListIndexState( BaseRandom ):
                     if not all(isinstance(s, int) and s >= 0 for s in _state):  
                         raise ValueError(f"all values of internal state must be non negative integers ({_state}")
                     else:
-                        self._state = list(_state)
+                        self._state = self._statewords( _state )
                 
                 case _:
-                    if not isinstance( _state[0], (list, tuple) ):
+                    if not isinstance( _state[0], (list, tuple, array) ):
                         raise TypeError(f"initialization state must be a tuple or a list (actually is {type(_state[0])})")
                     elif (len(_state[0]) != self._STATE_SIZE):
                         raise ValueError(f"Incorrect size for initializing state (should be {self._STATE_SIZE} integers, currently is {len(_state[0])})")
@@ -133,7 +180,87 @@ class ListIndexState( BaseRandom ):
                         if not all(isinstance(s, int) and s >= 0 for s in _state[0]):
                             raise ValueError(f"all values of internal state must be non negative integers: {_state[0]}")
                         else:
-                            self._state = list(_state[0])
+                            self._state = self._statewords( _state[0] )
+
+
+    #-------------------------------------------------------------------------
+    def spawn(self, n: int, /) -> 'list[ListIndexState]':
+        """Returns n new generators of the same class,  statistically independent of each other and of this one.
+
+        See BaseRandom.spawn().  The children get the same storage of their
+        internal state as this generator, see method compact_state().
+        """
+        return self._likestate( super().spawn( n ) )  # type: ignore
+
+
+    #-------------------------------------------------------------------------
+    def _advancerecurrence(self, _delta: int, _lags: tuple[int, ...], _modulo: int, _mult: int = 1, _addend: int = 0, /) -> None:
+        """Advances the internal state of this generator _delta steps ahead.
+
+        This applies to generators which internal list contains the last
+        values of the linear recurrence
+
+            x(i) = (_mult * (sum of the x(i-lag)) + _addend) mod _modulo
+
+        the greatest lag being self._STATE_SIZE.  The internal state after
+        _delta steps is evaluated with the polynomial x^_delta modulo  the
+        characteristic polynomial of the recurrence, and the current index
+        in the internal list is set as would _delta calls to next() do it.
+        Polynomials are multiplied via big integers (i.e. with Kronecker
+        substitution),  so that the jump costs about log2(_delta) squares
+        of integers of self._STATE_SIZE * (2 * log2(_modulo)) bits.
+        """
+        if not isinstance( _delta, int ):
+            raise TypeError(f"the count of steps to advance must be an integer (currently is {type(_delta)})")
+        if _delta < 0:
+            raise ValueError(f"this generator cannot advance back (count of steps is {_delta})")
+
+        k = self._STATE_SIZE
+        if _delta < k:
+            # notice: some of the current values in the internal list will still be there
+            self.next_n( _delta )
+            return
+
+        width = (2 * _modulo.bit_length() + k.bit_length() + 7) // 8  # count of bytes per coefficient
+
+        def pack(coeffs: list[int]) -> int:
+            return int.from_bytes( b''.join(c.to_bytes(width, 'little') for c in coeffs), 'little' )
+
+        def unpack(value: int, count: int) -> list[int]:
+            data = value.to_bytes( count * width, 'little' )
+            return [ int.from_bytes(data[i:i+width], 'little') for i in range(0, count * width, width) ]
+
+        def reduce(coeffs: list[int]) -> list[int]:
+            # x^k = _mult * (sum of the x^(k-lag))
+            for d in range(len(coeffs) - 1, k - 1, -1):
+                if (c := _mult * coeffs[d] % _modulo):
+                    for lag in _lags:
+                        coeffs[d - lag] += c
+            return [ c % _modulo for c in coeffs[:k] ]
+
+        # evaluates x^_delta modulo the characteristic polynomial
+        jumpPoly = [1] + [0] * (k - 1)
+        for bit in bin( _delta )[2:]:
+            jumpPoly = reduce( unpack(pack(jumpPoly) ** 2, 2 * k) )
+            if bit == '1':
+                jumpPoly = reduce( [0] + jumpPoly )
+
+        # evaluates the k next values as combinations of the 2k-1 values x(0) to x(2k-2), x(0) being the oldest current one
+        index = self._index
+        values = self._state[index:] + self._state[:index]
+        values += self.next_n( k - 1 )
+        products = unpack( pack(jumpPoly) * pack([v % _modulo for v in reversed(values)]), 3 * k )
+        if _addend:
+            # evaluates the fixed point of the affine recurrence
+            fixed = _addend * pow( 1 - _mult * len(_lags), -1, _modulo ) * (1 - sum(jumpPoly))
+        else:
+            fixed = 0
+        newValues = [ (products[2*k - 2 - t] + fixed) % _modulo for t in range(k) ]
+
+        # and finally stores them in the internal list according to the new index
+        self._index = (index + _delta) % k
+        i = (k - self._index) % k
+        self._state = self._statewords( newValues[i:] + newValues[:i] )
 
 
     #-------------------------------------------------------------------------
@@ -156,4 +283,24 @@ class ListIndexState( BaseRandom ):
         value is used as the initial seed value.
         """
         initRand = self._initRandClass( _initialSeed )
-        self._state = [ initRand() for _ in range(self._STATE_SIZE) ]        
+        self._state = self._statewords( initRand.fill(self._STATE_SIZE) )
+
+
+    #-------------------------------------------------------------------------
+    def _likestate(self, _children: 'list[ListIndexState]', /) -> 'list[ListIndexState]':
+        """Sets the storage of the internal state of spawned children as the one of this generator.
+        """
+        if self._stateTypecode is not None:
+            for child in _children:
+                child.compact_state()
+        return _children
+
+
+    #-------------------------------------------------------------------------
+    def _statewords(self, _values: Iterable[int], /) -> list[int] | array:
+        """Returns the words of an internal state stored as this generator stores them.
+        """
+        if self._stateTypecode is None:
+            return list( _values )
+        else:
+            return array( self._stateTypecode, _values )
\ No newline at end of file
@@ -53,7 +53,7 @@ class TestBaseCwg:
                 
     #-------------------------------------------------------------------------
     def test_init_list(self):
-        with pytest.raises(TypeError):  # notice: TypeError here due to a known bug with unhashable lists in Python 3.10
+        with pytest.raises(NotImplementedError):
             b_cwg = BaseCWG([0, 1, 0X1234_5678_9abc_def0, 0X1234_5678_9abc_def0])
                 
     #-------------------------------------------------------------------------
@@ -63,7 +63,7 @@ class TestBaseCwg:
 
     #-------------------------------------------------------------------------
     def test_init_list_int(self):
-        with pytest.raises(TypeError):  # notice: TypeError here due to a known bug with unhashable lists in Python 3.10
+        with pytest.raises(NotImplementedError):
             b_cwg = BaseCWG( ([0, 1, 0X1234_5678_9abc_def0, 0X1234_5678_9abc_def0], 11))
                 
     #-------------------------------------------------------------------------
@@ -51,50 +51,46 @@ class TestBaseLFib64:
     #-------------------------------------------------------------------------
     def test_init_int(self):
         STATE_SIZE = 17
-        with pytest.raises(TypeError):  # notice: no 2 arguments allowed in random.Random with Python 3.10
-            b_lfib = BaseLFib64(STATE_SIZE, 0X1234_5678_9abc_def0)
-            assert b_lfib._STATE_SIZE == STATE_SIZE
-            assert b_lfib._initRandClass is SplitMix64
-            assert b_lfib.gauss_next is None  # type: ignore
-            assert b_lfib._index == 0
-            assert len( b_lfib._state ) == STATE_SIZE
-            assert all( 0 < s < (1 << 64) for s in b_lfib._state )  # type: ignore
+        b_lfib = BaseLFib64(STATE_SIZE, 0X1234_5678_9abc_def0)
+        assert b_lfib._STATE_SIZE == STATE_SIZE
+        assert b_lfib._initRandClass is SplitMix64
+        assert b_lfib.gauss_next is None  # type: ignore
+        assert b_lfib._index == 0
+        assert len( b_lfib._state ) == STATE_SIZE
+        assert all( 0 < s < (1 << 64) for s in b_lfib._state )  # type: ignore
 
     #-------------------------------------------------------------------------
     def test_init_float(self):
         STATE_SIZE = 17
-        with pytest.raises(TypeError):  # notice: no 2 arguments allowed in random.Random with Python 3.10
-            b_lfib = BaseLFib64(STATE_SIZE, 0.1)
-            assert b_lfib._STATE_SIZE == STATE_SIZE
-            assert b_lfib._initRandClass is SplitMix64
-            assert b_lfib.gauss_next is None  # type: ignore
-            assert b_lfib._index == 0
-            assert len( b_lfib._state ) == STATE_SIZE
-            assert all( 0 < s < (1 << 64) for s in b_lfib._state )  # type: ignore
+        b_lfib = BaseLFib64(STATE_SIZE, 0.1)
+        assert b_lfib._STATE_SIZE == STATE_SIZE
+        assert b_lfib._initRandClass is SplitMix64
+        assert b_lfib.gauss_next is None  # type: ignore
+        assert b_lfib._index == 0
+        assert len( b_lfib._state ) == STATE_SIZE
+        assert all( 0 < s < (1 << 64) for s in b_lfib._state )  # type: ignore
 
     #-------------------------------------------------------------------------
     def test_init_tuple(self):
         STATE_SIZE = 19
-        with pytest.raises(TypeError):  # notice: no 2 arguments allowed in random.Random with Python 3.10
-            b_lfib = BaseLFib64(STATE_SIZE, tuple(i+1 for i in range(STATE_SIZE)))  # type: ignore
-            assert b_lfib._STATE_SIZE == STATE_SIZE
-            assert b_lfib._initRandClass is SplitMix64
-            assert b_lfib.gauss_next is None  # type: ignore
-            assert b_lfib._index == 0
-            assert len( b_lfib._state ) == STATE_SIZE
-            assert all( 0 < s < (1 << 64) for s in b_lfib._state )  # type: ignore
+        b_lfib = BaseLFib64(STATE_SIZE, tuple(i+1 for i in range(STATE_SIZE)))  # type: ignore
+        assert b_lfib._STATE_SIZE == STATE_SIZE
+        assert b_lfib._initRandClass is SplitMix64
+        assert b_lfib.gauss_next is None  # type: ignore
+        assert b_lfib._index == 0
+        assert len( b_lfib._state ) == STATE_SIZE
+        assert all( 0 < s < (1 << 64) for s in b_lfib._state )  # type: ignore
                 
     #-------------------------------------------------------------------------
     def test_init_list(self):
         STATE_SIZE = 21
-        with pytest.raises(TypeError):  # notice: no 2 arguments allowed in random.Random with Python 3.10
-            b_lfib = BaseLFib64(STATE_SIZE, [i+1 for i in range(STATE_SIZE)])
-            assert b_lfib._STATE_SIZE == STATE_SIZE
-            assert b_lfib._initRandClass is SplitMix64
-            assert b_lfib.gauss_next is None  # type: ignore
-            assert b_lfib._index == 0
-            assert len( b_lfib._state ) == STATE_SIZE
-            assert all( 0 < s < (1 << 64) for s in b_lfib._state )  # type: ignore
+        b_lfib = BaseLFib64(STATE_SIZE, [i+1 for i in range(STATE_SIZE)])
+        assert b_lfib._STATE_SIZE == STATE_SIZE
+        assert b_lfib._initRandClass is SplitMix64
+        assert b_lfib.gauss_next is None  # type: ignore
+        assert b_lfib._index == 0
+        assert len( b_lfib._state ) == STATE_SIZE
+        assert all( 0 < s < (1 << 64) for s in b_lfib._state )  # type: ignore
                 
     #-------------------------------------------------------------------------
     def test_init_tuple_int(self):
@@ -240,3 +236,10 @@ class TestBaseLFib64:
             b_lfib.setstate([(31, 32, 33, 34, -35), 1])  # type: ignore
         with pytest.raises(ValueError):
             b_lfib.setstate(((31, 32, 33, -34, -35), 1))  # type: ignore
+
+    #-------------------------------------------------------------------------
+    def test_advance(self):
+        STATE_SIZE = 17
+        b_lfib = BaseLFib64(STATE_SIZE)
+        with pytest.raises(AttributeError):
+            b_lfib.advance(STATE_SIZE)
@@ -51,50 +51,46 @@ class TestBaseMELG:
     #-------------------------------------------------------------------------
     def test_init_int(self):
         STATE_SIZE = 17
-        with pytest.raises(TypeError):
-            b_melg = BaseMELG(STATE_SIZE, 0X1234_5678_9abc_def0)
-            assert b_melg._STATE_SIZE == STATE_SIZE
-            assert b_melg._initRandClass is SplitMix64
-            assert b_melg.gauss_next is None  # type: ignore
-            assert b_melg._index == 0
-            assert len(b_melg._state) == STATE_SIZE
-            assert all( 0 < s < (1 << 64) for s in b_melg._state )  # type: ignore
+        b_melg = BaseMELG(STATE_SIZE, 0X1234_5678_9abc_def0)
+        assert b_melg._STATE_SIZE == STATE_SIZE
+        assert b_melg._initRandClass is SplitMix64
+        assert b_melg.gauss_next is None  # type: ignore
+        assert b_melg._index == 0
+        assert len(b_melg._state) == STATE_SIZE
+        assert all( 0 < s < (1 << 64) for s in b_melg._state )  # type: ignore
 
     #-------------------------------------------------------------------------
     def test_init_float(self):
         STATE_SIZE = 17
-        with pytest.raises(TypeError):
-            b_melg = BaseMELG(STATE_SIZE, 0.1)
-            assert b_melg._STATE_SIZE == STATE_SIZE
-            assert b_melg._initRandClass is SplitMix64
-            assert b_melg.gauss_next is None  # type: ignore
-            assert b_melg._index == 0
-            assert len(b_melg._state) == STATE_SIZE
-            assert all( 0 < s < (1 << 64) for s in b_melg._state )  # type: ignore
+        b_melg = BaseMELG(STATE_SIZE, 0.1)
+        assert b_melg._STATE_SIZE == STATE_SIZE
+        assert b_melg._initRandClass is SplitMix64
+        assert b_melg.gauss_next is None  # type: ignore
+        assert b_melg._index == 0
+        assert len(b_melg._state) == STATE_SIZE
+        assert all( 0 < s < (1 << 64) for s in b_melg._state )  # type: ignore
 
     #-------------------------------------------------------------------------
     def test_init_tuple(self):
         STATE_SIZE = 19
-        with pytest.raises(TypeError):
-            b_melg = BaseMELG(STATE_SIZE, tuple(i+1 for i in range(STATE_SIZE)))  # type: ignore
-            assert b_melg._STATE_SIZE == STATE_SIZE
-            assert b_melg._initRandClass is SplitMix64
-            assert b_melg.gauss_next is None  # type: ignore
-            assert b_melg._index == 0
-            assert len(b_melg._state) == STATE_SIZE
-            assert all( 0 < s < (1 << 64) for s in b_melg._state )  # type: ignore
+        b_melg = BaseMELG(STATE_SIZE, tuple(i+1 for i in range(STATE_SIZE)))  # type: ignore
+        assert b_melg._STATE_SIZE == STATE_SIZE
+        assert b_melg._initRandClass is SplitMix64
+        assert b_melg.gauss_next is None  # type: ignore
+        assert b_melg._index == 0
+        assert len(b_melg._state) == STATE_SIZE
+        assert all( 0 < s < (1 << 64) for s in b_melg._state )  # type: ignore
                 
     #-------------------------------------------------------------------------
     def test_init_list(self):
         STATE_SIZE = 21
-        with pytest.raises(TypeError):
-            b_melg = BaseMELG(STATE_SIZE, [i+1 for i in range(STATE_SIZE)])
-            assert b_melg._STATE_SIZE == STATE_SIZE
-            assert b_melg._initRandClass is SplitMix64
-            assert b_melg.gauss_next is None  # type: ignore
-            assert b_melg._index == 0
-            assert len(b_melg._state) == STATE_SIZE
-            assert all( 0 < s < (1 << 64) for s in b_melg._state )  # type: ignore
+        b_melg = BaseMELG(STATE_SIZE, [i+1 for i in range(STATE_SIZE)])
+        assert b_melg._STATE_SIZE == STATE_SIZE
+        assert b_melg._initRandClass is SplitMix64
+        assert b_melg.gauss_next is None  # type: ignore
+        assert b_melg._index == 0
+        assert len(b_melg._state) == STATE_SIZE
+        assert all( 0 < s < (1 << 64) for s in b_melg._state )  # type: ignore
                 
     #-------------------------------------------------------------------------
     def test_init_tuple_int(self):
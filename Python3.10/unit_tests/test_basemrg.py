@@ -45,77 +45,67 @@ class TestBaseMRG:
     #-------------------------------------------------------------------------
     def test_init_empty(self):
         STATE_SIZE = 15
-        with pytest.raises(TypeError):
-            # notice: no 2 arguments accepted in tuple with base class random.Random constructor until Python 3.11
-            b_mrg = BaseMRG(SplitMix31, STATE_SIZE)
-            assert b_mrg._STATE_SIZE == STATE_SIZE
-            assert b_mrg._initRandClass is SplitMix31
-            assert b_mrg.gauss_next is None  # type: ignore
-            assert b_mrg._index == 0
-            assert len(b_mrg._state) == STATE_SIZE
-            assert all(0 < s < (1 << b_mrg._OUT_BITS) for s in b_mrg._state)  # type: ignore
-            assert b_mrg._NORMALIZE == 1.0 / (1 << 32)  # should be (1 << 31), but not set after construction of base class BaseMRG
-            assert b_mrg._OUT_BITS == 32                # should be 31, but not set after construction of base class BaseMRG
+        b_mrg = BaseMRG(SplitMix31, STATE_SIZE)
+        assert b_mrg._STATE_SIZE == STATE_SIZE
+        assert b_mrg._initRandClass is SplitMix31
+        assert b_mrg.gauss_next is None  # type: ignore
+        assert b_mrg._index == 0
+        assert len(b_mrg._state) == STATE_SIZE
+        assert all(0 < s < (1 << b_mrg._OUT_BITS) for s in b_mrg._state)  # type: ignore
+        assert b_mrg._NORMALIZE == 1.0 / (1 << 32)  # should be (1 << 31), but not set after construction of base class BaseMRG
+        assert b_mrg._OUT_BITS == 32                # should be 31, but not set after construction of base class BaseMRG
 
     #-------------------------------------------------------------------------
     def test_init_int(self):
         STATE_SIZE = 17
-        with pytest.raises(TypeError):
-            # notice: no 2 arguments accepted in tuple with base class random.Random constructor until Python 3.11
-            b_mrg = BaseMRG(SplitMix32, STATE_SIZE, 0X1234_5678_9abc_def0)
-            assert b_mrg._STATE_SIZE == STATE_SIZE
-            assert b_mrg._initRandClass is SplitMix32
-            assert b_mrg.gauss_next is None  # type: ignore
-            assert b_mrg._index == 0
-            assert len(b_mrg._state) == STATE_SIZE
-            assert all(0 < s < (1 << b_mrg._OUT_BITS) for s in b_mrg._state)  # type: ignore
-            assert b_mrg._NORMALIZE == 1.0 / (1 << 32)
-            assert b_mrg._OUT_BITS == 32
+        b_mrg = BaseMRG(SplitMix32, STATE_SIZE, 0X1234_5678_9abc_def0)
+        assert b_mrg._STATE_SIZE == STATE_SIZE
+        assert b_mrg._initRandClass is SplitMix32
+        assert b_mrg.gauss_next is None  # type: ignore
+        assert b_mrg._index == 0
+        assert len(b_mrg._state) == STATE_SIZE
+        assert all(0 < s < (1 << b_mrg._OUT_BITS) for s in b_mrg._state)  # type: ignore
+        assert b_mrg._NORMALIZE == 1.0 / (1 << 32)
+        assert b_mrg._OUT_BITS == 32
 
     #-------------------------------------------------------------------------
     def test_init_float(self):
         STATE_SIZE = 17
-        with pytest.raises(TypeError):
-            # notice: no 2 arguments accepted in tuple with base class random.Random constructor until Python 3.11
-            b_mrg = BaseMRG(SplitMix31, STATE_SIZE, 0.1)
-            assert b_mrg._STATE_SIZE == STATE_SIZE
-            assert b_mrg._initRandClass is SplitMix31
-            assert b_mrg.gauss_next is None  # type: ignore
-            assert b_mrg._index == 0
-            assert len(b_mrg._state) == STATE_SIZE
-            assert all(0 < s < (1 << b_mrg._OUT_BITS) for s in b_mrg._state)  # type: ignore
-            assert b_mrg._NORMALIZE == 1.0 / (1 << 32)  # should be (1 << 31), but not set after construction of base class BaseMRG
-            assert b_mrg._OUT_BITS == 32                # should be 31, but not set after construction of base class BaseMRG
+        b_mrg = BaseMRG(SplitMix31, STATE_SIZE, 0.1)
+        assert b_mrg._STATE_SIZE == STATE_SIZE
+        assert b_mrg._initRandClass is SplitMix31
+        assert b_mrg.gauss_next is None  # type: ignore
+        assert b_mrg._index == 0
+        assert len(b_mrg._state) == STATE_SIZE
+        assert all(0 < s < (1 << b_mrg._OUT_BITS) for s in b_mrg._state)  # type: ignore
+        assert b_mrg._NORMALIZE == 1.0 / (1 << 32)  # should be (1 << 31), but not set after construction of base class BaseMRG
+        assert b_mrg._OUT_BITS == 32                # should be 31, but not set after construction of base class BaseMRG
 
     #-------------------------------------------------------------------------
     def test_init_tuple(self):
         STATE_SIZE = 19
-        with pytest.raises(TypeError):
-            # notice: no 2 arguments accepted in tuple with base class random.Random constructor until Python 3.11
-            b_mrg = BaseMRG(SplitMix32, STATE_SIZE, tuple(i+1 for i in range(STATE_SIZE)))  # type: ignore
-            assert b_mrg._STATE_SIZE == STATE_SIZE
-            assert b_mrg._initRandClass is SplitMix32
-            assert b_mrg.gauss_next is None  # type: ignore
-            assert b_mrg._index == 0
-            assert len(b_mrg._state) == STATE_SIZE
-            assert all(0 < s < (1 << b_mrg._OUT_BITS) for s in b_mrg._state)  # type: ignore
-            assert b_mrg._NORMALIZE == 1.0 / (1 << 32)
-            assert b_mrg._OUT_BITS == 32
+        b_mrg = BaseMRG(SplitMix32, STATE_SIZE, tuple(i+1 for i in range(STATE_SIZE)))  # type: ignore
+        assert b_mrg._STATE_SIZE == STATE_SIZE
+        assert b_mrg._initRandClass is SplitMix32
+        assert b_mrg.gauss_next is None  # type: ignore
+        assert b_mrg._index == 0
+        assert len(b_mrg._state) == STATE_SIZE
+        assert all(0 < s < (1 << b_mrg._OUT_BITS) for s in b_mrg._state)  # type: ignore
+        assert b_mrg._NORMALIZE == 1.0 / (1 << 32)
+        assert b_mrg._OUT_BITS == 32
                 
     #-------------------------------------------------------------------------
     def test_init_list(self):
         STATE_SIZE = 21
-        with pytest.raises(TypeError):
-            # notice: no 2 arguments accepted in tuple with base class random.Random constructor until Python 3.11
-            b_mrg = BaseMRG(SplitMix31, STATE_SIZE, [i+1 for i in range(STATE_SIZE)])
-            assert b_mrg._STATE_SIZE == STATE_SIZE
-            assert b_mrg._initRandClass is SplitMix31
-            assert b_mrg.gauss_next is None  # type: ignore
-            assert b_mrg._index == 0
-            assert len(b_mrg._state) == STATE_SIZE
-            assert all(0 < s < (1 << b_mrg._OUT_BITS) for s in b_mrg._state)  # type: ignore
-            assert b_mrg._NORMALIZE == 1.0 / (1 << 32)  # should be (1 << 31), but not set after construction of base class BaseMRG
-            assert b_mrg._OUT_BITS == 32                # should be 31, but not set after construction of base class BaseMRG
+        b_mrg = BaseMRG(SplitMix31, STATE_SIZE, [i+1 for i in range(STATE_SIZE)])
+        assert b_mrg._STATE_SIZE == STATE_SIZE
+        assert b_mrg._initRandClass is SplitMix31
+        assert b_mrg.gauss_next is None  # type: ignore
+        assert b_mrg._index == 0
+        assert len(b_mrg._state) == STATE_SIZE
+        assert all(0 < s < (1 << b_mrg._OUT_BITS) for s in b_mrg._state)  # type: ignore
+        assert b_mrg._NORMALIZE == 1.0 / (1 << 32)  # should be (1 << 31), but not set after construction of base class BaseMRG
+        assert b_mrg._OUT_BITS == 32                # should be 31, but not set after construction of base class BaseMRG
                     
     #-------------------------------------------------------------------------
     def test_init_tuple_int(self):
@@ -130,3 +120,12 @@ class TestBaseMRG:
         with pytest.raises(TypeError):
             # notice: no 2 arguments accepted in tuple with base class random.Random constructor since Python 3.9
             b_mrg = BaseMRG( SplitMix31, STATE_SIZE, tuple(STATE_SIZE-1, [i+1 for i in range(STATE_SIZE)]) )  # type: ignore
+
+    #-------------------------------------------------------------------------
+    def test_advance(self):
+        STATE_SIZE = 15
+        b_mrg = BaseMRG(SplitMix31, STATE_SIZE)
+        assert b_mrg._MULT == 1
+        assert b_mrg._ADDEND == 0
+        with pytest.raises(AttributeError):
+            b_mrg.advance(STATE_SIZE)
@@ -52,7 +52,7 @@ class TestBasePcg:
                 
     #-------------------------------------------------------------------------
     def test_init_list(self):
-        with pytest.raises(TypeError):  # notice: TypeError here due to a known bug with unhashable lists in Python 3.10
+        with pytest.raises(NotImplementedError):
             b_pcg = BasePCG([0, 1, 0X1234_5678_9abc_def0, 0X1234_5678_9abc_def0])
 
     #-------------------------------------------------------------------------
@@ -62,17 +62,17 @@ class TestBasePcg:
 
     #-------------------------------------------------------------------------
     def test_init_list_int(self):
-        with pytest.raises(TypeError):  # notice: TypeError here due to a known bug with unhashable lists in Python 3.10
+        with pytest.raises(NotImplementedError):
             b_pcg = BasePCG( ([0, 1, 0X1234_5678_9abc_def0, 0X1234_5678_9abc_def0], 11))
      
     #-------------------------------------------------------------------------
     def test_init_tuple_int_2(self):
-        with pytest.raises(TypeError):  # notice: TypeError here due to a known bug with unhashable lists in Python 3.10
+        with pytest.raises(NotImplementedError):
             b_pcg = BasePCG( [(0, 1, 0X1234_5678_9abc_def0, 0X1234_5678_9abc_def0), 11] )  # type: ignore
 
     #-------------------------------------------------------------------------
     def test_init_list_int_2(self):
-        with pytest.raises(TypeError):  # notice: TypeError here due to a known bug with unhashable lists in Python 3.10
+        with pytest.raises(NotImplementedError):
             b_pcg = BasePCG( [[0, 1, 0X1234_5678_9abc_def0, 0X1234_5678_9abc_def0], 11] )  # type: ignore
 
     #-------------------------------------------------------------------------
@@ -21,11 +21,17 @@ SOFTWARE.
 """
 
 #=============================================================================
+from array import array
 from math import log
+import math
 import pytest
+import random
+
+import PyRandLib.baserandom
 
 from PyRandLib.baserandom       import BaseRandom
 from PyRandLib.annotation_types import StateType
+from PyRandLib.splitmix         import SplitMix64
 
 
 #=============================================================================
@@ -97,6 +103,19 @@ class TestBaseRandom:
             assert b_rnd._OUT_BITS == 32
             assert b_rnd.gauss_next is None  # type: ignore
 
+        class BRandInits(BaseRandom):
+            def seed(self, _seed = None):  # type: ignore
+                self.inits.append(('seed', _seed))
+            def setstate(self, _state = None):  # type: ignore
+                self.inits.append(('setstate', _state))
+        BRandInits.inits = []  # type: ignore
+        b_rnd = BRandInits((1, 2, 3))
+        assert BRandInits.inits == [('setstate', (1, 2, 3))]  # type: ignore
+        assert b_rnd.gauss_next is None  # type: ignore
+        BRandInits.inits = []  # type: ignore
+        b_rnd = BRandInits(5)
+        assert BRandInits.inits == [('seed', 5)]  # type: ignore
+
     #-------------------------------------------------------------------------
     def test_next(self):
         b_rnd = BaseRandom()
@@ -112,6 +131,59 @@ class TestBaseRandom:
         b_rnd = TestBaseRandom.BRand33()
         assert b_rnd.next() == 0x5555_5555
 
+    #-------------------------------------------------------------------------
+    def test_next_n(self):
+        b_rnd = BaseRandom()
+        with pytest.raises(NotImplementedError):
+            b_rnd.next_n(3)
+
+        b_rnd = TestBaseRandom.BRand33()
+        values = b_rnd.next_n(5)
+        assert isinstance(values, array)
+        assert values.typecode == 'I'
+        assert list(values) == [0x5555_5555] * 5
+        assert len(b_rnd.next_n(0)) == 0
+        with pytest.raises(AssertionError):
+            b_rnd.next_n(-1)
+
+        class BRand64(BaseRandom):
+            _OUT_BITS = 64
+            def next(self) -> int: return 0xffff_ffff_ffff_ffff
+        values = BRand64().next_n(3)
+        assert values.typecode == 'Q'  # type: ignore
+        assert list(values) == [0xffff_ffff_ffff_ffff] * 3
+
+        class BRand128(BaseRandom):
+            _OUT_BITS = 128
+            def next(self) -> int: return 1 << 127
+        values = BRand128().next_n(3)
+        assert isinstance(values, list)
+        assert values == [1 << 127] * 3
+
+    #-------------------------------------------------------------------------
+    def test_fill(self):
+        b_rnd = TestBaseRandom.BRand33()
+
+        buffer = [0] * 7
+        b_rnd.fill(buffer)
+        assert buffer == [0x5555_5555] * 7
+
+        buffer = array('I', [0] * 8)
+        b_rnd.fill(buffer)
+        assert buffer == array('I', [0x5555_5555] * 8)
+
+        buffer = array('Q', [0] * 9)
+        b_rnd.fill(buffer)
+        assert buffer == array('Q', [0x5555_5555] * 9)
+
+        raw = array('I', [0] * 12)
+        b_rnd.fill(memoryview(raw)[2:6])
+        assert list(raw) == [0, 0] + [0x5555_5555] * 4 + [0] * 6
+
+        buffer = []
+        b_rnd.fill(buffer)
+        assert buffer == []
+
     #-------------------------------------------------------------------------
     def test_random(self):
         b_rnd = BaseRandom()
@@ -179,17 +251,297 @@ class TestBaseRandom:
         assert b_rnd.expovariate(0.5) == -log(1.0 - 0x5555_5555 * b_rnd._NORMALIZE) / 0.5
         assert b_rnd.expovariate(2.0) == -log(1.0 - 0x5555_5555 * b_rnd._NORMALIZE) / 2.0
 
+    #-------------------------------------------------------------------------
+    def test_random_array(self, monkeypatch):
+        class BRandCount(BaseRandom):
+            count = 0
+            def next(self) -> int:
+                self.count += 1
+                return self.count * 0x0101_0101
+
+        class BRandCount64(BRandCount):
+            _OUT_BITS = 64
+            _NORMALIZE = 1.0 / (1 << 64)
+            def next(self) -> int: return super().next() << 32
+
+        class BRandCount128(BRandCount):
+            _OUT_BITS = 128
+            _NORMALIZE = 1.0 / (1 << 128)
+            def next(self) -> int: return super().next() << 96
+
+        for numpyModule in (PyRandLib.baserandom.np, None):
+            monkeypatch.setattr(PyRandLib.baserandom, 'np', numpyModule)
+
+            for cls in (BRandCount, BRandCount64, BRandCount128):
+                b_rnd = cls()
+                b_ref = cls()
+                values = b_rnd.random_array(7)
+                assert list(values) == [b_ref.random() for _ in range(7)]
+                assert b_rnd.count == 7
+                if numpyModule is None:
+                    assert values.typecode == 'd'  # type: ignore
+                else:
+                    assert values.dtype.name == 'float64'  # type: ignore
+                assert len(b_rnd.random_array(0)) == 0
+
+            # two 32-bits output values per float64 value
+            values = BRandCount().random_array(5, 'float64', 53)
+            assert list(values) == [(((2*i+1) * 0x0101_0101 << 32 | (2*i+2) * 0x0101_0101) >> 11) / (1 << 53) for i in range(5)]
+
+            values = BRandCount().random_array(5, 'float64', 32)
+            assert list(values) == [(i+1) * 0x0101_0101 / (1 << 32) for i in range(5)]
+
+            values = BRandCount().random_array(5, 'float32')
+            assert list(values) == [((i+1) * 0x0101_0101 >> 8) / (1 << 24) for i in range(5)]
+            if numpyModule is None:
+                assert values.typecode == 'f'  # type: ignore
+            else:
+                assert values.dtype.name == 'float32'  # type: ignore
+
+            values = BRandCount64().random_array(5, 'float64', 40)
+            assert list(values) == [((i+1) * 0x0101_0101 << 8) / (1 << 40) for i in range(5)]
+
+            values = BRandCount128().random_array(5, 'float32', 12)
+            assert list(values) == [((i+1) * 0x0101_0101 >> 20) / (1 << 12) for i in range(5)]
+
+            b_rnd = BRandCount()
+            with pytest.raises(AssertionError):
+                b_rnd.random_array(-1)
+            with pytest.raises(ValueError):
+                b_rnd.random_array(3, 'int32')
+            for bits in (0, 54, -1, 2.0):
+                with pytest.raises(ValueError):
+                    b_rnd.random_array(3, 'float64', bits)  # type: ignore
+            with pytest.raises(ValueError):
+                b_rnd.random_array(3, 'float32', 25)
+            assert b_rnd.count == 0
+
+    #-------------------------------------------------------------------------
+    def test_integers(self, monkeypatch):
+        class BRandSeq(BaseRandom):
+            def __init__(self, values):
+                self.values = list(values)
+            def next(self) -> int:
+                return self.values.pop(0)
+
+        class BRandSeq64(BRandSeq):
+            _OUT_BITS = 64
+
+        for numpyModule in (PyRandLib.baserandom.np, None):
+            monkeypatch.setattr(PyRandLib.baserandom, 'np', numpyModule)
+
+            # width 3: word 0 is rejected and then drawn again after the whole batch
+            b_rnd = BRandSeq([0, 0xffff_ffff, 0x4000_0000, 0x8000_0000])
+            values = b_rnd.integers(10, 13, 3)
+            assert list(values) == [11, 12, 10]
+            assert b_rnd.values == []
+            if numpyModule is None:
+                assert values.typecode == 'q'  # type: ignore
+            else:
+                assert values.dtype.name == 'int64'  # type: ignore
+
+            b_rnd = BRandSeq([0, 0xffff_ffff])
+            assert b_rnd.integers(3) == 2
+            assert b_rnd.values == []
+
+            b_rnd = BRandSeq([0x8000_0000] * 3)
+            values = b_rnd.integers((1 << 63) + 5, (1 << 63) + 7, 3)
+            assert list(values) == [(1 << 63) + 6] * 3
+            if numpyModule is None:
+                assert values.typecode == 'Q'  # type: ignore
+            else:
+                assert values.dtype.name == 'uint64'  # type: ignore
+
+            b_rnd = BRandSeq([0x8000_0000] * 3)
+            assert b_rnd.integers(-(1 << 70), 1 << 70, 1) == [-(1 << 70) + (0x8000_0000_8000_0000_8000_0000 >> 25)]  # notice: a 96-bits word
+
+            # two 32-bits output values per word of 64 bits
+            b_rnd = BRandSeq([0x0123_4567, 0x89ab_cdef, 0xffff_ffff, 0xffff_ffff])
+            assert list(b_rnd.integers(-(1 << 39), 1 << 39, 2)) == [0x01_2345_6789 - (1 << 39), (1 << 39) - 1]
+
+            # highest 32 bits of 64-bits output values for widths fitting in 32 bits, whole output values otherwise
+            b_rnd = BRandSeq64([0x8000_0000_0000_0000, 0xc000_0000_0000_0000])
+            assert list(b_rnd.integers(1 << 32, size=2)) == [1 << 31, 3 << 30]
+            b_rnd = BRandSeq64([0x8000_0000_0000_0000, 0xc000_0000_0000_0000])
+            assert list(b_rnd.integers(1 << 33, size=2)) == [1 << 32, 3 << 31]
+
+            assert len(BRandSeq([]).integers(5, size=0)) == 0
+
+            b_rnd = BRandSeq([])
+            with pytest.raises(TypeError):
+                b_rnd.integers(2.5)  # type: ignore
+            with pytest.raises(TypeError):
+                b_rnd.integers(0, 2.5)  # type: ignore
+            with pytest.raises(ValueError):
+                b_rnd.integers(0)
+            with pytest.raises(ValueError):
+                b_rnd.integers(5, 5)
+            with pytest.raises(TypeError):
+                b_rnd.integers(5, size=3.0)  # type: ignore
+            with pytest.raises(ValueError):
+                b_rnd.integers(5, size=-1)
+
+        # unbiased
+        class BRandLCG(BaseRandom):
+            state = 1
+            def next(self) -> int:
+                self.state = (0x1_0dcd * self.state + 1) & 0xffff_ffff
+                return self.state
+        counts = [0] * 6
+        for v in BRandLCG().integers(6, size=60_000):
+            counts[v] += 1
+        assert all(9_500 < c < 10_500 for c in counts)
+
+    #-------------------------------------------------------------------------
+    def test_standard_normal(self, monkeypatch):
+        class BRandSeq(BaseRandom):
+            def __init__(self, values):
+                self.values = list(values)
+            def next(self) -> int:
+                return self.values.pop(0)
+
+        k, w, f = BaseRandom._ziggurattables('normal', 32)
+        assert k[1] == 0
+        assert all(0 < k[i] < (1 << 23) for i in range(2, 256))
+        assert all(w[i] < w[i+1] < w[0] for i in range(1, 255))
+        assert all(f[i] > f[i+1] for i in range(255))
+        assert f[0] == 1.0
+        assert math.isclose(w[255] * (1 << 23), BaseRandom._ZIGGURAT_NORMAL_R)
+        assert math.isclose(f[255], math.exp(-0.5 * BaseRandom._ZIGGURAT_NORMAL_R ** 2))
+        assert BaseRandom._ziggurattables('normal', 32) is BaseRandom._ziggurattables('normal', 32)
+
+        for numpyModule in (PyRandLib.baserandom.np, None):
+            monkeypatch.setattr(PyRandLib.baserandom, 'np', numpyModule)
+
+            # accepted values: layer in the highest 8 bits, sign in the next bit, magnitude in the lower bits
+            b_rnd = BRandSeq([(7 << 24) | (1 << 23) | 5, (200 << 24) | 6, 0])
+            values = b_rnd.standard_normal(2)
+            assert list(values) == [-5 * w[7], 6 * w[200]]
+            if numpyModule is None:
+                assert values.typecode == 'd'  # type: ignore
+            else:
+                assert values.dtype.name == 'float64'  # type: ignore
+            assert b_rnd.standard_normal() == 0.0
+            assert len(b_rnd.standard_normal(0)) == 0
+
+            # wedges of the layers: accepted, and then rejected values evaluated again after the whole batch
+            b_rnd = BRandSeq([0xffff_ffff, 0])
+            assert b_rnd.standard_normal() == -((1 << 23) - 1) * w[255]
+            b_rnd = BRandSeq([0xffff_ffff, (7 << 24) | 3, 0xffff_ffff, (2 << 24) | 9])
+            values = b_rnd.standard_normal(2)
+            assert list(values) == [9 * w[2], 3 * w[7]]
+            assert b_rnd.values == []
+
+            # the tail of the distribution, beyond the base layer
+            r = BaseRandom._ZIGGURAT_NORMAL_R
+            b_rnd = BRandSeq([0x007f_ffff, 0x8000_0000, 0, 0x8000_0000, 0x8000_0000])
+            assert math.isclose(b_rnd.standard_normal(), r + math.log(2.0) / r)
+            assert b_rnd.values == []
+            b_rnd = BRandSeq([0x00ff_ffff, 0x8000_0000, 0x8000_0000])
+            assert math.isclose(b_rnd.standard_normal(), -r - math.log(2.0) / r)
+
+            with pytest.raises(TypeError):
+                BRandSeq([]).standard_normal(1.0)  # type: ignore
+            with pytest.raises(ValueError):
+                BRandSeq([]).standard_normal(-1)
+
+        class BRandLCG(BaseRandom):
+            state = 1
+            def next(self) -> int:
+                self.state = (0x5851_f42d_4c95_7f2d * self.state + 0x1405_7b7e_f767_814f) & ((1 << 128) - 1)
+                return self.state >> (128 - self._OUT_BITS)
+        class BRandLCG64(BRandLCG):
+            _OUT_BITS = 64
+            _NORMALIZE = 1.0 / (1 << 64)
+        class BRandLCG128(BRandLCG):
+            _OUT_BITS = 128
+            _NORMALIZE = 1.0 / (1 << 128)
+        class BRandLCG32(BaseRandom):
+            # notice: the lowest bits of the outputs of this LCG have short periods
+            state = 1
+            def next(self) -> int:
+                self.state = (0x1_0dcd * self.state + 1) & 0xffff_ffff
+                return self.state
+
+        for cls in (BRandLCG, BRandLCG64, BRandLCG128, BRandLCG32):
+            values = list(cls().standard_normal(50_000))
+            assert abs(sum(values) / 50_000) < 0.02
+            assert abs(sum(v * v for v in values) / 50_000 - 1.0) < 0.03
+            assert 0.001 < sum(abs(v) > 3.0 for v in values) / 50_000 < 0.005
+            b_rnd = cls()
+            assert abs(sum(b_rnd.standard_normal() for _ in range(20_000)) / 20_000) < 0.03
+
+    #-------------------------------------------------------------------------
+    def test_standard_exponential(self, monkeypatch):
+        class BRandSeq(BaseRandom):
+            def __init__(self, values):
+                self.values = list(values)
+            def next(self) -> int:
+                return self.values.pop(0)
+
+        k, w, f = BaseRandom._ziggurattables('exponential', 32)
+        assert k[1] == 0
+        assert all(0 < k[i] < (1 << 24) for i in range(2, 256))
+        assert all(w[i] < w[i+1] < w[0] for i in range(1, 255))
+        assert all(f[i] > f[i+1] for i in range(255))
+        assert math.isclose(w[255] * (1 << 24), BaseRandom._ZIGGURAT_EXP_R)
+        assert math.isclose(f[255], math.exp(-BaseRandom._ZIGGURAT_EXP_R))
+
+        for numpyModule in (PyRandLib.baserandom.np, None):
+            monkeypatch.setattr(PyRandLib.baserandom, 'np', numpyModule)
+
+            b_rnd = BRandSeq([(7 << 24) | 5, (200 << 24) | 6, 0])
+            values = b_rnd.standard_exponential(2)
+            assert list(values) == [5 * w[7], 6 * w[200]]
+            assert b_rnd.standard_exponential() == 0.0
+            assert len(b_rnd.standard_exponential(0)) == 0
+
+            # the tail of the distribution, beyond the base layer
+            b_rnd = BRandSeq([0x00ff_ffff, 0x8000_0000])
+            assert math.isclose(b_rnd.standard_exponential(), BaseRandom._ZIGGURAT_EXP_R + math.log(2.0))
+
+            class BRandSeq64(BRandSeq):
+                _OUT_BITS = 64
+            b_rnd = BRandSeq64([0x00ff_ffff_ffff_ffff, 0xffff_ffff_ffff_ffff])
+            assert math.isclose(b_rnd.standard_exponential(), BaseRandom._ZIGGURAT_EXP_R + 53 * math.log(2.0))
+
+            # wedges of the layers: accepted, and then rejected values evaluated again after the whole batch
+            b_rnd = BRandSeq([0xffff_ffff, 0])
+            assert b_rnd.standard_exponential() == ((1 << 24) - 1) * w[255]
+            b_rnd = BRandSeq([0xffff_ffff, (7 << 24) | 3, 0xffff_ffff, (2 << 24) | 9])
+            values = b_rnd.standard_exponential(2)
+            assert list(values) == [9 * w[2], 3 * w[7]]
+            assert b_rnd.values == []
+
+            with pytest.raises(TypeError):
+                BRandSeq([]).standard_exponential(1.0)  # type: ignore
+            with pytest.raises(ValueError):
+                BRandSeq([]).standard_exponential(-1)
+
+        class BRandLCG(BaseRandom):
+            state = 1
+            def next(self) -> int:
+                self.state = (0x5851_f42d_4c95_7f2d * self.state + 0x1405_7b7e_f767_814f) & ((1 << 128) - 1)
+                return self.state >> (128 - self._OUT_BITS)
+        class BRandLCG128(BRandLCG):
+            _OUT_BITS = 128
+            _NORMALIZE = 1.0 / (1 << 128)
+
+        for cls in (BRandLCG, BRandLCG128):
+            values = list(cls().standard_exponential(50_000))
+            assert min(values) >= 0.0
+            assert abs(sum(values) / 50_000 - 1.0) < 0.02
+            assert abs(sum(v > 5.0 for v in values) / 50_000 - math.exp(-5.0)) < 0.002
+            b_rnd = cls()
+            assert abs(sum(b_rnd.standard_exponential() for _ in range(20_000)) / 20_000 - 1.0) < 0.03
+
     #-------------------------------------------------------------------------
     def test_getrandbits(self):
         b_rnd = BaseRandom()
         assert b_rnd.getrandbits(0) == 0
         with pytest.raises(AssertionError):
             n = b_rnd.getrandbits(-1)
-        with pytest.raises(AssertionError):
-            n = b_rnd.getrandbits(b_rnd._OUT_BITS)
-        with pytest.raises(AssertionError):
-            n = b_rnd.getrandbits(b_rnd._OUT_BITS + 1)
-        for k in range(1, b_rnd._OUT_BITS):
+        for k in range(1, 3 * b_rnd._OUT_BITS):
             with pytest.raises(NotImplementedError):
                 n = b_rnd.getrandbits(k)
 
@@ -205,6 +557,42 @@ class TestBaseRandom:
         for k in range(b_rnd._OUT_BITS):
             assert b_rnd.getrandbits(k) == int((0x5555_5555 / 0xffff_ffff) * (1 << k))
 
+        # more bits than output values provide
+        for cls in (TestBaseRandom.BRand0, TestBaseRandom.BRand1, TestBaseRandom.BRand33):
+            b_rnd = cls()
+            value = b_rnd.next()
+            for k in (32, 33, 64, 100, 100_000):
+                count = -(-k // 32)
+                assert b_rnd.getrandbits(k) == int(f"{value:032b}" * count, 2) >> (32 * count - k)
+
+        class BRandSeq(BaseRandom):
+            count = 0
+            def next(self) -> int:
+                self.count += 1
+                return self.count * self._MULT
+        class BRandSeq31(BRandSeq):
+            _OUT_BITS = 31
+            _MULT = 0x0101_0101
+        class BRandSeq64(BRandSeq):
+            _OUT_BITS = 64
+            _MULT = 0x0101_0101_0101_0101
+        class BRandSeq128(BRandSeq):
+            _OUT_BITS = 128
+            _MULT = 0x0101_0101_0101_0101_0101_0101_0101_0101
+
+        for cls in (BRandSeq31, BRandSeq64, BRandSeq128):
+            outBits = cls._OUT_BITS
+            for k in (outBits, outBits + 1, 3 * outBits, 3 * outBits + 7):
+                count = -(-k // outBits)
+                expected = 0
+                for i in range(1, count + 1):
+                    expected = (expected << outBits) | (i * cls._MULT)
+                b_rnd = cls()
+                assert b_rnd.getrandbits(k) == expected >> (count * outBits - k)
+                assert b_rnd.count == count
+
+        assert 0 <= TestBaseRandom.BRand33().randrange(10**40) < 10**40
+
     #-------------------------------------------------------------------------
     def test_randbytes(self):
         b_rnd = BaseRandom(1)
@@ -232,7 +620,115 @@ class TestBaseRandom:
         bytes_ = b_rnd.randbytes(5)
         for b in bytes_:
             assert b == 255 // 3
+
+        # every bit of the output values is used
+        class BRandSeq(BaseRandom):
+            count = 0
+            def next(self) -> int:
+                self.count += 1
+                return self.count * self._MULT
+        class BRandSeq31(BRandSeq):
+            _OUT_BITS = 31
+            _MULT = 0x0101_0101
+        class BRandSeq32(BRandSeq):
+            _MULT = 0x0102_0304
+        class BRandSeq64(BRandSeq):
+            _OUT_BITS = 64
+            _MULT = 0x0102_0304_0506_0708
+        class BRandSeq128(BRandSeq):
+            _OUT_BITS = 128
+            _MULT = 0x0102_0304_0506_0708_090a_0b0c_0d0e_0f10
+
+        b_rnd = BRandSeq32()
+        assert b_rnd.randbytes(10) == bytes([4, 3, 2, 1, 8, 6, 4, 2, 12, 9])
+        assert b_rnd.count == 3
+        b_rnd = BRandSeq64()
+        assert b_rnd.randbytes(10) == bytes([8, 7, 6, 5, 4, 3, 2, 1, 16, 14])
+        assert b_rnd.count == 2
+        b_rnd = BRandSeq128()
+        assert b_rnd.randbytes(17) == bytes(range(16, 0, -1)) + bytes([32])
+        assert b_rnd.count == 2
+        b_rnd = BRandSeq31()
+        assert b_rnd.randbytes(8) == (0x0101_0101 << 33 | 0x0202_0202 << 2 | 0x0303_0303 >> 29).to_bytes(8, 'big')
+        assert b_rnd.count == 3
+
+        for cls in (BRandSeq31, BRandSeq32, BRandSeq64, BRandSeq128):
+            assert cls().randbytes(0) == b''
+
+    #-------------------------------------------------------------------------
+    def test_readinto(self):
+        class BRandSeq(BaseRandom):
+            count = 0
+            def next(self) -> int:
+                self.count = (self.count + 0x0123_4567) & 0xffff_ffff
+                return self.count
+        class BRandSeq31(BRandSeq):
+            _OUT_BITS = 31
+            def next(self) -> int: return super().next() >> 1
+
+        for cls in (BRandSeq, BRandSeq31):
+            size = 2 * cls._OUT_BITS * 8192 + 11
+            buffer = bytearray(size)
+            assert cls().readinto(buffer) == size
+            assert buffer == cls().randbytes(size)
+
+            raw = array('Q', [0] * 12)
+            assert cls().readinto(memoryview(raw)[2:6]) == 32
+            assert list(raw[:2]) + list(raw[6:]) == [0] * 8
+            assert raw[2:6].tobytes() == cls().randbytes(32)
+
+            assert cls().readinto(bytearray()) == 0
+
+            with pytest.raises(TypeError):
+                cls().readinto(b'0123')
      
+    #-------------------------------------------------------------------------
+    def test_spawn(self):
+        class BRandSeeded(BaseRandom):
+            def seed(self, _seed = None) -> None:  # type: ignore
+                self.value = _seed
+            def next(self) -> int:
+                self.value = (self.value + 1) & 0xffff_ffff  # type: ignore
+                return self.value
+
+        b_rnd = BRandSeeded(0x0123_4567)
+        children = b_rnd.spawn(3)
+        initRand = SplitMix64((0x0123_4568 << 32) | 0x0123_4569)
+        assert [type(child) for child in children] == [BRandSeeded] * 3
+        assert [child.value for child in children] == [initRand() for _ in range(3)]  # type: ignore
+        assert b_rnd.value == 0x0123_4569  # type: ignore
+
+        # spawned generators get derived from the current state
+        assert [child.value for child in BRandSeeded(0x0123_4567).spawn(3)] == [child.value for child in children]  # type: ignore
+        assert [child.value for child in b_rnd.spawn(3)] != [child.value for child in children]  # type: ignore
+        assert b_rnd.spawn(0) == []
+
+        with pytest.raises(TypeError):
+            b_rnd.spawn(2.0)  # type: ignore
+        with pytest.raises(ValueError):
+            b_rnd.spawn(-1)
+
+    #-------------------------------------------------------------------------
+    def test_choices(self):
+        class BRandLCG(BaseRandom):
+            state = 1
+            def next(self) -> int:
+                self.state = (0x1_0dcd * self.state + 1) & 0xffff_ffff
+                return self.state
+
+        b_rnd = BRandLCG()
+        values = b_rnd.choices('abc', [1, 0, 3], k=40_000)
+        assert isinstance(values, list)
+        assert 'b' not in values
+        assert abs(values.count('a') / 40_000 - 0.25) < 0.01
+        assert b_rnd.choices('abc', [1, 0, 3]) in (['a'], ['c'])
+        with pytest.raises(ValueError):
+            b_rnd.choices('abc', [1, 3])
+
+        # unweighted or cumulated weights: method of random.Random
+        assert len(b_rnd.choices('abc', k=10)) == 10
+        assert 'b' not in b_rnd.choices('abc', cum_weights=[1, 1, 4], k=100)
+
     #-------------------------------------------------------------------------
     def test_getstate(self):
         b_rnd = BaseRandom(1)
@@ -248,9 +744,18 @@ class TestBaseRandom:
         b_rnd = TestBaseRandom.BRand33()
         assert b_rnd.getstate() == 0x5555_5555
 
+    #-------------------------------------------------------------------------
+    def test_restore(self):
+        b_rnd = BaseRandom(1)
+        with pytest.raises(NotImplementedError):
+            b_rnd.restore(1)  # type: ignore
+        with pytest.raises(NotImplementedError):
+            b_rnd.restore(1, trusted=False)  # type: ignore
+
     #-------------------------------------------------------------------------
     def test_seed(self):
         b_rnd = BaseRandom()
+        mtState = random.Random.getstate(b_rnd)
 
         b_rnd.seed()
         assert b_rnd._NORMALIZE == 1.0 / (1 << 32)
@@ -272,6 +777,12 @@ class TestBaseRandom:
         assert b_rnd._OUT_BITS == 32
         assert b_rnd.gauss_next is None  # type: ignore
 
+        # the unused internal state of the Mersenne Twister is never seeded
+        assert random.Random.getstate(b_rnd) == mtState
+        b_rnd.gauss_next = 0.5  # type: ignore
+        b_rnd.seed(1)
+        assert b_rnd.gauss_next is None  # type: ignore
+
         with pytest.raises(ValueError):
             b_rnd.seed(-0.002)
         with pytest.raises(ValueError):
@@ -503,6 +1014,16 @@ class TestBaseRandom:
         with pytest.raises(ValueError):
             t = b_rnd([1, b_rnd, [5, 6.0]])  # type: ignore
 
+    #-------------------------------------------------------------------------
+    def test_lcg_advance(self):
+        state = 0x1234_5678
+        for _ in range(100):
+            state = (0x1_0dcd * state + 1) & 0xffff_ffff
+        assert BaseRandom._lcgadvance(0x1234_5678, 100, 0x1_0dcd, 1, 0xffff_ffff) == state
+        assert BaseRandom._lcgadvance(state, -100, 0x1_0dcd, 1, 0xffff_ffff) == 0x1234_5678
+        assert BaseRandom._lcgadvance(state, 0, 0x1_0dcd, 1, 0xffff_ffff) == state
+        assert BaseRandom._lcgadvance(state, 1 << 32, 0x1_0dcd, 1, 0xffff_ffff) == state
+
     #-------------------------------------------------------------------------
     def test_rot_left(self):
         
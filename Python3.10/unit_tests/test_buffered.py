@@ -0,0 +1,182 @@
+"""
+Copyright (c) 2025 Philippe Schmouker, ph (dot) schmouker (at) gmail.com
+
+Permission is hereby granted,  free of charge,  to any person obtaining a copy
+of this software and associated documentation files (the "Software"),  to deal
+in the Software without restriction, including  without  limitation the rights
+to use,  copy,  modify,  merge,  publish,  distribute, sublicense, and/or sell
+copies of the Software,  and  to  permit  persons  to  whom  the  Software  is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS",  WITHOUT WARRANTY OF ANY  KIND,  EXPRESS  OR
+IMPLIED,  INCLUDING  BUT  NOT  LIMITED  TO  THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT  SHALL  THE
+AUTHORS  OR  COPYRIGHT  HOLDERS  BE  LIABLE  FOR  ANY CLAIM,  DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT,  TORT OR OTHERWISE, ARISING FROM,
+OUT  OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+#=============================================================================
+import pytest
+
+from PyRandLib.buffered   import Buffered
+from PyRandLib.cwg128     import Cwg128
+from PyRandLib.fastrand32 import FastRand32
+from PyRandLib.fastrand63 import FastRand63
+from PyRandLib.lfib1340   import LFib1340
+from PyRandLib.melg44497  import Melg44497
+from PyRandLib.mrg49507   import Mrg49507
+from PyRandLib.pcg64_32   import Pcg64_32
+from PyRandLib.well44497b import Well44497b
+
+
+#=============================================================================
+class TestBuffered:
+    """Tests class Buffered.
+    """
+
+    #-------------------------------------------------------------------------
+    def test_init(self):
+        bfr = Buffered(Well44497b(1))
+        assert isinstance(bfr.prng, Well44497b)
+        assert bfr._block == 4096
+        assert bfr._NORMALIZE == Well44497b._NORMALIZE
+        assert bfr._OUT_BITS == Well44497b._OUT_BITS
+        assert bfr.gauss_next is None  # type: ignore
+        assert bfr.getstate() == Well44497b(1).getstate()
+        bfr = Buffered(Cwg128(1), 7)
+        assert bfr._block == 7
+        assert bfr._OUT_BITS == 128
+
+        with pytest.raises(TypeError):
+            Buffered(1)  # type: ignore
+        with pytest.raises(TypeError):
+            Buffered(Well44497b(1), 7.0)  # type: ignore
+        with pytest.raises(ValueError):
+            Buffered(Well44497b(1), 0)
+
+    #-------------------------------------------------------------------------
+    def test_next(self):
+        for prngClass in (Well44497b, Melg44497, Mrg49507, LFib1340, FastRand32, Pcg64_32, Cwg128):
+            bfr = Buffered(prngClass(0x0123_4567_89ab_cdef), 100)
+            ref = prngClass(0x0123_4567_89ab_cdef)
+            assert [bfr.next() for _ in range(1_000)] == [ref.next() for _ in range(1_000)]
+            assert [bfr.random() for _ in range(250)] == [ref.random() for _ in range(250)]
+            assert [bfr(100) for _ in range(250)] == [ref(100) for _ in range(250)]
+
+    #-------------------------------------------------------------------------
+    def test_next_n(self):
+        bfr = Buffered(Mrg49507(0x0123_4567_89ab_cdef), 100)
+        ref = Mrg49507(0x0123_4567_89ab_cdef)
+        bfr.next()
+        values = bfr.next_n(20)
+        assert values.typecode == 'I'  # type: ignore
+        assert list(values) == list(ref.next_n(21))[1:]
+        assert list(bfr.next_n(250)) == list(ref.next_n(250))
+        assert bfr.getstate() == ref.getstate()
+        assert [bfr.next() for _ in range(150)] == [ref.next() for _ in range(150)]
+        assert len(bfr.next_n(0)) == 0
+
+        bfr = Buffered(Cwg128(1), 10)
+        ref = Cwg128(1)
+        assert bfr.next_n(15) == ref.next_n(15)
+
+        with pytest.raises(AssertionError):
+            bfr.next_n(-1)
+
+    #-------------------------------------------------------------------------
+    def test_getstate(self):
+        for prngClass in (Well44497b, LFib1340, FastRand32, Pcg64_32):
+            bfr = Buffered(prngClass(0x0123_4567_89ab_cdef), 100)
+            ref = prngClass(0x0123_4567_89ab_cdef)
+            for n in (0, 1, 98, 1, 1, 100, 37):
+                if n > 1:
+                    bfr.next_n(n)
+                else:
+                    [bfr.next() for _ in range(n)]
+                ref.next_n(n)
+                assert bfr.getstate() == ref.getstate()
+            # getstate() does not modify the sequence
+            assert [bfr.next() for _ in range(300)] == [ref.next() for _ in range(300)]
+
+    #-------------------------------------------------------------------------
+    def test_setstate(self):
+        bfr = Buffered(Well44497b(1), 100)
+        ref = Well44497b(0x0123_4567_89ab_cdef)
+        ref.next_n(1_234)
+        [bfr.next() for _ in range(15)]
+        bfr.setstate(ref.getstate())
+        assert bfr.getstate() == ref.getstate()
+        assert [bfr.next() for _ in range(300)] == [ref.next() for _ in range(300)]
+
+        # and back to an unbuffered generator
+        [bfr.next() for _ in range(15)]
+        prng = Well44497b()
+        prng.setstate(bfr.getstate())
+        assert [prng.next() for _ in range(300)] == [bfr.next() for _ in range(300)]
+
+    #-------------------------------------------------------------------------
+    def test_restore(self):
+        for trusted in (True, False):
+            bfr = Buffered(Well44497b(1), 100)
+            ref = Well44497b(0x0123_4567_89ab_cdef)
+            ref.next_n(1_234)
+            [bfr.next() for _ in range(15)]
+            bfr.restore(ref.getstate(), trusted=trusted)
+            assert bfr.getstate() == ref.getstate()
+            assert [bfr.next() for _ in range(300)] == [ref.next() for _ in range(300)]
+
+    #-------------------------------------------------------------------------
+    def test_seed(self):
+        bfr = Buffered(Mrg49507(1), 100)
+        [bfr.next() for _ in range(15)]
+        bfr.seed(0x0123_4567_89ab_cdef)
+        ref = Mrg49507(0x0123_4567_89ab_cdef)
+        assert bfr.getstate() == ref.getstate()
+        assert [bfr.next() for _ in range(300)] == [ref.next() for _ in range(300)]
+        bfr.seed(0.357)
+        ref.seed(0.357)
+        assert [bfr.next() for _ in range(300)] == [ref.next() for _ in range(300)]
+
+    #-------------------------------------------------------------------------
+    def test_spawn(self):
+        bfr = Buffered(Cwg128(1), 100)
+        bfr.next()
+        children = bfr.spawn(2)
+        prng = Cwg128(1)
+        prng.next()
+        assert [type(child) for child in children] == [Buffered] * 2
+        assert [child._block for child in children] == [100] * 2
+        assert [child.getstate() for child in children] == [child.getstate() for child in prng.spawn(2)]
+        assert bfr.getstate() == prng.getstate()
+        assert bfr.next_n(150) == prng.next_n(150)
+
+        # setstate() of the LCGs does not restore their internal state
+        for cls in (FastRand32, FastRand63):
+            bfr = Buffered(cls(9), 100)
+            bfr.next_n(250)
+            children = bfr.spawn(2)
+            prng = cls(9)
+            prng.next_n(250)
+            assert [child.next_n(10) for child in children] == [child.next_n(10) for child in prng.spawn(2)]
+            assert bfr.next_n(150) == prng.next_n(150)
+
+    #-------------------------------------------------------------------------
+    def test_copyprng(self):
+        prng = FastRand32(1)
+        prng.next()
+        prng_copy = Buffered._copyprng(prng)
+        assert type(prng_copy) is FastRand32
+        assert prng_copy.getstate() == prng.getstate()
+        assert [prng_copy.next() for _ in range(10)] == [prng.next() for _ in range(10)]
+
+        prng = Well44497b(1)
+        prng_copy = Buffered._copyprng(prng)
+        assert prng_copy._state is not prng._state
+        prng_copy.next()
+        assert prng_copy.getstate() != prng.getstate()
@@ -21,10 +21,17 @@ SOFTWARE.
 """
 
 #=============================================================================
+from array import array
 import pytest
 
+from PyRandLib.lfib1340       import LFib1340
 from PyRandLib.listindexstate import ListIndexState
+from PyRandLib.melg44497      import Melg44497
+from PyRandLib.mrg49507       import Mrg49507
 from PyRandLib.splitmix       import SplitMix31, SplitMix32, SplitMix63, SplitMix64
+from PyRandLib.well44497b     import Well44497b
+from PyRandLib.xoroshiro256   import Xoroshiro256
+from PyRandLib.xoroshiro1024  import Xoroshiro1024
 
 
 #=============================================================================
@@ -34,203 +41,167 @@ class TestListIndexState:
 
     #-------------------------------------------------------------------------
     def test_init_empty(self):
-        with pytest.raises(TypeError):
-            # don't know why "Random() requires 0 or 1 argument" with Python 3.10.18
-            lis = ListIndexState(SplitMix31, 15)
-            assert lis._initRandClass == SplitMix31
-            assert lis._STATE_SIZE == 15
-            assert lis._index == 0
-            assert len(lis._state) == 15
-            assert all(isinstance(s, int) for s in lis._state)
-            assert all(0 <= s <= 0x7fff_ffff for s in lis._state)  # type: ignore
+        lis = ListIndexState(SplitMix31, 15)
+        assert lis._initRandClass == SplitMix31
+        assert lis._STATE_SIZE == 15
+        assert lis._index == 0
+        assert len(lis._state) == 15
+        assert all(isinstance(s, int) for s in lis._state)
+        assert all(0 <= s <= 0x7fff_ffff for s in lis._state)  # type: ignore
 
 
     #-------------------------------------------------------------------------
     def test_init_int(self):
-        with pytest.raises(TypeError):
-            # don't know why "Random() requires 0 or 1 argument" with Python 3.10.18
-            lis = ListIndexState(SplitMix64, 17, 1)
-            assert lis._initRandClass == SplitMix64
-            assert lis._STATE_SIZE == 17
-            assert lis._index == 0
-            assert len(lis._state) == 17
-            assert lis._state[1]  == 0xbeeb8da1658eec67
-            assert lis._state[4]  == 0x71bb54d8d101b5b9
-            assert lis._state[7]  == 0x85e7bb0f12278575
-            assert lis._state[10] == 0x6775dc7701564f61
-            assert lis._state[13] == 0x87b341d690d7a28a
-            assert lis._state[16] == 0xa534a6a6b7fd0b63
+        lis = ListIndexState(SplitMix64, 17, 1)
+        assert lis._initRandClass == SplitMix64
+        assert lis._STATE_SIZE == 17
+        assert lis._index == 0
+        assert len(lis._state) == 17
+        assert lis._state[1]  == 0xbeeb8da1658eec67
+        assert lis._state[4]  == 0x71bb54d8d101b5b9
+        assert lis._state[7]  == 0x85e7bb0f12278575
+        assert lis._state[10] == 0x6775dc7701564f61
+        assert lis._state[13] == 0x87b341d690d7a28a
+        assert lis._state[16] == 0xa534a6a6b7fd0b63
 
-        with pytest.raises(TypeError):
-            # don't know why "Random() requires 0 or 1 argument" with Python 3.10.18
-            lis = ListIndexState(SplitMix63, 15, -2)
-            assert lis._initRandClass == SplitMix63
-            assert lis._STATE_SIZE == 15
-            assert lis._index == 0
-            assert len(lis._state) == 15
-            assert lis._state[1]  == 0xba56949915dcf9e9 >> 1
-            assert lis._state[4]  == 0x7842841591543f1d >> 1
-            assert lis._state[7]  == 0x1e2b53fb7bd63f05 >> 1
-            assert lis._state[10] == 0x2b724bbbfb591868 >> 1
-            assert lis._state[13] == 0x8457d34b5125f667 >> 1
+        lis = ListIndexState(SplitMix63, 15, -2)
+        assert lis._initRandClass == SplitMix63
+        assert lis._STATE_SIZE == 15
+        assert lis._index == 0
+        assert len(lis._state) == 15
+        assert lis._state[1]  == 0xba56949915dcf9e9 >> 1
+        assert lis._state[4]  == 0x7842841591543f1d >> 1
+        assert lis._state[7]  == 0x1e2b53fb7bd63f05 >> 1
+        assert lis._state[10] == 0x2b724bbbfb591868 >> 1
+        assert lis._state[13] == 0x8457d34b5125f667 >> 1
 
-        with pytest.raises(TypeError):
-            # don't know why "Random() requires 0 or 1 argument" with Python 3.10.18
-            lis = ListIndexState(SplitMix32, 21, 0x0123_4567_89ab_cdef)
-            assert lis._initRandClass == SplitMix32
-            assert lis._STATE_SIZE == 21
-            assert lis._index == 0
-            assert len(lis._state) == 21
-            assert lis._state[1]  == 0xd573529b34a1d093 >> 32
-            assert lis._state[4]  == 0x01404ce914938008 >> 32
-            assert lis._state[7]  == 0x8931545f4f9ea651 >> 32
-            assert lis._state[10] == 0xcdb8c9cd9a62da0f >> 32
-            assert lis._state[13] == 0x97f6c69811cfb13b >> 32
-            assert lis._state[16] == 0x2ab8c4e395cb5958 >> 32
+        lis = ListIndexState(SplitMix32, 21, 0x0123_4567_89ab_cdef)
+        assert lis._initRandClass == SplitMix32
+        assert lis._STATE_SIZE == 21
+        assert lis._index == 0
+        assert len(lis._state) == 21
+        assert lis._state[1]  == 0xd573529b34a1d093 >> 32
+        assert lis._state[4]  == 0x01404ce914938008 >> 32
+        assert lis._state[7]  == 0x8931545f4f9ea651 >> 32
+        assert lis._state[10] == 0xcdb8c9cd9a62da0f >> 32
+        assert lis._state[13] == 0x97f6c69811cfb13b >> 32
+        assert lis._state[16] == 0x2ab8c4e395cb5958 >> 32
 
-        with pytest.raises(TypeError):
-            # don't know why "Random() requires 0 or 1 argument" with Python 3.10.18
-            lis = ListIndexState(SplitMix63, 11, -8_870_000_000_000_000_000)
-            assert lis._initRandClass == SplitMix63
-            assert lis._STATE_SIZE == 11
-            assert lis._index == 0
-            assert len(lis._state) == 11
-            assert lis._state[1]  == 0xe2fbc345a799b5aa >> 1
-            assert lis._state[4]  == 0x2a03b9aff2bfd421 >> 1
-            assert lis._state[7]  == 0xe6d2502493ff622e >> 1
-            assert lis._state[10] == 0x4592e2e878ff1b75 >> 1
+        lis = ListIndexState(SplitMix63, 11, -8_870_000_000_000_000_000)
+        assert lis._initRandClass == SplitMix63
+        assert lis._STATE_SIZE == 11
+        assert lis._index == 0
+        assert len(lis._state) == 11
+        assert lis._state[1]  == 0xe2fbc345a799b5aa >> 1
+        assert lis._state[4]  == 0x2a03b9aff2bfd421 >> 1
+        assert lis._state[7]  == 0xe6d2502493ff622e >> 1
+        assert lis._state[10] == 0x4592e2e878ff1b75 >> 1
 
-        with pytest.raises(TypeError):
-            # don't know why "Random() requires 0 or 1 argument" with Python 3.10.18
-            lis = ListIndexState(SplitMix64, 27, 8_870_000_000_000_000_000)
-            assert lis._initRandClass == SplitMix64
-            assert lis._STATE_SIZE == 27
-            assert lis._index == 0
-            assert len(lis._state) == 27
-            assert lis._state[1]  == 0xa6eb6466bac9f251
-            assert lis._state[4]  == 0xe1b0fb2c7e764cdb
-            assert lis._state[7]  == 0xe0c07d9420f2f41e
-            assert lis._state[10] == 0xa92d263b8e9fbd45
-            assert lis._state[13] == 0x39390f80db89e31d
-            assert lis._state[16] == 0xcbe9dce4849cf8e6
+        lis = ListIndexState(SplitMix64, 27, 8_870_000_000_000_000_000)
+        assert lis._initRandClass == SplitMix64
+        assert lis._STATE_SIZE == 27
+        assert lis._index == 0
+        assert len(lis._state) == 27
+        assert lis._state[1]  == 0xa6eb6466bac9f251
+        assert lis._state[4]  == 0xe1b0fb2c7e764cdb
+        assert lis._state[7]  == 0xe0c07d9420f2f41e
+        assert lis._state[10] == 0xa92d263b8e9fbd45
+        assert lis._state[13] == 0x39390f80db89e31d
+        assert lis._state[16] == 0xcbe9dce4849cf8e6
 
-        with pytest.raises(TypeError):
-            # don't know why "Random() requires 0 or 1 argument" with Python 3.10.18
-            lis = ListIndexState(SplitMix31, 31, 0xffff_ffff_ffff_fffe_ffff_ffff_ffff_fffd)
-            assert lis._initRandClass == SplitMix31
-            assert lis._STATE_SIZE == 31
-            assert lis._index == 0
-            assert len(lis._state) == 31
-            assert lis._state[1]  == 0xec779c3693f88501 >> 33
-            assert lis._state[4]  == 0x260ffb0260bbbe5f >> 33
-            assert lis._state[7]  == 0xd7c07017388fa2af >> 33
-            assert lis._state[10] == 0x71da8c61bc0cfda9 >> 33
-            assert lis._state[13] == 0x69f17ee1a874dbdd >> 33
-            assert lis._state[16] == 0x66fb5ba3ae1546e0 >> 33
+        lis = ListIndexState(SplitMix31, 31, 0xffff_ffff_ffff_fffe_ffff_ffff_ffff_fffd)
+        assert lis._initRandClass == SplitMix31
+        assert lis._STATE_SIZE == 31
+        assert lis._index == 0
+        assert len(lis._state) == 31
+        assert lis._state[1]  == 0xec779c3693f88501 >> 33
+        assert lis._state[4]  == 0x260ffb0260bbbe5f >> 33
+        assert lis._state[7]  == 0xd7c07017388fa2af >> 33
+        assert lis._state[10] == 0x71da8c61bc0cfda9 >> 33
+        assert lis._state[13] == 0x69f17ee1a874dbdd >> 33
+        assert lis._state[16] == 0x66fb5ba3ae1546e0 >> 33
 
     #-------------------------------------------------------------------------
     def test_init_float(self):
-        with pytest.raises(TypeError):
-            # don't know why "Random() requires 0 or 1 argument" with Python 3.10.18
-            lis = ListIndexState(SplitMix63, 27, 0.357)
-            assert lis._initRandClass == SplitMix63
-            assert lis._STATE_SIZE == 27
-            assert lis._index == 0
-            assert len(lis._state) == 27
-            assert lis._state[1]  == 0x954faf5a9ad49cf8 >> 1
-            assert lis._state[4]  == 0xa3aac457d81d552c >> 1
-            assert lis._state[7]  == 0xe6b536617ee8b60c >> 1
-            assert lis._state[10] == 0x0df3d30dc1390db9 >> 1
-            assert lis._state[13] == 0xee8fd4bfccca5ee3 >> 1
-            assert lis._state[16] == 0x63be72f7c7521c27 >> 1
+        lis = ListIndexState(SplitMix63, 27, 0.357)
+        assert lis._initRandClass == SplitMix63
+        assert lis._STATE_SIZE == 27
+        assert lis._index == 0
+        assert len(lis._state) == 27
+        assert lis._state[1]  == 0x954faf5a9ad49cf8 >> 1
+        assert lis._state[4]  == 0xa3aac457d81d552c >> 1
+        assert lis._state[7]  == 0xe6b536617ee8b60c >> 1
+        assert lis._state[10] == 0x0df3d30dc1390db9 >> 1
+        assert lis._state[13] == 0xee8fd4bfccca5ee3 >> 1
+        assert lis._state[16] == 0x63be72f7c7521c27 >> 1
 
-        with pytest.raises(TypeError):
-            # don't know why "Random() requires 0 or 1 argument" with Python 3.10.18
-            lis = ListIndexState(SplitMix32, 27, 1.0)
-            assert lis._initRandClass == SplitMix32
-            assert lis._STATE_SIZE == 27
-            assert lis._index == 0
-            assert len(lis._state) == 27
-            assert all(isinstance(s, int) for s in lis._state)
-            assert all(0 < s < (1 << 64) for s in lis._state)  # type: ignore
+        lis = ListIndexState(SplitMix32, 27, 1.0)
+        assert lis._initRandClass == SplitMix32
+        assert lis._STATE_SIZE == 27
+        assert lis._index == 0
+        assert len(lis._state) == 27
+        assert all(isinstance(s, int) for s in lis._state)
+        assert all(0 < s < (1 << 64) for s in lis._state)  # type: ignore
 
-        with pytest.raises(TypeError):
-            # don't know why "Random() requires 0 or 1 argument" with Python 3.10.18
+        with pytest.raises(ValueError):
             lis = ListIndexState(SplitMix64, 27, -0.0001)
-        with pytest.raises(TypeError):
-            # don't know why "Random() requires 0 or 1 argument" with Python 3.10.18
+        with pytest.raises(ValueError):
             lis = ListIndexState(SplitMix31, 27, 1.001)
 
     #-------------------------------------------------------------------------
     def test_init_state(self):
-        with pytest.raises(TypeError):
-            # don't know why "Random() requires 0 or 1 argument" with Python 3.10.18
-            lis = ListIndexState(SplitMix32, 5, tuple(i+1 for i in range(5)))  # type: ignore
-            assert lis._initRandClass == SplitMix32
-            assert lis._STATE_SIZE == 5
-            assert lis._index == 0
-            assert len(lis._state) == 5
-            assert lis._state == [i+1 for i in range(5)] 
+        lis = ListIndexState(SplitMix32, 5, tuple(i+1 for i in range(5)))  # type: ignore
+        assert lis._initRandClass == SplitMix32
+        assert lis._STATE_SIZE == 5
+        assert lis._index == 0
+        assert len(lis._state) == 5
+        assert lis._state == [i+1 for i in range(5)] 
 
-        with pytest.raises(TypeError):
-            # don't know why "Random() requires 0 or 1 argument" with Python 3.10.18
-            lis = ListIndexState(SplitMix31, 7, [i+11 for i in range(7)])  # type: ignore
-            assert lis._initRandClass == SplitMix31
-            assert lis._STATE_SIZE == 7
-            assert lis._index == 0
-            assert len(lis._state) == 7
-            assert lis._state == [i+11 for i in range(7)] 
+        lis = ListIndexState(SplitMix31, 7, [i+11 for i in range(7)])  # type: ignore
+        assert lis._initRandClass == SplitMix31
+        assert lis._STATE_SIZE == 7
+        assert lis._index == 0
+        assert len(lis._state) == 7
+        assert lis._state == [i+11 for i in range(7)] 
 
-        with pytest.raises(TypeError):
-            # don't know why "Random() requires 0 or 1 argument" with Python 3.10.18
-            lis = ListIndexState(SplitMix32, 5, (tuple(i+1 for i in range(5)), 8))  # type: ignore
-            assert lis._initRandClass == SplitMix32
-            assert lis._STATE_SIZE == 5
-            assert lis._index == 3
-            assert len(lis._state) == 5
-            assert lis._state == [i+1 for i in range(5)] 
+        lis = ListIndexState(SplitMix32, 5, (tuple(i+1 for i in range(5)), 8))  # type: ignore
+        assert lis._initRandClass == SplitMix32
+        assert lis._STATE_SIZE == 5
+        assert lis._index == 3
+        assert len(lis._state) == 5
+        assert lis._state == [i+1 for i in range(5)] 
 
-        with pytest.raises(TypeError):
-            # don't know why "Random() requires 0 or 1 argument" with Python 3.10.18
-            lis = ListIndexState(SplitMix31, 7, ([i+11 for i in range(7)], 11))  # type: ignore
-            assert lis._initRandClass == SplitMix31
-            assert lis._STATE_SIZE == 7
-            assert lis._index == 4
-            assert len(lis._state) == 7
-            assert lis._state == [i+11 for i in range(7)] 
+        lis = ListIndexState(SplitMix31, 7, ([i+11 for i in range(7)], 11))  # type: ignore
+        assert lis._initRandClass == SplitMix31
+        assert lis._STATE_SIZE == 7
+        assert lis._index == 4
+        assert len(lis._state) == 7
+        assert lis._state == [i+11 for i in range(7)] 
 
-        with pytest.raises(TypeError):
-            # don't know why "Random() requires 0 or 1 argument" with Python 3.10.18
-            lis = ListIndexState(SplitMix32, 5, [tuple(i+1 for i in range(5)), 8])  # type: ignore
-            assert lis._initRandClass == SplitMix32
-            assert lis._STATE_SIZE == 5
-            assert lis._index == 3
-            assert len(lis._state) == 5
-            assert lis._state == [i+1 for i in range(5)] 
+        lis = ListIndexState(SplitMix32, 5, [tuple(i+1 for i in range(5)), 8])  # type: ignore
+        assert lis._initRandClass == SplitMix32
+        assert lis._STATE_SIZE == 5
+        assert lis._index == 3
+        assert len(lis._state) == 5
+        assert lis._state == [i+1 for i in range(5)] 
 
-        with pytest.raises(TypeError):
-            # don't know why "Random() requires 0 or 1 argument" with Python 3.10.18
-            lis = ListIndexState(SplitMix31, 7, [[i+11 for i in range(7)], 11])  # type: ignore
-            assert lis._initRandClass == SplitMix31
-            assert lis._STATE_SIZE == 7
-            assert lis._index == 4
-            assert len(lis._state) == 7
-            assert lis._state == [i+11 for i in range(7)]
+        lis = ListIndexState(SplitMix31, 7, [[i+11 for i in range(7)], 11])  # type: ignore
+        assert lis._initRandClass == SplitMix31
+        assert lis._STATE_SIZE == 7
+        assert lis._index == 4
+        assert len(lis._state) == 7
+        assert lis._state == [i+11 for i in range(7)]
 
-        with pytest.raises(TypeError):
-            # don't know why "Random() requires 0 or 1 argument" with Python 3.10.18
-            lis = ListIndexState(SplitMix64, 17, [])
-            assert lis._initRandClass == SplitMix64
-            assert lis._STATE_SIZE == 17
-            assert lis._index == 0
-            assert len(lis._state) == 17
-            assert all(0 <= s < (1 << 64) for s in lis._state)  # type: ignore
+        lis = ListIndexState(SplitMix64, 17, [])
+        assert lis._initRandClass == SplitMix64
+        assert lis._STATE_SIZE == 17
+        assert lis._index == 0
+        assert len(lis._state) == 17
+        assert all(0 <= s < (1 << 64) for s in lis._state)  # type: ignore
 
-        with pytest.raises(TypeError):
-            # don't know why "Random() requires 0 or 1 argument" with Python 3.10.18
+        with pytest.raises(ValueError):
             lis = ListIndexState(SplitMix64, 11, [tuple(), 16])  # type: ignore
-        with pytest.raises(TypeError):
-            # don't know why "Random() requires 0 or 1 argument" with Python 3.10.18
+        with pytest.raises(ValueError):
             lis = ListIndexState(SplitMix64, 11, [[], 9])  # type: ignore
         with pytest.raises(TypeError):
             lis = ListIndexState(SplitMix32, 5, (1, 2, 3))  # type: ignore
@@ -245,14 +216,94 @@ class TestListIndexState:
 
     #-------------------------------------------------------------------------
     def test_getstate(self):
-        state = (tuple(i+1 for i in range(17)), 16)
-        with pytest.raises(TypeError):
-            # don't know why "Random() requires 0 or 1 argument" with Python 3.10.18
-            lis = ListIndexState(SplitMix31, 17, state)  # type: ignore
-            assert lis.getstate() == state
+        state = ([i+1 for i in range(17)], 16)
+        lis = ListIndexState(SplitMix31, 17, state)
+        assert lis.getstate() == state
 
-        state33 = (tuple(i+1 for i in range(17)), 33)
-        with pytest.raises(TypeError):
-            # don't know why "Random() requires 0 or 1 argument" with Python 3.10.18
-            lis = ListIndexState(SplitMix31, 17, state33)  # type: ignore
-            assert lis.getstate() == state
+        state33 = ([i+1 for i in range(17)], 33)
+        lis = ListIndexState(SplitMix31, 17, state33)
+        assert lis.getstate() == state
+
+    #-------------------------------------------------------------------------
+    def test_restore(self):
+        for prngClass in (LFib1340, Melg44497, Mrg49507, Well44497b, Xoroshiro256, Xoroshiro1024):
+            for compact in (False, True):
+                prng = prngClass(1)
+                prng.compact_state(compact)
+                checkpoint = prng.getstate()
+                values = list(prng.next_n(100))
+                assert checkpoint == prngClass(1).getstate()  # i.e. the checkpoint is not modified by the generator
+                for trusted in (True, False):
+                    prng.restore(checkpoint, trusted=trusted)
+                    assert prng.getstate() == checkpoint
+                    assert isinstance(prng._state, array) == (prng._stateTypecode is not None)
+                    assert list(prng.next_n(100)) == values
+
+        lis = ListIndexState(SplitMix31, 17, 1)
+        state = ([i+1 for i in range(17)], 16)
+        lis.restore(state)
+        assert lis.getstate() == state
+        assert lis._state is not state[0]
+        with pytest.raises(ValueError):
+            lis.restore(([-1] * 17, 16), trusted=False)
+
+    #-------------------------------------------------------------------------
+    def test_compact_state(self):
+        lis = ListIndexState(SplitMix31, 17, 1)
+        assert lis._stateTypecode is None
+        assert isinstance(lis._state, list)
+        state = lis.getstate()
+        lis.compact_state()
+        assert lis._stateTypecode == 'I'
+        assert isinstance(lis._state, array)
+        assert lis.getstate() == state
+        assert isinstance(lis.getstate()[0], list)
+        lis.compact_state(False)
+        assert lis._stateTypecode is None
+        assert isinstance(lis._state, list)
+        assert lis.getstate() == state
+
+        for prngClass, typecode in ((Well44497b, 'I'), (Mrg49507, 'I'), (Melg44497, 'Q'), (LFib1340, 'Q')):
+            prng = prngClass(0x0123_4567_89ab_cdef)
+            ref = prngClass(0x0123_4567_89ab_cdef)
+            prng.compact_state()
+            assert prng._state.typecode == typecode  # type: ignore
+            assert [prng.next() for _ in range(1_000)] == [ref.next() for _ in range(1_000)]
+            assert list(prng.next_n(3_000)) == list(ref.next_n(3_000))
+            assert prng.getstate() == ref.getstate()
+
+            # getstate() and setstate() round-trips
+            other = prngClass(prng.getstate())
+            assert isinstance(other._state, list)
+            assert other.getstate() == ref.getstate()
+            prng.setstate(prngClass(1).getstate())
+            assert isinstance(prng._state, array)
+            assert prng.getstate() == prngClass(1).getstate()
+            prng.setstate((array(typecode, ref.getstate()[0]), ref.getstate()[1]))  # type: ignore
+            assert prng.getstate() == ref.getstate()
+            prng.seed(2)
+            assert isinstance(prng._state, array)
+            assert prng.getstate() == prngClass(2).getstate()
+            ref.seed(2)
+
+            # jumps and spawned children
+            if prngClass in (Well44497b, Melg44497):
+                prng.jump(1_000)
+                ref.jump(1_000)
+            else:
+                prng.advance(100_000)
+                ref.advance(100_000)
+            assert isinstance(prng._state, array)
+            assert prng.getstate() == ref.getstate()
+            children = prng.spawn(2)
+            assert all(isinstance(child._state, array) for child in children)
+            assert [child.getstate() for child in children] == [child.getstate() for child in ref.spawn(2)]
+            assert all(isinstance(child._state, list) for child in ref.spawn(1))
+
+        # the small internal states of the Xoroshiros are kept in lists
+        for prngClass in (Xoroshiro256, Xoroshiro1024):
+            prng = prngClass(0x0123_4567_89ab_cdef)
+            prng.compact_state()
+            assert prng._stateTypecode is None
+            assert isinstance(prng._state, list)
+            assert prng.getstate() == prngClass(0x0123_4567_89ab_cdef).getstate()
@@ -141,12 +141,10 @@ class TestMelg19937:
         assert melg.gauss_next is None  # type: ignore
         assert melg._state == [i for i in range(TestMelg19937.Melg19937_STATE_SIZE)]  # type: ignore
 
-        with pytest.raises(TypeError):
-            # due to unhashable lists bug in Python 3.10
-            melg = Melg19937(list(i+10 for i in range(TestMelg19937.Melg19937_STATE_SIZE)))  # type: ignore
-            assert melg._index == 0
-            assert melg.gauss_next is None  # type: ignore
-            assert melg._state == list(i+10 for i in range(TestMelg19937.Melg19937_STATE_SIZE))  # type: ignore
+        melg = Melg19937(list(i+10 for i in range(TestMelg19937.Melg19937_STATE_SIZE)))  # type: ignore
+        assert melg._index == 0
+        assert melg.gauss_next is None  # type: ignore
+        assert melg._state == list(i+10 for i in range(TestMelg19937.Melg19937_STATE_SIZE))  # type: ignore
 
         with pytest.raises(TypeError):
             melg = Melg19937((1, 2, 3))  # type: ignore
@@ -185,6 +183,35 @@ class TestMelg19937:
         assert melg._state[278] == 0xd049b13564d10022
         assert melg._state[311] == 0x221c86a9577b017c
 
+    #-------------------------------------------------------------------------
+    def test_next_n(self):
+        melg = Melg19937(0x0123_4567_89ab_cdef)
+        melg_ref = Melg19937(0x0123_4567_89ab_cdef)
+        values = melg.next_n(3_000)
+        assert values.typecode == 'Q'  # type: ignore
+        assert list(values) == [melg_ref.next() for _ in range(3_000)]
+        assert melg.getstate() == melg_ref.getstate()
+
+        assert len(melg.next_n(0)) == 0
+        with pytest.raises(AssertionError):
+            melg.next_n(-1)
+
+    #-------------------------------------------------------------------------
+    def test_jump(self):
+        for n in (0, 1, 5, 100, 19971):
+            melg = Melg19937(0x0123_4567_89ab_cdef)
+            melg_ref = Melg19937(0x0123_4567_89ab_cdef)
+            melg.next_n(7)
+            melg_ref.next_n(7 + n)
+            melg.jump(n)
+            assert melg._f2state() == melg_ref._f2state()
+            assert melg.next_n(100) == melg_ref.next_n(100)
+
+        with pytest.raises(TypeError):
+            melg.jump(1.0)  # type: ignore
+        with pytest.raises(ValueError):
+            melg.jump(-1)
+
     #-------------------------------------------------------------------------
     def test_seed(self):
         melg = Melg19937()
@@ -143,12 +143,10 @@ class TestMrg1457:
         assert mrg.gauss_next is None  # type: ignore
         assert mrg._state == [i for i in range(TestMrg1457.Mrg1457_STATE_SIZE)]  # type: ignore
 
-        with pytest.raises(TypeError):
-            # due to unhashable lists bug in Python 3.10
-            mrg = Mrg1457(list(i+10 for i in range(TestMrg1457.Mrg1457_STATE_SIZE)))  # type: ignore
-            assert mrg._index == 0
-            assert mrg.gauss_next is None  # type: ignore
-            assert mrg._state == list(i+10 for i in range(TestMrg1457.Mrg1457_STATE_SIZE))  # type: ignore
+        mrg = Mrg1457(list(i+10 for i in range(TestMrg1457.Mrg1457_STATE_SIZE)))  # type: ignore
+        assert mrg._index == 0
+        assert mrg.gauss_next is None  # type: ignore
+        assert mrg._state == list(i+10 for i in range(TestMrg1457.Mrg1457_STATE_SIZE))  # type: ignore
 
         with pytest.raises(TypeError):
             mrg = Mrg1457((1, 2, 3))  # type: ignore
@@ -188,6 +186,44 @@ class TestMrg1457:
         assert mrg._state[37] == 0x1efd7e94
         assert mrg._state[44] == 0x532cd602
 
+    #-------------------------------------------------------------------------
+    def test_next_n(self):
+        mrg = Mrg1457(0x0123_4567_89ab_cdef)
+        mrg_ref = Mrg1457(0x0123_4567_89ab_cdef)
+        values = mrg.next_n(3_000)
+        assert values.typecode == 'I'  # type: ignore
+        assert list(values) == [mrg_ref.next() for _ in range(3_000)]
+        assert mrg.getstate() == mrg_ref.getstate()
+
+        assert len(mrg.next_n(0)) == 0
+        with pytest.raises(AssertionError):
+            mrg.next_n(-1)
+
+    #-------------------------------------------------------------------------
+    def test_advance(self):
+        for delta in (0, 1, 46, 47, 48, 358):
+            mrg = Mrg1457(0x0123_4567_89ab_cdef)
+            mrg_ref = Mrg1457(0x0123_4567_89ab_cdef)
+            mrg.next_n(3)
+            mrg_ref.next_n(3 + delta)
+            mrg.advance(delta)
+            assert mrg.getstate() == mrg_ref.getstate()
+            assert mrg.next_n(100) == mrg_ref.next_n(100)
+
+        mrg = Mrg1457(0x0123_4567_89ab_cdef)
+        mrg.advance(1_000_000_000_000)
+        assert mrg._index == 1_000_000_000_000 % 47
+        assert mrg.next() == 0x7a527612
+        mrg = Mrg1457(0x0123_4567_89ab_cdef)
+        mrg.advance(400_000_000_000)
+        mrg.advance(600_000_000_000)
+        assert mrg.next() == 0x7a527612
+
+        with pytest.raises(TypeError):
+            mrg.advance(1.0)  # type: ignore
+        with pytest.raises(ValueError):
+            mrg.advance(-1)
+
     #-------------------------------------------------------------------------
     def test_seed(self):
         mrg = Mrg1457()
@@ -0,0 +1,171 @@
+"""
+Copyright (c) 2025 Philippe Schmouker, ph (dot) schmouker (at) gmail.com
+
+Permission is hereby granted,  free of charge,  to any person obtaining a copy
+of this software and associated documentation files (the "Software"),  to deal
+in the Software without restriction, including  without  limitation the rights
+to use,  copy,  modify,  merge,  publish,  distribute, sublicense, and/or sell
+copies of the Software,  and  to  permit  persons  to  whom  the  Software  is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS",  WITHOUT WARRANTY OF ANY  KIND,  EXPRESS  OR
+IMPLIED,  INCLUDING  BUT  NOT  LIMITED  TO  THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT  SHALL  THE
+AUTHORS  OR  COPYRIGHT  HOLDERS  BE  LIABLE  FOR  ANY CLAIM,  DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT,  TORT OR OTHERWISE, ARISING FROM,
+OUT  OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+#=============================================================================
+import pytest
+import threading
+
+from PyRandLib.buffered     import Buffered
+from PyRandLib.cwg128       import Cwg128
+from PyRandLib.cwg64        import Cwg64
+from PyRandLib.fastrand32   import FastRand32
+from PyRandLib.threadlocal  import ThreadLocalRandom
+from PyRandLib.well44497b   import Well44497b
+from PyRandLib.xoroshiro256 import Xoroshiro256
+
+
+#=============================================================================
+class TestThreadLocalRandom:
+    """Tests class ThreadLocalRandom.
+    """
+
+    #-------------------------------------------------------------------------
+    def test_init(self):
+        tlr = ThreadLocalRandom(Xoroshiro256, 1)
+        assert isinstance(tlr.root, Xoroshiro256)
+        assert tlr.root.getstate() == Xoroshiro256(1).getstate()
+        assert tlr.threads_count == 0
+        assert tlr._OUT_BITS == 64
+        assert tlr._NORMALIZE == Xoroshiro256._NORMALIZE
+        assert tlr.gauss_next is None  # type: ignore
+
+        tlr = ThreadLocalRandom(lambda seed: Buffered(Cwg128(seed), 100), 1)
+        assert isinstance(tlr.root, Buffered)
+        assert tlr._OUT_BITS == 128
+
+        with pytest.raises(TypeError):
+            ThreadLocalRandom(1)  # type: ignore
+        with pytest.raises(TypeError):
+            ThreadLocalRandom(int, 1)  # type: ignore
+
+    #-------------------------------------------------------------------------
+    def test_next(self):
+        for factory in (Xoroshiro256, FastRand32, Cwg128, lambda seed: Buffered(Well44497b(seed), 100)):
+            tlr = ThreadLocalRandom(factory, 0x0123_4567_89ab_cdef)
+            ref = factory(0x0123_4567_89ab_cdef).spawn(1)[0]
+            assert [tlr.next() for _ in range(100)] == [ref.next() for _ in range(100)]
+            assert list(tlr.next_n(100)) == list(ref.next_n(100))
+            assert [tlr.random() for _ in range(100)] == [ref.random() for _ in range(100)]
+            assert [tlr.getrandbits(k) for k in range(0, 200, 7)] == [ref.getrandbits(k) for k in range(0, 200, 7)]
+            assert [tlr.gauss(1.0, 2.0) for _ in range(11)] == [ref.gauss(1.0, 2.0) for _ in range(11)]
+            assert [tlr(100) for _ in range(100)] == [ref(100) for _ in range(100)]
+            assert tlr.randbytes(100) == ref.randbytes(100)
+            assert tlr.threads_count == 1
+
+    #-------------------------------------------------------------------------
+    def test_threads(self):
+        def draw(tlr, results, index):
+            results[index] = [tlr.next() for _ in range(1_000)]
+
+        root = Xoroshiro256(1)
+        refs = [root.spawn(1)[0] for _ in range(8)]
+        expected = [[ref.next() for _ in range(1_000)] for ref in refs]
+
+        # the k-th thread gets the k-th spawned generator
+        tlr = ThreadLocalRandom(Xoroshiro256, 1)
+        results = [None] * 4
+        for index in range(4):
+            thread = threading.Thread(target=draw, args=(tlr, results, index))
+            thread.start()
+            thread.join()
+        assert results == expected[:4]
+        assert tlr.threads_count == 4
+
+        # concurrent threads each get their own generator
+        tlr = ThreadLocalRandom(Xoroshiro256, 1)
+        results = [None] * 8
+        threads = [threading.Thread(target=draw, args=(tlr, results, index)) for index in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert sorted(results) == sorted(expected)  # type: ignore
+        assert tlr.threads_count == 8
+
+        # the threads of CWGs run streams with distinct Weyl increments
+        def weyl(tlr, results, index):
+            tlr.next()
+            results[index] = tlr._local.prng._s
+        tlr = ThreadLocalRandom(Cwg64, 1)
+        results = [None] * 4
+        for index in range(4):
+            thread = threading.Thread(target=weyl, args=(tlr, results, index))
+            thread.start()
+            thread.join()
+        assert len(set(results)) == 4
+
+    #-------------------------------------------------------------------------
+    def test_getstate(self):
+        tlr = ThreadLocalRandom(Well44497b, 1)
+        ref = Well44497b(1).spawn(1)[0]
+        tlr.next_n(10)
+        ref.next_n(10)
+        assert tlr.getstate() == ref.getstate()
+
+        states = [None]
+        thread = threading.Thread(target=lambda: states.__setitem__(0, tlr.getstate()))
+        thread.start()
+        thread.join()
+        assert states[0] != tlr.getstate()
+
+    #-------------------------------------------------------------------------
+    def test_setstate(self):
+        tlr = ThreadLocalRandom(Xoroshiro256, 1)
+        ref = Xoroshiro256(0x0123_4567_89ab_cdef)
+        tlr.setstate(ref.getstate())
+        assert tlr.getstate() == ref.getstate()
+        assert [tlr.next() for _ in range(100)] == [ref.next() for _ in range(100)]
+        assert tlr.threads_count == 1
+
+    #-------------------------------------------------------------------------
+    def test_restore(self):
+        for trusted in (True, False):
+            tlr = ThreadLocalRandom(Well44497b, 1)
+            ref = Well44497b(0x0123_4567_89ab_cdef)
+            tlr.restore(ref.getstate(), trusted=trusted)
+            assert tlr.getstate() == ref.getstate()
+            assert [tlr.next() for _ in range(100)] == [ref.next() for _ in range(100)]
+
+    #-------------------------------------------------------------------------
+    def test_seed(self):
+        tlr = ThreadLocalRandom(FastRand32, 1)
+        tlr.next_n(10)
+        tlr.seed(0x0123_4567_89ab_cdef)
+        assert tlr.threads_count == 0
+        assert tlr.root.getstate() == FastRand32(0x0123_4567_89ab_cdef).getstate()
+        ref = FastRand32(0x0123_4567_89ab_cdef).spawn(1)[0]
+        assert [tlr.next() for _ in range(100)] == [ref.next() for _ in range(100)]
+        assert tlr.threads_count == 1
+
+    #-------------------------------------------------------------------------
+    def test_spawn(self):
+        tlr = ThreadLocalRandom(Xoroshiro256, 1)
+        tlr.next()
+        children = tlr.spawn(3)
+        refRoot = Xoroshiro256(1)
+        refRoot.spawn(1)
+        refChildren = refRoot.spawn(3)
+        assert [type(child) for child in children] == [ThreadLocalRandom] * 3
+        assert [child.root.getstate() for child in children] == [ref.getstate() for ref in refChildren]
+        assert [child.threads_count for child in children] == [0] * 3
+        assert [child.next() for child in children] == [ref.spawn(1)[0].next() for ref in refChildren]
+        assert tlr.root.getstate() == refRoot.getstate()
+        assert tlr.spawn(0) == []
@@ -71,8 +71,8 @@ class BaseLFib64( ListIndexState ):
       print( rand(a) )    # prints a pseudo-random value within [0, a) or [0.0, a) depending on the type of a
       print( rand(a, n) ) # prints a list of n pseudo-random values each within [0, a)
     
-    Inheriting classes have to define class attribute '_STATE_SIZE'. See LFib78 for an
-    example.
+    Inheriting classes have to define class attributes '_STATE_SIZE' and '_LAGS'. See
+    LFib78 for an example.
 
     Reminder:
     We give you here below a copy of the table of tests for the LCGs that have 
@@ -131,6 +131,19 @@ class BaseLFib64( ListIndexState ):
             # since it internally calls self.setstate().
 
 
+    #-------------------------------------------------------------------------
+    def advance(self, _delta: int, /) -> None:
+        """Advances the internal state of this generator _delta steps ahead.
+
+        The internal state is the one that _delta successive calls to next()
+        would have reached,  the index in the internal list included,  but
+        the jump costs about log2(_delta) squares of polynomials.  Inheriting
+        classes have to define class attribute '_LAGS',  the lags of their
+        recurrence. Raises ValueError if _delta is negative.
+        """
+        self._advancerecurrence( _delta, self._LAGS, 1 << 64 )  # type: ignore
+
+
     #-------------------------------------------------------------------------
     def seed(self, _seed: Numerical = None, /) -> None:  # type: ignore
         """Initiates the internal state of this pseudo-random generator.
@@ -22,7 +22,7 @@ SOFTWARE.
 
 #=============================================================================
 from .baserandom       import BaseRandom
-from .annotation_types import Numerical, SeedStateType
+from .annotation_types import Numerical, SeedStateType, StatesList
 
 
 #=============================================================================
@@ -106,15 +106,31 @@ class BasePCG( BaseRandom ):
             
  
     #-------------------------------------------------------------------------
-    def getstate(self) -> int:  # type: ignore
+    def getstate(self) -> StatesList:  # type: ignore
         """Returns an object capturing the current internal state of the generator.
         
         This object can be passed to setstate() to restore the state.
-        For PCG,  the state is defined with  a  single  integer,  'self._value',
-        which  has  to  be  used  in  methods 'random() and 'setstate() of every
-        inheriting class.
+        For PCG,  the state is defined with two integers,  'self._state' and
+        'self._inc',  which have to be used in methods 'next()' and 'setstate()'
+        of every inheriting class.  'self._inc' is the odd increment  of  the
+        LCG, i.e. it selects the stream of the generator.
         """
-        return self._state  # notice: attribute _state MUST be initialized in inheriting classes  # type: ignore
+        return (self._state, self._inc)  # notice: attributes _state and _inc MUST be initialized in inheriting classes  # type: ignore
+
+
+    #-------------------------------------------------------------------------
+    @classmethod
+    def _streaminc(cls, _stream: int, _default: int, _modMask: int, /) -> int:
+        """Evaluates the odd LCG increment that is associated with a stream index.
+
+        Useful for inheriting classes. Returns _default if _stream is None.
+        """
+        if _stream is None:
+            return _default
+        elif isinstance( _stream, int ):
+            return ((_stream << 1) | 1) & _modMask
+        else:
+            raise TypeError(f"stream index must be None or an int (currently is {type(_stream)})")
  
 
 #=====   end of module   basepcg.py   ========================================
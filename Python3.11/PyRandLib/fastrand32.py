@@ -21,6 +21,9 @@ SOFTWARE.
 """
 
 #=============================================================================
+from array  import array
+from typing import Final
+
 from .baselcg          import BaseLCG
 from .annotation_types import Numerical
 from .splitmix         import SplitMix32
@@ -85,6 +88,12 @@ class FastRand32( BaseLCG ):
     should definitively pass.
     """
 
+    #-------------------------------------------------------------------------
+    _A: Final[int] = 0x1_0dcd  # LCG mult. attribute
+    _C: Final[int] = 1  # LCG add. attribute
+    _MODULO: Final[int] = 0xffff_ffff  # optimization here to get modulo via operator &
+
+
     #-------------------------------------------------------------------------
     def next(self) -> int:
         """This is the core of the pseudo-random generator.
@@ -93,6 +102,19 @@ class FastRand32( BaseLCG ):
         return self._state
 
 
+    #-------------------------------------------------------------------------
+    def next_n(self, count: int, /) -> array:
+        """Returns the next count pseudo-random values, as would count calls to next().
+        """
+        assert count >= 0, "the count of generated values must not be negative"
+        state = self._state
+        values = [0] * count
+        for n in range(count):
+            values[n] = state = (0x1_0dcd * state + 1) & 0xffff_ffff
+        self._state = state
+        return array('I', values)
+
+
     #-------------------------------------------------------------------------
     def seed(self, _seed: Numerical = None, /) -> None:  # type: ignore
         """Initiates the internal state of this pseudo-random generator.
@@ -21,6 +21,7 @@ SOFTWARE.
 """
 
 #=============================================================================
+from array  import array
 from typing import Final
 
 from .baselcg          import BaseLCG
@@ -107,6 +108,10 @@ class FastRand63( BaseLCG ):
     than 32 bits.
     """
 
+    _A: Final[int] = 0x7ff3_19fa_a77b_e975  # LCG mult. attribute
+    _C: Final[int] = 1  # LCG add. attribute
+    _MODULO: Final[int] = 0x7fff_ffff_ffff_ffff  # optimization here to get modulo via operator &
+
 
     #-------------------------------------------------------------------------
     def next(self) -> int:
@@ -116,6 +121,19 @@ class FastRand63( BaseLCG ):
         return self._state
 
 
+    #-------------------------------------------------------------------------
+    def next_n(self, count: int, /) -> array:
+        """Returns the next count pseudo-random values, as would count calls to next().
+        """
+        assert count >= 0, "the count of generated values must not be negative"
+        state = self._state
+        values = [0] * count
+        for n in range(count):
+            values[n] = state = (0x7ff3_19fa_a77b_e975 * state + 1) & 0x7fff_ffff_ffff_ffff
+        self._state = state
+        return array('Q', values)
+
+
     #-------------------------------------------------------------------------
     def seed(self, _seed: Numerical = None, /) -> None:  # type: ignore
         """Initiates the internal state of this pseudo-random generator.
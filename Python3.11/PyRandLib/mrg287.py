@@ -21,6 +21,9 @@ SOFTWARE.
 """
 
 #=============================================================================
+from array  import array
+from typing import Final
+
 from .basemrg          import BaseMRG
 from .annotation_types import SeedStateType
 from .splitmix         import SplitMix32
@@ -115,6 +118,11 @@ class Mrg287( BaseMRG ):
     should definitively pass.
     """
 
+    #-------------------------------------------------------------------------
+    _LAGS: Final[tuple[int, ...]] = (55, 119, 179, 256)  # lags of the recurrence
+    _MODULO: Final[int] = 1 << 32  # modulo of the recurrence
+
+
     #-------------------------------------------------------------------------
     def __init__(self, _seed: SeedStateType = None, /) -> None:  # type: ignore
         """Constructor.
@@ -130,27 +138,53 @@ class Mrg287( BaseMRG ):
     def next(self) -> int:
         """This is the core of the pseudo-random generator.
         """
+        state = self._state  # notice: the local binding speeds up the accesses to the internal state
+        i = self._index
         # The Marsa-LIBF4 version uses the recurrence
         #    x(i) = (x(i-55) + x(i-119) + x(i-179) + x(i-256)) mod 2^32
 
         # evaluates indexes in suite for the i-55, i-119, i-179 (and i-256) -th values
-        if (k55 := self._index-55) < 0:
+        if (k55 := i - 55) < 0:
             k55 += self._STATE_SIZE  # notice: attribute _STATE_SIZE is set in base class
         
-        if (k119 := self._index-119) < 0:
+        if (k119 := i - 119) < 0:
             k119 += self._STATE_SIZE
         
-        if (k179 := self._index-179) < 0:
+        if (k179 := i - 179) < 0:
             k179 += self._STATE_SIZE
         
         # then evaluates current value
-        self._state[self._index] = (myValue := (self._state[k55] + self._state[k119] + self._state[k179] + self._state[self._index]) & 0xffff_ffff)  # type: ignore
+        state[i] = (myValue := (state[k55] + state[k119] + state[k179] + state[i]) & 0xffff_ffff)  # type: ignore
         
         # next index
-        self._index = (self._index + 1) % self._STATE_SIZE
+        self._index = (i + 1) % self._STATE_SIZE
         
         # then returns the integer generated value
         return  myValue
 
 
+    #-------------------------------------------------------------------------
+    def next_n(self, count: int, /) -> array:
+        """Returns the next count pseudo-random values, as would count calls to next().
+        """
+        assert count >= 0, "the count of generated values must not be negative"
+        state = self._state
+        i = self._index
+        values = [0] * count
+        for n in range(count):
+            # evaluates indexes in suite for the i-55, i-119, i-179 (and i-256) -th values
+            if (k55 := i - 55) < 0:
+                k55 += 256
+            if (k119 := i - 119) < 0:
+                k119 += 256
+            if (k179 := i - 179) < 0:
+                k179 += 256
+            # then evaluates current value
+            values[n] = state[i] = (state[k55] + state[k119] + state[k179] + state[i]) & 0xffff_ffff
+            # next index
+            i = (i + 1) & 0xff
+        self._index = i
+        return array('I', values)
+
+
 #=====   end of module   mrgrand287.py   ==================================
@@ -21,6 +21,13 @@ SOFTWARE.
 """
 
 #=============================================================================
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
 from .basesquares      import BaseSquares
 from .annotation_types import SeedStateType, StatesList
 
@@ -108,4 +115,62 @@ class Squares32( BaseSquares ):
         return ((x * x + z) & 0xffff_ffff_ffff_ffff) >> 32
 
 
+    #-------------------------------------------------------------------------
+    def next_n(self, count: int, /) -> array:
+        """Returns the next count pseudo-random values, as would count calls to next().
+        """
+        assert count >= 0, "the count of generated values must not be negative"
+        counter, key = self._counter, self._key
+        values = [0] * count
+        for n in range(count):
+            counter = (counter + 1) & 0xffff_ffff_ffff_ffff
+            y = x = (counter * key) & 0xffff_ffff_ffff_ffff
+            z = (y + key) & 0xffff_ffff_ffff_ffff
+            # round 1
+            x = (x * x + y) & 0xffff_ffff_ffff_ffff
+            x = (x >> 32) | ((x & 0xffff_ffff) << 32)
+            # round 2
+            x = (x * x + z) & 0xffff_ffff_ffff_ffff
+            x = (x >> 32) | ((x & 0xffff_ffff) << 32)
+            # round 3
+            x = (x * x + y) & 0xffff_ffff_ffff_ffff
+            x = (x >> 32) | ((x & 0xffff_ffff) << 32)
+            # round 4
+            values[n] = ((x * x + z) & 0xffff_ffff_ffff_ffff) >> 32
+        self._counter = counter
+        return array('I', values)
+
+
+    #-------------------------------------------------------------------------
+    def next_array(self, n: int, /) -> 'np.ndarray | array':  # type: ignore
+        """Returns the next n pseudo-random values in a numpy array of uint32.
+
+        Same values as n successive calls to next(),  all evaluated at once
+        with numpy vectorized arithmetic on unsigned 64-bits integers. They
+        wrap around modulo 2^64 just as do the scalar computations. Internal
+        counter is advanced by n. Should numpy not be available, this method 
+        falls back on method next_n().
+        """
+        assert n >= 0, "the count of generated values must not be negative"
+        if np is None:
+            return self.next_n( n )
+
+        key = np.uint64( self._key )
+        half = np.uint64( 32 )
+        y = x = (np.arange(1, n + 1, dtype=np.uint64) + np.uint64(self._counter)) * key
+        z = y + key
+        self._counter = (self._counter + n) & 0xffff_ffff_ffff_ffff
+        # round 1
+        x = x * x + y
+        x = (x >> half) | (x << half)
+        # round 2
+        x = x * x + z
+        x = (x >> half) | (x << half)
+        # round 3
+        x = x * x + y
+        x = (x >> half) | (x << half)
+        # round 4
+        return ((x * x + z) >> half).astype( np.uint32 )
+
+
 #=====   end of module   squares32.py   ======================================
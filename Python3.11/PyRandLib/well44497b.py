@@ -21,6 +21,7 @@ SOFTWARE.
 """
 
 #=============================================================================
+from array  import array
 from .basewell         import BaseWELL
 from .annotation_types import SeedStateType
 
@@ -123,6 +124,7 @@ class Well44497b( BaseWELL ):
     def next(self) -> int:
         """This is the core of the pseudo-random generator.
         """
+        state = self._state  # notice: the local binding speeds up the accesses to the internal state
         match (i := self._index):
             case 0:
                 i_1, i_2 = 1390, 1389
@@ -133,15 +135,50 @@ class Well44497b( BaseWELL ):
             case _:
                 i_1, i_2 = i-1, i-2
 
-        z0 = (self._state[i_1] & 0x0001_ffff) ^ (self._state[i_2] & 0xfffe_0000)  # type: ignore
-        z1 = BaseWELL._M3_neg(self._state[i], 24) ^ BaseWELL._M3_pos(self._state[(i + 23) % 1391], 30)  # type: ignore
-        z2 = BaseWELL._M3_neg(self._state[(i + 481) % 1391], 10) ^ BaseWELL._M2_neg(self._state[(i + 229) % 1391], 26)  # type: ignore
+        z0 = (state[i_1] & 0x0001_ffff) ^ (state[i_2] & 0xfffe_0000)  # type: ignore
+        z1 = BaseWELL._M3_neg(state[i], 24) ^ BaseWELL._M3_pos(state[(i + 23) % 1391], 30)  # type: ignore
+        z2 = BaseWELL._M3_neg(state[(i + 481) % 1391], 10) ^ BaseWELL._M2_neg(state[(i + 229) % 1391], 26)  # type: ignore
 
-        self._state[i] = (z3 := z1 ^ z2)
-        self._state[i_1] = z0 ^ BaseWELL._M3_pos(z1, 20) ^ BaseWELL._M6(z2, 9, 14, 5, BaseWELL._a7) ^ z3
+        state[i] = (z3 := z1 ^ z2)
+        state[i_1] = z0 ^ BaseWELL._M3_pos(z1, 20) ^ BaseWELL._M6(z2, 9, 14, 5, BaseWELL._a7) ^ z3
 
         self._index = i_1
         return BaseWELL._tempering(z3, 0x93dd_1400, 0xfa11_8000)
 
 
+    #-------------------------------------------------------------------------
+    def next_n(self, count: int, /) -> array:
+        """Returns the next count pseudo-random values, as would count calls to next().
+        """
+        assert count >= 0, "the count of generated values must not be negative"
+        state = self._state
+        i = self._index
+        a7 = self._a7
+        values = [0] * count
+        for n in range(count):
+            if i >= 2:
+                i_1, i_2 = i - 1, i - 2
+            elif i == 1:
+                i_1, i_2 = 0, 1390
+            else:
+                i_1, i_2 = 1390, 1389
+            z0 = (state[i_1] & 0x0001_ffff) ^ (state[i_2] & 0xfffe_0000)
+            # z1 = M3_neg(state[i], 24) ^ M3_pos(state[i+23], 30)
+            z1 = (u := state[i]) ^ ((u << 24) & 0xffff_ffff) ^ (v := state[(i + 23) % 1391]) ^ (v >> 30)
+            # z2 = M3_neg(state[i+481], 10) ^ M2_neg(state[i+229], 26)
+            z2 = (u := state[(i + 481) % 1391]) ^ ((u << 10) & 0xffff_ffff) ^ ((state[(i + 229) % 1391] << 26) & 0xffff_ffff)
+            state[i] = z3 = z1 ^ z2
+            # state[i-1] = z0 ^ M3_pos(z1, 20) ^ M6(z2, 9, 14, 5, a7) ^ z3
+            m6 = (((z2 << 9) & 0xffff_ffff) ^ (z2 >> 23)) & 0xffff_ffdf
+            if z2 & 0x4000:
+                m6 ^= a7
+            state[i_1] = z0 ^ (z1 ^ (z1 >> 20)) ^ m6 ^ z3
+            # tempering
+            z3 ^= ((z3 << 7) & 0xffff_ffff) & 0x93dd_1400
+            values[n] = z3 ^ (((z3 << 15) & 0xffff_ffff) & 0xfa11_8000)
+            i = i_1
+        self._index = i
+        return array('I', values)
+
+
 #=====   end of module   Well44497b.py   =====================================
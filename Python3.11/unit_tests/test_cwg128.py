@@ -159,6 +159,19 @@ class TestCwg128:
         assert cwg._s == 0x157a3807a48faa9dd573529b34a1d093
         assert cwg._state == 0x4e21c10a0b2187a97ab330efe719487b
 
+    #-------------------------------------------------------------------------
+    def test_next_n(self):
+        cwg = Cwg128(0x0123_4567_89ab_cdef)
+        cwg_ref = Cwg128(0x0123_4567_89ab_cdef)
+        values = cwg.next_n(3_000)
+        assert isinstance(values, list)
+        assert list(values) == [cwg_ref.next() for _ in range(3_000)]
+        assert cwg.getstate() == cwg_ref.getstate()
+
+        assert len(cwg.next_n(0)) == 0
+        with pytest.raises(AssertionError):
+            cwg.next_n(-1)
+
     #-------------------------------------------------------------------------
     def test_seed(self):  # Notice: tests seed() and _seed() also
         cwg = Cwg128()
@@ -265,3 +278,25 @@ class TestCwg128:
             cwg.setstate([11, 12, 13.1, 14])  # type: ignore
         with pytest.raises(ValueError):
             cwg.setstate((21, 22, 23, -24))  # type: ignore
+
+    #-------------------------------------------------------------------------
+    def test_spawn(self):
+        cwg = Cwg128(0x0123_4567_89ab_cdef)
+        s = cwg._s
+        children = cwg.spawn(4)
+        for child in children:
+            assert type(child) is Cwg128
+            assert child._s & 1 == 1
+            assert child._s <= (1 << 128) - 1
+        assert [child.getstate() for child in Cwg128(0x0123_4567_89ab_cdef).spawn(4)] == [child.getstate() for child in children]
+
+        # the Weyl increments remain distinct over repeated and nested spawns
+        children += cwg.spawn(1) + cwg.spawn(1) + children[0].spawn(2) + children[1].spawn(1)[0].spawn(1)
+        assert len({child._s for child in children} | {s}) == 10
+        assert cwg._s == s
+        assert cwg.spawn(0) == []
+
+        with pytest.raises(TypeError):
+            cwg.spawn('4')  # type: ignore
+        with pytest.raises(ValueError):
+            cwg.spawn(-4)
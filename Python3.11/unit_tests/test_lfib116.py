@@ -182,6 +182,44 @@ class TestLFib116:
         assert lfib._state[44] == 0xa659ac05d6767b6f
         assert lfib._state[54] == 0xfadc7d62c4f8c2f9
 
+    #-------------------------------------------------------------------------
+    def test_next_n(self):
+        lfib = LFib116(0x0123_4567_89ab_cdef)
+        lfib_ref = LFib116(0x0123_4567_89ab_cdef)
+        values = lfib.next_n(3_000)
+        assert values.typecode == 'Q'  # type: ignore
+        assert list(values) == [lfib_ref.next() for _ in range(3_000)]
+        assert lfib.getstate() == lfib_ref.getstate()
+
+        assert len(lfib.next_n(0)) == 0
+        with pytest.raises(AssertionError):
+            lfib.next_n(-1)
+
+    #-------------------------------------------------------------------------
+    def test_advance(self):
+        for delta in (0, 1, 54, 55, 56, 398):
+            lfib = LFib116(0x0123_4567_89ab_cdef)
+            lfib_ref = LFib116(0x0123_4567_89ab_cdef)
+            lfib.next_n(3)
+            lfib_ref.next_n(3 + delta)
+            lfib.advance(delta)
+            assert lfib.getstate() == lfib_ref.getstate()
+            assert lfib.next_n(100) == lfib_ref.next_n(100)
+
+        lfib = LFib116(0x0123_4567_89ab_cdef)
+        lfib.advance(1_000_000_000_000)
+        assert lfib._index == 1_000_000_000_000 % 55
+        assert lfib.next() == 0xdbb7c1c47bb16f1c
+        lfib = LFib116(0x0123_4567_89ab_cdef)
+        lfib.advance(400_000_000_000)
+        lfib.advance(600_000_000_000)
+        assert lfib.next() == 0xdbb7c1c47bb16f1c
+
+        with pytest.raises(TypeError):
+            lfib.advance(1.0)  # type: ignore
+        with pytest.raises(ValueError):
+            lfib.advance(-1)
+
     #-------------------------------------------------------------------------
     def test_seed(self):
         lfib = LFib116()
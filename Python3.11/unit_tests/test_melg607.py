@@ -182,6 +182,47 @@ class TestMelg607:
         assert melg._state[8] == 0xf984db4ef14fde1b
         assert melg._state[9] == 0xa719a436712eacad
 
+    #-------------------------------------------------------------------------
+    def test_next_n(self):
+        melg = Melg607(0x0123_4567_89ab_cdef)
+        melg_ref = Melg607(0x0123_4567_89ab_cdef)
+        values = melg.next_n(3_000)
+        assert values.typecode == 'Q'  # type: ignore
+        assert list(values) == [melg_ref.next() for _ in range(3_000)]
+        assert melg.getstate() == melg_ref.getstate()
+
+        assert len(melg.next_n(0)) == 0
+        with pytest.raises(AssertionError):
+            melg.next_n(-1)
+
+    #-------------------------------------------------------------------------
+    def test_jump(self):
+        for n in (0, 1, 5, 100, 643):
+            melg = Melg607(0x0123_4567_89ab_cdef)
+            melg_ref = Melg607(0x0123_4567_89ab_cdef)
+            melg.next_n(7)
+            melg_ref.next_n(7 + n)
+            melg.jump(n)
+            assert melg._f2state() == melg_ref._f2state()
+            assert melg.next_n(100) == melg_ref.next_n(100)
+
+        # jumps of 2^64 and 2^128 steps are provided in directory 'jumppolys'
+        melg = Melg607(0x0123_4567_89ab_cdef)
+        melg_ref = Melg607(0x0123_4567_89ab_cdef)
+        melg.jump(1 << 64)
+        melg_ref.jump(1 << 63)
+        melg_ref.jump(1 << 63)
+        assert melg._f2state() == melg_ref._f2state()
+        melg.jump((1 << 128) - (1 << 64))
+        melg_ref = Melg607(0x0123_4567_89ab_cdef)
+        melg_ref.jump(1 << 128)
+        assert melg._f2state() == melg_ref._f2state()
+
+        with pytest.raises(TypeError):
+            melg.jump(1.0)  # type: ignore
+        with pytest.raises(ValueError):
+            melg.jump(-1)
+
     #-------------------------------------------------------------------------
     def test_seed(self):
         melg = Melg607()
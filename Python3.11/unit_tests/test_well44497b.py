@@ -187,6 +187,35 @@ class TestWell44497b:
         wll.next()
         assert wll._index == 0
 
+    #-------------------------------------------------------------------------
+    def test_next_n(self):
+        wll = Well44497b(0x0123_4567_89ab_cdef)
+        wll_ref = Well44497b(0x0123_4567_89ab_cdef)
+        values = wll.next_n(3_000)
+        assert values.typecode == 'I'  # type: ignore
+        assert list(values) == [wll_ref.next() for _ in range(3_000)]
+        assert wll.getstate() == wll_ref.getstate()
+
+        assert len(wll.next_n(0)) == 0
+        with pytest.raises(AssertionError):
+            wll.next_n(-1)
+
+    #-------------------------------------------------------------------------
+    def test_jump(self):
+        for n in (0, 1, 5, 100, 44515):
+            wll = Well44497b(0x0123_4567_89ab_cdef)
+            wll_ref = Well44497b(0x0123_4567_89ab_cdef)
+            wll.next_n(7)
+            wll_ref.next_n(7 + n)
+            wll.jump(n)
+            assert wll._f2state() == wll_ref._f2state()
+            assert wll.next_n(100) == wll_ref.next_n(100)
+
+        with pytest.raises(TypeError):
+            wll.jump(1.0)  # type: ignore
+        with pytest.raises(ValueError):
+            wll.jump(-1)
+
     #-------------------------------------------------------------------------
     def test_seed(self):
         wll = Well44497b()
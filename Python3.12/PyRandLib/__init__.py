@@ -6,7 +6,9 @@ Please see files README.md and LICENSE.
 Copyright (c) 2016-2025 Philippe Schmouker, ph (dot) schmouker (at) gmail.com
 """
 
+from .asyncstream    import AsyncRandomStream
 from .basecwg        import BaseCWG
+from .basef2linear   import BaseF2Linear
 from .baselcg        import BaseLCG
 from .baselfib64     import BaseLFib64
 from .basemelg       import BaseMELG
@@ -15,9 +17,11 @@ from .baserandom     import BaseRandom
 from .basesquares    import BaseSquares
 from .basewell       import BaseWELL
 from .basexoroshiro  import BaseXoroshiro
+from .buffered       import Buffered
 from .cwg64          import Cwg64
 from .cwg128_64      import Cwg128_64
 from .cwg128         import Cwg128
+from .discretesampler import DiscreteSampler
 from .fastrand32     import FastRand32
 from .fastrand63     import FastRand63
 from .lfib78         import LFib78
@@ -30,11 +34,15 @@ from .melg44497      import Melg44497
 from .mrg287         import Mrg287
 from .mrg1457        import Mrg1457
 from .mrg49507       import Mrg49507
+from .numpybitgen    import NumpyBitGenerator
+from .parallel       import parallel_fill
 from .pcg64_32       import Pcg64_32
 from .pcg128_64      import Pcg128_64
 from .pcg1024_32     import Pcg1024_32
+from .prefetching    import PrefetchingRandom
 from .squares32      import Squares32
 from .squares64      import Squares64
+from .threadlocal    import ThreadLocalRandom
 from .well512a       import Well512a
 from .well1024a      import Well1024a
 from .well19937c     import Well19937c
@@ -21,15 +21,16 @@ SOFTWARE.
 """
 
 #=============================================================================
+from array  import array
 from typing import Final, override
 
-from .listindexstate   import ListIndexState
+from .basef2linear     import BaseF2Linear
 from .annotation_types import Numerical, SeedStateType, StateType
 from .splitmix         import SplitMix32
 
 
 #=============================================================================
-class BaseWELL( ListIndexState ):
+class BaseWELL( BaseF2Linear ):
     """Definition of the base class for all WELL pseudo-random generators.
     
     This module is part of library PyRandLib.
@@ -106,6 +107,10 @@ class BaseWELL( ListIndexState ):
     should definitively pass.
     """
     
+    #-------------------------------------------------------------------------
+    _WORD_BITS: Final[int] = 32  # count of bits of the integers in the internal state list
+
+
     #-------------------------------------------------------------------------
     def __init__(self, _stateSize: int, _seedState: SeedStateType = None, /) -> None:  # type: ignore
         """Constructor.
@@ -148,6 +153,31 @@ class BaseWELL( ListIndexState ):
         super().setstate(_state)
 
 
+    #-------------------------------------------------------------------------
+    @override
+    def _f2state(self) -> int:
+        """Returns the internal state of this generator packed in a single integer.
+
+        The integers of the internal state list are packed from the current
+        index on.
+        """
+        i = self._index
+        return int.from_bytes( array('I', self._state[i:] + self._state[:i]).tobytes(), 'little' )  # type: ignore
+
+
+    #-------------------------------------------------------------------------
+    @override
+    def _f2setstate(self, _f2state: int, /) -> None:
+        """Sets the internal state of this generator from a packed integer.
+
+        The integers of the internal state list are unpacked from the current
+        index on.
+        """
+        i = self._STATE_SIZE - self._index
+        words = array('I', _f2state.to_bytes(4 * self._STATE_SIZE, 'little')).tolist()
+        self._state = self._statewords( words[i:] + words[:i] )
+
+
     #-------------------------------------------------------------------------
     @classmethod
     def _M0(cls, x: int = None, /) -> int:  # type: ignore
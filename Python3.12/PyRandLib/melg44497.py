@@ -21,6 +21,7 @@ SOFTWARE.
 """
 
 #=============================================================================
+from array  import array
 from typing import override
 
 from .basemelg import BaseMELG
@@ -118,15 +119,40 @@ class Melg44497( BaseMELG ):
 
         Notice: the output value is coded on 64-bits.
         """
+        state = self._state  # notice: the local binding speeds up the accesses to the internal state
         i = self._index
         self._index = (i_1 := (i+1) % 695)
 
-        s695 = self._state[695]
-        x = (self._state[i] & 0xffff_8000_0000_0000) | (self._state[i_1] & 0x0000_7fff_ffff_ffff)  # notice: | instead of ^ as erroneously printed in [11]  # type: ignore
-        self._state[695] = (s695 := ((x >> 1) ^ Melg44497._A_COND[x & 0x01]) ^ self._state[(i+373) % 695] ^ (s695 ^ ((s695 << 37) & 0xffff_ffff_ffff_ffff)))  # type: ignore
+        s695 = state[695]
+        x = (state[i] & 0xffff_8000_0000_0000) | (state[i_1] & 0x0000_7fff_ffff_ffff)  # notice: | instead of ^ as erroneously printed in [11]  # type: ignore
+        state[695] = (s695 := ((x >> 1) ^ Melg44497._A_COND[x & 0x01]) ^ state[(i+373) % 695] ^ (s695 ^ ((s695 << 37) & 0xffff_ffff_ffff_ffff)))  # type: ignore
 
-        si = self._state[i] = x ^ (s695 ^ (s695 >> 14))
-        return (si ^ ((si << 6) & 0xffff_ffff_ffff_ffff)) ^ ((self._state[(i + 95) % 695]) & 0x06fb_bee2_9aae_fd91)  # type: ignore
+        si = state[i] = x ^ (s695 ^ (s695 >> 14))
+        return (si ^ ((si << 6) & 0xffff_ffff_ffff_ffff)) ^ ((state[(i + 95) % 695]) & 0x06fb_bee2_9aae_fd91)  # type: ignore
         
 
+
+    #-------------------------------------------------------------------------
+    @override
+    def next_n(self, count: int, /) -> array:
+        """Returns the next count pseudo-random values, as would count calls to next().
+        """
+        assert count >= 0, "the count of generated values must not be negative"
+        state = self._state
+        i = self._index
+        s695 = state[695]
+        aCond = Melg44497._A_COND
+        values = [0] * count
+        for n in range(count):
+            i_1 = (i + 1) % 695
+            x = (state[i] & 0xffff_8000_0000_0000) | (state[i_1] & 0x0000_7fff_ffff_ffff)
+            s695 = ((x >> 1) ^ aCond[x & 0x01]) ^ state[(i + 373) % 695] ^ (s695 ^ ((s695 << 37) & 0xffff_ffff_ffff_ffff))
+            si = state[i] = x ^ (s695 ^ (s695 >> 14))
+            values[n] = (si ^ ((si << 6) & 0xffff_ffff_ffff_ffff)) ^ (state[(i + 95) % 695] & 0x06fb_bee2_9aae_fd91)
+            i = i_1
+        state[695] = s695  # notice: never read in the loop, so set once after it
+        self._index = i
+        return array('Q', values)
+
+
 #=====   end of module   melg44977.py   ======================================
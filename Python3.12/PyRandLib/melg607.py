@@ -21,6 +21,7 @@ SOFTWARE.
 """
 
 #=============================================================================
+from array  import array
 from typing import override
 
 from .basemelg import BaseMELG
@@ -118,15 +119,39 @@ class Melg607( BaseMELG ):
 
         Notice: the output value is coded on 64-bits.
         """
+        state = self._state  # notice: the local binding speeds up the accesses to the internal state
         i = self._index
         self._index = (i_1 := (i+1) % 9)
 
-        s9 = self._state[9]
-        x = (self._state[i] & 0xffff_ffff_8000_0000) | (self._state[i_1] & 0x0000_0000_7fff_ffff)  # notice: | instead of ^ as erroneously printed in [11]  # type: ignore
-        self._state[9] = (s9 := ((x >> 1) ^ Melg607._A_COND[x & 0x01]) ^ self._state[(i+5) % 9] ^ (s9 ^ ((s9 << 13) & 0xffff_ffff_ffff_ffff)))  # type: ignore
+        s9 = state[9]
+        x = (state[i] & 0xffff_ffff_8000_0000) | (state[i_1] & 0x0000_0000_7fff_ffff)  # notice: | instead of ^ as erroneously printed in [11]  # type: ignore
+        state[9] = (s9 := ((x >> 1) ^ Melg607._A_COND[x & 0x01]) ^ state[(i+5) % 9] ^ (s9 ^ ((s9 << 13) & 0xffff_ffff_ffff_ffff)))  # type: ignore
 
-        si = self._state[i] = x ^ (s9 ^ (s9 >> 35))
-        return (si ^ ((si << 30) & 0xffff_ffff_ffff_ffff)) ^ ((self._state[(i + 3) % 9]) & 0x66ed_c62a_6bf8_c826)  # type: ignore
+        si = state[i] = x ^ (s9 ^ (s9 >> 35))
+        return (si ^ ((si << 30) & 0xffff_ffff_ffff_ffff)) ^ ((state[(i + 3) % 9]) & 0x66ed_c62a_6bf8_c826)  # type: ignore
+
+
+    #-------------------------------------------------------------------------
+    @override
+    def next_n(self, count: int, /) -> array:
+        """Returns the next count pseudo-random values, as would count calls to next().
+        """
+        assert count >= 0, "the count of generated values must not be negative"
+        state = self._state
+        i = self._index
+        s9 = state[9]
+        aCond = Melg607._A_COND
+        values = [0] * count
+        for n in range(count):
+            i_1 = (i + 1) % 9
+            x = (state[i] & 0xffff_ffff_8000_0000) | (state[i_1] & 0x0000_0000_7fff_ffff)
+            s9 = ((x >> 1) ^ aCond[x & 0x01]) ^ state[(i + 5) % 9] ^ (s9 ^ ((s9 << 13) & 0xffff_ffff_ffff_ffff))
+            si = state[i] = x ^ (s9 ^ (s9 >> 35))
+            values[n] = (si ^ ((si << 30) & 0xffff_ffff_ffff_ffff)) ^ (state[(i + 3) % 9] & 0x66ed_c62a_6bf8_c826)
+            i = i_1
+        state[9] = s9  # notice: never read in the loop, so set once after it
+        self._index = i
+        return array('Q', values)
 
 
 #=====   end of module   melg607.py   ========================================
@@ -21,6 +21,7 @@ SOFTWARE.
 """
 
 #=============================================================================
+from array  import array
 from typing import override
 
 from .basewell         import BaseWELL
@@ -126,16 +127,17 @@ class Well1024a( BaseWELL ):
     def next(self) -> int:
         """This is the core of the pseudo-random generator.
         """
-        z0 = self._state[(i_1 :=((i := self._index) - 1) & 0x1f)]
+        state = self._state  # notice: the local binding speeds up the accesses to the internal state
+        z0 = state[(i_1 :=((i := self._index) - 1) & 0x1f)]
             # notice:  all blocks of bits in the internal state are 32 bits wide, which leads to a great 
             # simplification for the implementation of the generic WELL algorithm when evaluating z0.
-        z1 = self._state[i] ^ BaseWELL._M3_pos(self._state[(i + 3) & 0x1f], 8)  # type: ignore
+        z1 = state[i] ^ BaseWELL._M3_pos(state[(i + 3) & 0x1f], 8)  # type: ignore
             # notice: the transformation applied to self._state[i] for Well1024a
             # is the identity which leads to simplification also
-        z2 = BaseWELL._M3_neg(self._state[(i + 24) & 0x1f], 19) ^ BaseWELL._M3_neg(self._state[(i + 10) & 0x1f], 14)  # type: ignore
+        z2 = BaseWELL._M3_neg(state[(i + 24) & 0x1f], 19) ^ BaseWELL._M3_neg(state[(i + 10) & 0x1f], 14)  # type: ignore
         
-        self._state[i] = (z3 := z1 ^ z2)
-        self._state[i_1] = BaseWELL._M3_neg(z0, 11) ^ BaseWELL._M3_neg(z1, 7) ^ BaseWELL._M3_neg(z2, 13)  # type: ignore
+        state[i] = (z3 := z1 ^ z2)
+        state[i_1] = BaseWELL._M3_neg(z0, 11) ^ BaseWELL._M3_neg(z1, 7) ^ BaseWELL._M3_neg(z2, 13)  # type: ignore
             # notice: the last term of the above equation in the WELL generic algorithm is, for its Well1024a
             # version, the zero matrix _M0 which we suppress here for calculations optimization purpose
 
@@ -143,4 +145,28 @@ class Well1024a( BaseWELL ):
         return z3
 
 
+    #-------------------------------------------------------------------------
+    @override
+    def next_n(self, count: int, /) -> array:
+        """Returns the next count pseudo-random values, as would count calls to next().
+        """
+        assert count >= 0, "the count of generated values must not be negative"
+        state = self._state
+        i = self._index
+        values = [0] * count
+        for n in range(count):
+            i_1 = (i - 1) & 0x1f
+            z0 = state[i_1]
+            # z1 = state[i] ^ M3_pos(state[i+3], 8)
+            z1 = state[i] ^ (u := state[(i + 3) & 0x1f]) ^ (u >> 8)
+            # z2 = M3_neg(state[i+24], 19) ^ M3_neg(state[i+10], 14)
+            z2 = (u := state[(i + 24) & 0x1f]) ^ ((u << 19) & 0xffff_ffff) ^ (v := state[(i + 10) & 0x1f]) ^ ((v << 14) & 0xffff_ffff)
+            values[n] = state[i] = z3 = z1 ^ z2
+            # state[i-1] = M3_neg(z0, 11) ^ M3_neg(z1, 7) ^ M3_neg(z2, 13)
+            state[i_1] = (z0 ^ ((z0 << 11) & 0xffff_ffff)) ^ (z1 ^ ((z1 << 7) & 0xffff_ffff)) ^ (z2 ^ ((z2 << 13) & 0xffff_ffff))
+            i = i_1
+        self._index = i
+        return array('I', values)
+
+
 #=====   end of module   well1024a.py   ======================================
@@ -21,6 +21,7 @@ SOFTWARE.
 """
 
 #=============================================================================
+from array  import array
 from typing import override
 
 from .basewell         import BaseWELL
@@ -127,20 +128,46 @@ class Well512a( BaseWELL ):
     def next(self) -> int:
         """This is the core of the pseudo-random generator.
         """
-        z0 = self._state[(i_1 := ((i := self._index) - 1) & 0xf)]
+        state = self._state  # notice: the local binding speeds up the accesses to the internal state
+        z0 = state[(i_1 := ((i := self._index) - 1) & 0xf)]
             # notice:  all blocks of bits in the internal state are 32 bits wide, which leads to a great 
             # simplification for the implementation of the generic WELL algorithm when evaluating z0.
-        z1 = self._M3_neg(self._state[i], 16) ^ self._M3_neg(self._state[(i + 13) & 0x0f], 15)  # type: ignore
-        z2 = self._M3_pos(self._state[(i + 9) & 0x0f], 11)  # type: ignore
+        z1 = self._M3_neg(state[i], 16) ^ self._M3_neg(state[(i + 13) & 0x0f], 15)  # type: ignore
+        z2 = self._M3_pos(state[(i + 9) & 0x0f], 11)  # type: ignore
             # notice: the last term of the above equation in the WELL generic algorithm is, for its Well512a
             # version, the zero matrix _M0 which we suppress here for calculations optimization purpose
         z3 = z1 ^ z2
 
-        self._state[i] = z3
-        self._state[i_1] = self._M3_neg(z0, 2) ^ self._M3_neg(z1, 18) ^ self._M2_neg(z2, 28) ^ self._M5_neg(z3, 5, self._a1)  # type: ignore
+        state[i] = z3
+        state[i_1] = self._M3_neg(z0, 2) ^ self._M3_neg(z1, 18) ^ self._M2_neg(z2, 28) ^ self._M5_neg(z3, 5, self._a1)  # type: ignore
 
         self._index = i_1
         return z3
 
 
+    #-------------------------------------------------------------------------
+    @override
+    def next_n(self, count: int, /) -> array:
+        """Returns the next count pseudo-random values, as would count calls to next().
+        """
+        assert count >= 0, "the count of generated values must not be negative"
+        state = self._state
+        i = self._index
+        a1 = self._a1
+        values = [0] * count
+        for n in range(count):
+            i_1 = (i - 1) & 0xf
+            z0 = state[i_1]
+            # z1 = M3_neg(state[i], 16) ^ M3_neg(state[i+13], 15)
+            z1 = (u := state[i]) ^ ((u << 16) & 0xffff_ffff) ^ (v := state[(i + 13) & 0x0f]) ^ ((v << 15) & 0xffff_ffff)
+            # z2 = M3_pos(state[i+9], 11)
+            z2 = (u := state[(i + 9) & 0x0f]) ^ (u >> 11)
+            values[n] = state[i] = z3 = z1 ^ z2
+            # state[i-1] = M3_neg(z0, 2) ^ M3_neg(z1, 18) ^ M2_neg(z2, 28) ^ M5_neg(z3, 5, a1)
+            state[i_1] = (z0 ^ ((z0 << 2) & 0xffff_ffff)) ^ (z1 ^ ((z1 << 18) & 0xffff_ffff)) ^ ((z2 << 28) & 0xffff_ffff) ^ (z3 ^ ((z3 << 5) & a1))
+            i = i_1
+        self._index = i
+        return array('I', values)
+
+
 #=====   end of module   well512a.py   =======================================
@@ -0,0 +1,126 @@
+"""
+Copyright (c) 2025 Philippe Schmouker, ph (dot) schmouker (at) gmail.com
+
+Permission is hereby granted,  free of charge,  to any person obtaining a copy
+of this software and associated documentation files (the "Software"),  to deal
+in the Software without restriction, including  without  limitation the rights
+to use,  copy,  modify,  merge,  publish,  distribute, sublicense, and/or sell
+copies of the Software,  and  to  permit  persons  to  whom  the  Software  is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS",  WITHOUT WARRANTY OF ANY  KIND,  EXPRESS  OR
+IMPLIED,  INCLUDING  BUT  NOT  LIMITED  TO  THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT  SHALL  THE
+AUTHORS  OR  COPYRIGHT  HOLDERS  BE  LIABLE  FOR  ANY CLAIM,  DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT,  TORT OR OTHERWISE, ARISING FROM,
+OUT  OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+#=============================================================================
+import pytest
+
+from PyRandLib.basef2linear import BaseF2Linear
+from PyRandLib.melg607      import Melg607
+from PyRandLib.splitmix     import SplitMix32
+from PyRandLib.well512a     import Well512a
+
+
+#=============================================================================
+class Well512aNoPolys( Well512a ):
+    """No polynomials are provided in directory 'jumppolys' for this class.
+    """
+
+
+#=============================================================================
+class TestBaseF2Linear:
+    """Tests the base class BaseF2Linear.
+    """
+
+    #-------------------------------------------------------------------------
+    def test_f2state(self):
+        b_f2l = BaseF2Linear(SplitMix32, 16)
+        with pytest.raises(NotImplementedError):
+            b_f2l._f2state()
+        with pytest.raises(NotImplementedError):
+            b_f2l._f2setstate(0)
+
+    #-------------------------------------------------------------------------
+    def test_jump(self):
+        b_f2l = BaseF2Linear(SplitMix32, 16)
+        with pytest.raises(TypeError):
+            b_f2l.jump(1.0)  # type: ignore
+        with pytest.raises(TypeError):
+            b_f2l.jump((1, 2))  # type: ignore
+        with pytest.raises(ValueError):
+            b_f2l.jump(-1)
+
+    #-------------------------------------------------------------------------
+    def test_berlekampmassey(self):
+        # s(n+3) = s(n+1) ^ s(n), i.e. minimal polynomial x^3 + x + 1
+        bits = [1, 0, 0]
+        for n in range(20):
+            bits.append(bits[n+1] ^ bits[n])
+        assert BaseF2Linear._berlekampmassey(bits) == 0b1011
+        # s(n+4) = s(n+3) ^ s(n), i.e. minimal polynomial x^4 + x^3 + 1
+        bits = [0, 0, 0, 1]
+        for n in range(30):
+            bits.append(bits[n+3] ^ bits[n])
+        assert BaseF2Linear._berlekampmassey(bits) == 0b11001
+        assert BaseF2Linear._berlekampmassey([0] * 10) == 1
+        assert BaseF2Linear._berlekampmassey([1] * 10) == 0b11
+
+    #-------------------------------------------------------------------------
+    def test_polylcm(self):
+        assert BaseF2Linear._polylcm(0b11, 0b101) == 0b101
+        assert BaseF2Linear._polylcm(0b101, 0b11) == 0b101
+        assert BaseF2Linear._polylcm(0b11, 0b111) == 0b1001
+        assert BaseF2Linear._polylcm(0b1011, 0b1011) == 0b1011
+        assert BaseF2Linear._polylcm(1, 0b1011) == 0b1011
+
+    #-------------------------------------------------------------------------
+    def test_xpowmod(self):
+        # x^3 + x + 1 is primitive, so x^7 = 1
+        assert BaseF2Linear._xpowmod(0, 0b1011) == 1
+        assert BaseF2Linear._xpowmod(2, 0b1011) == 0b100
+        assert BaseF2Linear._xpowmod(3, 0b1011) == 0b011
+        assert BaseF2Linear._xpowmod(7, 0b1011) == 1
+        assert BaseF2Linear._xpowmod(7 * 1_000_003 + 3, 0b1011) == 0b011
+
+        modPoly = Well512a._minpoly()
+        poly = 1
+        for n in range(1, 1200):
+            poly <<= 1
+            if poly >> 512:
+                poly ^= modPoly
+            if n % 97 == 0:
+                assert BaseF2Linear._xpowmod(n, modPoly) == poly
+
+    #-------------------------------------------------------------------------
+    def test_loadpolys(self):
+        for cls in (Well512a, Melg607):
+            jumpPolys = cls._loadpolys()
+            assert set(jumpPolys) >= {1 << 64, 1 << 128}
+            assert jumpPolys[1 << 64] == BaseF2Linear._xpowmod(1 << 64, cls._minpoly())
+            assert jumpPolys[1 << 128] == BaseF2Linear._xpowmod(1 << 128, cls._minpoly())
+        assert Well512a._minpoly().bit_length() == 512 + 1
+        assert Melg607._minpoly().bit_length() == 610 + 1
+
+        assert Well512aNoPolys._loadpolys() == {}
+        assert Well512aNoPolys not in BaseF2Linear._minPolys
+
+    #-------------------------------------------------------------------------
+    def test_minpoly(self):
+        assert Well512aNoPolys._minpoly() == Well512a._minpoly()
+        assert BaseF2Linear._minPolys[Well512aNoPolys] == Well512a._minpoly()
+
+        wll = Well512aNoPolys(0x0123_4567_89ab_cdef)
+        wll_ref = Well512a(0x0123_4567_89ab_cdef)
+        wll.jump(1 << 64)
+        wll_ref.jump(1 << 64)
+        assert wll._f2state() == wll_ref._f2state()
+        assert (1 << 64) in BaseF2Linear._jumpPolys[Well512aNoPolys]
@@ -110,3 +110,12 @@ class TestBaseMRG:
         with pytest.raises(TypeError):
             # notice: no 2 arguments accepted in tuple with base class random.Random constructor since Python 3.11
             b_mrg = BaseMRG( SplitMix31, STATE_SIZE, tuple(STATE_SIZE-1, [i+1 for i in range(STATE_SIZE)]) )  # type: ignore
+
+    #-------------------------------------------------------------------------
+    def test_advance(self):
+        STATE_SIZE = 15
+        b_mrg = BaseMRG(SplitMix31, STATE_SIZE)
+        assert b_mrg._MULT == 1
+        assert b_mrg._ADDEND == 0
+        with pytest.raises(AttributeError):
+            b_mrg.advance(STATE_SIZE)
@@ -214,6 +214,14 @@ class TestBaseSquares:
         with pytest.raises(ValueError):
             b_sqr.setstate((34, 35.1))  # type: ignore
 
+    #-------------------------------------------------------------------------
+    def test_next_array(self):
+        b_sqr = BaseSquares(0x0123_4567_89ab_cdef)
+        with pytest.raises(NotImplementedError):
+            b_sqr.next_array(3)
+        with pytest.raises(NotImplementedError):
+            b_sqr.random_array(3)
+
     #-------------------------------------------------------------------------
     def test__initkey(self):
         b_sqr = BaseSquares()
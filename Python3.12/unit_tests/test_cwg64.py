@@ -154,6 +154,19 @@ class TestCwg64:
         assert cwg._s == 0x157a3807a48faa9d
         assert cwg._state == 0x81a05875df4bae5f
 
+    #-------------------------------------------------------------------------
+    def test_next_n(self):
+        cwg = Cwg64(0x0123_4567_89ab_cdef)
+        cwg_ref = Cwg64(0x0123_4567_89ab_cdef)
+        values = cwg.next_n(3_000)
+        assert values.typecode == 'Q'  # type: ignore
+        assert list(values) == [cwg_ref.next() for _ in range(3_000)]
+        assert cwg.getstate() == cwg_ref.getstate()
+
+        assert len(cwg.next_n(0)) == 0
+        with pytest.raises(AssertionError):
+            cwg.next_n(-1)
+
     #-------------------------------------------------------------------------
     def test_seed(self):
         cwg = Cwg64()
@@ -241,3 +254,25 @@ class TestCwg64:
             cwg.setstate((21, 22, 23, -24))  # type: ignore
         with pytest.raises(ValueError):
             cwg.setstate((21, 22, 23, -24))  # type: ignore
+
+    #-------------------------------------------------------------------------
+    def test_spawn(self):
+        cwg = Cwg64(0x0123_4567_89ab_cdef)
+        s = cwg._s
+        children = cwg.spawn(4)
+        for child in children:
+            assert type(child) is Cwg64
+            assert child._s & 1 == 1
+            assert child._s <= 0xffff_ffff_ffff_ffff
+        assert [child.getstate() for child in Cwg64(0x0123_4567_89ab_cdef).spawn(4)] == [child.getstate() for child in children]
+
+        # the Weyl increments remain distinct over repeated and nested spawns
+        children += cwg.spawn(1) + cwg.spawn(1) + children[0].spawn(2) + children[1].spawn(1)[0].spawn(1)
+        assert len({child._s for child in children} | {s}) == 10
+        assert cwg._s == s
+        assert cwg.spawn(0) == []
+
+        with pytest.raises(TypeError):
+            cwg.spawn('4')  # type: ignore
+        with pytest.raises(ValueError):
+            cwg.spawn(-4)
@@ -21,10 +21,19 @@ SOFTWARE.
 """
 
 #=============================================================================
+import math
+import sys
+from array  import array
 from random import Random
-from typing import override
+from typing import Any, Final, Sequence, override
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
 
 from .annotation_types import Numerical, SeedStateType, StateType
+from .splitmix         import SplitMix64
 
 
 #=============================================================================
@@ -106,7 +115,8 @@ class BaseRandom( Random ):
       random(), seed(), getstate(), and setstate().
 
     Since version 2.0 of PyRandLib,  the core engine of every PRNG is coded in  method
-    next().
+    next().  Method next_n() returns at once a compact array of successive  values  of
+    next(), and method fill() fills a mutable sequence with them.
     
     Furthermore this class and all its inheriting sub-classes are callable. Example:
       rand = BaseRandom() # Caution: this is just used as illustrative. This base class cannot be instantiated
@@ -292,6 +302,25 @@ class BaseRandom( Random ):
     than 32 bits.
     """
 
+    _ZIGGURAT_NORMAL_R: Final[float] = 3.654_152_885_361_008_8  # abscissa of the rightmost layer of the normal Ziggurat
+    _ZIGGURAT_NORMAL_V: Final[float] = 4.928_673_233_99e-3  # area of every layer of the normal Ziggurat
+    _ZIGGURAT_EXP_R: Final[float] = 7.697_117_470_131_049_7  # abscissa of the rightmost layer of the exponential Ziggurat
+    _ZIGGURAT_EXP_V: Final[float] = 3.949_659_822_581_571_2e-3  # area of every layer of the exponential Ziggurat
+
+    _zigguratTables: dict[tuple[str, int], tuple[list[int], list[float], list[float]]] = {}  # notice: cache shared by all the inheriting classes
+
+
+    #-------------------------------------------------------------------------
+    def __new__(cls, *args, **kwargs):  # type: ignore
+        """Creates a new instance of this class, its arguments being then passed to __init__().
+
+        Notice: up to Python 3.10,  the constructor of built-in class random.Random
+        accepts one single argument,  which it hashes to seed its internal state.
+        So,  no argument is passed to it,  since inheriting classes are constructed
+        with more arguments or with states that are not hashable (e.g. lists).
+        """
+        return super().__new__( cls )
+
 
     #-------------------------------------------------------------------------
     def __init__(self, _seedState: SeedStateType = None, /) -> None:  # type: ignore
@@ -303,6 +332,8 @@ class BaseRandom( Random ):
         Notice: the Python built-in base class random.Random  internally 
         calls method setstate() which MUST be overridden in classes that 
         inherit from class BaseRandom.
+        Notice: the internal state is initialized once only,  either  with
+        method seed() or with method setstate() when _seedState is a state.
         """
         if _seedState is None or isinstance(_seedState, (int, float)):
             if isinstance(_seedState, float) and not (0.0 <= _seedState <= 1.0):
@@ -310,7 +341,8 @@ class BaseRandom( Random ):
             else:
                 super().__init__( _seedState )
         else:
-            super().__init__()
+            # notice: random.Random.__init__() would seed first the whole internal state, then fully overwritten here
+            self.gauss_next = None
             self.setstate( _seedState )
 
 
@@ -324,6 +356,41 @@ class BaseRandom( Random ):
         raise NotImplementedError()
 
 
+    #-------------------------------------------------------------------------
+    def next_n(self, count: int, /) -> array | list[int]:
+        """Returns the next count pseudo-random integer values generated by this PRNG.
+
+        The returned values are exactly the same, and in the same order, as
+        those returned by count successive calls to method next().  They are
+        packed in a compact array of unsigned integers:  typecode 'I' is used
+        for output values coded on 32 bits at most,  typecode 'Q' for output 
+        values coded on 64 bits at most.  128-bits output values do not  fit
+        into an array: a list of integers is returned in this case.
+        Inheriting classes SHOULD OVERRIDE this method with a loop that keeps
+        their internal state in local variables all along the loop.
+        """
+        assert count >= 0, "the count of generated values must not be negative"
+        return self._outarray( [self.next() for _ in range(count)] )
+
+
+    #-------------------------------------------------------------------------
+    def fill(self, buffer: list[int] | array | memoryview, /) -> None:
+        """Fills a mutable sequence with the next pseudo-random integer values.
+
+        buffer may be a list, an array or a writable memoryview of integers.
+        Its whole length is filled with the same values,  in the same order,
+        as successive calls to method next() would return them.  The typecode 
+        or the format of arrays and memoryviews must be able to  store  values
+        coded on self._OUT_BITS bits.
+        """
+        values = self.next_n( len(buffer) )
+        if isinstance(buffer, list):
+            buffer[:] = values
+        else:
+            typecode = buffer.typecode if isinstance(buffer, array) else buffer.format
+            buffer[:] = values if typecode == getattr(values, 'typecode', None) else array(typecode, values)
+
+
     #-------------------------------------------------------------------------
     @override
     def random(self) -> float:
@@ -336,17 +403,217 @@ class BaseRandom( Random ):
         return self.next() * self._NORMALIZE
 
 
+    #-------------------------------------------------------------------------
+    def random_array(self, n: int, /, dtype: str = 'float64', bits: int | None = None) -> 'np.ndarray | array':  # type: ignore
+        """Returns the next n pseudo-random float values in [0.0, 1.0) at once.
+
+        The values are returned in a numpy array of type dtype, either 'float64'
+        or 'float32', or in an array of typecode 'd' or 'f' when numpy is  not
+        available.  They are evaluated from the integer values returned by the
+        dedicated method next_n(), with vectorized numpy arithmetic when numpy
+        is available.
+        Should bits be None,  float64 values are the same as n successive calls
+        to random() return,  while float32 values get 24 bits of precision.
+        Otherwise,  each float value gets bits bits of precision (at most 53
+        for float64 and 24 for float32 values): the highest bits of as  many
+        successive output values as needed are concatenated,  e.g. two 32-bits
+        output values per float64 value with full 53-bits precision.
+        """
+        assert n >= 0, "the count of generated values must not be negative"
+
+        dtypeName = dtype if np is None else np.dtype( dtype ).name
+        if dtypeName == 'float64':
+            maxBits, typecode = 53, 'd'
+        elif dtypeName == 'float32':
+            maxBits, typecode = 24, 'f'
+        else:
+            raise ValueError( f"random arrays must be of type 'float64' or 'float32' (currently is {dtype})" )
+
+        outBits = self._OUT_BITS
+
+        if bits is None and maxBits == 53:
+            # same values as n successive calls to random()
+            if np is None:
+                return array( 'd', [v * self._NORMALIZE for v in self.next_n( n )] )
+            elif outBits <= 64:
+                return np.asarray( self.next_n( n ), dtype=np.float64 ) * self._NORMALIZE
+            else:
+                return np.array( [v * self._NORMALIZE for v in self.next_n( n )], dtype=np.float64 )
+
+        if bits is None:
+            bits = maxBits
+        elif not isinstance( bits, int ) or not (1 <= bits <= maxBits):
+            raise ValueError( f"the precision of {dtypeName} random values must be an integer in [1, {maxBits}] (currently is {bits})" )
+
+        valuesCount = -(-bits // outBits)  # count of output values per float value
+        shift = valuesCount * outBits - bits
+        scale = 1.0 / (1 << bits)
+
+        if np is None or outBits > 64:
+            outValues = iter( self.next_n( n * valuesCount ) )
+            floats = [0.0] * n
+            for i in range(n):
+                v = next( outValues )
+                for _ in range(valuesCount - 1):
+                    v = (v << outBits) | next( outValues )
+                floats[i] = (v >> shift) * scale
+            return array( typecode, floats ) if np is None else np.array( floats, dtype=dtypeName )
+
+        outValues = np.asarray( self.next_n( n * valuesCount ), dtype=np.uint64 ).reshape( n, valuesCount )
+        values = outValues[:, 0]
+        for i in range(1, valuesCount):
+            values = (values << np.uint64( outBits )) | outValues[:, i]
+        return ((values >> np.uint64( shift )) * scale).astype( dtypeName )
+
+
+    #-------------------------------------------------------------------------
+    def integers(self, low: int, high: int | None = None, size: int | None = None) -> 'int | np.ndarray | array | list[int]':  # type: ignore
+        """Returns uniformly distributed random integers in range [low, high).
+
+        Should high be None, integers are in range [0, low) instead.  Should
+        size be None, a single integer is returned;  otherwise,  size integers
+        are returned in a numpy array of type int64 or uint64, or in an array
+        of typecode 'q' or 'Q' when numpy is not available,  or in a list when
+        they cannot be coded on 64 bits.
+        Integers are not biased,  whatever the width of the range.  They are
+        evaluated with the multiply-shift method of D. Lemire (see "Fast Random
+        Integer Generation in an Interval", ACM Trans. Model. Comput. Simul.,
+        2019): a random word of L bits multiplied by the width of the range is
+        shifted L bits right,  the rare words that would bias the result being
+        rejected.  When the range width fits in 32 bits (31 for 31-bits output
+        values),  the words are the highest bits of the output values of this
+        PRNG and their products are evaluated with numpy vectorized arithmetic
+        when available;  otherwise,  as many successive output  values  as
+        needed are concatenated in each word.
+        """
+        if high is None:
+            low, high = 0, low
+        if not isinstance( low, int ) or not isinstance( high, int ):
+            raise TypeError( f"the bounds of the range must be integers (currently are {type(low)} and {type(high)})" )
+        if (width := high - low) <= 0:
+            raise ValueError( f"the range of integers must not be empty (currently is [{low}, {high}))" )
+        if size is not None and not isinstance( size, int ):
+            raise TypeError( f"the count of integers must be None or an integer (currently is {type(size)})" )
+        if size is not None and size < 0:
+            raise ValueError( f"the count of integers must not be negative (currently is {size})" )
+
+        outBits = self._OUT_BITS
+        count = 1 if size is None else size
+        if width <= 1 << min( outBits, 32 ):
+            wordsCount = 1
+            wordBits = min( outBits, 32 )
+        else:
+            wordsCount = -(-(width - 1).bit_length() // outBits)
+            wordBits = wordsCount * outBits
+        threshold = (1 << wordBits) % width  # words leading to a lower low part of their products are rejected
+
+        if -(1 << 63) <= low and high <= 1 << 63:
+            typecode = 'q'
+        elif low >= 0 and high <= 1 << 64:
+            typecode = 'Q'
+        else:
+            typecode = ''
+
+        if np is not None and size is not None and typecode and wordBits <= 32 and outBits <= 64:
+            words = np.asarray( self.next_n( count ), dtype=np.uint64 ) >> np.uint64( outBits - wordBits )
+            products = words * np.uint64( width )
+            values = products >> np.uint64( wordBits )
+            for i in np.flatnonzero( (products & np.uint64( (1 << wordBits) - 1 )) < threshold ):
+                values[i] = self._lemire( width, wordsCount, wordBits )
+            return values.astype( np.int64 ) + np.int64( low ) if typecode == 'q' else values + np.uint64( low )
+
+        outValues = self.next_n( count * wordsCount )
+        if wordsCount == 1:
+            words = [v >> (outBits - wordBits) for v in outValues]
+        else:
+            valuesIter = iter( outValues )
+            words = [0] * count
+            for i in range(count):
+                for _ in range(wordsCount):
+                    words[i] = (words[i] << outBits) | next( valuesIter )
+        mask = (1 << wordBits) - 1
+        values = [low + ((p >> wordBits) if (p & mask) >= threshold else self._lemire( width, wordsCount, wordBits ))
+                      for p in (w * width for w in words)]
+
+        if size is None:
+            return values[0]
+        elif np is not None and typecode:
+            return np.array( values, dtype=np.int64 if typecode == 'q' else np.uint64 )
+        elif typecode:
+            return array( typecode, values )
+        else:
+            return values
+
+
+    #-------------------------------------------------------------------------
+    def standard_normal(self, size: int | None = None) -> 'float | np.ndarray | array':  # type: ignore
+        """Returns normally distributed random values, with mean 0.0 and standard deviation 1.0.
+
+        Should size be None, a single float value is returned;  otherwise,
+        size values are returned in a numpy array of float64 values,  or  in
+        an array of typecode 'd' when numpy is not available.
+        Values are evaluated with the Ziggurat method of G. Marsaglia and  W.
+        W. Tsang (see "The Ziggurat Method for Generating Random  Variables",
+        Journal of Statistical Software, 2000) with 256 layers:  the highest
+        8 bits of one output value (of its highest 64 bits at most) provide
+        the index of a layer,  its next bit provides the sign of the value and
+        its lower bits provide the magnitude of the value,  which is accepted
+        with a sole comparison in about 99% of the cases.  Notice: the lowest
+        bits of the outputs of some generators (e.g. LCGs) have short periods,
+        so they are never used as the index of a layer.
+        """
+        if size is None:
+            return self._zigguratnormal( self.next() >> max( self._OUT_BITS - 64, 0 ), self._ziggurattables( 'normal', self._OUT_BITS ) )
+        else:
+            return self._ziggurat( 'normal', size )
+
+
+    #-------------------------------------------------------------------------
+    def standard_exponential(self, size: int | None = None) -> 'float | np.ndarray | array':  # type: ignore
+        """Returns exponentially distributed random values, with mean 1.0.
+
+        Should size be None, a single float value is returned;  otherwise,
+        size values are returned in a numpy array of float64 values,  or  in
+        an array of typecode 'd' when numpy is not available.
+        Values are evaluated with the Ziggurat method, see standard_normal(),
+        the highest 8 bits of one output value providing the index of a layer.
+        """
+        if size is None:
+            return self._zigguratexponential( self.next() >> max( self._OUT_BITS - 64, 0 ), self._ziggurattables( 'exponential', self._OUT_BITS ) )
+        else:
+            return self._ziggurat( 'exponential', size )
+
+
     #-------------------------------------------------------------------------
     @override
     def getrandbits(self, k: int, /) -> int:
         """Returns k bits from the internal state of the generator.
 
-        k must be a positive value greater or equal to zero.
+        k must be a positive value greater or equal to zero.  Should  k  be
+        greater than the count of bits of the output values, as many output
+        values as needed are evaluated at once with method next_n() and are
+        concatenated,  the first ones providing the highest bits.  Their
+        concatenation is evaluated in linear time: from the raw bytes of the
+        array of values for 32- and 64-bits output values, or from their
+        hexadecimal or binary digits otherwise.
         """
         assert k >= 0, "the returned bits count must not be negative"
-        assert k < self._OUT_BITS, f"the returned bits count must be less than {self._OUT_BITS}"
 
-        return 0 if k == 0 else self.next() >> (self._OUT_BITS - k)
+        outBits = self._OUT_BITS
+        if k <= outBits:
+            return 0 if k == 0 else self.next() >> (outBits - k)
+
+        count = -(-k // outBits)
+        values = self.next_n( count )
+        if isinstance( values, array ) and values.itemsize * 8 == outBits:
+            if sys.byteorder == 'little':
+                values.byteswap()
+            bits = int.from_bytes( values.tobytes(), 'big' )
+        elif outBits % 4 == 0:
+            bits = int( ''.join( [f"{v:0{outBits // 4}x}" for v in values] ), 16 )
+        else:
+            bits = int( ''.join( [f"{v:0{outBits}b}" for v in values] ), 2 )
+        return bits >> (count * outBits - k)
         
 
     #-------------------------------------------------------------------------
@@ -354,11 +621,85 @@ class BaseRandom( Random ):
     def randbytes(self, n: int) -> bytes:
         """Generates n random bytes.
 
+        Every bit of the output values is used:  32-, 64- and 128-bits output
+        values provide 4, 8 or 16 bytes each, in little-endian order,  and are
+        evaluated at once with method next_n(),  while 31- and 63-bits output
+        values are concatenated with method getrandbits().
         This method should not be used for generating security tokens.
         (use Python built-in secrets.token_bytes() instead)
         """
-        assert n >= 0  # and self._OUT_BITS >= 8
-        return bytes([self.next() >> (self._OUT_BITS - 8) for _ in range(n)])
+        assert n >= 0, "the count of generated bytes must not be negative"
+
+        if self._OUT_BITS % 8:
+            return self.getrandbits( 8 * n ).to_bytes( n, 'big' )
+
+        bytesCount = self._OUT_BITS // 8
+        values = self.next_n( -(-n // bytesCount) )
+        if isinstance( values, array ) and values.itemsize == bytesCount:
+            if sys.byteorder == 'big':  # pragma: no cover  (big-endian platforms)
+                values.byteswap()
+            return values.tobytes()[:n]
+        else:
+            return b''.join( [v.to_bytes( bytesCount, 'little' ) for v in values] )[:n]
+
+
+    #-------------------------------------------------------------------------
+    def readinto(self, buffer: bytearray | memoryview | array, /) -> int:
+        """Fills a writable buffer with random bytes and returns the count of written bytes.
+
+        The written bytes are the same as method randbytes() would return for
+        the size of the buffer, in bytes.  They are evaluated and written chunk
+        by chunk,  so that huge buffers get filled without the allocation of
+        an intermediate bytes object of their whole size.
+        """
+        view = memoryview( buffer ).cast( 'B' )
+        chunkSize = self._OUT_BITS * 8192  # notice: a whole count of output values per chunk
+        for start in range(0, view.nbytes, chunkSize):
+            stop = min( start + chunkSize, view.nbytes )
+            view[start:stop] = self.randbytes( stop - start )
+        return view.nbytes
+
+
+    #-------------------------------------------------------------------------
+    def spawn(self, n: int, /) -> 'list[BaseRandom]':
+        """Returns n new generators of the same class,  statistically independent of each other and of this one.
+
+        The children are derived from the current internal state of this
+        generator, so that a seeded generator always spawns the same children,
+        e.g. one per process of a parallel simulation.  Each call to spawn()
+        advances this generator and provides new children.
+        Each child is seeded with its own entry of a hashed sequence of seeds,
+        i.e. of the successive values of a SplitMix64 generator which is seeded
+        with 64 bits drawn from this generator.  Inheriting classes override
+        this method with a better suited mechanism when their algorithm offers
+        one, e.g. jumps for the Xoroshiros or distinct Weyl increments for the
+        CWGs.
+        """
+        if not isinstance( n, int ):
+            raise TypeError( f"the count of spawned generators must be an integer (currently is {type(n)})" )
+        if n < 0:
+            raise ValueError( f"the count of spawned generators must not be negative (currently is {n})" )
+
+        initRand = SplitMix64( self.getrandbits(64) )
+        return [ type(self)( initRand() ) for _ in range(n) ]
+
+
+    #-------------------------------------------------------------------------
+    @override
+    def choices(self, population: Sequence[Any], weights: Sequence[float] | None = None, *,
+                      cum_weights: Sequence[float] | None = None, k: int = 1) -> list[Any]:
+        """Returns a k sized list of population elements chosen with replacement.
+
+        Should weights be provided,  the elements are drawn  with  the  alias
+        table of the weighted distribution,  see class DiscreteSampler, which
+        is cached for next calls with the same weights. Otherwise, the method
+        of Python built-in class random.Random is called.
+        """
+        if weights is None or cum_weights is not None:
+            return super().choices( population, weights, cum_weights=cum_weights, k=k )
+
+        from .discretesampler import DiscreteSampler  # notice: not at module level, since discretesampler imports baserandom
+        return DiscreteSampler( self, weights, population ).sample( k )  # type: ignore
 
 
     #-------------------------------------------------------------------------
@@ -372,16 +713,33 @@ class BaseRandom( Random ):
         raise NotImplementedError()
 
 
+    #-------------------------------------------------------------------------
+    def restore(self, _state: StateType, /, trusted: bool = True) -> None:
+        """Restores the internal state of the generator from a state returned by getstate().
+
+        Should trusted be True,  _state MUST have been returned by method
+        getstate() of a generator of the same class,  and inheriting classes
+        with large internal states then skip its validation,  e.g.  when
+        frequently restoring checkpoints.  Otherwise,  this is the same as
+        method setstate().
+        """
+        self.setstate( _state )
+
+
     #-------------------------------------------------------------------------
     @override
     def seed(self, _seed: Numerical = None, /) -> None:  # type: ignore
         """Initiates the internal state of this pseudo-random generator.
+
+        Notice: the internal state of the Mersenne Twister that every instance
+        of random.Random embeds is never used by PyRandLib, so it is not seeded.
+        Inheriting classes initiate their own internal state.
         """
         if _seed is None or isinstance(_seed, (int, float)):
             if isinstance(_seed, float) and not (0.0 <= _seed <= 1.0):
                 raise ValueError(f"Float seeds must be in range [0.0, 1.0] (currently is {_seed})")
             else:
-                super().seed( _seed )
+                self.gauss_next = None  # notice: as does random.Random.seed(), but without seeding the Mersenne Twister
         else:
             raise TypeError(f"Seeding value must be None, an int or a float (currently is {type(_seed)})")
 
@@ -432,6 +790,204 @@ class BaseRandom( Random ):
         return ret[0] if len(ret) == 1 else ret  # type: ignore
     
 
+    #-------------------------------------------------------------------------
+    def _outarray(self, _values: list[int], /) -> array | list[int]:
+        """Packs a list of generated values into a compact array.
+
+        The typecode of the array depends on the count of bits of the output
+        values of this PRNG. 128-bits values are kept in their list.
+        """
+        if self._OUT_BITS <= 32:
+            return array('I', _values)
+        elif self._OUT_BITS <= 64:
+            return array('Q', _values)
+        else:
+            return _values
+
+
+    #-------------------------------------------------------------------------
+    def _lemire(self, _width: int, _wordsCount: int, _wordBits: int, /) -> int:
+        """Returns an unbiased random integer in range [0, _width) with the multiply-shift method of D. Lemire.
+
+        Each word of _wordBits bits is the concatenation of the highest bits of
+        _wordsCount successive output values. Words are drawn until the low part
+        of their product with _width is not lower than the rejection threshold.
+        """
+        mask = (1 << _wordBits) - 1
+        threshold = (1 << _wordBits) % _width
+        while True:
+            word = 0
+            for _ in range(_wordsCount):
+                word = (word << self._OUT_BITS) | self.next()
+            if ((product := (word >> (_wordsCount * self._OUT_BITS - _wordBits)) * _width) & mask) >= threshold:
+                return product >> _wordBits
+
+
+    #-------------------------------------------------------------------------
+    def _ziggurat(self, _kind: str, _size: int, /) -> 'np.ndarray | array':  # type: ignore
+        """Returns _size random values evaluated with the Ziggurat method, _kind being 'normal' or 'exponential'.
+
+        See method standard_normal().  The output values are all evaluated at
+        once with method next_n() and the values of the related layers  are
+        evaluated with numpy vectorized arithmetic when available.  Rejected
+        values are then evaluated again one by one, in order,  so that numpy
+        and pure Python evaluations return the same values.
+        """
+        if not isinstance( _size, int ):
+            raise TypeError( f"the count of random values must be None or an integer (currently is {type(_size)})" )
+        if _size < 0:
+            raise ValueError( f"the count of random values must not be negative (currently is {_size})" )
+
+        isNormal = _kind == 'normal'
+        magnitudeBits = min( self._OUT_BITS, 64 ) - (9 if isNormal else 8)  # notice: the bit above the magnitude is the sign of normal values
+        tables = self._ziggurattables( _kind, self._OUT_BITS )
+        fromWord = self._zigguratnormal if isNormal else self._zigguratexponential
+
+        words = self.next_n( _size )
+        if self._OUT_BITS > 64:
+            words = [w >> (self._OUT_BITS - 64) for w in words]
+
+        if np is None:
+            return array( 'd', [fromWord( w, tables ) for w in words] )
+
+        words = np.asarray( words, dtype=np.uint64 )
+        layers = (words >> np.uint64( min( self._OUT_BITS, 64 ) - 8 )).astype( np.intp )
+        magnitudes = words & np.uint64( (1 << magnitudeBits) - 1 )
+        values = magnitudes * np.asarray( tables[1] )[layers]
+        if isNormal:
+            values[ ((words >> np.uint64( magnitudeBits )) & np.uint64( 1 )) != 0 ] *= -1.0
+        for i in np.flatnonzero( magnitudes >= np.asarray( tables[0], dtype=np.uint64 )[layers] ):
+            values[i] = fromWord( int(words[i]), tables )
+        return values
+
+
+    #-------------------------------------------------------------------------
+    def _zigguratnormal(self, _word: int, _tables: tuple[list[int], list[float], list[float]], /) -> float:
+        """Evaluates a normally distributed random value with the Ziggurat method, starting from a first random word.
+
+        The tables are the ones returned by method '_ziggurattables()'.
+        """
+        k, w, f = _tables
+        magnitudeBits = min( self._OUT_BITS, 64 ) - 9
+        magnitudeMask = (1 << magnitudeBits) - 1
+        while True:
+            layer = _word >> (magnitudeBits + 1)
+            isNegative = (_word >> magnitudeBits) & 1
+            x = (_word & magnitudeMask) * w[layer]
+            if isNegative:
+                x = -x
+            if (_word & magnitudeMask) < k[layer]:
+                return x
+            elif layer == 0:
+                # the base layer: evaluates a value in the tail of the distribution
+                r = self._ZIGGURAT_NORMAL_R
+                while True:
+                    xx = -math.log1p( -self._tailrandom() ) / r
+                    if -2.0 * math.log1p( -self._tailrandom() ) > xx * xx:
+                        return -(r + xx) if isNegative else r + xx
+            elif (f[layer - 1] - f[layer]) * self.random() + f[layer] < math.exp( -0.5 * x * x ):
+                return x
+            _word = self.next() >> max( self._OUT_BITS - 64, 0 )
+
+
+    #-------------------------------------------------------------------------
+    def _zigguratexponential(self, _word: int, _tables: tuple[list[int], list[float], list[float]], /) -> float:
+        """Evaluates an exponentially distributed random value with the Ziggurat method, starting from a first random word.
+
+        The tables are the ones returned by method '_ziggurattables()'.
+        """
+        k, w, f = _tables
+        magnitudeBits = min( self._OUT_BITS, 64 ) - 8
+        magnitudeMask = (1 << magnitudeBits) - 1
+        while True:
+            layer = _word >> magnitudeBits
+            x = (_word & magnitudeMask) * w[layer]
+            if (_word & magnitudeMask) < k[layer]:
+                return x
+            elif layer == 0:
+                # the base layer: the tail of the distribution is exponential also
+                return self._ZIGGURAT_EXP_R - math.log1p( -self._tailrandom() )
+            elif (f[layer - 1] - f[layer]) * self.random() + f[layer] < math.exp( -x ):
+                return x
+            _word = self.next() >> max( self._OUT_BITS - 64, 0 )
+
+
+    #-------------------------------------------------------------------------
+    def _tailrandom(self) -> float:
+        """Returns a random float value in [0.0, 1.0) for the tails of the Ziggurats.
+
+        Contrary to random(),  the returned value cannot be rounded to 1.0 with
+        output values coded on more than 53 bits.
+        """
+        bits = min( self._OUT_BITS, 53 )
+        return (self.next() >> (self._OUT_BITS - bits)) / (1 << bits)
+
+
+    #-------------------------------------------------------------------------
+    @classmethod
+    def _ziggurattables(cls, _kind: str, _outBits: int, /) -> tuple[list[int], list[float], list[float]]:
+        """Returns the tables of the Ziggurat with 256 layers of the normal or exponential distribution.
+
+        The tables are related to output values coded on _outBits bits, their
+        highest 64 bits at most being used.  They are, for each layer,  the
+        acceptance thresholds of the magnitudes of the values, the  scaling
+        factors of these magnitudes and the values of the density function at
+        the layer abscissa. They are evaluated at first call and then cached.
+        """
+        if (tables := BaseRandom._zigguratTables.get( (_kind, _outBits) )) is None:
+            if _kind == 'normal':
+                r, v = cls._ZIGGURAT_NORMAL_R, cls._ZIGGURAT_NORMAL_V
+                density = lambda x: math.exp( -0.5 * x * x )
+                inverse = lambda y: math.sqrt( -2.0 * math.log( y ) )
+                magnitudeBits = min( _outBits, 64 ) - 9
+            else:
+                r, v = cls._ZIGGURAT_EXP_R, cls._ZIGGURAT_EXP_V
+                density = lambda x: math.exp( -x )
+                inverse = lambda y: -math.log( y )
+                magnitudeBits = min( _outBits, 64 ) - 8
+
+            scale = float( 1 << magnitudeBits )
+            k, w, f = [0] * 256, [0.0] * 256, [0.0] * 256
+            q = v / density( r )
+            k[0] = int( r / q * scale )
+            w[0], w[255] = q / scale, r / scale
+            f[0], f[255] = 1.0, density( r )
+            x = prev = r
+            for i in range(254, 0, -1):
+                x = inverse( v / x + density( x ) )
+                k[i + 1] = int( x / prev * scale )
+                w[i] = x / scale
+                f[i] = density( x )
+                prev = x
+            tables = BaseRandom._zigguratTables[ (_kind, _outBits) ] = (k, w, f)
+
+        return tables
+
+
+    #-------------------------------------------------------------------------
+    @classmethod
+    def _lcgadvance(cls, _state: int, _delta: int, _a: int, _c: int, _modMask: int, /) -> int:
+        """Returns the state of an LCG after _delta steps from _state, in O(log _delta).
+
+        The LCG is x(i) = (_a * x(i-1) + _c) mod (_modMask + 1), with _modMask+1
+        a power of 2. The affine step is squared along the bits of _delta, as
+        described by F. Brown in "Random Number Generation with Arbitrary 
+        Strides", Trans. Am. Nucl. Soc., 1994. Negative values of _delta are 
+        taken modulo the period of the LCG, i.e. they step backward.
+        Useful for some inheriting classes.
+        """
+        accMult, accPlus = 1, 0
+        curMult, curPlus = _a, _c
+        delta = _delta & _modMask
+        while delta > 0:
+            if delta & 1:
+                accMult = (accMult * curMult) & _modMask
+                accPlus = (accPlus * curMult + curPlus) & _modMask
+            curPlus = ((curMult + 1) * curPlus) & _modMask
+            curMult = (curMult * curMult) & _modMask
+            delta >>= 1
+        return (accMult * _state + accPlus) & _modMask
+
     #-------------------------------------------------------------------------
     @classmethod
     def _rotleft(cls, _value: int, _rotCount: int, _bitsCount: int = 64, /) -> int:
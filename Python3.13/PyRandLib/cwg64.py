@@ -21,6 +21,7 @@ SOFTWARE.
 """
 
 #=============================================================================
+from array  import array
 from typing import Final, override
 
 from .basecwg          import BaseCWG
@@ -124,6 +125,23 @@ class Cwg64( BaseCWG ):
         return self._state ^ (self._a >> 48)
 
 
+    #-------------------------------------------------------------------------
+    @override
+    def next_n(self, count: int, /) -> array:
+        """Returns the next count pseudo-random values, as would count calls to next().
+        """
+        assert count >= 0, "the count of generated values must not be negative"
+        a, weyl, s, state = self._a, self._weyl, self._s, self._state
+        values = [0] * count
+        for n in range(count):
+            a = (a + state) & 0xffff_ffff_ffff_ffff
+            weyl = (weyl + s) & 0xffff_ffff_ffff_ffff
+            state = (((state >> 1) * (a | 1)) ^ weyl) & 0xffff_ffff_ffff_ffff
+            values[n] = state ^ (a >> 48)
+        self._a, self._weyl, self._state = a, weyl, state
+        return array('Q', values)
+
+
     #-------------------------------------------------------------------------
     @override
     def seed(self, _seed: Numerical = None, /) -> None:  # type: ignore
@@ -0,0 +1,124 @@
+"""
+Copyright (c) 2025 Philippe Schmouker, ph (dot) schmouker (at) gmail.com
+
+Permission is hereby granted,  free of charge,  to any person obtaining a copy
+of this software and associated documentation files (the "Software"),  to deal
+in the Software without restriction, including  without  limitation the rights
+to use,  copy,  modify,  merge,  publish,  distribute, sublicense, and/or sell
+copies of the Software,  and  to  permit  persons  to  whom  the  Software  is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS",  WITHOUT WARRANTY OF ANY  KIND,  EXPRESS  OR
+IMPLIED,  INCLUDING  BUT  NOT  LIMITED  TO  THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT  SHALL  THE
+AUTHORS  OR  COPYRIGHT  HOLDERS  BE  LIABLE  FOR  ANY CLAIM,  DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT,  TORT OR OTHERWISE, ARISING FROM,
+OUT  OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+#=============================================================================
+from array import array
+import math
+import pytest
+
+import PyRandLib.discretesampler
+from PyRandLib.discretesampler import DiscreteSampler
+from PyRandLib.cwg128          import Cwg128
+from PyRandLib.fastrand32      import FastRand32
+from PyRandLib.mrg1457         import Mrg1457
+from PyRandLib.xoroshiro256    import Xoroshiro256
+
+
+#=============================================================================
+class TestDiscreteSampler:
+    """Tests class DiscreteSampler.
+    """
+
+    #-------------------------------------------------------------------------
+    def test_init(self):
+        prng = Xoroshiro256(1)
+        smp = DiscreteSampler(prng, [1, 2, 3])
+        assert smp.prng is prng
+        assert smp._population is None
+        assert smp._count == 3
+        smp = DiscreteSampler(prng, (0.5, 0.5), 'ab')
+        assert smp._population == 'ab'
+
+        with pytest.raises(TypeError):
+            DiscreteSampler(1, [1, 2])  # type: ignore
+        with pytest.raises(ValueError):
+            DiscreteSampler(prng, [1, 2], 'abc')
+        with pytest.raises(ValueError):
+            DiscreteSampler(prng, [])
+        with pytest.raises(ValueError):
+            DiscreteSampler(prng, [1, -2])
+        with pytest.raises(ValueError):
+            DiscreteSampler(prng, [1, math.inf])
+        with pytest.raises(ValueError):
+            DiscreteSampler(prng, [1, math.nan])
+        with pytest.raises(ValueError):
+            DiscreteSampler(prng, [0, 0.0])
+
+    #-------------------------------------------------------------------------
+    def test_aliastables(self):
+        for weights in ((1,), (1, 1, 1, 1), (5, 1, 0, 3, 1), (0.1, 0.2, 0.3, 0.4), tuple(range(1, 101))):
+            probs, aliases = DiscreteSampler._aliastables(weights)
+            count = len(weights)
+            assert len(probs) == len(aliases) == count
+            assert all(0.0 <= p <= 1.0 for p in probs)
+            # the probability of each index is the sum of its own column and of the columns it is the alias of
+            for index, w in enumerate(weights):
+                p = probs[index] + sum(1.0 - probs[i] for i in range(count) if aliases[i] == index and i != index)
+                assert math.isclose(p / count, w / sum(weights), abs_tol=1e-12)
+
+        # cached tables
+        assert DiscreteSampler._aliastables((1, 2, 3)) is DiscreteSampler._aliastables((1, 2, 3))
+        prng = Xoroshiro256(1)
+        assert DiscreteSampler(prng, [1, 2, 3])._probs is DiscreteSampler(prng, (1, 2, 3))._probs
+
+    #-------------------------------------------------------------------------
+    def test_draw(self):
+        smp = DiscreteSampler(Xoroshiro256(1), [0, 1, 0])
+        assert all(smp.draw() == 1 for _ in range(100))
+        smp = DiscreteSampler(Xoroshiro256(1), [1, 0, 3], ['a', 'b', 'c'])
+        draws = [smp.draw() for _ in range(40_000)]
+        assert 'b' not in draws
+        assert abs(draws.count('a') / 40_000 - 0.25) < 0.01
+
+        for prngClass in (FastRand32, Mrg1457, Cwg128, Xoroshiro256):
+            smp = DiscreteSampler(prngClass(7), [5, 1, 0, 3, 1])
+            counts = [0] * 5
+            for _ in range(50_000):
+                counts[smp.draw()] += 1
+            assert counts[2] == 0
+            for c, w in zip(counts, (5, 1, 0, 3, 1)):
+                assert abs(c / 50_000 - w / 10) < 0.01
+
+    #-------------------------------------------------------------------------
+    def test_sample(self, monkeypatch):
+        for numpyModule in (PyRandLib.discretesampler.np, None):
+            monkeypatch.setattr(PyRandLib.discretesampler, 'np', numpyModule)
+
+            for prngClass in (FastRand32, Mrg1457, Cwg128, Xoroshiro256):
+                for k in (0, 1, 63, 64, 1_000):
+                    smp = DiscreteSampler(prngClass(5), [5, 1, 0, 3, 1])
+                    ref = DiscreteSampler(prngClass(5), [5, 1, 0, 3, 1])
+                    indexes = smp.sample(k)
+                    assert list(indexes) == [ref.draw() for _ in range(k)]
+                    if numpyModule is None or k < 64:
+                        assert isinstance(indexes, array) and indexes.typecode == 'q'
+                    else:
+                        assert indexes.dtype.name == 'int64'  # type: ignore
+
+                smp = DiscreteSampler(prngClass(5), [5, 1, 0, 3, 1], 'abcde')
+                ref = DiscreteSampler(prngClass(5), [5, 1, 0, 3, 1], 'abcde')
+                assert smp.sample(100) == [ref.draw() for _ in range(100)]
+
+            smp = DiscreteSampler(Xoroshiro256(1), [1, 2])
+            with pytest.raises(TypeError):
+                smp.sample(1.0)  # type: ignore
+            with pytest.raises(ValueError):
+                smp.sample(-1)
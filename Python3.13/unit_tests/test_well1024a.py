@@ -175,6 +175,47 @@ class TestWell1024a:
         assert wll._state[21] == 0x797f89de
         assert wll._state[27] == 0xfddc00f7
 
+    #-------------------------------------------------------------------------
+    def test_next_n(self):
+        wll = Well1024a(0x0123_4567_89ab_cdef)
+        wll_ref = Well1024a(0x0123_4567_89ab_cdef)
+        values = wll.next_n(3_000)
+        assert values.typecode == 'I'  # type: ignore
+        assert list(values) == [wll_ref.next() for _ in range(3_000)]
+        assert wll.getstate() == wll_ref.getstate()
+
+        assert len(wll.next_n(0)) == 0
+        with pytest.raises(AssertionError):
+            wll.next_n(-1)
+
+    #-------------------------------------------------------------------------
+    def test_jump(self):
+        for n in (0, 1, 5, 100, 1027):
+            wll = Well1024a(0x0123_4567_89ab_cdef)
+            wll_ref = Well1024a(0x0123_4567_89ab_cdef)
+            wll.next_n(7)
+            wll_ref.next_n(7 + n)
+            wll.jump(n)
+            assert wll._f2state() == wll_ref._f2state()
+            assert wll.next_n(100) == wll_ref.next_n(100)
+
+        # jumps of 2^64 and 2^128 steps are provided in directory 'jumppolys'
+        wll = Well1024a(0x0123_4567_89ab_cdef)
+        wll_ref = Well1024a(0x0123_4567_89ab_cdef)
+        wll.jump(1 << 64)
+        wll_ref.jump(1 << 63)
+        wll_ref.jump(1 << 63)
+        assert wll._f2state() == wll_ref._f2state()
+        wll.jump((1 << 128) - (1 << 64))
+        wll_ref = Well1024a(0x0123_4567_89ab_cdef)
+        wll_ref.jump(1 << 128)
+        assert wll._f2state() == wll_ref._f2state()
+
+        with pytest.raises(TypeError):
+            wll.jump(1.0)  # type: ignore
+        with pytest.raises(ValueError):
+            wll.jump(-1)
+
     #-------------------------------------------------------------------------
     def test_seed(self):
         wll = Well1024a()
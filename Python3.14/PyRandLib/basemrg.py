@@ -21,6 +21,8 @@ SOFTWARE.
 """
 
 #=============================================================================
+from typing import Final
+
 from .listindexstate   import ListIndexState
 from .annotation_types import SeedStateType
 
@@ -66,8 +68,8 @@ class BaseMRG( ListIndexState ):
       print( rand(a) )    # prints a pseudo-random value within [0, a) or [0.0, a) depending on the type of a
       print( rand(a, n) ) # prints a list of n pseudo-random values each within [0, a)
     
-    Inheriting classes have to define class attributes  '_STATE_SIZE'  and  '_MODULO'. 
-    See Mrg287 for an example.
+    Inheriting classes have to define class attributes  '_STATE_SIZE',  '_MODULO'  and
+    '_LAGS'. See Mrg287 for an example.
 
     Reminder:
     We give you here below a copy of the table of tests for the MRGs that have 
@@ -88,6 +90,11 @@ class BaseMRG( ListIndexState ):
     should definitively pass.
     """
     
+    #-------------------------------------------------------------------------
+    _MULT: Final[int] = 1  # multiplier of the sum of the lagged values in the recurrence
+    _ADDEND: Final[int] = 0  # constant added in the recurrence
+
+
     #-------------------------------------------------------------------------
     def __init__(self, _initRandClass, _stateSize: int, _seedState: SeedStateType = None, /) -> None:  # type: ignore
         """Constructor.
@@ -109,5 +116,20 @@ class BaseMRG( ListIndexState ):
             # self._state and self._index, and sets them
             # since it internally calls self.setstate().
 
+
+    #-------------------------------------------------------------------------
+    def advance(self, _delta: int, /) -> None:
+        """Advances the internal state of this generator _delta steps ahead.
+
+        The internal state is the one that _delta successive calls to next()
+        would have reached,  the index in the internal list included,  but
+        the jump costs about log2(_delta) squares of polynomials.  Inheriting
+        classes have to define class attribute '_LAGS',  the lags of their
+        recurrence,  and may override class attributes '_MULT' and '_ADDEND'.
+        Raises ValueError if _delta is negative.
+        """
+        self._advancerecurrence( _delta, self._LAGS, self._MODULO, self._MULT, self._ADDEND )  # type: ignore
+
+
  
 #=====   end of module   basemrg.py   ========================================
@@ -21,10 +21,11 @@ SOFTWARE.
 """
 
 #=============================================================================
+from array  import array
 from typing import Final, override
 
 from .basepcg          import BasePCG
-from .annotation_types import Numerical
+from .annotation_types import Numerical, StatesList
 from .splitmix         import SplitMix64
 
 
@@ -120,33 +121,70 @@ class Pcg128_64( BasePCG ):
     """
 
     _A: Final[int] = 0x2360_ed05_1fc6_5da4_4385_df64_9fcc_f645  # LCG mult. attribute
-    _C: Final[int] = 0x5851_f42d_4c95_7f2d_1405_7b7e_f767_814f  # LCG add. attribute
+    _C: Final[int] = 0x5851_f42d_4c95_7f2d_1405_7b7e_f767_814f  # LCG add. attribute, i.e. the default stream increment
     _MODULO_128 : Final[int] = (1 << 128) - 1  # optimization here to get modulo via operator &
 
 
     #-------------------------------------------------------------------------
-    def __init__(self, _seed: Numerical = None, /) -> None:  # type: ignore
+    def __init__(self, _seed: Numerical = None, _stream: int = None, /) -> None:  # type: ignore
         """Constructor.
         
         Should _seed be None or not a numerical then the local 
         time is used (with its shuffled value) as a seed.
+        _stream selects one of the 2^127 streams of this PCG, i.e.
+        the odd increment of its LCG.  Should it be None then the
+        default increment of the reference implementation is used.
         """
+        self._inc = self._streaminc( _stream, Pcg128_64._C, Pcg128_64._MODULO_128 )
         super().__init__( _seed ) # this call creates attribute self._state and sets it
 
 
+    #-------------------------------------------------------------------------
+    def advance(self, _delta: int, /) -> None:
+        """Jumps the internal state of this generator _delta steps ahead.
+
+        The state reached is the one that _delta successive calls to next()
+        would have reached, but it is evaluated in O(log _delta) time. A
+        negative _delta steps this generator back.
+        """
+        if not isinstance(_delta, int):
+            raise TypeError(f"the advance delta must be an int (currently is {type(_delta)})")
+        self._state = self._lcgadvance( self._state, _delta, Pcg128_64._A, self._inc, Pcg128_64._MODULO_128 )
+
+
     #-------------------------------------------------------------------------
     @override
     def next(self) -> int:
         """This is the core of the pseudo-random generator.
         """
         # evaluates next internal state
-        self._state = (self._A * (previous_state := self._state) + self._C) & Pcg128_64._MODULO_128  # type: ignore
+        self._state = (self._A * (previous_state := self._state) + self._inc) & Pcg128_64._MODULO_128  # type: ignore
         # the permutated output is then computed
         random_rotation = previous_state >> 122  # random right rotation is set with the 6 upper bits of internal state  # type: ignore
         value = (previous_state ^ (previous_state >> 64)) & 0xffff_ffff_ffff_ffff  # type: ignore
         return (value >> random_rotation) | ((value & ((1 << random_rotation) - 1))) << (64 - random_rotation)
 
 
+    #-------------------------------------------------------------------------
+    @override
+    def next_n(self, count: int, /) -> array:
+        """Returns the next count pseudo-random values, as would count calls to next().
+        """
+        assert count >= 0, "the count of generated values must not be negative"
+        state = self._state
+        a, c = self._A, self._inc
+        values = [0] * count
+        for n in range(count):
+            # the permutated output is computed from the current state
+            rotation = state >> 122
+            value = (state ^ (state >> 64)) & 0xffff_ffff_ffff_ffff
+            values[n] = (value >> rotation) | ((value & ((1 << rotation) - 1)) << (64 - rotation))
+            # then the next internal state is evaluated
+            state = (a * state + c) & Pcg128_64._MODULO_128
+        self._state = state
+        return array('Q', values)
+
+
     #-------------------------------------------------------------------------
     @override
     def seed(self, _seed: Numerical = None, /) -> None:  # type: ignore
@@ -181,18 +219,24 @@ class Pcg128_64( BasePCG ):
 
     #-------------------------------------------------------------------------
     @override
-    def setstate(self, _state: int = None, /) -> None:  # type: ignore
+    def setstate(self, _state: int | StatesList = None, /) -> None:  # type: ignore
         """Restores the internal state of the generator.
         
         _state should have been obtained from a previous call 
         to  getstate(),  and setstate() restores the internal 
         state of the generator to what it  was  at  the  time 
-        setstate() was called.
+        setstate() was called. It is then a pair of integers:
+        the LCG state and the increment of the stream. Should
+        _state be None or an int,  this generator  is  seeded
+        with it and keeps its current stream.
         """
         if _state is None or isinstance( _state, int ):
             self.seed( _state )
+        elif isinstance( _state, list | tuple ) and len( _state ) == 2 and all( isinstance(s, int) for s in _state ):
+            self._state = _state[0] & Pcg128_64._MODULO_128
+            self._inc = (_state[1] & Pcg128_64._MODULO_128) | 1  # Notice: increment must be odd
         else:
-            raise TypeError(f"State value must be None or an int (currently is {type(_state)})")
+            raise TypeError(f"State value must be None, an int or a pair of ints (currently is {type(_state)})")
 
 
 #=====   end of module   pcg128_64.py   ======================================
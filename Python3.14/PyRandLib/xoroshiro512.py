@@ -21,7 +21,8 @@ SOFTWARE.
 """
 
 #=============================================================================
-from typing import override
+from array  import array
+from typing import Final, override
 
 from .baserandom       import BaseRandom
 from .basexoroshiro    import BaseXoroshiro
@@ -79,6 +80,18 @@ class Xoroshiro512( BaseXoroshiro ):
     should definitively pass.
     """
 
+    #-------------------------------------------------------------------------
+    _JUMP: Final[tuple[int, ...]] = (
+        0x33ed_89b6_e7a3_53f9, 0x7600_83d7_9553_23be, 0x2837_f2fb_b5f2_2fae, 0x4b8c_5674_d309_511c,
+        0xb11a_c47a_7ba2_8c25, 0xf1be_7667_092b_cc1c, 0x5385_1efd_b6df_0aaf, 0x1ebb_c8b2_3eaf_25db,
+    )  # jump polynomial, i.e. 2^256 steps ahead
+
+    _LONG_JUMP: Final[tuple[int, ...]] = (
+        0x1146_7fef_8f92_1d28, 0xa2a8_19f2_e79c_8ea8, 0xa829_9fc2_84b3_959a, 0xb4d3_4734_0ca6_3ee1,
+        0x1cb0_940b_edbf_f6ce, 0xd956_c5c4_fa1f_8e17, 0x915e_38fd_4eda_93bc, 0x5b3c_cdfa_5d7d_aca5,
+    )  # long-jump polynomial, i.e. 2^384 steps ahead
+
+
     #-------------------------------------------------------------------------
     def __init__(self, _seedState: Numerical | StatesList = None, /) -> None:  # type: ignore
         """Constructor.
@@ -120,4 +133,31 @@ class Xoroshiro512( BaseXoroshiro ):
         return (BaseRandom._rotleft( currentS1 * 5, 7) * 9) & BaseXoroshiro._MODULO  # type: ignore
 
 
+    #-------------------------------------------------------------------------
+    @override
+    def next_n(self, count: int, /) -> array:
+        """Returns the next count pseudo-random values, as would count calls to next().
+        """
+        assert count >= 0, "the count of generated values must not be negative"
+        s0, s1, s2, s3, s4, s5, s6, s7 = self._state
+        values = [0] * count
+        for n in range(count):
+            # evaluates the output value
+            values[n] = ((((v := (s1 * 5) & 0xffff_ffff_ffff_ffff) << 7) & 0xffff_ffff_ffff_ffff | (v >> 57)) * 9) & 0xffff_ffff_ffff_ffff
+            # then advances the internal state of the PRNG
+            currentS1 = s1
+            s2 ^= s0
+            s5 ^= s1
+            s1 ^= s2
+            s7 ^= s3
+            s3 ^= s4
+            s4 ^= s5
+            s0 ^= s6
+            s6 ^= s7
+            s6 ^= (currentS1 << 11) & 0xffff_ffff_ffff_ffff
+            s7 = ((s7 << 21) & 0xffff_ffff_ffff_ffff) | (s7 >> 43)
+        self._state[:] = self._statewords( (s0, s1, s2, s3, s4, s5, s6, s7) )
+        return array('Q', values)
+
+
 #=====   end of module   xoroshiro512.py   ===================================
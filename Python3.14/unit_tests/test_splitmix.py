@@ -23,6 +23,7 @@ SOFTWARE.
 #=============================================================================
 import pytest
 
+import PyRandLib.splitmix
 from PyRandLib.splitmix import SplitMix31, SplitMix32, SplitMix63, SplitMix64
 
 
@@ -86,6 +87,17 @@ class TestSplitMix64:
         with pytest.raises(TypeError):
             splt = SplitMix64(SplitMix64())  # type: ignore
 
+    #-------------------------------------------------------------------------
+    def test_fill(self, monkeypatch):
+        for numpyModule in (PyRandLib.splitmix.np, None):
+            monkeypatch.setattr(PyRandLib.splitmix, 'np', numpyModule)
+            for seed in (1, -1, 0xfedc_ba98_7654_3210_0123_4567_89ab_cdef):
+                splt = SplitMix64(seed)
+                splt_ref = SplitMix64(seed)
+                for n in (0, 1, 5, 63, 64, 1_000):
+                    assert splt.fill(n) == [splt_ref() for _ in range(n)]
+                assert splt() == splt_ref()
+
     #-------------------------------------------------------------------------
     def test_call_int(self):
         splt = SplitMix64()
@@ -157,6 +169,17 @@ class TestSplitMix63:
         with pytest.raises(TypeError):
             splt = SplitMix63(SplitMix63())  # type: ignore
 
+    #-------------------------------------------------------------------------
+    def test_fill(self, monkeypatch):
+        for numpyModule in (PyRandLib.splitmix.np, None):
+            monkeypatch.setattr(PyRandLib.splitmix, 'np', numpyModule)
+            for seed in (1, -1, 0xfedc_ba98_7654_3210_0123_4567_89ab_cdef):
+                splt = SplitMix63(seed)
+                splt_ref = SplitMix63(seed)
+                for n in (0, 1, 5, 63, 64, 1_000):
+                    assert splt.fill(n) == [splt_ref() for _ in range(n)]
+                assert splt() == splt_ref()
+
     #-------------------------------------------------------------------------
     def test_call_int(self):
         splt = SplitMix63()
@@ -228,6 +251,17 @@ class TestSplitMix32:
         with pytest.raises(TypeError):
             splt = SplitMix32(SplitMix32())  # type: ignore
 
+    #-------------------------------------------------------------------------
+    def test_fill(self, monkeypatch):
+        for numpyModule in (PyRandLib.splitmix.np, None):
+            monkeypatch.setattr(PyRandLib.splitmix, 'np', numpyModule)
+            for seed in (1, -1, 0xfedc_ba98_7654_3210_0123_4567_89ab_cdef):
+                splt = SplitMix32(seed)
+                splt_ref = SplitMix32(seed)
+                for n in (0, 1, 5, 63, 64, 1_000):
+                    assert splt.fill(n) == [splt_ref() for _ in range(n)]
+                assert splt() == splt_ref()
+
     #-------------------------------------------------------------------------
     def test_call_int(self):
         splt = SplitMix32()
@@ -299,6 +333,17 @@ class TestSplitMix31:
         with pytest.raises(TypeError):
             splt = SplitMix31(SplitMix31())  # type: ignore
 
+    #-------------------------------------------------------------------------
+    def test_fill(self, monkeypatch):
+        for numpyModule in (PyRandLib.splitmix.np, None):
+            monkeypatch.setattr(PyRandLib.splitmix, 'np', numpyModule)
+            for seed in (1, -1, 0xfedc_ba98_7654_3210_0123_4567_89ab_cdef):
+                splt = SplitMix31(seed)
+                splt_ref = SplitMix31(seed)
+                for n in (0, 1, 5, 63, 64, 1_000):
+                    assert splt.fill(n) == [splt_ref() for _ in range(n)]
+                assert splt() == splt_ref()
+
     #-------------------------------------------------------------------------
     def test_call_int(self):
         splt = SplitMix31()
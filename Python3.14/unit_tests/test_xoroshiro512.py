@@ -199,6 +199,40 @@ class TestXoroshiro512:
         assert xrsr._state[6] == 0xfad74f72516c3bfd
         assert xrsr._state[7] == 0x8f2b04287d66d6e6
 
+    #-------------------------------------------------------------------------
+    def test_next_n(self):
+        xrsr = Xoroshiro512(0x0123_4567_89ab_cdef)
+        xrsr_ref = Xoroshiro512(0x0123_4567_89ab_cdef)
+        values = xrsr.next_n(3_000)
+        assert values.typecode == 'Q'  # type: ignore
+        assert list(values) == [xrsr_ref.next() for _ in range(3_000)]
+        assert xrsr.getstate() == xrsr_ref.getstate()
+
+        assert len(xrsr.next_n(0)) == 0
+        with pytest.raises(AssertionError):
+            xrsr.next_n(-1)
+
+    #-------------------------------------------------------------------------
+    def test_jump(self):
+        xrsr = Xoroshiro512(0x0123_4567_89ab_cdef)
+        xrsr.jump()
+        assert list(xrsr.next_n(3)) == [0x5efa_d7e8_68fd_e265, 0x6da7_19b6_d4fa_8db9, 0x03b3_9d8b_b00a_5ce8]
+
+        xrsr = Xoroshiro512(0x0123_4567_89ab_cdef)
+        xrsr.long_jump()
+        assert list(xrsr.next_n(3)) == [0xbde5_7c68_14ae_4814, 0x91de_1615_3f53_9916, 0x0439_d088_676f_c9bc]
+
+        # jump polynomial x^k mod charpoly is x^k itself as long as k is less than the state bits count
+        for k in (0, 1, 5, 100, 511):
+            xrsr = Xoroshiro512(0x0123_4567_89ab_cdef)
+            xrsr_ref = Xoroshiro512(0x0123_4567_89ab_cdef)
+            xrsr.next_n(7)
+            jumpPoly = [0] * 8
+            jumpPoly[k // 64] = 1 << (k % 64)
+            xrsr._jumpwith(tuple(jumpPoly))
+            xrsr_ref.next_n(7 + k)
+            assert xrsr.next_n(100) == xrsr_ref.next_n(100)
+
     #-------------------------------------------------------------------------
     def test_seed(self):
         xrsr = Xoroshiro512()
@@ -325,3 +359,24 @@ class TestXoroshiro512:
             _state = [i+1 for i in range(TestXoroshiro512.Xoroshiro512_STATE_SIZE)]  # type: ignore
             _state[TestXoroshiro512.Xoroshiro512_STATE_SIZE - 5] = {1, 2}
             xrsr.setstate(_state)  # type: ignore
+
+    #-------------------------------------------------------------------------
+    def test_spawn(self):
+        xrsr = Xoroshiro512(0x0123_4567_89ab_cdef)
+        xrsr_ref = Xoroshiro512(0x0123_4567_89ab_cdef)
+        xrsr.next_n(5)
+        xrsr_ref.next_n(5)
+        children = xrsr.spawn(3)
+        for child in children:
+            assert type(child) is Xoroshiro512
+            assert child._state is not xrsr._state
+            assert child.getstate() == xrsr_ref.getstate()
+            xrsr_ref.long_jump()
+        assert xrsr.getstate() == xrsr_ref.getstate()
+        assert list(children[0].next_n(10)) != list(children[1].next_n(10))
+        assert xrsr.spawn(0) == []
+
+        with pytest.raises(TypeError):
+            xrsr.spawn(3.0)  # type: ignore
+        with pytest.raises(ValueError):
+            xrsr.spawn(-3)
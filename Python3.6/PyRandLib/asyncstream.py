@@ -0,0 +1,211 @@
+"""
+Copyright (c) 2025 Philippe Schmouker, ph (dot) schmouker (at) gmail.com
+
+Permission is hereby granted,  free of charge,  to any person obtaining a copy
+of this software and associated documentation files (the "Software"),  to deal
+in the Software without restriction, including  without  limitation the rights
+to use,  copy,  modify,  merge,  publish,  distribute, sublicense, and/or sell
+copies of the Software,  and  to  permit  persons  to  whom  the  Software  is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS",  WITHOUT WARRANTY OF ANY  KIND,  EXPRESS  OR
+IMPLIED,  INCLUDING  BUT  NOT  LIMITED  TO  THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT  SHALL  THE
+AUTHORS  OR  COPYRIGHT  HOLDERS  BE  LIABLE  FOR  ANY CLAIM,  DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT,  TORT OR OTHERWISE, ARISING FROM,
+OUT  OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+#=============================================================================
+import asyncio
+import math
+import time
+from array              import array
+from concurrent.futures import Executor
+from typing             import List, Optional, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+from .baserandom import BaseRandom
+
+
+#=============================================================================
+class AsyncRandomStream:
+    """Asynchronous stream of the pseudo-random values of any PyRandLib generator, for asyncio.
+
+    This module is part of library PyRandLib.
+
+    Copyright (c) 2025 Philippe Schmouker
+
+    The output values of the wrapped generator are evaluated batch by batch
+    with its method next_n().  Batches which evaluation would block the event
+    loop for more than a time slice are evaluated in an executor,  the time
+    of evaluation of the values being measured at each batch.  Evaluations in
+    the executor release the global interpreter lock after each time slice,
+    so that the event loop keeps on running while they last.  The values are
+    exactly the same,  and in the same order,  as the ones of the wrapped
+    generator, whatever the interleaving of the awaiting coroutines.
+
+      stream = AsyncRandomStream( Cwg64(1), 65536 )
+      async for x in stream:                   # x is a pseudo-random value within [0.0, 1.0)
+          ...
+      values = await stream.random_array( n )  # n pseudo-random values within [0.0, 1.0)
+
+    Notice: the wrapped generator is modified by the executor.  It must not
+    be used on its own while it is wrapped.
+    """
+
+    #-------------------------------------------------------------------------
+    _MIN_CHUNK_SIZE: int = 256  # the minimal count of values evaluated at once
+
+
+    #-------------------------------------------------------------------------
+    def __init__(self, prng: BaseRandom, batch: int = 65536, timeSlice: float = 0.001, executor: Executor = None) -> None:  # type: ignore
+        """Constructor.
+
+        prng is the wrapped PyRandLib generator.  batch is the count of values
+        that are evaluated at once each time the current batch is exhausted.
+        timeSlice is the maximal time, in seconds,  that the evaluation of
+        values may block the event loop.  executor is the executor in which
+        longer evaluations are run,  the default executor of the event loop
+        being used when it is None.
+        """
+        if not isinstance( prng, BaseRandom ):
+            raise TypeError( f"the wrapped generator must be a PyRandLib generator (currently is {type(prng)})" )
+        if not isinstance( batch, int ):
+            raise TypeError( f"the size of batches must be an integer (currently is {type(batch)})" )
+        if batch <= 0:
+            raise ValueError( f"the size of batches must be positive (currently is {batch})" )
+        if not isinstance( timeSlice, (int, float) ) or not timeSlice >= 0.0:
+            raise ValueError( f"the time slice must be a non negative number of seconds (currently is {timeSlice})" )
+
+        self._prng = prng
+        self._batch = batch
+        self._timeSlice = timeSlice
+        self._executor = executor
+        self._values = prng._outarray( [] )
+        self._index = 0
+        self._valueTime = math.inf  # notice: the time of evaluation of one value, unknown until a first batch is evaluated
+        self._lock: Optional[asyncio.Lock] = None  # notice: created in the event loop, at first need
+
+
+    #-------------------------------------------------------------------------
+    @property
+    def prng(self) -> BaseRandom:
+        """The wrapped PyRandLib generator.
+        """
+        return self._prng
+
+
+    #-------------------------------------------------------------------------
+    def __aiter__(self) -> 'AsyncRandomStream':
+        """Returns this stream, which is its own asynchronous iterator.
+        """
+        return self
+
+
+    #-------------------------------------------------------------------------
+    async def __anext__(self) -> float:
+        """Returns the next pseudo-random float value in [0.0, 1.0), as would method random() of the wrapped generator.
+
+        The stream never ends.
+        """
+        if self._index >= len( self._values ):
+            async with self._getlock():
+                if self._index >= len( self._values ):
+                    self._values = await self._evaluate( self._batch )
+                    self._index = 0
+
+        value = self._values[self._index]
+        self._index += 1
+        return value * self._prng._NORMALIZE
+
+
+    #-------------------------------------------------------------------------
+    async def next_n(self, count: int) -> Union[array, List[int]]:
+        """Returns the next count pseudo-random integer values, as would method next_n() of the wrapped generator.
+
+        The remaining values of the current batch are returned first,  then
+        the other ones are directly evaluated by the wrapped generator.  They
+        are returned in the same kind of array as next_n() would return.
+        """
+        assert count >= 0, "the count of generated values must not be negative"
+        async with self._getlock():
+            values = self._values[self._index : self._index + count]
+            self._index += len( values )
+            if len( values ) < count:
+                values.extend( await self._evaluate(count - len(values)) )
+        return values
+
+
+    #-------------------------------------------------------------------------
+    async def random_array(self, n: int) -> 'np.ndarray | array':  # type: ignore
+        """Returns the next n pseudo-random float values in [0.0, 1.0) at once.
+
+        The values are the same as n successive calls to random() of the
+        wrapped generator would return.  They are returned in a numpy array
+        of float64 values,  or in an array of typecode 'd' when numpy is not
+        available.
+        """
+        values = await self.next_n( n )
+        normalize = self._prng._NORMALIZE
+        if np is None:
+            return array( 'd', [v * normalize for v in values] )
+        elif self._prng._OUT_BITS <= 64:
+            return np.asarray( values, dtype=np.float64 ) * normalize
+        else:
+            return np.array( [v * normalize for v in values], dtype=np.float64 )
+
+
+    #-------------------------------------------------------------------------
+    async def _evaluate(self, _count: int) -> Union[array, List[int]]:
+        """Evaluates the next _count values of the wrapped generator.
+
+        They are evaluated in the event loop if this is expected to last less
+        than the time slice,  and in the executor otherwise. The time of
+        evaluation of one value gets updated on each evaluation.
+        """
+        if _count * self._valueTime <= self._timeSlice:
+            return self._timednext_n( _count )
+        else:
+            return await asyncio.get_running_loop().run_in_executor( self._executor, self._timednext_n, _count )
+
+
+    #-------------------------------------------------------------------------
+    def _getlock(self) -> asyncio.Lock:
+        """Returns the lock which serializes the evaluations of the values.
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+
+    #-------------------------------------------------------------------------
+    def _timednext_n(self, _count: int) -> Union[array, List[int]]:
+        """Returns the next _count values of the wrapped generator and measures the time of their evaluation.
+
+        The values are evaluated by chunks lasting about the time slice.  The
+        global interpreter lock is released between chunks,  so that the event
+        loop is not blocked by the evaluations that are run in the executor.
+        """
+        prng = self._prng
+        values = prng._outarray( [] )
+        while (remaining := _count - len(values)) > 0:
+            chunk = min( remaining, max(self._MIN_CHUNK_SIZE, int(self._timeSlice / self._valueTime)) )
+            start = time.perf_counter()
+            values.extend( prng.next_n(chunk) )
+            self._valueTime = max( time.perf_counter() - start, 1e-9 ) / chunk  # notice: never null, whatever the resolution of the clock
+            if chunk < remaining:
+                time.sleep( 0 )  # notice: releases the GIL, letting the event loop run
+        return values
+
+
+#=====   end of module   asyncstream.py   ====================================
@@ -21,6 +21,8 @@ SOFTWARE.
 """
 
 #=============================================================================
+from typing import List
+
 from .baserandom       import BaseRandom
 from .annotation_types import SeedStateType, StatesListAndExt
 
@@ -83,6 +85,10 @@ class BaseCWG( BaseRandom ):
     should definitively pass.
     """
     
+    #-------------------------------------------------------------------------
+    _S_MODULO: int = (1 << 64) - 1  # the modulo of the Weyl increment s, to be overridden in inheriting classes with larger ones
+
+
     #-------------------------------------------------------------------------
     def __init__(self, _seedState: SeedStateType = None) -> None:  # type: ignore
         """Constructor. 
@@ -112,4 +118,26 @@ class BaseCWG( BaseRandom ):
         return (self._a, self._weyl, self._s, self._state)  # type: ignore
 
 
+    #-------------------------------------------------------------------------
+    def spawn(self, n: int) -> 'List[BaseCWG]':
+        """Returns n new generators of the same class, each one running its own stream.
+
+        Each odd value of the Weyl increment s initiates a unique period  (see
+        [8] in file README.md).  The children are seeded as with base class
+        BaseRandom,  and they then get odd Weyl increments drawn from this
+        generator,  which moves forward with each call to spawn().  These
+        increments are distinct from each other and from the one  of  this
+        generator,  so that none of them run the same stream.
+        """
+        children = super().spawn( n )
+        increments = { self._s }  # type: ignore
+        for child in children:
+            s = self._s  # type: ignore
+            while s in increments:
+                s = self.getrandbits( self._S_MODULO.bit_length() ) | 1
+            increments.add( s )
+            child._s = s  # type: ignore
+        return children  # type: ignore
+
+
 #=====   end of module   basecwg.py   ========================================
@@ -101,5 +101,23 @@ class BaseLCG( BaseRandom ):
         inheriting class.
         """
         return self._state  # type: ignore
- 
+
+
+    #-------------------------------------------------------------------------
+    def advance(self, _delta: int) -> None:
+        """Jumps ahead the internal state of this generator by _delta steps.
+
+        After this call, the internal state is the one that would have been
+        reached after _delta calls to next(),  but it is evaluated in O(log
+        _delta) time.  Negative values of _delta step back the generator. 
+        Useful to split one single sequence into disjoint and  reproducible
+        sub-sequences.
+        Inheriting classes MUST define the class attributes _A, _C and _MODULO
+        of their LCG, _MODULO being the mask of the modulo power of 2.
+        """
+        if not isinstance(_delta, int):
+            raise TypeError(f"the advance delta must be an int (currently is {type(_delta)})")
+        self._state = self._lcgadvance( self._state, _delta, self._A, self._C, self._MODULO )  # type: ignore
+
+
 #=====   end of module   baselcg.py   ========================================
@@ -21,7 +21,7 @@ SOFTWARE.
 """
 
 #=============================================================================
-from typing import Union
+from typing import Tuple, Union
 
 from .listindexstate   import ListIndexState
 from .annotation_types import Numerical, StatesList
@@ -130,6 +130,16 @@ class BaseXoroshiro( ListIndexState ):
             # since it internally calls self.setstate().
 
 
+    #-------------------------------------------------------------------------
+    def compact_state(self, compact: bool = True) -> None:
+        """Keeps the internal state of this generator in a list.
+
+        The internal states of the Xoroshiros are 16 words long at most,  so
+        an array would hardly save memory while it would slow down next().
+        """
+        pass
+
+
     #-------------------------------------------------------------------------
     def seed(self, _seed: Numerical = None) -> None:  # type: ignore
         """Initiates the internal state of this pseudo-random generator.
@@ -137,6 +147,32 @@ class BaseXoroshiro( ListIndexState ):
         super().seed( _seed )
 
 
+    #-------------------------------------------------------------------------
+    def jump(self) -> None:
+        """Jumps the internal state of this generator ahead.
+
+        The jump is equivalent to 2^128, 2^256 or 2^512 calls to next(), for
+        resp. Xoroshiro256, Xoroshiro512 and Xoroshiro1024.  It is evaluated
+        with the jump polynomials published by the authors of the algorithm
+        (see [10] in file README.md).  Successive calls to jump() provide the
+        starting points of that many non-overlapping subsequences,  e.g. for
+        parallel computations.
+        """
+        self._jumpwith( self._JUMP )  # notice: attribute _JUMP MUST be defined in inheriting classes  # type: ignore
+
+
+    #-------------------------------------------------------------------------
+    def long_jump(self) -> None:
+        """Jumps the internal state of this generator far ahead.
+
+        The jump is equivalent to 2^192, 2^384 or 2^768 calls to next(), for
+        resp. Xoroshiro256, Xoroshiro512 and Xoroshiro1024.  Successive calls
+        to long_jump() provide starting points from each of which successive
+        calls to jump() provide in turn non-overlapping subsequences.
+        """
+        self._jumpwith( self._LONG_JUMP )  # notice: attribute _LONG_JUMP MUST be defined in inheriting classes  # type: ignore
+
+
     #-------------------------------------------------------------------------
     def setstate(self, _state: StatesList = None) -> None:  # type: ignore
         """Restores the internal state of the generator.
@@ -149,4 +185,49 @@ class BaseXoroshiro( ListIndexState ):
         super().setstate(_state)
 
 
+    #-------------------------------------------------------------------------
+    def spawn(self, n: int) -> 'List[BaseXoroshiro]':
+        """Returns n new generators of the same class, each one starting a non-overlapping subsequence.
+
+        The first child gets the current internal state of this generator,
+        which then calls long_jump() once per child,  so that the children
+        start 2^192,  2^384 or 2^768 steps apart from each other,  for resp.
+        Xoroshiro256,  Xoroshiro512 and Xoroshiro1024,  and this generator
+        starts after all of them.  Each child can then provide in turn non-
+        overlapping subsequences with successive calls to jump().
+        """
+        if not isinstance( n, int ):
+            raise TypeError( f"the count of spawned generators must be an integer (currently is {type(n)})" )
+        if n < 0:
+            raise ValueError( f"the count of spawned generators must not be negative (currently is {n})" )
+
+        children = []
+        for _ in range(n):
+            child = type(self)()
+            child.restore( self.getstate() )
+            children.append( child )
+            self.long_jump()
+        return self._likestate( children )  # type: ignore
+
+
+    #-------------------------------------------------------------------------
+    def _jumpwith(self, _jumpPoly: Tuple[int, ...]) -> None:
+        """Jumps the internal state of this generator according to a jump polynomial.
+
+        _jumpPoly contains the coefficients of the polynomial,  64 per integer,
+        lowest degrees first. The new state is the sum, over the coefficients
+        set to 1,  of the states that are reached by successive calls to next().
+        Inheriting classes which internal state is indexed MUST OVERRIDE this
+        method. See Xoroshiro1024 for an example.
+        """
+        state = self._state
+        jumped = [0] * self._STATE_SIZE
+        for word in _jumpPoly:
+            for b in range(64):
+                if (word >> b) & 1:
+                    jumped = [j ^ s for j, s in zip(jumped, state)]  # type: ignore
+                self.next()
+        state[:] = self._statewords( jumped )  # type: ignore
+
+
 #=====   end of module   basexoroshiro.py   ==================================
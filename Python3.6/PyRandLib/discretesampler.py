@@ -0,0 +1,188 @@
+"""
+Copyright (c) 2025 Philippe Schmouker, ph (dot) schmouker (at) gmail.com
+
+Permission is hereby granted,  free of charge,  to any person obtaining a copy
+of this software and associated documentation files (the "Software"),  to deal
+in the Software without restriction, including  without  limitation the rights
+to use,  copy,  modify,  merge,  publish,  distribute, sublicense, and/or sell
+copies of the Software,  and  to  permit  persons  to  whom  the  Software  is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS",  WITHOUT WARRANTY OF ANY  KIND,  EXPRESS  OR
+IMPLIED,  INCLUDING  BUT  NOT  LIMITED  TO  THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT  SHALL  THE
+AUTHORS  OR  COPYRIGHT  HOLDERS  BE  LIABLE  FOR  ANY CLAIM,  DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT,  TORT OR OTHERWISE, ARISING FROM,
+OUT  OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+#=============================================================================
+import math
+from array     import array
+from functools import lru_cache
+from typing    import Any, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+from .baserandom import BaseRandom
+
+
+#=============================================================================
+class DiscreteSampler:
+    """Weighted sampler of a fixed discrete distribution, bound to a PyRandLib generator.
+
+    This module is part of library PyRandLib.
+
+    Copyright (c) 2025 Philippe Schmouker
+
+    The sampler builds once the alias table of the distribution, as described
+    by M. D. Vose in "A Linear Algorithm for Generating Random Numbers with a
+    Given Distribution",  IEEE Trans. Softw. Eng.,  1991,  after the  method
+    of A. J. Walker.  Every draw then costs one output value of the generator
+    whatever the count of weights:  the output value, normalized in [0.0,
+    1.0) and multiplied by the count of weights,  provides the index of a
+    column of the table by its integer part and, by its fractional part,  the
+    choice between the index and its alias in the column.
+
+    Alias tables are cached in a least-recently-used cache keyed by the
+    weights,  so that samplers that are built for already used weights,
+    e.g. by method choices() of the PyRandLib generators,  reuse their table.
+
+      sampler = DiscreteSampler( Xoroshiro256(1), [0.5, 0.25, 0.25], ['a', 'b', 'c'] )
+      print( sampler.draw() )      # prints 'a', 'b' or 'c'
+      print( sampler.sample(10) )  # prints a list of 10 such items
+    """
+
+    #-------------------------------------------------------------------------
+    _CACHE_SIZE: int = 128  # the count of alias tables kept in cache
+    _NUMPY_MIN_COUNT: int = 64  # the minimal count of samples for which numpy is worth its overhead
+
+
+    #-------------------------------------------------------------------------
+    def __init__(self, prng: BaseRandom, weights: Sequence[float], population: Sequence[Any] = None) -> None:  # type: ignore
+        """Constructor.
+
+        prng is the PyRandLib generator that draws the samples.  weights  are
+        the relative weights of the items of population,  which must all  be
+        finite and non negative,  their sum being positive.  Should population
+        be None, the indexes of the weights are drawn instead of items.
+        """
+        if not isinstance( prng, BaseRandom ):
+            raise TypeError( f"the sampling generator must be a PyRandLib generator (currently is {type(prng)})" )
+        if population is not None and len( population ) != len( weights ):
+            raise ValueError( f"the count of weights ({len(weights)}) does not match the size of the population ({len(population)})" )
+
+        self._prng = prng
+        self._population = population
+        self._probs, self._aliases = self._aliastables( tuple(weights) )
+        self._count = len( self._probs )
+        self._npTables = None  # notice: numpy arrays of the alias table, evaluated at first need
+
+
+    #-------------------------------------------------------------------------
+    @property
+    def prng(self) -> BaseRandom:
+        """The PyRandLib generator that draws the samples.
+        """
+        return self._prng
+
+
+    #-------------------------------------------------------------------------
+    def draw(self) -> Any:
+        """Returns one randomly chosen item of the population, or its index if the population is None.
+        """
+        prng = self._prng
+        bits = min( prng._OUT_BITS, 53 )
+        x = (prng.next() >> (prng._OUT_BITS - bits)) * (1.0 / (1 << bits)) * self._count
+        i = min( int(x), self._count - 1 )
+        index = i if x - i < self._probs[i] else self._aliases[i]
+        return index if self._population is None else self._population[index]
+
+
+    #-------------------------------------------------------------------------
+    def sample(self, k: int) -> 'list[Any] | np.ndarray | array':  # type: ignore
+        """Returns k randomly chosen items of the population, with replacement.
+
+        The items are returned in a list.  Should the population be None,  their
+        indexes are returned instead in a numpy array of int64 values,  or in
+        an array of typecode 'q' when numpy is not available or when k is less
+        than 64.  The output values of the generator are all evaluated at once
+        with its method next_n(),  and the indexes with numpy vectorized
+        arithmetic when available. They are the same as k successive calls to
+        draw() would return.
+        """
+        if not isinstance( k, int ):
+            raise TypeError( f"the count of samples must be an integer (currently is {type(k)})" )
+        if k < 0:
+            raise ValueError( f"the count of samples must not be negative (currently is {k})" )
+
+        outBits = self._prng._OUT_BITS
+        bits = min( outBits, 53 )
+        words = self._prng.next_n( k )
+        if outBits > 64:
+            words = [w >> (outBits - bits) for w in words]
+            outBits = bits
+
+        if np is None or k < self._NUMPY_MIN_COUNT:
+            probs, aliases, count, scale = self._probs, self._aliases, self._count, 1.0 / (1 << bits)
+            indexes = array( 'q', [0] * k )
+            for n, w in enumerate( words ):
+                x = (w >> (outBits - bits)) * scale * count
+                i = min( int(x), count - 1 )
+                indexes[n] = i if x - i < probs[i] else aliases[i]
+        else:
+            if self._npTables is None:
+                self._npTables = (np.asarray( self._probs ), np.asarray( self._aliases, dtype=np.int64 ))
+            probs, aliases = self._npTables
+            x = (np.asarray( words, dtype=np.uint64 ) >> np.uint64( outBits - bits )) * (1.0 / (1 << bits)) * self._count
+            i = np.minimum( x.astype( np.int64 ), self._count - 1 )
+            indexes = np.where( x - i < probs[i], i, aliases[i] )
+
+        if self._population is None:
+            return indexes
+        else:
+            population = self._population
+            return [ population[index] for index in indexes ]
+
+
+    #-------------------------------------------------------------------------
+    @staticmethod
+    @lru_cache( maxsize=_CACHE_SIZE )
+    def _aliastables(weights: Tuple[float, ...]) -> Tuple[List[float], List[int]]:
+        """Returns the alias table of a discrete distribution, evaluated with the method of M. D. Vose.
+
+        The table is returned as the list of the probabilities to keep the
+        index of each column and the list of the aliases of the columns. The
+        tables are cached.
+        """
+        if len( weights ) == 0:
+            raise ValueError( "the weights of the distribution must not be empty" )
+        if not all( math.isfinite(w) and w >= 0 for w in weights ):
+            raise ValueError( "the weights of the distribution must all be finite and non negative" )
+        if (total := math.fsum( weights )) <= 0.0:
+            raise ValueError( "the total of the weights of the distribution must be positive" )
+
+        count = len( weights )
+        scaled = [ w * count / total for w in weights ]
+        probs = [1.0] * count
+        aliases = list( range(count) )
+        small = [ i for i, p in enumerate(scaled) if p < 1.0 ]
+        large = [ i for i, p in enumerate(scaled) if p >= 1.0 ]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            probs[s], aliases[s] = scaled[s], l
+            scaled[l] = (scaled[l] + scaled[s]) - 1.0
+            (small if scaled[l] < 1.0 else large).append( l )
+        # notice: the remaining columns keep probability 1.0, whatever the rounding errors
+
+        return probs, aliases
+
+
+#=====   end of module   discretesampler.py   ================================
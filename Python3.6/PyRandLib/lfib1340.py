@@ -21,6 +21,9 @@ SOFTWARE.
 """
 
 #=============================================================================
+from array import array
+from typing import Tuple
+
 from .baselfib64       import BaseLFib64
 from .annotation_types import SeedStateType
 
@@ -109,6 +112,10 @@ class LFib1340( BaseLFib64 ):
     should definitively pass.
     """
 
+    #-------------------------------------------------------------------------
+    _LAGS: Tuple[int, ...] = (861, 1279)  # lags of the recurrence
+
+
     #-------------------------------------------------------------------------
     def __init__(self, _seed: SeedStateType = None) -> None:  # type: ignore
         """Constructor.
@@ -124,18 +131,41 @@ class LFib1340( BaseLFib64 ):
     def next(self) -> int:
         """This is the core of the pseudo-random generator.
         """
+        state = self._state  # notice: the local binding speeds up the accesses to the internal state
+        i = self._index
         # evaluates indexes in suite for the i-861 and i-1279 -th values
         
-        if (k861 := self._index-861) < 0:
+        if (k861 := i - 861) < 0:
             k861 += self._STATE_SIZE  # notice: attribute _STATE_SIZE is set in base class
         
         # then evaluates current value
-        self._state[self._index] = (myValue := (self._state[k861] + self._state[self._index]) & 0xffff_ffff_ffff_ffff)  # type: ignore
+        state[i] = (myValue := (state[k861] + state[i]) & 0xffff_ffff_ffff_ffff)  # type: ignore
         
         # next index
-        self._index = (self._index+1) % self._STATE_SIZE
+        self._index = (i + 1) % self._STATE_SIZE
         
         return myValue
 
 
+    #-------------------------------------------------------------------------
+    def next_n(self, count: int) -> array:
+        """Returns the next count pseudo-random values, as would count calls to next().
+        """
+        assert count >= 0, "the count of generated values must not be negative"
+        state = self._state
+        i = self._index
+        values = [0] * count
+        for n in range(count):
+            # evaluates index in suite for the i-861 -th value
+            if (k861 := i - 861) < 0:
+                k861 += 1279
+            # then evaluates current value
+            values[n] = state[i] = (state[k861] + state[i]) & 0xffff_ffff_ffff_ffff
+            # next index
+            if (i := i + 1) == 1279:
+                i = 0
+        self._index = i
+        return array('Q', values)
+
+
 #=====   end of module   lfib1340.py   ======================================
@@ -21,6 +21,9 @@ SOFTWARE.
 """
 
 #=============================================================================
+from array import array
+from typing import Tuple
+
 from .basemrg          import BaseMRG
 from .annotation_types import SeedStateType
 from .splitmix         import SplitMix31
@@ -118,6 +121,12 @@ class Mrg1457( BaseMRG ):
     """
 
 
+    #-------------------------------------------------------------------------
+    _LAGS: Tuple[int, ...] = (1, 24, 47)  # lags of the recurrence
+    _MODULO: int = 2_147_483_647  # modulo of the recurrence
+    _MULT: int = 0x0408_0000  # i.e. 2^26 + 2^19  # type: ignore
+
+
     #-------------------------------------------------------------------------
     def __init__(self, _seed: SeedStateType = None) -> None:  # type: ignore
         """Constructor.
@@ -133,25 +142,50 @@ class Mrg1457( BaseMRG ):
     def next(self) -> int:
         """This is the core of the pseudo-random generator.
         """
+        state = self._state  # notice: the local binding speeds up the accesses to the internal state
+        i = self._index
         # The DX-47-3 version uses the recurrence
         #   x(i) = (2^26+2^19) * (x(i-1) + x(i-24) + x(i-47)) mod (2^31-1)
 
         # evaluates indexes in suite for the i-1, i-24 (and i-47) -th values
-        if (k1 := self._index - 1) < 0:
+        if (k1 := i - 1) < 0:
             k1 = self._STATE_SIZE - 1  # notice: attribute _STATE_SIZE is set in base class
         
-        if (k24 := self._index - 24) < 0:
+        if (k24 := i - 24) < 0:
             k24 += self._STATE_SIZE
         
         # then evaluates current value
-        myValue = (0x0408_0000 * (self._state[k1] + self._state[k24] + self._state[self._index])) % 2_147_483_647  # type: ignore
-        self._state[self._index] = myValue
+        myValue = (0x0408_0000 * (state[k1] + state[k24] + state[i])) % 2_147_483_647  # type: ignore
+        state[i] = myValue
         
         # next index
-        self._index = (self._index + 1) % self._STATE_SIZE
+        self._index = (i + 1) % self._STATE_SIZE
 
         # then returns the integer generated value
         return  myValue
 
 
+    #-------------------------------------------------------------------------
+    def next_n(self, count: int) -> array:
+        """Returns the next count pseudo-random values, as would count calls to next().
+        """
+        assert count >= 0, "the count of generated values must not be negative"
+        state = self._state
+        i = self._index
+        values = [0] * count
+        for n in range(count):
+            # evaluates indexes in suite for the i-1, i-24 (and i-47) -th values
+            if (k1 := i - 1) < 0:
+                k1 = 46
+            if (k24 := i - 24) < 0:
+                k24 += 47
+            # then evaluates current value
+            values[n] = state[i] = (0x0408_0000 * (state[k1] + state[k24] + state[i])) % 2_147_483_647
+            # next index
+            if (i := i + 1) == 47:
+                i = 0
+        self._index = i
+        return array('I', values)
+
+
 #=====   end of module   mrgrand1457.py   ====================================
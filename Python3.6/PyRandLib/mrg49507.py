@@ -21,6 +21,9 @@ SOFTWARE.
 """
 
 #=============================================================================
+from array import array
+from typing import Tuple
+
 from .basemrg          import BaseMRG
 from .annotation_types import SeedStateType
 from .splitmix         import SplitMix31
@@ -119,6 +122,11 @@ class Mrg49507( BaseMRG ):
     """
 
     _MULT = -(1 << 25) - (1 << 7)
+    _LAGS: Tuple[int, ...] = (7, 1597)  # lags of the recurrence
+    _MODULO: int = 2_147_483_647  # modulo of the recurrence
+    _ADDEND: int = (1 << 64) % 2_147_483_647  # type: ignore
+    # notice: the 64-bits masking of the negative products in next() adds 2^64 to them,
+    # except when x(i-7) and x(i-1597) are both 0,  which method advance() ignores.
 
 
     #-------------------------------------------------------------------------
@@ -136,20 +144,45 @@ class Mrg49507( BaseMRG ):
     def next(self) -> int:
         """This is the core of the pseudo-random generator.
         """
+        state = self._state  # notice: the local binding speeds up the accesses to the internal state
+        i = self._index
         # evaluates indexes in suite for the i-7, i-1597 -th values
-        if (k7 := self._index - 7) < 0:
+        if (k7 := i - 7) < 0:
             k7 += self._STATE_SIZE  # notice: attribute _STATE_SIZE is set in base class
         
         # then evaluates current value
-        v = (Mrg49507._MULT * (self._state[k7] + self._state[self._index])) & 0xffff_ffff_ffff_ffff  # type: ignore
+        v = (Mrg49507._MULT * (state[k7] + state[i])) & 0xffff_ffff_ffff_ffff  # type: ignore
         myValue = (v % 2_147_483_647) & 0x7fff_ffff
-        self._state[self._index] = myValue
+        state[i] = myValue
         
         # next index
-        self._index = (self._index+1) % self._STATE_SIZE
+        self._index = (i + 1) % self._STATE_SIZE
         
         # then returns the integer generated value
         return  myValue
 
 
+    #-------------------------------------------------------------------------
+    def next_n(self, count: int) -> array:
+        """Returns the next count pseudo-random values, as would count calls to next().
+        """
+        assert count >= 0, "the count of generated values must not be negative"
+        state = self._state
+        i = self._index
+        mult = Mrg49507._MULT
+        values = [0] * count
+        for n in range(count):
+            # evaluates index in suite for the i-7 (and i-1597) -th values
+            if (k7 := i - 7) < 0:
+                k7 += 1597
+            # then evaluates current value
+            v = (mult * (state[k7] + state[i])) & 0xffff_ffff_ffff_ffff
+            values[n] = state[i] = (v % 2_147_483_647) & 0x7fff_ffff
+            # next index
+            if (i := i + 1) == 1597:
+                i = 0
+        self._index = i
+        return array('I', values)
+
+
 #=====   end of module   mrgrand49507.py   ===================================
@@ -0,0 +1,235 @@
+"""
+Copyright (c) 2025 Philippe Schmouker, ph (dot) schmouker (at) gmail.com
+
+Permission is hereby granted,  free of charge,  to any person obtaining a copy
+of this software and associated documentation files (the "Software"),  to deal
+in the Software without restriction, including  without  limitation the rights
+to use,  copy,  modify,  merge,  publish,  distribute, sublicense, and/or sell
+copies of the Software,  and  to  permit  persons  to  whom  the  Software  is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS",  WITHOUT WARRANTY OF ANY  KIND,  EXPRESS  OR
+IMPLIED,  INCLUDING  BUT  NOT  LIMITED  TO  THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT  SHALL  THE
+AUTHORS  OR  COPYRIGHT  HOLDERS  BE  LIABLE  FOR  ANY CLAIM,  DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT,  TORT OR OTHERWISE, ARISING FROM,
+OUT  OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+#=============================================================================
+import ctypes
+from copy   import deepcopy
+from typing import Any, Dict, List
+
+try:
+    import numpy as np
+    from numpy.random import BitGenerator
+except ImportError:
+    np = None  # type: ignore
+    BitGenerator = object  # type: ignore
+
+from .baserandom import BaseRandom
+
+
+#=============================================================================
+_NextUInt64 = ctypes.CFUNCTYPE( ctypes.c_uint64, ctypes.c_void_p )
+_NextUInt32 = ctypes.CFUNCTYPE( ctypes.c_uint32, ctypes.c_void_p )
+_NextDouble = ctypes.CFUNCTYPE( ctypes.c_double, ctypes.c_void_p )
+
+class _BitGenT( ctypes.Structure ):
+    """The C structure 'bitgen_t' through which numpy random generators get their random bits.
+    """
+    _fields_ = [ ('state'      , ctypes.c_void_p),
+                 ('next_uint64', _NextUInt64    ),
+                 ('next_uint32', _NextUInt32    ),
+                 ('next_double', _NextDouble    ),
+                 ('next_raw'   , _NextUInt64    ) ]
+
+_PyCapsule_New = ctypes.pythonapi.PyCapsule_New
+_PyCapsule_New.restype = ctypes.py_object
+_PyCapsule_New.argtypes = ( ctypes.c_void_p, ctypes.c_char_p, ctypes.c_void_p )
+
+
+#=============================================================================
+class NumpyBitGenerator( BitGenerator ):  # type: ignore
+    """Adapter of any PyRandLib generator as a numpy BitGenerator.
+
+    This module is part of library PyRandLib.
+
+    Copyright (c) 2025 Philippe Schmouker
+
+    numpy.random.Generator evaluates all its distributions (normal, gamma,
+    binomial,  etc.)  from the random bits provided by a BitGenerator.  This
+    adapter provides them from the values generated by a wrapped PyRandLib
+    generator,  so that all the numpy distributions get evaluated on  top  of
+    PyRandLib sequences:
+
+      gen = numpy.random.Generator( NumpyBitGenerator(Well19937c(1)) )
+      print( gen.normal(size=10) )  # prints 10 normal values
+
+    Random bits are provided as 64-bits words,  which are evaluated block by
+    block with method 'next_n()' of the wrapped generator and with vectorized
+    numpy arithmetic.  Generators that output 64-bits values provide one word
+    per value.  Otherwise,  each word packs the highest 32 bits (resp. 16 bits)
+    of two (resp. four) successive values for generators that output 32- to
+    63-bits (resp. 16- to 31-bits) values,  and is the highest 64 bits of each
+    value for generators that output 128-bits values.  32-bits values are the
+    low then the high halves of the 64-bits words,  and doubles get their 53
+    bits of precision from one word.
+
+    numpy is needed for this adapter to be instantiated.
+    """
+
+    #-------------------------------------------------------------------------
+    def __init__(self, prng: BaseRandom, block: int = 4096) -> None:
+        """Constructor.
+
+        prng is the wrapped PyRandLib generator.  block is the count of 64-bits
+        words that are evaluated at once each time the internal buffer of
+        random words is exhausted.
+        """
+        if np is None:
+            raise ImportError( "numpy is needed to instantiate a NumpyBitGenerator" )
+        if not isinstance( prng, BaseRandom ):
+            raise TypeError( f"the wrapped generator must be a PyRandLib generator (currently is {type(prng)})" )
+        if not isinstance( block, int ):
+            raise TypeError( f"the size of blocks must be an integer (currently is {type(block)})" )
+        if block <= 0:
+            raise ValueError( f"the size of blocks must be positive (currently is {block})" )
+
+        super().__init__( 0 )  # notice: the numpy seed sequence is not used by this adapter
+
+        self._prng = prng
+        self._block = block
+        self._buffer: List[int] = []
+        self._index = 0
+        self._hasUInt32 = False
+        self._uinteger = 0
+
+        # the C structure 'bitgen_t' and the functions it points to must live as long as this adapter
+        self._nextFuncs = ( _NextUInt64(self._nextuint64), _NextUInt32(self._nextuint32), _NextDouble(self._nextdouble) )
+        self._bitgenT = _BitGenT( None, self._nextFuncs[0], self._nextFuncs[1], self._nextFuncs[2], self._nextFuncs[0] )
+        self._capsule = _PyCapsule_New( ctypes.addressof(self._bitgenT), b"BitGenerator", None )
+
+
+    #-------------------------------------------------------------------------
+    @property
+    def capsule(self) -> Any:
+        """The capsule of the C structure 'bitgen_t' that is used by numpy random generators.
+        """
+        return self._capsule
+
+
+    #-------------------------------------------------------------------------
+    @property
+    def prng(self) -> BaseRandom:
+        """The wrapped PyRandLib generator.
+        """
+        return self._prng
+
+
+    #-------------------------------------------------------------------------
+    @property
+    def state(self) -> Dict[str, Any]:
+        """The state of this adapter: the state of the wrapped generator and the not yet used random bits.
+        """
+        return { 'bit_generator': type(self).__name__,
+                 'state'        : deepcopy( self._prng.getstate() ),  # notice: some generators return their internal list
+                 'buffer'       : self._buffer[self._index:],
+                 'has_uint32'   : int(self._hasUInt32),
+                 'uinteger'     : self._uinteger }
+
+    @state.setter
+    def state(self, value: Dict[str, Any]) -> None:
+        if not isinstance( value, dict ):
+            raise TypeError( f"the state of a NumpyBitGenerator must be a dict (currently is {type(value)})" )
+        if value.get( 'bit_generator' ) != type(self).__name__:
+            raise ValueError( f"the state must be the one of a {type(self).__name__} (currently is {value.get('bit_generator')})" )
+        self._prng.setstate( value['state'] )
+        self._buffer = list( value['buffer'] )
+        self._index = 0
+        self._hasUInt32 = bool( value['has_uint32'] )
+        self._uinteger = value['uinteger']
+
+
+    #-------------------------------------------------------------------------
+    def random_raw(self, size: Any = None, output: bool = True) -> Any:
+        """Returns the next random 64-bits words, as used by the numpy random generators.
+
+        Returns a single integer if size is None,  and a numpy array of uint64
+        of shape size otherwise.  Nothing is returned if output is False.
+        """
+        if size is None:
+            word = self._nextuint64( None )
+            return word if output else None
+
+        words = np.empty( size, dtype=np.uint64 )
+        flatWords = words.reshape( -1 )
+        n = 0
+        while n < flatWords.size:
+            if self._index == len( self._buffer ):
+                self._refill()
+            count = min( flatWords.size - n, len(self._buffer) - self._index )
+            flatWords[n:n+count] = self._buffer[self._index:self._index+count]
+            self._index += count
+            n += count
+        return words if output else None
+
+
+    #-------------------------------------------------------------------------
+    def _nextuint64(self, _state: Any) -> int:
+        """Returns the next random 64-bits word. This is function 'next_uint64' of the C structure 'bitgen_t'.
+        """
+        if self._index == len( self._buffer ):
+            self._refill()
+        self._index += 1
+        return self._buffer[self._index - 1]
+
+
+    #-------------------------------------------------------------------------
+    def _nextuint32(self, _state: Any) -> int:
+        """Returns the next random 32-bits integer. This is function 'next_uint32' of the C structure 'bitgen_t'.
+        """
+        if self._hasUInt32:
+            self._hasUInt32 = False
+            return self._uinteger
+        word = self._nextuint64( None )
+        self._hasUInt32 = True
+        self._uinteger = word >> 32
+        return word & 0xffff_ffff
+
+
+    #-------------------------------------------------------------------------
+    def _nextdouble(self, _state: Any) -> float:
+        """Returns the next random double in [0.0, 1.0). This is function 'next_double' of the C structure 'bitgen_t'.
+        """
+        return (self._nextuint64( None ) >> 11) * 1.110_223_024_625_156_540_423_6e-16  # i.e. 1.0 / (1 << 53)
+
+
+    #-------------------------------------------------------------------------
+    def _refill(self) -> None:
+        """Evaluates the next block of random 64-bits words with the wrapped generator.
+        """
+        outBits = self._prng._OUT_BITS
+        if outBits > 64:
+            self._buffer = [ v >> (outBits - 64) for v in self._prng.next_n( self._block ) ]
+
+        else:
+            chunkBits = 64 if outBits == 64 else 32 if outBits >= 32 else 16
+            chunksCount = 64 // chunkBits
+            chunks = np.asarray( self._prng.next_n(self._block * chunksCount), dtype=np.uint64 ) >> np.uint64( outBits - chunkBits )
+            chunks = chunks.reshape( self._block, chunksCount )
+            words = chunks[:, 0]
+            for i in range(1, chunksCount):
+                words = words | (chunks[:, i] << np.uint64( i * chunkBits ))
+            self._buffer = words.tolist()
+
+        self._index = 0
+
+
+#=====   end of module   numpybitgen.py   ====================================
@@ -0,0 +1,128 @@
+"""
+Copyright (c) 2025 Philippe Schmouker, ph (dot) schmouker (at) gmail.com
+
+Permission is hereby granted,  free of charge,  to any person obtaining a copy
+of this software and associated documentation files (the "Software"),  to deal
+in the Software without restriction, including  without  limitation the rights
+to use,  copy,  modify,  merge,  publish,  distribute, sublicense, and/or sell
+copies of the Software,  and  to  permit  persons  to  whom  the  Software  is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS",  WITHOUT WARRANTY OF ANY  KIND,  EXPRESS  OR
+IMPLIED,  INCLUDING  BUT  NOT  LIMITED  TO  THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT  SHALL  THE
+AUTHORS  OR  COPYRIGHT  HOLDERS  BE  LIABLE  FOR  ANY CLAIM,  DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT,  TORT OR OTHERWISE, ARISING FROM,
+OUT  OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+#=============================================================================
+import os
+from array                import array
+from concurrent.futures   import ProcessPoolExecutor
+from multiprocessing      import shared_memory
+from typing               import Type
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+from .annotation_types import SeedStateType
+from .basef2linear     import BaseF2Linear
+from .baserandom       import BaseRandom
+
+
+#=============================================================================
+_CHUNK_SIZE: int = 1 << 16  # the count of values that are evaluated at once by the workers
+_MIN_WORKER_SIZE: int = 1 << 16  # the minimal count of values for which a worker process is worth its overhead
+
+
+#=============================================================================
+def parallel_fill(generatorClass: Type[BaseRandom], seed: SeedStateType, n: int, workers: int = None) -> 'np.ndarray | array':  # type: ignore
+    """Returns the n first pseudo-random float values in [0.0, 1.0) of a seeded generator, evaluated by parallel processes.
+
+    The values are the same,  bit for bit,  as the ones of n successive calls
+    to method random() of generatorClass(seed).  They are partitioned into
+    as many contiguous sub-ranges as worker processes,  each worker getting
+    its own generator which is positioned at the start of its sub-range and
+    which writes its values into a shared memory buffer.  The values are
+    returned in a numpy array of float64 values,  or in an array of typecode
+    'd' when numpy is not available.
+    Generators are positioned with their method advance(), e.g. LCGs, PCGs,
+    LFibs,  MRGs and Squares,  or with their method jump(),  i.e. WELLs and
+    MELGs.  TypeError is raised for the other generators, which cannot be
+    positioned at any step of their sequence (i.e. CWGs and Xoroshiros).
+    workers defaults to the count of CPUs.  Fewer workers are run when n is
+    too small to take benefit of them all,  down to no worker process at all
+    and the sequential evaluation of the values.
+    """
+    if not (isinstance( generatorClass, type ) and issubclass( generatorClass, BaseRandom )):
+        raise TypeError( f"the generator class must be a PyRandLib generator class (currently is {generatorClass})" )
+    if not (issubclass( generatorClass, BaseF2Linear ) or hasattr( generatorClass, 'advance' )):
+        raise TypeError( f"{generatorClass.__name__} generators cannot be positioned at any step of their sequence" )
+    if seed is None:
+        raise ValueError( "the seed must be set, since all the workers must evaluate the same sequence" )
+    if not isinstance( n, int ):
+        raise TypeError( f"the count of values must be an integer (currently is {type(n)})" )
+    if n < 0:
+        raise ValueError( f"the count of values must not be negative (currently is {n})" )
+    if workers is None:
+        workers = os.cpu_count() or 1
+    elif not isinstance( workers, int ) or workers < 1:
+        raise ValueError( f"the count of workers must be a positive integer (currently is {workers})" )
+
+    workers = max( 1, min(workers, n // _MIN_WORKER_SIZE) )
+    bounds = [ k * n // workers for k in range(workers + 1) ]
+
+    shm = shared_memory.SharedMemory( create=True, size=max(8 * n, 8) )
+    try:
+        if workers == 1:
+            _fillrange( generatorClass, seed, shm.name, 0, n )
+        else:
+            with ProcessPoolExecutor( workers ) as pool:
+                for future in [ pool.submit( _fillrange, generatorClass, seed, shm.name, bounds[k], bounds[k+1] )
+                                for k in range(workers) ]:
+                    future.result()
+
+        if np is None:
+            values = array( 'd' )
+            values.frombytes( shm.buf[:8 * n] )
+        else:
+            values = np.frombuffer( shm.buf, dtype=np.float64, count=n ).copy()
+        return values
+
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+#=============================================================================
+def _fillrange(_generatorClass: Type[BaseRandom], _seed: SeedStateType, _shmName: str, _start: int, _stop: int) -> None:
+    """Writes the values of a seeded generator from step _start up to step _stop (excluded) into a shared memory buffer.
+
+    This is the task of each worker process of parallel_fill().
+    """
+    shm = shared_memory.SharedMemory( name=_shmName )
+    try:
+        prng = _generatorClass( _seed )
+        if isinstance( prng, BaseF2Linear ):
+            prng.jump( _start )
+        else:
+            prng.advance( _start )  # type: ignore
+
+        view = shm.buf[8 * _start : 8 * _stop].cast( 'd' )
+        for start in range(0, _stop - _start, _CHUNK_SIZE):
+            stop = min( start + _CHUNK_SIZE, _stop - _start )
+            view[start:stop] = prng.random_array( stop - start )
+        view.release()
+
+    finally:
+        shm.close()
+
+
+#=====   end of module   parallel.py   =======================================
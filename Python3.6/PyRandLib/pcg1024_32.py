@@ -21,6 +21,8 @@ SOFTWARE.
 """
 
 #=============================================================================
+from array import array
+
 from .annotation_types import Numerical, SeedStateType, StateType
 from .pcg64_32         import Pcg64_32
 from .splitmix         import SplitMix32
@@ -138,6 +140,51 @@ class Pcg1024_32( Pcg64_32 ):
         return super().next() ^ extendedValue
 
 
+    #-------------------------------------------------------------------------
+    def next_n(self, count: int) -> array:
+        """Returns the next count pseudo-random values, as would count calls to next().
+        """
+        assert count >= 0, "the count of generated values must not be negative"
+        state = self._state
+        inc = self._inc
+        extendedState = self._extendedState  # notice: modified in place by method _advancetable()
+        values = [0] * count
+        for n in range(count):
+            if state & 0xffff_ffff == 0:
+                self._advancetable()
+            # the permutated output is computed from the current state and xor'ed with the extended one
+            values[n] = (((state ^ (state >> 22)) >> (22 + ((state >> 61) & 0x07))) & 0xffff_ffff) ^ extendedState[ (state >> 22) & 0x03ff ]
+            # then the next internal state is evaluated
+            state = (0x5851_f42D_4c95_7f2d * state + inc) & 0xffff_ffff_ffff_ffff
+        self._state = state
+        return array('I', values)
+
+
+    #-------------------------------------------------------------------------
+    def advance(self, _delta: int) -> None:
+        """Jumps the internal state of this generator _delta steps ahead.
+
+        The extended state is advanced once per zero crossing of the 32 low
+        bits of the internal state,  exactly as next() does.  These crossings
+        happen every 2^32 steps,  but the first one may happen after fewer
+        steps.  The count of steps up to this first crossing is evaluated with
+        method '_lcgdistance()' (in 32 iterations at most, one per low bit),
+        so that the count of crossings within the _delta steps is known.  The
+        internal state is then advanced in O(log _delta) time.
+        Caution: _delta must not be negative since the extended state cannot
+        step back.
+        """
+        if not isinstance(_delta, int):
+            raise TypeError(f"the advance delta must be an int (currently is {type(_delta)})")
+        if _delta < 0:
+            raise ValueError(f"PCG extended generators cannot step back (delta is {_delta})")
+        firstCrossing = Pcg1024_32._lcgdistance( self._state & 0xffff_ffff, 0, Pcg64_32._A & 0xffff_ffff, self._inc & 0xffff_ffff, 0xffff_ffff )
+        if firstCrossing < _delta:
+            for _ in range( 1 + ((_delta - 1 - firstCrossing) >> 32) ):
+                self._advancetable()
+        super().advance( _delta )
+
+
     #-------------------------------------------------------------------------
     def getstate(self) -> StateType:  # type: ignore
         """Returns an object capturing the current internal state of the  generator.
@@ -148,13 +195,26 @@ class Pcg1024_32( Pcg64_32 ):
         return ( self._extendedState[:], self._state )
 
 
+    #-------------------------------------------------------------------------
+    def restore(self, _state: StateType, trusted: bool = True) -> None:
+        """Restores the internal state of the generator from a state returned by getstate().
+
+        See BaseRandom.restore().  Should trusted be True,  the values of the
+        extended state are just copied, without any validation.
+        """
+        if trusted:
+            self._extendedState = _state[0][:]  # type: ignore
+            self._state = _state[1]  # type: ignore
+        else:
+            self.setstate( _state )
+
+
     #-------------------------------------------------------------------------
     def seed(self, _seed: Numerical = None) -> None:  # type: ignore
         """Initiates the internal state of this pseudo-random generator.
         """
         if _seed is None or isinstance(_seed, int) or isinstance(_seed, float):
-            self._initstate( _seed )
-            self._initextendedstate( _seed )        
+            self._initstate( _seed )  # notice: this inits the extended state also
         else:
             raise TypeError(f"Seeding value must be None, an int or a float (currently is {type(_seed)})")
 
@@ -189,7 +249,7 @@ class Pcg1024_32( Pcg64_32 ):
             else:
                 # sets the internal state, MUST be a 64-bits unsigned integer
                 if isinstance(_state[1], int) and _state[1] >= 0:
-                    super().setstate( _state[1] & 0xffff_ffff_ffff_ffff )
+                    self._state = _state[1] & 0xffff_ffff_ffff_ffff
                 else:
                     raise ValueError(f"seed values for internal state must be a non negative integer (currently is {_state[1]})")
                 # then sets the extended state, MUST be 32-bits integers
@@ -238,7 +298,7 @@ class Pcg1024_32( Pcg64_32 ):
         """
         # feeds the list according to an initial seed.
         initRand = SplitMix32( _initialSeed )
-        self._extendedState = [ initRand() for _ in range(Pcg1024_32._EXTENDED_STATE_SIZE) ]
+        self._extendedState = initRand.fill( Pcg1024_32._EXTENDED_STATE_SIZE )
         
 
     #-------------------------------------------------------------------------
@@ -261,6 +321,28 @@ class Pcg1024_32( Pcg64_32 ):
         self._initextendedstate( _initialSeed )
 
 
+    #-------------------------------------------------------------------------
+    @classmethod
+    def _lcgdistance(cls, _state: int, _target: int, _a: int, _c: int, _modMask: int) -> int:
+        """Evaluates the count of LCG steps that lead from _state to _target.
+
+        The LCG must be of full period, i.e. with _c odd and _a = 1 mod 4,
+        the modulo being a power of 2.  See method 'distance()' in the C++
+        reference implementation of PCGs by M. E. O'Neill.
+        """
+        curMult, curPlus = _a, _c
+        theBit = 1
+        distance = 0
+        while _state != _target:
+            if (_state ^ _target) & theBit:
+                _state = (_state * curMult + curPlus) & _modMask
+                distance |= theBit
+            curPlus = ((curMult + 1) * curPlus) & _modMask
+            curMult = (curMult * curMult) & _modMask
+            theBit <<= 1
+        return distance
+
+
     #-------------------------------------------------------------------------
     @classmethod
     def _invxrs(cls, value: int, bitsCount: int, shift: int) -> int:
@@ -0,0 +1,279 @@
+"""
+Copyright (c) 2025 Philippe Schmouker, ph (dot) schmouker (at) gmail.com
+
+Permission is hereby granted,  free of charge,  to any person obtaining a copy
+of this software and associated documentation files (the "Software"),  to deal
+in the Software without restriction, including  without  limitation the rights
+to use,  copy,  modify,  merge,  publish,  distribute, sublicense, and/or sell
+copies of the Software,  and  to  permit  persons  to  whom  the  Software  is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS",  WITHOUT WARRANTY OF ANY  KIND,  EXPRESS  OR
+IMPLIED,  INCLUDING  BUT  NOT  LIMITED  TO  THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT  SHALL  THE
+AUTHORS  OR  COPYRIGHT  HOLDERS  BE  LIABLE  FOR  ANY CLAIM,  DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT,  TORT OR OTHERWISE, ARISING FROM,
+OUT  OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+#=============================================================================
+import queue
+import threading
+import time
+import weakref
+from array    import array
+from operator import length_hint
+from typing   import List, Union
+
+from .baserandom       import BaseRandom
+from .annotation_types import Numerical, StateType
+from .buffered         import Buffered
+
+
+#=============================================================================
+class PrefetchingRandom( Buffered ):
+    """Wrapper of any PyRandLib generator which output values are evaluated by a background thread.
+
+    This module is part of library PyRandLib.
+
+    Copyright (c) 2025 Philippe Schmouker
+
+    A background thread evaluates the output values of the wrapped generator
+    block by block,  as class Buffered does,  and puts the blocks in a ring
+    buffer of bounded capacity.  Method next() then just gets the next value
+    of the current block,  or dequeues the next block of the ring buffer.  So,
+    the costly evaluations of the generators with large internal states (e.g.
+    Well44497b) or with occasional heavy steps (e.g.  the advance  of  the
+    extended table of Pcg1024_32) happen out of the hot path of the callers.
+
+    The generated values are exactly the same, and in the same order, as the
+    ones of the wrapped generator.  getstate() returns the state that  the
+    unbuffered generator would have at the same point of the sequence. seed()
+    and setstate() stop the thread,  flush the ring buffer,  set the  wrapped
+    generator and then restart the thread which refills the ring buffer.
+    Property underruns counts the times the ring buffer was found empty and
+    had to be waited for,  and property underrun_time sums up these waits,  in
+    seconds.
+
+      rand = PrefetchingRandom( Well44497b(1) )
+      print( rand() )     # prints a pseudo-random value within [0.0, 1.0)
+      print( rand(a) )    # prints a pseudo-random value within [0, a) or [0.0, a) depending on the type of a
+      print( rand(a, n) ) # prints a list of n pseudo-random values each within [0, a)
+      rand.close()        # stops the background thread
+
+    Notice: the wrapped generator is modified by the background thread.  It
+    must not be used on its own while it is wrapped.
+    Notice also: the background thread holds the GIL while it evaluates a
+    block.  So,  the latencies get lowered when the calling threads leave idle
+    times to the background thread,  e.g. between served requests,  or with
+    free-threaded builds of Python.
+    """
+
+    #-------------------------------------------------------------------------
+    _BLOCK_SIZE: int = 4096  # the maximal count of values per block of the ring buffer
+
+
+    #-------------------------------------------------------------------------
+    def __init__(self, prng: BaseRandom, capacity: int = 65536) -> None:
+        """Constructor.
+
+        prng is the wrapped PyRandLib generator.  capacity is the count of
+        values that the ring buffer holds,  rounded down to a whole count of
+        blocks of at most 4,096 values,  and at least one block.
+        """
+        if not isinstance( capacity, int ):
+            raise TypeError( f"the capacity of the ring buffer must be an integer (currently is {type(capacity)})" )
+        if capacity <= 0:
+            raise ValueError( f"the capacity of the ring buffer must be positive (currently is {capacity})" )
+
+        super().__init__( prng, min(capacity, self._BLOCK_SIZE) )
+        self._capacity = capacity
+        self._underruns = 0
+        self._underrunTime = 0.0
+        self._startthread()
+
+
+    #-------------------------------------------------------------------------
+    @property
+    def underruns(self) -> int:
+        """The count of times the ring buffer was found empty by the hot path.
+        """
+        return self._underruns
+
+
+    #-------------------------------------------------------------------------
+    @property
+    def underrun_time(self) -> float:
+        """The total time, in seconds, spent waiting for the ring buffer to get filled.
+        """
+        return self._underrunTime
+
+
+    #-------------------------------------------------------------------------
+    def close(self) -> None:
+        """Stops the background thread.
+
+        The next values are then evaluated in the calling thread,  block  by
+        block,  as class Buffered does.  Methods seed(), setstate() and spawn()
+        restart the background thread.
+        """
+        if self._finalizer.alive:
+            self._stopthread()
+
+
+    #-------------------------------------------------------------------------
+    def next_n(self, count: int) -> Union[array, List[int]]:
+        """Returns the next count pseudo-random integer values.
+
+        The values are got from the successive blocks of the ring buffer.
+        """
+        assert count >= 0, "the count of generated values must not be negative"
+        values = [ v for _, v in zip(range(count), self._values) ]
+        while len( values ) < count:
+            self._nextblock()
+            values += [ v for _, v in zip(range(count - len(values)), self._values) ]
+        return self._outarray( values )
+
+
+    #-------------------------------------------------------------------------
+    def getstate(self) -> StateType:
+        """Returns an object capturing the current internal state of the wrapped generator.
+
+        This is the state the wrapped generator would have if its values had
+        not been prefetched.  It is evaluated from a copy of the wrapped
+        generator as it was at the beginning of the current block.
+        """
+        if self._blockPrng is None:
+            return self._prng.getstate()
+        prng = self._copyprng( self._blockPrng )
+        prng.next_n( self._blockSize - length_hint(self._values) )
+        return prng.getstate()
+
+
+    #-------------------------------------------------------------------------
+    def restore(self, _state: StateType, trusted: bool = True) -> None:
+        """Restores the internal state of the wrapped generator, flushes the ring buffer and refills it.
+        """
+        self._finalizer()
+        super().restore( _state, trusted )
+        self._startthread()
+
+
+    #-------------------------------------------------------------------------
+    def seed(self, _seed: Numerical = None) -> None:  # type: ignore
+        """Initiates the internal state of the wrapped generator, flushes the ring buffer and refills it.
+        """
+        self._finalizer()
+        super().seed( _seed )
+        self._startthread()
+
+
+    #-------------------------------------------------------------------------
+    def setstate(self, _state: StateType = None) -> None:  # type: ignore
+        """Restores the internal state of the wrapped generator, flushes the ring buffer and refills it.
+        """
+        self._finalizer()
+        super().setstate( _state )
+        self._startthread()
+
+
+    #-------------------------------------------------------------------------
+    def spawn(self, n: int) -> 'List[PrefetchingRandom]':  # type: ignore
+        """Returns n new prefetching generators wrapping the children spawned by the wrapped generator.
+
+        The children are spawned from the state of the wrapped generator at
+        the current point of the sequence.  The ring buffer is then flushed
+        and refilled.
+        """
+        self._stopthread()
+        children = [ PrefetchingRandom( prng, self._capacity ) for prng in self._prng.spawn( n ) ]
+        self._startthread()
+        return children
+
+
+    #-------------------------------------------------------------------------
+    def _nextblock(self) -> None:
+        """Dequeues the next block of values of the ring buffer.
+
+        Should the ring buffer be empty,  the underrun gets counted and timed
+        while waiting for the next block.  Should the background thread  be
+        stopped,  the block is evaluated in the calling thread.
+        """
+        if not self._finalizer.alive:
+            super()._nextblock()
+            return
+
+        try:
+            self._blockPrng, values = self._queue.get_nowait()
+        except queue.Empty:
+            self._underruns += 1
+            start = time.perf_counter()
+            self._blockPrng, values = self._queue.get()
+            self._underrunTime += time.perf_counter() - start
+        self._blockSize = len( values )
+        self._values = iter( values )
+
+
+    #-------------------------------------------------------------------------
+    def _startthread(self) -> None:
+        """Starts the background thread which fills the ring buffer.
+        """
+        self._clearblock()
+        self._blockPrng = self._copyprng( self._prng )
+        self._queue = queue.Queue( maxsize=max(1, self._capacity // self._block) )
+        self._stopEvent = threading.Event()
+        self._thread = threading.Thread( target=PrefetchingRandom._prefetch,
+                                         args=(self._prng, self._block, self._queue, self._stopEvent),
+                                         daemon=True )
+        self._thread.start()
+        self._finalizer = weakref.finalize( self, PrefetchingRandom._jointhread, self._thread, self._queue, self._stopEvent )
+            # notice: the thread does not refer to self,  so that self can be garbage collected and its thread then stopped
+
+
+    #-------------------------------------------------------------------------
+    def _stopthread(self) -> None:
+        """Stops the background thread and sets the wrapped generator at the current point of the sequence.
+
+        The values that were prefetched after this point are dropped.
+        """
+        self._finalizer()
+        self._rewind()
+
+
+    #-------------------------------------------------------------------------
+    @staticmethod
+    def _prefetch(_prng: BaseRandom, _block: int, _queue: queue.Queue, _stopEvent: threading.Event) -> None:
+        """The loop of the background thread.
+
+        Each block of values is queued together with a copy of the generator
+        as it was at the beginning of the block.  The thread waits while the
+        ring buffer is full.
+        """
+        while not _stopEvent.is_set():
+            blockPrng = Buffered._copyprng( _prng )
+            _queue.put( (blockPrng, list(_prng.next_n( _block ))) )
+
+
+    #-------------------------------------------------------------------------
+    @staticmethod
+    def _jointhread(_thread: threading.Thread, _queue: queue.Queue, _stopEvent: threading.Event) -> None:
+        """Stops the background thread and waits for its end.
+
+        The ring buffer is flushed, so that the thread does not wait for free
+        room in it anymore.
+        """
+        _stopEvent.set()
+        while _thread.is_alive():
+            try:
+                _queue.get_nowait()
+            except queue.Empty:
+                pass
+            _thread.join( 0.001 )
+
+
+#=====   end of module   prefetching.py   ====================================
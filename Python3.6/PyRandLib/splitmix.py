@@ -22,6 +22,12 @@ SOFTWARE.
 
 #=============================================================================
 import time
+from typing import List
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
 
 from .annotation_types import Numerical
 
@@ -45,6 +51,10 @@ class SplitMix64:
     under the same license by D. Lemire by Aug. 2017.
     (see https://github.com/lemire/testingRNG/blob/master/source/splitmix64.h).
     """
+    #-------------------------------------------------------------------------
+    _NUMPY_MIN_COUNT: int = 64  # the minimal count of values for which numpy is worth its overhead
+    _OUT_SHIFT: int = 0  # the right shift of the 64-bits values, set by inheriting classes
+
     #-------------------------------------------------------------------------
     def __init__(self, _seed: Numerical = None) -> None:  # type: ignore
         """Constructor.
@@ -81,6 +91,37 @@ class SplitMix64:
         z = ((z ^ (z >> 27)) * 0x94d_049b_b133_111eb) & 0xffff_ffff_ffff_ffff
 
         return z ^ (z >> 31)
+
+    #-------------------------------------------------------------------------
+    def fill(self, n: int) -> List[int]:
+        """Returns the list of the next n values, as would n calls to this splitter.
+
+        This is the fast way to fill the internal states of PRNGs.  SplitMix
+        values are evaluated from the sole value of an incremented counter,
+        so they are all evaluated at once with numpy vectorized arithmetic
+        when numpy is available and n is at least 64.
+        """
+        if n <= 0:
+            return []
+
+        shift = self._OUT_SHIFT
+        state = self._state & 0xffff_ffff_ffff_ffff
+        if np is None or n < self._NUMPY_MIN_COUNT:
+            values = [0] * n
+            for i in range(n):
+                state = (state + 0x9e37_79b9_7f4a_7c15) & 0xffff_ffff_ffff_ffff
+                z = ((state ^ (state >> 30)) * 0xbf5_8476_d1ce_4e5b9) & 0xffff_ffff_ffff_ffff
+                z = ((z ^ (z >> 27)) * 0x94d_049b_b133_111eb) & 0xffff_ffff_ffff_ffff
+                values[i] = (z ^ (z >> 31)) >> shift
+            self._state = state
+            return values
+        else:
+            # notice: numpy uint64 arithmetic on arrays is evaluated modulo 2^64
+            z = np.arange( 1, n + 1, dtype=np.uint64 ) * np.uint64( 0x9e37_79b9_7f4a_7c15 ) + np.uint64( state )
+            z = (z ^ (z >> np.uint64( 30 ))) * np.uint64( 0xbf5_8476_d1ce_4e5b9 )
+            z = (z ^ (z >> np.uint64( 27 ))) * np.uint64( 0x94d_049b_b133_111eb )
+            self._state = (state + n * 0x9e37_79b9_7f4a_7c15) & 0xffff_ffff_ffff_ffff
+            return ((z ^ (z >> np.uint64( 31 ))) >> np.uint64( shift )).tolist()
     
 
 #=============================================================================
@@ -93,6 +134,9 @@ class SplitMix63( SplitMix64 ):
 
     This class evaluates "random" values on 63 bits.
     """
+    #-------------------------------------------------------------------------
+    _OUT_SHIFT: int = 1
+
     #-------------------------------------------------------------------------
     def __init__(self, _seed: Numerical = None) -> None:  # type: ignore
         """Constructor.
@@ -119,6 +163,9 @@ class SplitMix32( SplitMix64 ):
 
     This class evaluates "random" values on 32 bits.
     """
+    #-------------------------------------------------------------------------
+    _OUT_SHIFT: int = 32
+
     #-------------------------------------------------------------------------
     def __init__(self, _seed: Numerical = None) -> None:  # type: ignore
         """Constructor.
@@ -145,6 +192,9 @@ class SplitMix31( SplitMix64 ):
 
     This class evaluates "random" values on 31 bits.
     """
+    #-------------------------------------------------------------------------
+    _OUT_SHIFT: int = 33
+
     #-------------------------------------------------------------------------
     def __init__(self, _seed: Numerical = None) -> None:  # type: ignore
         """Constructor.
@@ -0,0 +1,203 @@
+"""
+Copyright (c) 2025 Philippe Schmouker, ph (dot) schmouker (at) gmail.com
+
+Permission is hereby granted,  free of charge,  to any person obtaining a copy
+of this software and associated documentation files (the "Software"),  to deal
+in the Software without restriction, including  without  limitation the rights
+to use,  copy,  modify,  merge,  publish,  distribute, sublicense, and/or sell
+copies of the Software,  and  to  permit  persons  to  whom  the  Software  is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS",  WITHOUT WARRANTY OF ANY  KIND,  EXPRESS  OR
+IMPLIED,  INCLUDING  BUT  NOT  LIMITED  TO  THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT  SHALL  THE
+AUTHORS  OR  COPYRIGHT  HOLDERS  BE  LIABLE  FOR  ANY CLAIM,  DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT,  TORT OR OTHERWISE, ARISING FROM,
+OUT  OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+#=============================================================================
+import threading
+from array  import array
+from typing import Callable, List, Union
+
+from .baserandom       import BaseRandom
+from .annotation_types import Numerical, SeedStateType, StateType
+
+
+#=============================================================================
+class ThreadLocalRandom( BaseRandom ):
+    """Thread-safe facade of PyRandLib generators, giving each thread its own sub-stream.
+
+    This module is part of library PyRandLib.
+
+    Copyright (c) 2025 Philippe Schmouker
+
+    PyRandLib generators modify their internal state with no locking,  so a
+    generator must not be shared by threads.  This facade may be: each thread
+    that calls it gets its own generator at first call.  These generators are
+    the successive children spawned by a root generator (see method spawn()
+    of the PyRandLib generators, which jumps the Xoroshiros for instance), so
+    that the sequence of each thread is reproducible given the order in which
+    threads call the facade for the first time:  the k-th thread gets the
+    generator that the k-th call to root.spawn(1) returns.  The lock which
+    serializes the spawning is acquired at first call of each thread  only,
+    the generators of the threads being then got without any contention.
+
+      rand = ThreadLocalRandom( Xoroshiro256, 1 )
+      print( rand() )     # prints a pseudo-random value within [0.0, 1.0), whatever the calling thread
+      print( rand(a) )    # prints a pseudo-random value within [0, a) or [0.0, a) depending on the type of a
+      print( rand(a, n) ) # prints a list of n pseudo-random values each within [0, a)
+
+    Notice: methods getstate() and setstate() get and set the state of the
+    generator of the calling thread,  while method seed() seeds the  root
+    generator and restarts the spawning of the generators of all threads.
+    """
+
+    #-------------------------------------------------------------------------
+    def __init__(self, factory: Callable[[SeedStateType], BaseRandom], seed: SeedStateType = None) -> None:  # type: ignore
+        """Constructor.
+
+        factory is called with seed to create the root generator. It may be
+        any PyRandLib generator class,  or any callable returning a PyRandLib
+        generator (e.g. a Buffered one).
+        """
+        if not callable( factory ):
+            raise TypeError( f"the factory of the generators must be callable (currently is {type(factory)})" )
+        if not isinstance( root := factory(seed), BaseRandom ):
+            raise TypeError( f"the factory of the generators must return a PyRandLib generator (currently returns {type(root)})" )
+        self._setroot( root )
+
+
+    #-------------------------------------------------------------------------
+    @property
+    def root(self) -> BaseRandom:
+        """The root generator which spawns the generators of the threads.
+        """
+        return self._root
+
+
+    #-------------------------------------------------------------------------
+    @property
+    def threads_count(self) -> int:
+        """The count of generators that have been spawned for threads since the last seeding.
+        """
+        return self._threadsCount
+
+
+    #-------------------------------------------------------------------------
+    def next(self) -> int:
+        """Returns the next pseudo-random integer value of the generator of the calling thread.
+        """
+        return self._threadprng().next()
+
+
+    #-------------------------------------------------------------------------
+    def next_n(self, count: int) -> Union[array, List[int]]:
+        """Returns the next count pseudo-random integer values of the generator of the calling thread.
+        """
+        return self._threadprng().next_n( count )
+
+
+    #-------------------------------------------------------------------------
+    def random(self) -> float:
+        """Returns the next pseudo-random float value in [0.0, 1.0) of the generator of the calling thread.
+        """
+        return self._threadprng().random()
+
+
+    #-------------------------------------------------------------------------
+    def getrandbits(self, k: int) -> int:
+        """Returns k bits from the generator of the calling thread.
+        """
+        return self._threadprng().getrandbits( k )
+
+
+    #-------------------------------------------------------------------------
+    def gauss(self, mu: float = 0.0, sigma: float = 1.0) -> float:
+        """Returns a value of the normal distribution with the generator of the calling thread.
+
+        Notice: the second value that the algorithm evaluates is kept by the
+        generator of the calling thread for its next call.
+        """
+        return self._threadprng().gauss( mu, sigma )
+
+
+    #-------------------------------------------------------------------------
+    def getstate(self) -> StateType:
+        """Returns an object capturing the current internal state of the generator of the calling thread.
+        """
+        return self._threadprng().getstate()
+
+
+    #-------------------------------------------------------------------------
+    def restore(self, _state: StateType, trusted: bool = True) -> None:
+        """Restores the internal state of the generator of the calling thread.
+        """
+        self._threadprng().restore( _state, trusted )
+
+
+    #-------------------------------------------------------------------------
+    def seed(self, _seed: Numerical = None) -> None:  # type: ignore
+        """Seeds the root generator and restarts the spawning of the generators of all threads.
+
+        Each thread gets a new generator at its next call, the k-th one to call
+        getting the k-th generator spawned by the newly seeded root generator.
+        """
+        with self._lock:
+            self._root.seed( _seed )
+            self._local = threading.local()
+            self._threadsCount = 0
+
+
+    #-------------------------------------------------------------------------
+    def setstate(self, _state: StateType = None) -> None:  # type: ignore
+        """Restores the internal state of the generator of the calling thread.
+        """
+        self._threadprng().setstate( _state )
+
+
+    #-------------------------------------------------------------------------
+    def spawn(self, n: int) -> 'List[ThreadLocalRandom]':
+        """Returns n new facades which root generators are spawned by the root generator of this one.
+        """
+        with self._lock:
+            roots = self._root.spawn( n )
+        children = [ ThreadLocalRandom.__new__( ThreadLocalRandom ) for _ in roots ]
+        for child, root in zip( children, roots ):
+            child._setroot( root )
+        return children
+
+
+    #-------------------------------------------------------------------------
+    def _setroot(self, _root: BaseRandom) -> None:
+        """Sets the root generator of this facade, no thread having got its own generator yet.
+        """
+        self._root = _root
+        self._NORMALIZE = _root._NORMALIZE
+        self._OUT_BITS = _root._OUT_BITS
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._threadsCount = 0
+        self.gauss_next = None  # notice: no call to the base class constructor which would seed this facade
+
+
+    #-------------------------------------------------------------------------
+    def _threadprng(self) -> BaseRandom:
+        """Returns the generator of the calling thread, which is spawned at its first call.
+        """
+        try:
+            return self._local.prng
+        except AttributeError:
+            with self._lock:
+                prng = self._local.prng = self._root.spawn( 1 )[0]
+                self._threadsCount += 1
+            return prng
+
+
+#=====   end of module   threadlocal.py   ====================================
@@ -21,6 +21,8 @@ SOFTWARE.
 """
 
 #=============================================================================
+from array import array
+
 from .basewell         import BaseWELL
 from .annotation_types import SeedStateType
 
@@ -123,6 +125,7 @@ class Well19937c( BaseWELL ):
     def next(self) -> int:
         """This is the core of the pseudo-random generator.
         """
+        state = self._state  # notice: the local binding speeds up the accesses to the internal state
         if (i := self._index) >= 2:
             i_1, i_2 = i-1, i-2
         elif i == 1:
@@ -130,15 +133,46 @@ class Well19937c( BaseWELL ):
         else:
             i_1, i_2 = 623, 622
 
-        z0 = (self._state[i_1] & 0x0000_0001) ^ (self._state[i_2] & 0xffff_fffe)  # type: ignore
-        z1 = BaseWELL._M3_neg(self._state[i], 25) ^ BaseWELL._M3_pos(self._state[(i + 70) % 624], 27)  # type: ignore
-        z2 = BaseWELL._M2_pos(self._state[(i + 179) % 624], 9) ^ BaseWELL._M3_pos(self._state[(i + 449) % 624], 1)  # type: ignore
+        z0 = (state[i_1] & 0x0000_0001) ^ (state[i_2] & 0xffff_fffe)  # type: ignore
+        z1 = BaseWELL._M3_neg(state[i], 25) ^ BaseWELL._M3_pos(state[(i + 70) % 624], 27)  # type: ignore
+        z2 = BaseWELL._M2_pos(state[(i + 179) % 624], 9) ^ BaseWELL._M3_pos(state[(i + 449) % 624], 1)  # type: ignore
 
-        self._state[i] = (z3 := z1 ^ z2)
-        self._state[i_1] = z0 ^ BaseWELL._M3_neg(z1, 9) ^ BaseWELL._M2_neg(z2, 21) ^ BaseWELL._M3_pos(z3, 21)
+        state[i] = (z3 := z1 ^ z2)
+        state[i_1] = z0 ^ BaseWELL._M3_neg(z1, 9) ^ BaseWELL._M2_neg(z2, 21) ^ BaseWELL._M3_pos(z3, 21)
 
         self._index = i_1
         return BaseWELL._tempering(z3, 0xe46e_1700, 0x9b86_8000)
 
 
+    #-------------------------------------------------------------------------
+    def next_n(self, count: int) -> array:
+        """Returns the next count pseudo-random values, as would count calls to next().
+        """
+        assert count >= 0, "the count of generated values must not be negative"
+        state = self._state
+        i = self._index
+        values = [0] * count
+        for n in range(count):
+            if i >= 2:
+                i_1, i_2 = i - 1, i - 2
+            elif i == 1:
+                i_1, i_2 = 0, 623
+            else:
+                i_1, i_2 = 623, 622
+            z0 = (state[i_1] & 0x0000_0001) ^ (state[i_2] & 0xffff_fffe)
+            # z1 = M3_neg(state[i], 25) ^ M3_pos(state[i+70], 27)
+            z1 = (u := state[i]) ^ ((u << 25) & 0xffff_ffff) ^ (v := state[(i + 70) % 624]) ^ (v >> 27)
+            # z2 = M2_pos(state[i+179], 9) ^ M3_pos(state[i+449], 1)
+            z2 = (state[(i + 179) % 624] >> 9) ^ (u := state[(i + 449) % 624]) ^ (u >> 1)
+            state[i] = z3 = z1 ^ z2
+            # state[i-1] = z0 ^ M3_neg(z1, 9) ^ M2_neg(z2, 21) ^ M3_pos(z3, 21)
+            state[i_1] = z0 ^ (z1 ^ ((z1 << 9) & 0xffff_ffff)) ^ ((z2 << 21) & 0xffff_ffff) ^ (z3 ^ (z3 >> 21))
+            # tempering
+            z3 ^= ((z3 << 7) & 0xffff_ffff) & 0xe46e_1700
+            values[n] = z3 ^ (((z3 << 15) & 0xffff_ffff) & 0x9b86_8000)
+            i = i_1
+        self._index = i
+        return array('I', values)
+
+
 #=====   end of module   well19937c.py   =====================================
@@ -21,7 +21,8 @@ SOFTWARE.
 """
 
 #=============================================================================
-from typing import Union
+from array  import array
+from typing import Tuple, Union
 
 from .baserandom       import BaseRandom
 from .basexoroshiro    import BaseXoroshiro
@@ -79,6 +80,22 @@ class Xoroshiro1024( BaseXoroshiro ):
     should definitively pass.
     """
 
+    #-------------------------------------------------------------------------
+    _JUMP: Tuple[int, ...] = (
+        0x9311_97d8_e317_7f17, 0xb594_22e0_b913_8c5f, 0xf06a_6afb_49d6_68bb, 0xacb8_a641_2c8a_1401,
+        0x1230_4ec8_5f0b_3468, 0xb7df_e707_9209_891e, 0x405b_7eec_77d9_eb14, 0x34ea_d682_80c4_4e4a,
+        0xe0e4_ba3e_0ac9_e366, 0x8f46_eda8_3489_05b7, 0x328b_f4db_ad90_d6ff, 0xc8fd_6fb3_1c9e_ffc3,
+        0xe899_d452_d4b6_7652, 0x45f3_8728_6ade_3205, 0x0386_4f45_4a89_20bd, 0xa68f_a287_25b1_b384,
+    )  # jump polynomial, i.e. 2^512 steps ahead
+
+    _LONG_JUMP: Tuple[int, ...] = (
+        0x7374_1563_60bb_f00f, 0x4630_c2ef_a3b3_c1f6, 0x6654_183a_8927_86b1, 0x94f7_bfcb_fb0f_1661,
+        0x27d8_243d_3d13_eb2d, 0x9701_730f_3dfb_300f, 0x2f29_3baa_e6f6_04ad, 0xa661_831c_b60c_d8b6,
+        0x6828_0c77_d9fe_008c, 0x5055_4160_f5ba_9459, 0x2fc2_0b17_ec7b_2a9a, 0x4918_9bbd_c8ec_9f8f,
+        0x92a6_5bca_4185_2cc1, 0xf468_20dd_0509_c12a, 0x52b0_0c35_fbf9_2185, 0x1e5b_3b7f_589e_03c1,
+    )  # long-jump polynomial, i.e. 2^768 steps ahead
+
+
     #-------------------------------------------------------------------------
     def __init__(self, _seedState: Union[Numerical, StatesList] = None, /) -> None:  # type: ignore
         """Constructor.
@@ -115,4 +132,43 @@ class Xoroshiro1024( BaseXoroshiro ):
         return (BaseRandom._rotleft( sLow * 5, 7) * 9) & self._MODULO  # type: ignore
 
 
+    #-------------------------------------------------------------------------
+    def next_n(self, count: int) -> array:
+        """Returns the next count pseudo-random values, as would count calls to next().
+        """
+        assert count >= 0, "the count of generated values must not be negative"
+        state = self._state
+        i = self._index
+        values = [0] * count
+        for n in range(count):
+            previousIndex = i
+            i = (i + 1) & 0x0f
+            sHigh = state[previousIndex] ^ (sLow := state[i])
+            state[previousIndex] = (((sLow << 25) & 0xffff_ffff_ffff_ffff) | (sLow >> 39)) ^ sHigh ^ ((sHigh << 27) & 0xffff_ffff_ffff_ffff)
+            state[i] = ((sHigh << 36) & 0xffff_ffff_ffff_ffff) | (sHigh >> 28)
+            # evaluates the output value
+            values[n] = ((((v := (sLow * 5) & 0xffff_ffff_ffff_ffff) << 7) & 0xffff_ffff_ffff_ffff | (v >> 57)) * 9) & 0xffff_ffff_ffff_ffff
+        self._index = i
+        return array('Q', values)
+
+
+    #-------------------------------------------------------------------------
+    def _jumpwith(self, _jumpPoly: Tuple[int, ...]) -> None:
+        """Jumps the internal state of this generator according to a jump polynomial.
+
+        The states that are summed up are aligned on the current index in the
+        internal state list, as is the resulting state.
+        """
+        state = self._state
+        jumped = [0] * 16
+        for word in _jumpPoly:
+            for b in range(64):
+                if (word >> b) & 1:
+                    i = self._index
+                    jumped = [j ^ s for j, s in zip(jumped, state[i:] + state[:i])]  # type: ignore
+                self.next()
+        i = self._index
+        state[:] = self._statewords( jumped[16-i:] + jumped[:16-i] )
+
+
 #=====   end of module   xoroshiro1024.py   ==================================
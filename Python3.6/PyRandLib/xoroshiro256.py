@@ -21,7 +21,8 @@ SOFTWARE.
 """
 
 #=============================================================================
-from typing import Union
+from array  import array
+from typing import Tuple, Union
 
 from .baserandom       import BaseRandom
 from .basexoroshiro    import BaseXoroshiro
@@ -85,6 +86,16 @@ class Xoroshiro256( BaseXoroshiro ):
     should definitively pass.
     """
 
+    #-------------------------------------------------------------------------
+    _JUMP: Tuple[int, ...] = (
+        0x180e_c6d3_3cfd_0aba, 0xd5a6_1266_f0c9_392c, 0xa958_2618_e03f_c9aa, 0x39ab_dc45_29b1_661c,
+    )  # jump polynomial, i.e. 2^128 steps ahead
+
+    _LONG_JUMP: Tuple[int, ...] = (
+        0x76e1_5d3e_fefd_cbbf, 0xc500_4e44_1c52_2fb3, 0x7771_0069_854e_e241, 0x3910_9bb0_2acb_e635,
+    )  # long-jump polynomial, i.e. 2^192 steps ahead
+
+
     #-------------------------------------------------------------------------
     def __init__(self, _seedState: Union[Numerical, StatesList] = None) -> None:  # type: ignore
         """Constructor.
@@ -121,4 +132,26 @@ class Xoroshiro256( BaseXoroshiro ):
         return (BaseRandom._rotleft( currentS1 * 5, 7) * 9) & BaseXoroshiro._MODULO  # type: ignore
 
 
+    #-------------------------------------------------------------------------
+    def next_n(self, count: int) -> array:
+        """Returns the next count pseudo-random values, as would count calls to next().
+        """
+        assert count >= 0, "the count of generated values must not be negative"
+        s0, s1, s2, s3 = self._state
+        values = [0] * count
+        for n in range(count):
+            # evaluates the output value
+            values[n] = ((((v := (s1 * 5) & 0xffff_ffff_ffff_ffff) << 7) & 0xffff_ffff_ffff_ffff | (v >> 57)) * 9) & 0xffff_ffff_ffff_ffff
+            # then advances the internal state of the PRNG
+            currentS1 = s1
+            s2 ^= s0
+            s3 ^= s1
+            s1 ^= s2
+            s0 ^= s3
+            s2 ^= (currentS1 << 17) & 0xffff_ffff_ffff_ffff
+            s3 = ((s3 << 45) & 0xffff_ffff_ffff_ffff) | (s3 >> 19)
+        self._state[:] = self._statewords( (s0, s1, s2, s3) )
+        return array('Q', values)
+
+
 #=====   end of module   xoroshiro256.py   ===================================
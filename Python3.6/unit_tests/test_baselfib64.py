@@ -244,3 +244,10 @@ class TestBaseLFib64:
             b_lfib.setstate([(31, 32, 33, 34, -35), 1])  # type: ignore
         with pytest.raises(ValueError):
             b_lfib.setstate(((31, 32, 33, -34, -35), 1))  # type: ignore
+
+    #-------------------------------------------------------------------------
+    def test_advance(self):
+        STATE_SIZE = 17
+        b_lfib = BaseLFib64(STATE_SIZE)
+        with pytest.raises(AttributeError):
+            b_lfib.advance(STATE_SIZE)
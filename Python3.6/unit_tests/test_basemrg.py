@@ -97,17 +97,15 @@ class TestBaseMRG:
     #-------------------------------------------------------------------------
     def test_init_list(self):
         STATE_SIZE = 21
-        with pytest.raises(TypeError):
-            # notice: lists are not allowed as a seed in base class random.Random in Python 3.9 (not hashable)
-            b_mrg = BaseMRG(SplitMix31, STATE_SIZE, [i+1 for i in range(STATE_SIZE)])
-            assert b_mrg._STATE_SIZE == STATE_SIZE
-            assert b_mrg._initRandClass is SplitMix31
-            assert b_mrg.gauss_next is None  # type: ignore
-            assert b_mrg._index == 0
-            assert len(b_mrg._state) == STATE_SIZE
-            assert all(0 < s < (1 << b_mrg._OUT_BITS) for s in b_mrg._state)  # type: ignore
-            assert b_mrg._NORMALIZE == 1.0 / (1 << 32)  # should be (1 << 31), but not set after construction of base class BaseMRG
-            assert b_mrg._OUT_BITS == 32                # should be 31, but not set after construction of base class BaseMRG
+        b_mrg = BaseMRG(SplitMix31, STATE_SIZE, [i+1 for i in range(STATE_SIZE)])
+        assert b_mrg._STATE_SIZE == STATE_SIZE
+        assert b_mrg._initRandClass is SplitMix31
+        assert b_mrg.gauss_next is None  # type: ignore
+        assert b_mrg._index == 0
+        assert len(b_mrg._state) == STATE_SIZE
+        assert all(0 < s < (1 << b_mrg._OUT_BITS) for s in b_mrg._state)  # type: ignore
+        assert b_mrg._NORMALIZE == 1.0 / (1 << 32)  # should be (1 << 31), but not set after construction of base class BaseMRG
+        assert b_mrg._OUT_BITS == 32                # should be 31, but not set after construction of base class BaseMRG
                     
     #-------------------------------------------------------------------------
     def test_init_tuple_int(self):
@@ -122,3 +120,12 @@ class TestBaseMRG:
         with pytest.raises(TypeError):
             # notice: no 2 arguments accepted in tuple with base class random.Random constructor since Python 3.9
             b_mrg = BaseMRG( SplitMix31, STATE_SIZE, tuple(STATE_SIZE-1, [i+1 for i in range(STATE_SIZE)]) )  # type: ignore
+
+    #-------------------------------------------------------------------------
+    def test_advance(self):
+        STATE_SIZE = 15
+        b_mrg = BaseMRG(SplitMix31, STATE_SIZE)
+        assert b_mrg._MULT == 1
+        assert b_mrg._ADDEND == 0
+        with pytest.raises(AttributeError):
+            b_mrg.advance(STATE_SIZE)
@@ -114,6 +114,16 @@ class TestBaseXoroshiro:
             # notice: no 2 arguments accepted in tuple with base class random.Random constructor
             b_xrsr = BaseXoroshiro( STATE_SIZE, tuple(STATE_SIZE-1, [i+1 for i in range(STATE_SIZE)]) )  # type: ignore
 
+    #-------------------------------------------------------------------------
+    def test_jump(self):
+        b_xrsr = BaseXoroshiro(5)
+        with pytest.raises(AttributeError):
+            b_xrsr.jump()
+        with pytest.raises(AttributeError):
+            b_xrsr.long_jump()
+        with pytest.raises(NotImplementedError):
+            b_xrsr._jumpwith((1,))
+
     #-------------------------------------------------------------------------
     def test_seed(self):
         b_xrsr = BaseXoroshiro(5)
@@ -189,6 +189,44 @@ class TestLFib1340:
         assert lfib._state[ 886] == 0x3b2ee6608180063f
         assert lfib._state[1099] == 0x820166d19fd2b597
 
+    #-------------------------------------------------------------------------
+    def test_next_n(self):
+        lfib = LFib1340(0x0123_4567_89ab_cdef)
+        lfib_ref = LFib1340(0x0123_4567_89ab_cdef)
+        values = lfib.next_n(3_000)
+        assert values.typecode == 'Q'  # type: ignore
+        assert list(values) == [lfib_ref.next() for _ in range(3_000)]
+        assert lfib.getstate() == lfib_ref.getstate()
+
+        assert len(lfib.next_n(0)) == 0
+        with pytest.raises(AssertionError):
+            lfib.next_n(-1)
+
+    #-------------------------------------------------------------------------
+    def test_advance(self):
+        for delta in (0, 1, 1278, 1279, 1280, 6518):
+            lfib = LFib1340(0x0123_4567_89ab_cdef)
+            lfib_ref = LFib1340(0x0123_4567_89ab_cdef)
+            lfib.next_n(3)
+            lfib_ref.next_n(3 + delta)
+            lfib.advance(delta)
+            assert lfib.getstate() == lfib_ref.getstate()
+            assert lfib.next_n(100) == lfib_ref.next_n(100)
+
+        lfib = LFib1340(0x0123_4567_89ab_cdef)
+        lfib.advance(1_000_000_000_000)
+        assert lfib._index == 1_000_000_000_000 % 1279
+        assert lfib.next() == 0x9766e9a6bab5657
+        lfib = LFib1340(0x0123_4567_89ab_cdef)
+        lfib.advance(400_000_000_000)
+        lfib.advance(600_000_000_000)
+        assert lfib.next() == 0x9766e9a6bab5657
+
+        with pytest.raises(TypeError):
+            lfib.advance(1.0)  # type: ignore
+        with pytest.raises(ValueError):
+            lfib.advance(-1)
+
     #-------------------------------------------------------------------------
     def test_seed(self):
         lfib = LFib1340()
@@ -189,6 +189,44 @@ class TestLFib668:
         assert lfib._state[442] == 0xaab04d23fc88a152
         assert lfib._state[543] == 0x0891f7d38d26c8fb
 
+    #-------------------------------------------------------------------------
+    def test_next_n(self):
+        lfib = LFib668(0x0123_4567_89ab_cdef)
+        lfib_ref = LFib668(0x0123_4567_89ab_cdef)
+        values = lfib.next_n(3_000)
+        assert values.typecode == 'Q'  # type: ignore
+        assert list(values) == [lfib_ref.next() for _ in range(3_000)]
+        assert lfib.getstate() == lfib_ref.getstate()
+
+        assert len(lfib.next_n(0)) == 0
+        with pytest.raises(AssertionError):
+            lfib.next_n(-1)
+
+    #-------------------------------------------------------------------------
+    def test_advance(self):
+        for delta in (0, 1, 606, 607, 608, 3158):
+            lfib = LFib668(0x0123_4567_89ab_cdef)
+            lfib_ref = LFib668(0x0123_4567_89ab_cdef)
+            lfib.next_n(3)
+            lfib_ref.next_n(3 + delta)
+            lfib.advance(delta)
+            assert lfib.getstate() == lfib_ref.getstate()
+            assert lfib.next_n(100) == lfib_ref.next_n(100)
+
+        lfib = LFib668(0x0123_4567_89ab_cdef)
+        lfib.advance(1_000_000_000_000)
+        assert lfib._index == 1_000_000_000_000 % 607
+        assert lfib.next() == 0xd19e188c9246583e
+        lfib = LFib668(0x0123_4567_89ab_cdef)
+        lfib.advance(400_000_000_000)
+        lfib.advance(600_000_000_000)
+        assert lfib.next() == 0xd19e188c9246583e
+
+        with pytest.raises(TypeError):
+            lfib.advance(1.0)  # type: ignore
+        with pytest.raises(ValueError):
+            lfib.advance(-1)
+
     #-------------------------------------------------------------------------
     def test_seed(self):
         lfib = LFib668()
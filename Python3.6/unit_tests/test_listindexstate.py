@@ -21,11 +21,18 @@ SOFTWARE.
 """
 
 #=============================================================================
+from array import array
 import pytest
 import platform
 
+from PyRandLib.lfib1340       import LFib1340
 from PyRandLib.listindexstate import ListIndexState
+from PyRandLib.melg44497      import Melg44497
+from PyRandLib.mrg49507       import Mrg49507
 from PyRandLib.splitmix       import SplitMix31, SplitMix32, SplitMix63, SplitMix64
+from PyRandLib.well44497b     import Well44497b
+from PyRandLib.xoroshiro256   import Xoroshiro256
+from PyRandLib.xoroshiro1024  import Xoroshiro1024
 
 
 #=============================================================================
@@ -270,6 +277,90 @@ class TestListIndexState:
         assert all(s == t for (s, t) in zip(state33[0], lis_state[0]))  # type: ignore
         assert lis_state[1] == state33[1] % 17  # type: ignore
 
+    #-------------------------------------------------------------------------
+    def test_restore(self):
+        for prngClass in (LFib1340, Melg44497, Mrg49507, Well44497b, Xoroshiro256, Xoroshiro1024):
+            for compact in (False, True):
+                prng = prngClass(1)
+                prng.compact_state(compact)
+                checkpoint = prng.getstate()
+                values = list(prng.next_n(100))
+                assert checkpoint == prngClass(1).getstate()  # i.e. the checkpoint is not modified by the generator
+                for trusted in (True, False):
+                    prng.restore(checkpoint, trusted=trusted)
+                    assert prng.getstate() == checkpoint
+                    assert isinstance(prng._state, array) == (prng._stateTypecode is not None)
+                    assert list(prng.next_n(100)) == values
+
+        lis = ListIndexState(SplitMix31, 17, 1)
+        state = ([i+1 for i in range(17)], 16)
+        lis.restore(state)
+        assert lis.getstate() == state
+        assert lis._state is not state[0]
+        with pytest.raises(ValueError):
+            lis.restore(([-1] * 17, 16), trusted=False)
+
+    #-------------------------------------------------------------------------
+    def test_compact_state(self):
+        lis = ListIndexState(SplitMix31, 17, 1)
+        assert lis._stateTypecode is None
+        assert isinstance(lis._state, list)
+        state = lis.getstate()
+        lis.compact_state()
+        assert lis._stateTypecode == 'I'
+        assert isinstance(lis._state, array)
+        assert lis.getstate() == state
+        assert isinstance(lis.getstate()[0], list)
+        lis.compact_state(False)
+        assert lis._stateTypecode is None
+        assert isinstance(lis._state, list)
+        assert lis.getstate() == state
+
+        for prngClass, typecode in ((Well44497b, 'I'), (Mrg49507, 'I'), (Melg44497, 'Q'), (LFib1340, 'Q')):
+            prng = prngClass(0x0123_4567_89ab_cdef)
+            ref = prngClass(0x0123_4567_89ab_cdef)
+            prng.compact_state()
+            assert prng._state.typecode == typecode  # type: ignore
+            assert [prng.next() for _ in range(1_000)] == [ref.next() for _ in range(1_000)]
+            assert list(prng.next_n(3_000)) == list(ref.next_n(3_000))
+            assert prng.getstate() == ref.getstate()
+
+            # getstate() and setstate() round-trips
+            other = prngClass(prng.getstate())
+            assert isinstance(other._state, list)
+            assert other.getstate() == ref.getstate()
+            prng.setstate(prngClass(1).getstate())
+            assert isinstance(prng._state, array)
+            assert prng.getstate() == prngClass(1).getstate()
+            prng.setstate((array(typecode, ref.getstate()[0]), ref.getstate()[1]))  # type: ignore
+            assert prng.getstate() == ref.getstate()
+            prng.seed(2)
+            assert isinstance(prng._state, array)
+            assert prng.getstate() == prngClass(2).getstate()
+            ref.seed(2)
+
+            # jumps and spawned children
+            if prngClass in (Well44497b, Melg44497):
+                prng.jump(1_000)
+                ref.jump(1_000)
+            else:
+                prng.advance(100_000)
+                ref.advance(100_000)
+            assert isinstance(prng._state, array)
+            assert prng.getstate() == ref.getstate()
+            children = prng.spawn(2)
+            assert all(isinstance(child._state, array) for child in children)
+            assert [child.getstate() for child in children] == [child.getstate() for child in ref.spawn(2)]
+            assert all(isinstance(child._state, list) for child in ref.spawn(1))
+
+        # the small internal states of the Xoroshiros are kept in lists
+        for prngClass in (Xoroshiro256, Xoroshiro1024):
+            prng = prngClass(0x0123_4567_89ab_cdef)
+            prng.compact_state()
+            assert prng._stateTypecode is None
+            assert isinstance(prng._state, list)
+            assert prng.getstate() == prngClass(0x0123_4567_89ab_cdef).getstate()
+
     #-------------------------------------------------------------------------
     def test_init_index(self):
         lis = ListIndexState(SplitMix31, 17)
@@ -189,6 +189,35 @@ class TestMelg44497:
         assert melg._state[687] == 0xe5822e6f04b94654
         assert melg._state[695] == 0x48bcfda3458883ef
 
+    #-------------------------------------------------------------------------
+    def test_next_n(self):
+        melg = Melg44497(0x0123_4567_89ab_cdef)
+        melg_ref = Melg44497(0x0123_4567_89ab_cdef)
+        values = melg.next_n(3_000)
+        assert values.typecode == 'Q'  # type: ignore
+        assert list(values) == [melg_ref.next() for _ in range(3_000)]
+        assert melg.getstate() == melg_ref.getstate()
+
+        assert len(melg.next_n(0)) == 0
+        with pytest.raises(AssertionError):
+            melg.next_n(-1)
+
+    #-------------------------------------------------------------------------
+    def test_jump(self):
+        for n in (0, 1, 5, 100, 44547):
+            melg = Melg44497(0x0123_4567_89ab_cdef)
+            melg_ref = Melg44497(0x0123_4567_89ab_cdef)
+            melg.next_n(7)
+            melg_ref.next_n(7 + n)
+            melg.jump(n)
+            assert melg._f2state() == melg_ref._f2state()
+            assert melg.next_n(100) == melg_ref.next_n(100)
+
+        with pytest.raises(TypeError):
+            melg.jump(1.0)  # type: ignore
+        with pytest.raises(ValueError):
+            melg.jump(-1)
+
     #-------------------------------------------------------------------------
     def test_seed(self):
         melg = Melg44497()
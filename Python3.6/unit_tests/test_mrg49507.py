@@ -189,6 +189,44 @@ class TestMrg49507:
         assert mrg._state[1126] == 0x6d472f68
         assert mrg._state[1392] == 0x21476161
 
+    #-------------------------------------------------------------------------
+    def test_next_n(self):
+        mrg = Mrg49507(0x0123_4567_89ab_cdef)
+        mrg_ref = Mrg49507(0x0123_4567_89ab_cdef)
+        values = mrg.next_n(3_000)
+        assert values.typecode == 'I'  # type: ignore
+        assert list(values) == [mrg_ref.next() for _ in range(3_000)]
+        assert mrg.getstate() == mrg_ref.getstate()
+
+        assert len(mrg.next_n(0)) == 0
+        with pytest.raises(AssertionError):
+            mrg.next_n(-1)
+
+    #-------------------------------------------------------------------------
+    def test_advance(self):
+        for delta in (0, 1, 1596, 1597, 1598, 8108):
+            mrg = Mrg49507(0x0123_4567_89ab_cdef)
+            mrg_ref = Mrg49507(0x0123_4567_89ab_cdef)
+            mrg.next_n(3)
+            mrg_ref.next_n(3 + delta)
+            mrg.advance(delta)
+            assert mrg.getstate() == mrg_ref.getstate()
+            assert mrg.next_n(100) == mrg_ref.next_n(100)
+
+        mrg = Mrg49507(0x0123_4567_89ab_cdef)
+        mrg.advance(1_000_000_000_000)
+        assert mrg._index == 1_000_000_000_000 % 1597
+        assert mrg.next() == 0x2ad2d7ed
+        mrg = Mrg49507(0x0123_4567_89ab_cdef)
+        mrg.advance(400_000_000_000)
+        mrg.advance(600_000_000_000)
+        assert mrg.next() == 0x2ad2d7ed
+
+        with pytest.raises(TypeError):
+            mrg.advance(1.0)  # type: ignore
+        with pytest.raises(ValueError):
+            mrg.advance(-1)
+
     #-------------------------------------------------------------------------
     def test_seed(self):
         mrg = Mrg49507()
@@ -0,0 +1,85 @@
+"""
+Copyright (c) 2025 Philippe Schmouker, ph (dot) schmouker (at) gmail.com
+
+Permission is hereby granted,  free of charge,  to any person obtaining a copy
+of this software and associated documentation files (the "Software"),  to deal
+in the Software without restriction, including  without  limitation the rights
+to use,  copy,  modify,  merge,  publish,  distribute, sublicense, and/or sell
+copies of the Software,  and  to  permit  persons  to  whom  the  Software  is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS",  WITHOUT WARRANTY OF ANY  KIND,  EXPRESS  OR
+IMPLIED,  INCLUDING  BUT  NOT  LIMITED  TO  THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT  SHALL  THE
+AUTHORS  OR  COPYRIGHT  HOLDERS  BE  LIABLE  FOR  ANY CLAIM,  DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT,  TORT OR OTHERWISE, ARISING FROM,
+OUT  OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+#=============================================================================
+#=============================================================================
+from array import array
+import pytest
+
+import PyRandLib.parallel
+from PyRandLib.parallel     import parallel_fill
+from PyRandLib.cwg64        import Cwg64
+from PyRandLib.fastrand63   import FastRand63
+from PyRandLib.lfib116      import LFib116
+from PyRandLib.melg607      import Melg607
+from PyRandLib.mrg1457      import Mrg1457
+from PyRandLib.pcg128_64    import Pcg128_64
+from PyRandLib.squares64    import Squares64
+from PyRandLib.xoroshiro256 import Xoroshiro256
+
+
+#=============================================================================
+class TestParallel:
+    """Tests the parallel evaluation of pseudo-random values.
+    """
+
+    #-------------------------------------------------------------------------
+    def test_parallel_fill(self, monkeypatch):
+        # sequential evaluation, chunk by chunk
+        monkeypatch.setattr(PyRandLib.parallel, '_CHUNK_SIZE', 100)
+        for cls in (FastRand63, LFib116, Melg607, Mrg1457, Pcg128_64, Squares64):
+            values = parallel_fill(cls, 0x0123_4567_89ab_cdef, 1_005, 4)
+            prng = cls(0x0123_4567_89ab_cdef)
+            assert list(values) == [prng.random() for _ in range(1_005)]
+
+        # parallel evaluation
+        monkeypatch.setattr(PyRandLib.parallel, '_MIN_WORKER_SIZE', 100)
+        for cls in (FastRand63, Melg607, Squares64):
+            values = parallel_fill(cls, 0x0123_4567_89ab_cdef, 1_005, 3)
+            prng = cls(0x0123_4567_89ab_cdef)
+            assert list(values) == [prng.random() for _ in range(1_005)]
+        assert list(parallel_fill(Mrg1457, 1, 301)) == list(Mrg1457(1).random_array(301))
+        assert len(parallel_fill(Mrg1457, 1, 0, 2)) == 0
+
+        # no numpy available
+        monkeypatch.setattr(PyRandLib.parallel, 'np', None)
+        values = parallel_fill(Pcg128_64, 0.357, 211, 2)
+        assert values.typecode == 'd'  # type: ignore
+        assert values == array('d', Pcg128_64(0.357).random_array(211))
+
+        with pytest.raises(TypeError):
+            parallel_fill(int, 1, 10)  # type: ignore
+        with pytest.raises(TypeError):
+            parallel_fill(FastRand63(1), 1, 10)  # type: ignore
+        with pytest.raises(TypeError):
+            parallel_fill(Cwg64, 1, 10)
+        with pytest.raises(TypeError):
+            parallel_fill(Xoroshiro256, 1, 10)
+        with pytest.raises(ValueError):
+            parallel_fill(FastRand63, None, 10)
+        with pytest.raises(TypeError):
+            parallel_fill(FastRand63, 1, 10.0)  # type: ignore
+        with pytest.raises(ValueError):
+            parallel_fill(FastRand63, 1, -10)
+        with pytest.raises(ValueError):
+            parallel_fill(FastRand63, 1, 10, 0)
+        with pytest.raises(ValueError):
+            parallel_fill(FastRand63, 1, 10, 2.0)  # type: ignore
@@ -0,0 +1,212 @@
+"""
+Copyright (c) 2025 Philippe Schmouker, ph (dot) schmouker (at) gmail.com
+
+Permission is hereby granted,  free of charge,  to any person obtaining a copy
+of this software and associated documentation files (the "Software"),  to deal
+in the Software without restriction, including  without  limitation the rights
+to use,  copy,  modify,  merge,  publish,  distribute, sublicense, and/or sell
+copies of the Software,  and  to  permit  persons  to  whom  the  Software  is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS",  WITHOUT WARRANTY OF ANY  KIND,  EXPRESS  OR
+IMPLIED,  INCLUDING  BUT  NOT  LIMITED  TO  THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT  SHALL  THE
+AUTHORS  OR  COPYRIGHT  HOLDERS  BE  LIABLE  FOR  ANY CLAIM,  DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT,  TORT OR OTHERWISE, ARISING FROM,
+OUT  OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+#=============================================================================
+import gc
+import threading
+import pytest
+
+from PyRandLib.buffered     import Buffered
+from PyRandLib.cwg128       import Cwg128
+from PyRandLib.fastrand32   import FastRand32
+from PyRandLib.pcg1024_32   import Pcg1024_32
+from PyRandLib.prefetching  import PrefetchingRandom
+from PyRandLib.well44497b   import Well44497b
+from PyRandLib.xoroshiro256 import Xoroshiro256
+
+
+#=============================================================================
+class TestPrefetchingRandom:
+    """Tests class PrefetchingRandom.
+    """
+
+    #-------------------------------------------------------------------------
+    def test_init(self):
+        pfr = PrefetchingRandom(Well44497b(1))
+        assert isinstance(pfr, Buffered)
+        assert isinstance(pfr.prng, Well44497b)
+        assert pfr._capacity == 65536
+        assert pfr._block == 4096
+        assert pfr._queue.maxsize == 16
+        assert pfr._OUT_BITS == Well44497b._OUT_BITS
+        assert pfr.gauss_next is None  # type: ignore
+        assert pfr.underruns == 0
+        assert pfr.underrun_time == 0.0
+        assert pfr._thread.is_alive()
+        assert pfr.getstate() == Well44497b(1).getstate()
+        pfr.close()
+
+        pfr = PrefetchingRandom(Cwg128(1), 100)
+        assert pfr._block == 100
+        assert pfr._queue.maxsize == 1
+        assert pfr._OUT_BITS == 128
+        pfr.close()
+
+        with pytest.raises(TypeError):
+            PrefetchingRandom(1)  # type: ignore
+        with pytest.raises(TypeError):
+            PrefetchingRandom(Well44497b(1), 7.0)  # type: ignore
+        with pytest.raises(ValueError):
+            PrefetchingRandom(Well44497b(1), 0)
+
+    #-------------------------------------------------------------------------
+    def test_next(self):
+        for prngClass in (Well44497b, Pcg1024_32, FastRand32, Cwg128):
+            pfr = PrefetchingRandom(prngClass(0x0123_4567_89ab_cdef), 300)
+            ref = prngClass(0x0123_4567_89ab_cdef)
+            assert [pfr.next() for _ in range(1_000)] == [ref.next() for _ in range(1_000)]
+            assert [pfr.random() for _ in range(250)] == [ref.random() for _ in range(250)]
+            assert [pfr(100) for _ in range(250)] == [ref(100) for _ in range(250)]
+            pfr.close()
+
+    #-------------------------------------------------------------------------
+    def test_next_n(self):
+        pfr = PrefetchingRandom(FastRand32(0x0123_4567_89ab_cdef), 100)
+        ref = FastRand32(0x0123_4567_89ab_cdef)
+        pfr.next()
+        values = pfr.next_n(20)
+        assert values.typecode == 'I'  # type: ignore
+        assert list(values) == list(ref.next_n(21))[1:]
+        assert list(pfr.next_n(250)) == list(ref.next_n(250))
+        assert len(pfr.next_n(0)) == 0
+        pfr.close()
+
+        pfr = PrefetchingRandom(Cwg128(1), 10)
+        assert pfr.next_n(15) == Cwg128(1).next_n(15)
+        pfr.close()
+
+        with pytest.raises(AssertionError):
+            pfr.next_n(-1)
+
+    #-------------------------------------------------------------------------
+    def test_getstate(self):
+        for prngClass in (Well44497b, FastRand32):
+            pfr = PrefetchingRandom(prngClass(0x0123_4567_89ab_cdef), 100)
+            ref = prngClass(0x0123_4567_89ab_cdef)
+            for n in (0, 1, 98, 1, 1, 100, 37):
+                if n > 1:
+                    pfr.next_n(n)
+                else:
+                    [pfr.next() for _ in range(n)]
+                ref.next_n(n)
+                assert pfr.getstate() == ref.getstate()
+            # getstate() does not modify the sequence
+            assert [pfr.next() for _ in range(300)] == [ref.next() for _ in range(300)]
+            pfr.close()
+
+    #-------------------------------------------------------------------------
+    def test_setstate(self):
+        pfr = PrefetchingRandom(Well44497b(1), 100)
+        ref = Well44497b(0x0123_4567_89ab_cdef)
+        ref.next_n(1_234)
+        [pfr.next() for _ in range(15)]
+        pfr.setstate(ref.getstate())
+        assert pfr._thread.is_alive()
+        assert pfr.getstate() == ref.getstate()
+        assert [pfr.next() for _ in range(300)] == [ref.next() for _ in range(300)]
+        pfr.close()
+
+    #-------------------------------------------------------------------------
+    def test_restore(self):
+        for trusted in (True, False):
+            pfr = PrefetchingRandom(Well44497b(1), 100)
+            ref = Well44497b(0x0123_4567_89ab_cdef)
+            ref.next_n(1_234)
+            [pfr.next() for _ in range(15)]
+            pfr.restore(ref.getstate(), trusted=trusted)
+            assert pfr._thread.is_alive()
+            assert pfr.getstate() == ref.getstate()
+            assert [pfr.next() for _ in range(300)] == [ref.next() for _ in range(300)]
+            pfr.close()
+
+    #-------------------------------------------------------------------------
+    def test_seed(self):
+        pfr = PrefetchingRandom(Pcg1024_32(1), 100)
+        [pfr.next() for _ in range(15)]
+        pfr.seed(0x0123_4567_89ab_cdef)
+        ref = Pcg1024_32(0x0123_4567_89ab_cdef)
+        assert pfr._thread.is_alive()
+        assert pfr.getstate() == ref.getstate()
+        assert [pfr.next() for _ in range(300)] == [ref.next() for _ in range(300)]
+        pfr.close()
+
+    #-------------------------------------------------------------------------
+    def test_spawn(self):
+        pfr = PrefetchingRandom(Xoroshiro256(1), 100)
+        ref = Xoroshiro256(1)
+        [pfr.next() for _ in range(15)]
+        ref.next_n(15)
+        children = pfr.spawn(2)
+        assert [type(child) for child in children] == [PrefetchingRandom] * 2
+        assert [child._capacity for child in children] == [100] * 2
+        assert [child.getstate() for child in children] == [child.getstate() for child in ref.spawn(2)]
+        assert pfr._thread.is_alive()
+        assert [pfr.next() for _ in range(300)] == [ref.next() for _ in range(300)]
+        for child in children + [pfr]:
+            child.close()
+
+    #-------------------------------------------------------------------------
+    def test_close(self):
+        pfr = PrefetchingRandom(FastRand32(1), 100)
+        ref = FastRand32(1)
+        pfr.close()
+        assert not pfr._thread.is_alive()
+        assert pfr.getstate() == ref.getstate()
+        pfr.close()
+
+        pfr = PrefetchingRandom(FastRand32(1), 100)
+        [pfr.next() for _ in range(150)]
+        pfr.close()
+        ref.next_n(150)
+        # the wrapped generator is set at the current point of the sequence
+        assert pfr.prng.getstate() == ref.getstate()
+        assert [pfr.next() for _ in range(30)] == [ref.next() for _ in range(30)]
+        assert pfr.getstate() == ref.getstate()
+        assert not pfr._thread.is_alive()
+
+        # spawn() restarts the background thread
+        [child.close() for child in pfr.spawn(1)]
+        assert pfr._thread.is_alive()
+        pfr.close()
+
+        # the background thread stops once its generator gets garbage collected
+        pfr = PrefetchingRandom(FastRand32(1), 100)
+        thread = pfr._thread
+        del pfr
+        gc.collect()
+        thread.join(1.0)
+        assert not thread.is_alive()
+
+    #-------------------------------------------------------------------------
+    def test_underruns(self):
+        class FastRand32Waiting(FastRand32):
+            ready = threading.Event()
+            def next_n(self, count: int):
+                self.ready.wait()
+                return super().next_n(count)
+
+        pfr = PrefetchingRandom(FastRand32Waiting(1), 100)
+        threading.Timer(0.05, FastRand32Waiting.ready.set).start()
+        assert pfr.next() == FastRand32(1).next()
+        assert pfr.underruns == 1
+        assert pfr.underrun_time >= 0.04
+        pfr.close()
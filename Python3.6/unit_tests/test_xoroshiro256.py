@@ -170,6 +170,40 @@ class TestXoroshiro256:
         assert xrsr._state[2] == 0xdfd0524fbf0afc81
         assert xrsr._state[3] == 0x288d5f023136edc7
 
+    #-------------------------------------------------------------------------
+    def test_next_n(self):
+        xrsr = Xoroshiro256(0x0123_4567_89ab_cdef)
+        xrsr_ref = Xoroshiro256(0x0123_4567_89ab_cdef)
+        values = xrsr.next_n(3_000)
+        assert values.typecode == 'Q'  # type: ignore
+        assert list(values) == [xrsr_ref.next() for _ in range(3_000)]
+        assert xrsr.getstate() == xrsr_ref.getstate()
+
+        assert len(xrsr.next_n(0)) == 0
+        with pytest.raises(AssertionError):
+            xrsr.next_n(-1)
+
+    #-------------------------------------------------------------------------
+    def test_jump(self):
+        xrsr = Xoroshiro256(0x0123_4567_89ab_cdef)
+        xrsr.jump()
+        assert list(xrsr.next_n(3)) == [0xa6c7_c7bc_2f6f_5f50, 0x0120_60ba_17b4_5e7c, 0xc286_4a4b_5a52_4de8]
+
+        xrsr = Xoroshiro256(0x0123_4567_89ab_cdef)
+        xrsr.long_jump()
+        assert list(xrsr.next_n(3)) == [0x72d1_ee52_7e23_c070, 0xb377_e715_a442_ec11, 0x8818_d1b2_e64e_9438]
+
+        # jump polynomial x^k mod charpoly is x^k itself as long as k is less than the state bits count
+        for k in (0, 1, 5, 100, 255):
+            xrsr = Xoroshiro256(0x0123_4567_89ab_cdef)
+            xrsr_ref = Xoroshiro256(0x0123_4567_89ab_cdef)
+            xrsr.next_n(7)
+            jumpPoly = [0] * 4
+            jumpPoly[k // 64] = 1 << (k % 64)
+            xrsr._jumpwith(tuple(jumpPoly))
+            xrsr_ref.next_n(7 + k)
+            assert xrsr.next_n(100) == xrsr_ref.next_n(100)
+
     #-------------------------------------------------------------------------
     def test_seed(self):
         xrsr = Xoroshiro256()
@@ -288,3 +322,24 @@ class TestXoroshiro256:
             _state = [i+1 for i in range(TestXoroshiro256.Xoroshiro256_STATE_SIZE)]  # type: ignore
             _state[TestXoroshiro256.Xoroshiro256_STATE_SIZE - 5] = {1, 2}
             xrsr.setstate(_state)  # type: ignore
+
+    #-------------------------------------------------------------------------
+    def test_spawn(self):
+        xrsr = Xoroshiro256(0x0123_4567_89ab_cdef)
+        xrsr_ref = Xoroshiro256(0x0123_4567_89ab_cdef)
+        xrsr.next_n(5)
+        xrsr_ref.next_n(5)
+        children = xrsr.spawn(3)
+        for child in children:
+            assert type(child) is Xoroshiro256
+            assert child._state is not xrsr._state
+            assert child.getstate() == xrsr_ref.getstate()
+            xrsr_ref.long_jump()
+        assert xrsr.getstate() == xrsr_ref.getstate()
+        assert list(children[0].next_n(10)) != list(children[1].next_n(10))
+        assert xrsr.spawn(0) == []
+
+        with pytest.raises(TypeError):
+            xrsr.spawn(3.0)  # type: ignore
+        with pytest.raises(ValueError):
+            xrsr.spawn(-3)
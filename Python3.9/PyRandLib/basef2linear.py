@@ -0,0 +1,279 @@
+"""
+Copyright (c) 2025 Philippe Schmouker, ph (dot) schmouker (at) gmail.com
+
+Permission is hereby granted,  free of charge,  to any person obtaining a copy
+of this software and associated documentation files (the "Software"),  to deal
+in the Software without restriction, including  without  limitation the rights
+to use,  copy,  modify,  merge,  publish,  distribute, sublicense, and/or sell
+copies of the Software,  and  to  permit  persons  to  whom  the  Software  is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS",  WITHOUT WARRANTY OF ANY  KIND,  EXPRESS  OR
+IMPLIED,  INCLUDING  BUT  NOT  LIMITED  TO  THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT  SHALL  THE
+AUTHORS  OR  COPYRIGHT  HOLDERS  BE  LIABLE  FOR  ANY CLAIM,  DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT,  TORT OR OTHERWISE, ARISING FROM,
+OUT  OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+#=============================================================================
+import os
+from array  import array
+from typing import Final
+
+from .listindexstate import ListIndexState
+from .splitmix       import SplitMix64
+
+
+#=============================================================================
+class BaseF2Linear( ListIndexState ):
+    """The base class for all F2-linear PRNGs.
+
+    Definition of the base class for all the pseudo-random generators which
+    internal state is transformed with a linear function over GF(2), i.e. the
+    WELL and the MELG generators.
+
+    This module is part of library PyRandLib.
+
+    Copyright (c) 2025 Philippe Schmouker
+
+    The transition function of these PRNGs is a matrix T over GF(2).  Jumping
+    N steps ahead evaluates T^N.s, which is equal to J(T).s with the  jump
+    polynomial J(x) = x^N mod P(x),  P(x) being the minimal polynomial of T.
+    J(T).s is the sum of the states T^i.s for which the coefficient  of
+    x^i in J(x) is set.  So, jumping costs k calls to next() and about k / 2
+    xor's of whole states, k being the count of bits of the  internal  state,
+    whatever the value of N.
+
+    P(x) is provided with the library,  see directory 'jumppolys',  as are
+    the jump polynomials for 2^64 and 2^128 steps.  The other jump polynomials
+    are evaluated on demand and then cached.
+
+    Inheriting classes have to define class attribute '_WORD_BITS' and  to
+    implement methods '_f2state()' and '_f2setstate()'.  See BaseWELL  and
+    BaseMELG for examples.
+    """
+
+
+    #-------------------------------------------------------------------------
+    _JUMP_POLYS_DIR: Final[str] = os.path.join( os.path.dirname(__file__), 'jumppolys' )
+
+    _minPolys: dict[type, int] = {}  # notice: cache shared by all the inheriting classes
+    _jumpPolys: dict[type, dict[int, int]] = {}  # notice: cache shared by all the inheriting classes
+
+
+    #-------------------------------------------------------------------------
+    def jump(self, _n: int, /) -> None:
+        """Jumps the internal state of this generator _n steps ahead.
+
+        This generator then provides the same output sequence as after _n
+        successive calls to next(),  but whatever the value of _n the jump
+        costs about the time of k calls to next(),  k being the count of bits
+        of the internal state.  Notice: the values of the internal state are
+        the same ones,  but they may be stored at other places in the internal
+        list,  i.e. with another value of its index.
+        Successive calls to jump() with a same large value of _n (e.g. 2^64)
+        provide the starting points of non-overlapping subsequences, e.g. for
+        parallel computations. Raises ValueError if _n is negative.
+        """
+        if not isinstance( _n, int ):
+            raise TypeError(f"the count of jumped steps must be an integer (currently is {type(_n)})")
+        if _n < 0:
+            raise ValueError(f"F2-linear generators cannot jump back (count of steps is {_n})")
+
+        jumped = 0
+        for bit in bin( self._jumppoly(_n) )[:1:-1]:  # notice: lowest degrees first
+            if bit == '1':
+                jumped ^= self._f2state()
+            self.next()
+        self._f2setstate( jumped )
+
+
+    #-------------------------------------------------------------------------
+    def _f2state(self) -> int:
+        """Returns the internal state of this generator packed in a single integer.
+
+        The packing MUST NOT depend on the current index in the  internal  state
+        list.  Inheriting classes MUST IMPLEMENT this method.
+        """
+        raise NotImplementedError()
+
+
+    #-------------------------------------------------------------------------
+    def _f2setstate(self, _f2state: int, /) -> None:
+        """Sets the internal state of this generator from a packed integer.
+
+        _f2state has been evaluated from values returned by method '_f2state()'.
+        Inheriting classes MUST IMPLEMENT this method.
+        """
+        raise NotImplementedError()
+
+
+    #-------------------------------------------------------------------------
+    @classmethod
+    def _jumppoly(cls, _n: int, /) -> int:
+        """Returns the polynomial x^_n mod P(x), P(x) being the minimal polynomial of the transition function.
+
+        The polynomials that are provided in directory 'jumppolys' are loaded at
+        first call. The other ones are evaluated and then cached.
+        """
+        jumpPolys = cls._loadpolys()
+        if _n not in jumpPolys:
+            jumpPolys[_n] = cls._xpowmod( _n, cls._minpoly() )
+        return jumpPolys[_n]
+
+
+    #-------------------------------------------------------------------------
+    @classmethod
+    def _minpoly(cls) -> int:
+        """Returns the minimal polynomial of the transition function of this class of generators.
+
+        Should it not be provided in directory 'jumppolys',  it is evaluated as
+        the least common multiple of the minimal polynomials of sequences of
+        bits,  each bit being the parity of a random subset of the bits of the
+        successive internal states of the generator.  These minimal polynomials
+        are evaluated with the Berlekamp-Massey algorithm.  The evaluation stops
+        once two successive sequences do not modify the least common multiple.
+        """
+        cls._loadpolys()
+        if cls not in BaseF2Linear._minPolys:
+            initRand = SplitMix64( 1 )
+            minPoly = 1
+            unchangedCount = 0
+            while unchangedCount < 2:
+                prng = cls( initRand() )  # type: ignore
+                stateBits = prng._STATE_SIZE * cls._WORD_BITS  # type: ignore
+                mask = int.from_bytes( array('Q', initRand.fill(stateBits // 64 + 1)).tobytes(), 'little' )
+                bits = [0] * (2 * stateBits)
+                for n in range(2 * stateBits):
+                    bits[n] = bin( prng._f2state() & mask ).count('1') & 1
+                    prng.next()
+                if (lcm := cls._polylcm( minPoly, cls._berlekampmassey(bits) )) == minPoly:
+                    unchangedCount += 1
+                else:
+                    minPoly = lcm
+                    unchangedCount = 0
+            BaseF2Linear._minPolys[cls] = minPoly
+        return BaseF2Linear._minPolys[cls]
+
+
+    #-------------------------------------------------------------------------
+    @classmethod
+    def _loadpolys(cls) -> dict[int, int]:
+        """Loads the polynomials that are provided for this class of generators and returns the jump ones.
+
+        The related file in directory 'jumppolys' contains the minimal polynomial
+        of the transition function of the generator, on a line starting with
+        'minpoly',  and jump polynomials on lines starting with '2^e',  e being
+        the exponent of the count of jumped steps.  Polynomials are coded  in
+        hexadecimal format. Lines starting with '#' are comments.
+        """
+        if cls not in BaseF2Linear._jumpPolys:
+            jumpPolys = BaseF2Linear._jumpPolys[cls] = {}
+            filepath = os.path.join( BaseF2Linear._JUMP_POLYS_DIR, f"{cls.__name__.lower()}.txt" )
+            if os.path.isfile( filepath ):
+                with open( filepath, 'r' ) as fp:
+                    for line in fp:
+                        if (line := line.strip()) and not line.startswith( '#' ):
+                            key, poly = line.split()
+                            if key == 'minpoly':
+                                BaseF2Linear._minPolys[cls] = int( poly, 16 )
+                            else:
+                                jumpPolys[ 1 << int(key[2:]) ] = int( poly, 16 )
+        return BaseF2Linear._jumpPolys[cls]
+
+
+    #-------------------------------------------------------------------------
+    @classmethod
+    def _berlekampmassey(cls, _bits: list[int], /) -> int:
+        """Evaluates the minimal polynomial of a sequence of bits over GF(2).
+
+        Polynomials are coded as integers,  the coefficient of x^i being bit i.
+        Notice: the returned polynomial is the reciprocal of the connection
+        polynomial that is evaluated by the algorithm.
+        """
+        connPoly, prevPoly = 1, 1
+        length, shift = 0, 1
+        window = 0  # notice: bit j of window is _bits[n - j]
+        for n, bit in enumerate( _bits ):
+            window = (window << 1) | bit
+            if bin( connPoly & window ).count('1') & 1:
+                if 2 * length <= n:
+                    connPoly, prevPoly = connPoly ^ (prevPoly << shift), connPoly
+                    length = n + 1 - length
+                    shift = 1
+                else:
+                    connPoly ^= prevPoly << shift
+                    shift += 1
+            else:
+                shift += 1
+        return int( f"{connPoly:0{length + 1}b}"[::-1], 2 )
+
+
+    #-------------------------------------------------------------------------
+    @classmethod
+    def _polylcm(cls, _poly1: int, _poly2: int, /) -> int:
+        """Evaluates the least common multiple of two polynomials over GF(2).
+
+        Polynomials are coded as integers,  the coefficient of x^i being bit i.
+        """
+        # evaluates the greatest common divisor of the two polynomials
+        a, b = _poly1, _poly2
+        while b:
+            while (shift := a.bit_length() - b.bit_length()) >= 0:
+                a ^= b << shift
+            a, b = b, a
+
+        # divides _poly2 by it
+        quotient, remainder = 0, _poly2
+        while (shift := remainder.bit_length() - a.bit_length()) >= 0:
+            quotient |= 1 << shift
+            remainder ^= a << shift
+
+        # and finally multiplies the quotient by _poly1
+        lcm = 0
+        for bit in bin( quotient )[:1:-1]:
+            if bit == '1':
+                lcm ^= _poly1
+            _poly1 <<= 1
+        return lcm
+
+
+    #-------------------------------------------------------------------------
+    @classmethod
+    def _xpowmod(cls, _n: int, _modPoly: int, /) -> int:
+        """Evaluates x^_n modulo polynomial _modPoly over GF(2).
+
+        Polynomials are coded as integers,  the coefficient of x^i being bit i.
+        Squares are evaluated by spreading the bits of polynomials.  Reductions
+        are evaluated eight bits at a time with a table of 256 multiples of the
+        modulo polynomial.
+        """
+        degree = _modPoly.bit_length() - 1
+
+        # evaluates the table of the multiples of _modPoly which 8 upper bits are their index in the table
+        table = [0] * 256
+        for b in range(1, 256):
+            multiple = _modPoly << (b.bit_length() - 1)
+            table[b] = multiple ^ table[ b ^ (multiple >> degree) ]
+
+        def reduce(poly: int) -> int:
+            while (shift := poly.bit_length() - degree - 8) >= 0:
+                poly ^= table[ poly >> (degree + shift) ] << shift
+            while (shift := poly.bit_length() - degree - 1) >= 0:
+                poly ^= _modPoly << shift
+            return poly
+
+        result = reduce( 1 )
+        for bit in bin( _n )[2:]:
+            result = reduce( int( '0'.join(bin(result)[2:]), 2 ) )  # i.e. result^2
+            if bit == '1':
+                result = reduce( result << 1 )
+        return result
+
+
+#=====   end of module   basef2linear.py   ===================================
@@ -21,15 +21,16 @@ SOFTWARE.
 """
 
 #=============================================================================
+from array  import array
 from typing import Final
 
-from .listindexstate   import ListIndexState
+from .basef2linear     import BaseF2Linear
 from .annotation_types import Numerical, SeedStateType, StateType
 from .splitmix         import SplitMix64
 
 
 #=============================================================================
-class BaseMELG( ListIndexState ):
+class BaseMELG( BaseF2Linear ):
     """Definition of the base class for all MELG pseudo-random generators.
     
     This module is part of library PyRandLib.
@@ -102,6 +103,8 @@ class BaseMELG( ListIndexState ):
     classes  if returned random integer values are coded on anything else 
     than 32 bits.
     """
+
+    _WORD_BITS: Final[int] = 64  # count of bits of the integers in the internal state list
     
 
     #-------------------------------------------------------------------------
@@ -135,4 +138,30 @@ class BaseMELG( ListIndexState ):
         super().setstate(_state)
 
 
+    #-------------------------------------------------------------------------
+    def _f2state(self) -> int:
+        """Returns the internal state of this generator packed in a single integer.
+
+        The integers of the internal state list are packed from the current
+        index on, the last one - i.e. the state extension - being packed last.
+        """
+        i = self._index
+        last = self._STATE_SIZE - 1
+        state = self._state
+        return int.from_bytes( array('Q', state[i:last] + state[:i] + state[last:]).tobytes(), 'little' )  # type: ignore
+
+
+    #-------------------------------------------------------------------------
+    def _f2setstate(self, _f2state: int, /) -> None:
+        """Sets the internal state of this generator from a packed integer.
+
+        The integers of the internal state list are unpacked from the current
+        index on, the last one - i.e. the state extension - being unpacked last.
+        """
+        last = self._STATE_SIZE - 1
+        i = last - self._index
+        words = array('Q', _f2state.to_bytes(8 * self._STATE_SIZE, 'little')).tolist()
+        self._state = self._statewords( words[i:last] + words[:i] + words[last:] )
+
+
 #=====   end of module   basemelg.py   =======================================
@@ -0,0 +1,223 @@
+"""
+Copyright (c) 2025 Philippe Schmouker, ph (dot) schmouker (at) gmail.com
+
+Permission is hereby granted,  free of charge,  to any person obtaining a copy
+of this software and associated documentation files (the "Software"),  to deal
+in the Software without restriction, including  without  limitation the rights
+to use,  copy,  modify,  merge,  publish,  distribute, sublicense, and/or sell
+copies of the Software,  and  to  permit  persons  to  whom  the  Software  is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS",  WITHOUT WARRANTY OF ANY  KIND,  EXPRESS  OR
+IMPLIED,  INCLUDING  BUT  NOT  LIMITED  TO  THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT  SHALL  THE
+AUTHORS  OR  COPYRIGHT  HOLDERS  BE  LIABLE  FOR  ANY CLAIM,  DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT,  TORT OR OTHERWISE, ARISING FROM,
+OUT  OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+#=============================================================================
+from array    import array
+from copy     import deepcopy
+from operator import length_hint
+from typing   import List, Union
+
+from .baserandom       import BaseRandom
+from .annotation_types import Numerical, StateType
+
+
+#=============================================================================
+class Buffered( BaseRandom ):
+    """Block-buffered wrapper of any PyRandLib generator.
+
+    This module is part of library PyRandLib.
+
+    Copyright (c) 2025 Philippe Schmouker
+
+    The wrapped generator evaluates its output values block by block  with
+    its method next_n(),  which keeps its internal state in local variables
+    all along a tight loop,  just as the Mersenne-Twister algorithm  does
+    when it regenerates its whole internal state at once. Method next() then
+    just gets the next value of the current block.  This is valuable  for
+    the generators with large internal states (e.g. Well44497b, Melg44497,
+    Mrg49507 or LFib1340) which next() method is the most costly one.
+
+    The generated values are exactly the same, and in the same order, as the
+    ones of the wrapped generator.  getstate() returns the state that  the
+    unbuffered generator would have at the same point of the sequence, and
+    setstate() and seed() restart the buffering from the state  or  the  seed
+    they set to the wrapped generator.
+
+      rand = Buffered( Well44497b(1) )
+      print( rand() )     # prints a pseudo-random value within [0.0, 1.0)
+      print( rand(a) )    # prints a pseudo-random value within [0, a) or [0.0, a) depending on the type of a
+      print( rand(a, n) ) # prints a list of n pseudo-random values each within [0, a)
+
+    Notice: the wrapped generator should not be used on its own while it is
+    wrapped.
+    """
+
+    #-------------------------------------------------------------------------
+    def __init__(self, prng: BaseRandom, block: int = 4096, /) -> None:
+        """Constructor.
+
+        prng is the wrapped PyRandLib generator.  block is the count of values
+        that are evaluated at once each time the current block is exhausted.
+        """
+        if not isinstance( prng, BaseRandom ):
+            raise TypeError( f"the wrapped generator must be a PyRandLib generator (currently is {type(prng)})" )
+        if not isinstance( block, int ):
+            raise TypeError( f"the size of blocks must be an integer (currently is {type(block)})" )
+        if block <= 0:
+            raise ValueError( f"the size of blocks must be positive (currently is {block})" )
+
+        self._prng = prng
+        self._block = block
+        self._NORMALIZE = prng._NORMALIZE
+        self._OUT_BITS = prng._OUT_BITS
+        self._clearblock()
+        self.gauss_next = None  # notice: no call to the base class constructor which would seed the wrapped generator
+
+
+    #-------------------------------------------------------------------------
+    @property
+    def prng(self) -> BaseRandom:
+        """The wrapped PyRandLib generator.
+        """
+        return self._prng
+
+
+    #-------------------------------------------------------------------------
+    def next(self) -> int:
+        """Returns the next pseudo-random integer value of the current block.
+        """
+        try:
+            return next( self._values )
+        except StopIteration:
+            self._nextblock()
+            return next( self._values )
+
+
+    #-------------------------------------------------------------------------
+    def next_n(self, count: int, /) -> Union[array, List[int]]:
+        """Returns the next count pseudo-random integer values.
+
+        The remaining values of the current block are returned first, then
+        the other ones are directly evaluated by the wrapped generator.
+        """
+        assert count >= 0, "the count of generated values must not be negative"
+        values = [ v for _, v in zip(range(count), self._values) ]
+        if len( values ) < count:
+            values += self._prng.next_n( count - len(values) )
+            self._clearblock()
+        return self._outarray( values )
+
+
+    #-------------------------------------------------------------------------
+    def getstate(self) -> StateType:
+        """Returns an object capturing the current internal state of the wrapped generator.
+
+        This is the state the wrapped generator would have if it  had  not
+        been buffered.  It is evaluated from a copy of the wrapped generator
+        as it was at the beginning of the current block.
+        """
+        if (remaining := length_hint( self._values )) == 0:
+            return self._prng.getstate()
+        prng = self._copyprng( self._blockPrng )  # type: ignore
+        prng.next_n( self._blockSize - remaining )
+        return prng.getstate()
+
+
+    #-------------------------------------------------------------------------
+    def restore(self, _state: StateType, /, trusted: bool = True) -> None:
+        """Restores the internal state of the wrapped generator and clears the current block.
+        """
+        self._prng.restore( _state, trusted )
+        self._clearblock()
+
+
+    #-------------------------------------------------------------------------
+    def seed(self, _seed: Numerical = None, /) -> None:  # type: ignore
+        """Initiates the internal state of the wrapped generator and clears the current block.
+        """
+        self._prng.seed( _seed )
+        self._clearblock()
+
+
+    #-------------------------------------------------------------------------
+    def setstate(self, _state: StateType = None, /) -> None:  # type: ignore
+        """Restores the internal state of the wrapped generator and clears the current block.
+        """
+        self._prng.setstate( _state )
+        self._clearblock()
+
+
+    #-------------------------------------------------------------------------
+    def spawn(self, n: int, /) -> 'list[Buffered]':
+        """Returns n new buffered generators wrapping the children spawned by the wrapped generator.
+
+        Notice: the wrapped generator has already provided the values of the
+        current block.  So,  it is first set back at the current point of the
+        sequence,  the rest of the current block being dropped,  and the
+        children are spawned from there,  as they would be from an unbuffered
+        generator.
+        """
+        self._rewind()
+        return [ Buffered( prng, self._block ) for prng in self._prng.spawn( n ) ]
+
+
+    #-------------------------------------------------------------------------
+    def _clearblock(self) -> None:
+        """Clears the current block of values.
+        """
+        self._values = iter( [] )
+        self._blockPrng = None
+        self._blockSize = 0
+
+
+    #-------------------------------------------------------------------------
+    def _nextblock(self) -> None:
+        """Evaluates the next block of values with the wrapped generator.
+        """
+        self._blockPrng = self._copyprng( self._prng )
+        self._blockSize = self._block
+        self._values = iter( list(self._prng.next_n( self._block )) )
+
+
+    #-------------------------------------------------------------------------
+    def _rewind(self) -> None:
+        """Sets the wrapped generator back at the current point of the sequence and clears the current block.
+
+        The wrapped generator is replaced with a copy of the generator as it
+        was at the beginning of the current block,  advanced up to the current
+        point. Notice: setstate(getstate()) cannot be used here,  since method
+        setstate() does not restore the internal state of all the PyRandLib
+        generators (e.g. of the LCGs).
+        """
+        if self._blockPrng is not None:
+            prng = self._copyprng( self._blockPrng )
+            prng.next_n( self._blockSize - length_hint(self._values) )
+            self._prng.__dict__ = prng.__dict__
+        self._clearblock()
+
+
+    #-------------------------------------------------------------------------
+    @classmethod
+    def _copyprng(cls, _prng: BaseRandom, /) -> BaseRandom:
+        """Returns an independent copy of a PyRandLib generator.
+
+        Notice: the pickling of random.Random instances,  and so deepcopy(),
+        goes through getstate() and setstate(),  which do not restore the
+        internal state of all PyRandLib generators (e.g. of the LCGs).
+        """
+        prng = type(_prng).__new__( type(_prng) )
+        prng.__dict__ = deepcopy( _prng.__dict__ )
+        return prng
+
+
+#=====   end of module   buffered.py   =======================================
@@ -21,7 +21,7 @@ SOFTWARE.
 """
 
 #=============================================================================
-from typing import Final
+from typing import Final, List
 
 from .basecwg          import BaseCWG
 from .annotation_types import Numerical, SeedStateType, StateType
@@ -105,6 +105,7 @@ class Cwg128( BaseCWG ):
 
 
     _MODULO: Final[int] = (1 << 128) - 1  # notice: optimization on modulo computations
+    _S_MODULO: Final[int] = (1 << 128) - 1  # type: ignore
 
 
     #-------------------------------------------------------------------------
@@ -130,6 +131,23 @@ class Cwg128( BaseCWG ):
         return self._state ^ (self._a >> 96)
 
 
+    #-------------------------------------------------------------------------
+    def next_n(self, count: int, /) -> List[int]:
+        """Returns the next count pseudo-random values, as would count calls to next().
+        """
+        assert count >= 0, "the count of generated values must not be negative"
+        a, weyl, s, state = self._a, self._weyl, self._s, self._state
+        modulo = self._MODULO
+        values = [0] * count
+        for n in range(count):
+            a = (a + state) & modulo
+            weyl = (weyl + s) & modulo
+            state = (((state >> 1) * (a | 1)) ^ weyl) & modulo
+            values[n] = state ^ (a >> 96)
+        self._a, self._weyl, self._state = a, weyl, state
+        return values
+
+
     #-------------------------------------------------------------------------
     def seed(self, _seed: Numerical = None, /) -> None:  # type: ignore
         """Initiates the internal state of this pseudo-random generator.
@@ -21,6 +21,8 @@ SOFTWARE.
 """
 
 #=============================================================================
+from array import array
+
 from .basemelg import BaseMELG
 from .annotation_types import SeedStateType
 
@@ -116,15 +118,39 @@ class Melg19937( BaseMELG ):
 
         Notice: the output value is coded on 64-bits.
         """
+        state = self._state  # notice: the local binding speeds up the accesses to the internal state
         i = self._index
         self._index = (i_1 := (i+1) % 311)
 
-        s311 = self._state[311]
-        x = (self._state[i] & 0xffff_fffe_0000_0000) | (self._state[i_1] & 0x0000_0001_ffff_ffff)  # notice: | instead of ^ as erroneously printed in [11]  # type: ignore
-        self._state[311] = (s311 := ((x >> 1) ^ Melg19937._A_COND[x & 0x01]) ^ self._state[(i+81) % 311] ^ (s311 ^ ((s311 << 23) & 0xffff_ffff_ffff_ffff)))  # type: ignore
+        s311 = state[311]
+        x = (state[i] & 0xffff_fffe_0000_0000) | (state[i_1] & 0x0000_0001_ffff_ffff)  # notice: | instead of ^ as erroneously printed in [11]  # type: ignore
+        state[311] = (s311 := ((x >> 1) ^ Melg19937._A_COND[x & 0x01]) ^ state[(i+81) % 311] ^ (s311 ^ ((s311 << 23) & 0xffff_ffff_ffff_ffff)))  # type: ignore
 
-        si = self._state[i] = x ^ (s311 ^ (s311 >> 33))
-        return (si ^ ((si << 16) & 0xffff_ffff_ffff_ffff)) ^ ((self._state[(i + 19) % 311]) & 0x6aed_e6fd_97b3_38ec)  # type: ignore
+        si = state[i] = x ^ (s311 ^ (s311 >> 33))
+        return (si ^ ((si << 16) & 0xffff_ffff_ffff_ffff)) ^ ((state[(i + 19) % 311]) & 0x6aed_e6fd_97b3_38ec)  # type: ignore
         
 
+
+    #-------------------------------------------------------------------------
+    def next_n(self, count: int, /) -> array:
+        """Returns the next count pseudo-random values, as would count calls to next().
+        """
+        assert count >= 0, "the count of generated values must not be negative"
+        state = self._state
+        i = self._index
+        s311 = state[311]
+        aCond = Melg19937._A_COND
+        values = [0] * count
+        for n in range(count):
+            i_1 = (i + 1) % 311
+            x = (state[i] & 0xffff_fffe_0000_0000) | (state[i_1] & 0x0000_0001_ffff_ffff)
+            s311 = ((x >> 1) ^ aCond[x & 0x01]) ^ state[(i + 81) % 311] ^ (s311 ^ ((s311 << 23) & 0xffff_ffff_ffff_ffff))
+            si = state[i] = x ^ (s311 ^ (s311 >> 33))
+            values[n] = (si ^ ((si << 16) & 0xffff_ffff_ffff_ffff)) ^ (state[(i + 19) % 311] & 0x6aed_e6fd_97b3_38ec)
+            i = i_1
+        state[311] = s311  # notice: never read in the loop, so set once after it
+        self._index = i
+        return array('Q', values)
+
+
 #=====   end of module   melg19937.py   ======================================
@@ -21,8 +21,11 @@ SOFTWARE.
 """
 
 #=============================================================================
+from array  import array
+from typing import Final, Union
+
 from .basepcg          import BasePCG
-from .annotation_types import Numerical
+from .annotation_types import Numerical, StatesList
 from .splitmix         import SplitMix64
 
 
@@ -103,27 +106,67 @@ class Pcg64_32( BasePCG ):
     """
 
     #-------------------------------------------------------------------------
-    def __init__(self, _seed: Numerical = None, /) -> None:  # type: ignore
+    _A: Final[int] = 0x5851_f42d_4c95_7f2d  # LCG mult. attribute
+    _C: Final[int] = 0x1405_7b7e_f767_814f  # LCG add. attribute, i.e. the default stream increment
+    _MODULO: Final[int] = 0xffff_ffff_ffff_ffff  # optimization here to get modulo via operator &
+
+
+    #-------------------------------------------------------------------------
+    def __init__(self, _seed: Numerical = None, _stream: int = None, /) -> None:  # type: ignore
         """Constructor.
         
         Should _seed be None or not a numerical then the local 
         time is used (with its shuffled value) as a seed.
+        _stream selects one of the 2^63 streams of this PCG, i.e.
+        the odd increment of its LCG.  Should it be None then the
+        default increment of the reference implementation is used.
         """
+        self._inc = self._streaminc( _stream, Pcg64_32._C, Pcg64_32._MODULO )
         super().__init__( _seed ) # this call creates attribute self._state and sets it
 
 
+    #-------------------------------------------------------------------------
+    def advance(self, _delta: int, /) -> None:
+        """Jumps the internal state of this generator _delta steps ahead.
+
+        The state reached is the one that _delta successive calls to next()
+        would have reached, but it is evaluated in O(log _delta) time. A
+        negative _delta steps this generator back.
+        """
+        if not isinstance(_delta, int):
+            raise TypeError(f"the advance delta must be an int (currently is {type(_delta)})")
+        self._state = self._lcgadvance( self._state, _delta, Pcg64_32._A, self._inc, Pcg64_32._MODULO )
+
+
     #-------------------------------------------------------------------------
     def next(self) -> int:
         """This is the core of the pseudo-random generator.
         """
         # evaluates next internal state
         current_state = self._state
-        self._state = (0x5851_f42D_4c95_7f2d * current_state + 0x1405_7b7e_f767_814f) & 0xffff_ffff_ffff_ffff
+        self._state = (0x5851_f42D_4c95_7f2d * current_state + self._inc) & 0xffff_ffff_ffff_ffff
         # the permutated output is then computed
         random_shift = (current_state >> 61) & 0x07  # random shift is set with the 3 upper bits of internal state
         return ((current_state ^ (current_state >> 22)) >> (22 + random_shift)) & 0xffff_ffff
 
 
+    #-------------------------------------------------------------------------
+    def next_n(self, count: int, /) -> array:
+        """Returns the next count pseudo-random values, as would count calls to next().
+        """
+        assert count >= 0, "the count of generated values must not be negative"
+        state = self._state
+        inc = self._inc
+        values = [0] * count
+        for n in range(count):
+            # the permutated output is computed from the current state
+            values[n] = ((state ^ (state >> 22)) >> (22 + ((state >> 61) & 0x07))) & 0xffff_ffff
+            # then the next internal state is evaluated
+            state = (0x5851_f42D_4c95_7f2d * state + inc) & 0xffff_ffff_ffff_ffff
+        self._state = state
+        return array('I', values)
+
+
     #-------------------------------------------------------------------------
     def seed(self, _seed: Numerical = None, /) -> None:  # type: ignore
         """Initiates the internal state of this pseudo-random generator.
@@ -148,18 +191,24 @@ class Pcg64_32( BasePCG ):
 
 
     #-------------------------------------------------------------------------
-    def setstate(self, _state: int = None, /) -> None:  # type: ignore
+    def setstate(self, _state: Union[int, StatesList] = None, /) -> None:  # type: ignore
         """Restores the internal state of the generator.
         
         _state should have been obtained from a previous call 
         to  getstate(),  and setstate() restores the internal 
         state of the generator to what it  was  at  the  time 
-        setstate() was called.
+        setstate() was called. It is then a pair of integers:
+        the LCG state and the increment of the stream. Should
+        _state be None or an int,  this generator  is  seeded
+        with it and keeps its current stream.
         """
         if _state is None or isinstance( _state, int ):
             self.seed( _state )
+        elif isinstance( _state, (list, tuple) ) and len( _state ) == 2 and all( isinstance(s, int) for s in _state ):
+            self._state = _state[0] & 0xffff_ffff_ffff_ffff
+            self._inc = (_state[1] & 0xffff_ffff_ffff_ffff) | 1  # Notice: increment must be odd
         else:
-            raise TypeError(f"State value must be None or an int (currently is {type(_state)})")
+            raise TypeError(f"State value must be None, an int or a pair of ints (currently is {type(_state)})")
 
 
 #=====   end of module   pcg64_32.py   =======================================
@@ -41,6 +41,21 @@ def test_perf(prng_class_name: str, seed_value: int, n_loops: int, n_repeats: in
     print(f"--> {min(perfs) / n_loops * 1e-3:.4f} us\n")
 
 
+#=============================================================================
+def test_init_perf(prng_class_name: str, seed_value: int, n_loops: int, n_repeats: int):
+    """Evaluates the CPU time spent constructing a generator from a seed and from a saved state."""
+    print("---", prng_class_name, "construction ---")
+    setup = f"from PyRandLib import {prng_class_name}; state = {prng_class_name}({seed_value}).getstate()"
+    for init_name, init_value in (("seed", seed_value), ("state", "state")):
+        perfs = repeat(f"{prng_class_name}({init_value})",
+                       setup=setup,
+                       repeat=n_repeats,
+                       timer=perf_counter_ns,
+                       number=n_loops)
+        print(f"--> from {init_name}: {min(perfs) / n_loops * 1e-3:.4f} us")
+    print()
+
+
 #=============================================================================
 if __name__ == "__main__":
 
@@ -76,6 +91,36 @@ if __name__ == "__main__":
     test_perf("Xoroshiro256" , 0x3ca5_8796_1f2e_b45a, 100_000, N)
     test_perf("Xoroshiro512" , 0x3ca5_8796_1f2e_b45a, 100_000, N)
     test_perf("Xoroshiro1024", 0x3ca5_8796_1f2e_b45a, 100_000, N)
+
+    print("=== PyRandLib construction CPU time performances ===\n")
+
+    test_init_perf("Cwg64"        , 0x3ca5_8796          , 1_000, N)
+    test_init_perf("Cwg128_64"    , 0x3ca5_8796_1f2e_b45a, 1_000, N)
+    test_init_perf("Cwg128"       , 0x3ca5_8796_1f2e_b45a_3ca5_8796_1f2e_b45a, 1_000, N)
+    test_init_perf("FastRand32"   , 0x3ca5_8796          , 1_000, N)
+    test_init_perf("FastRand63"   , 0x3ca5_8796_1f2e_b45a, 1_000, N)
+    test_init_perf("LFib78"       , 0x3ca5_8796_1f2e_b45a, 1_000, N)
+    test_init_perf("LFib116"      , 0x3ca5_8796_1f2e_b45a, 1_000, N)
+    test_init_perf("LFib668"      , 0x3ca5_8796_1f2e_b45a, 1_000, N)
+    test_init_perf("LFib1340"     , 0x3ca5_8796_1f2e_b45a, 1_000, N)
+    test_init_perf("Melg607"      , 0x3ca5_8796_1f2e_b45a, 1_000, N)
+    test_init_perf("Melg19937"    , 0x3ca5_8796_1f2e_b45a, 1_000, N)
+    test_init_perf("Melg44497"    , 0x3ca5_8796_1f2e_b45a, 1_000, N)
+    test_init_perf("Mrg287"       , 0x3ca5_8796          , 1_000, N)
+    test_init_perf("Mrg1457"      , 0x3ca5_8796          , 1_000, N)
+    test_init_perf("Mrg49507"     , 0x3ca5_8796          , 1_000, N)
+    test_init_perf("Pcg64_32"     , 0x3ca5_8796_1f2e_b45a, 1_000, N)
+    test_init_perf("Pcg128_64"    , 0x3ca5_8796_1f2e_b45a_3ca5_8796_1f2e_b45a, 1_000, N)
+    test_init_perf("Pcg1024_32"   , 0x3ca5_8796_1f2e_b45a, 1_000, N)
+    test_init_perf("Squares32"    , 0x3ca5_8796_1f2e_b45a, 1_000, N)
+    test_init_perf("Squares64"    , 0x3ca5_8796_1f2e_b45a, 1_000, N)
+    test_init_perf("Well512a"     , 0x3ca5_8796          , 1_000, N)
+    test_init_perf("Well1024a"    , 0x3ca5_8796          , 1_000, N)
+    test_init_perf("Well19937c"   , 0x3ca5_8796          , 1_000, N)
+    test_init_perf("Well44497b"   , 0x3ca5_8796          , 1_000, N)
+    test_init_perf("Xoroshiro256" , 0x3ca5_8796_1f2e_b45a, 1_000, N)
+    test_init_perf("Xoroshiro512" , 0x3ca5_8796_1f2e_b45a, 1_000, N)
+    test_init_perf("Xoroshiro1024", 0x3ca5_8796_1f2e_b45a, 1_000, N)
     
 
 #=====   end of module   testCPUPerfs.py   ===================================
@@ -0,0 +1,199 @@
+"""
+Copyright (c) 2025 Philippe Schmouker, ph (dot) schmouker (at) gmail.com
+
+Permission is hereby granted,  free of charge,  to any person obtaining a copy
+of this software and associated documentation files (the "Software"),  to deal
+in the Software without restriction, including  without  limitation the rights
+to use,  copy,  modify,  merge,  publish,  distribute, sublicense, and/or sell
+copies of the Software,  and  to  permit  persons  to  whom  the  Software  is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS",  WITHOUT WARRANTY OF ANY  KIND,  EXPRESS  OR
+IMPLIED,  INCLUDING  BUT  NOT  LIMITED  TO  THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT  SHALL  THE
+AUTHORS  OR  COPYRIGHT  HOLDERS  BE  LIABLE  FOR  ANY CLAIM,  DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT,  TORT OR OTHERWISE, ARISING FROM,
+OUT  OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+#=============================================================================
+from array              import array
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import math
+import pytest
+
+import PyRandLib.asyncstream
+from PyRandLib.asyncstream  import AsyncRandomStream
+from PyRandLib.cwg128       import Cwg128
+from PyRandLib.cwg64        import Cwg64
+from PyRandLib.fastrand32   import FastRand32
+from PyRandLib.mrg287       import Mrg287
+from PyRandLib.squares64    import Squares64
+from PyRandLib.well44497b   import Well44497b
+from PyRandLib.xoroshiro256 import Xoroshiro256
+
+
+#=============================================================================
+class TestAsyncRandomStream:
+    """Tests class AsyncRandomStream.
+    """
+
+    #-------------------------------------------------------------------------
+    def test_init(self):
+        stream = AsyncRandomStream(Cwg64(1))
+        assert isinstance(stream.prng, Cwg64)
+        assert stream._batch == 65536
+        assert stream._timeSlice == 0.001
+        assert stream._executor is None
+        assert len(stream._values) == 0
+        assert stream._index == 0
+        assert stream._valueTime == math.inf
+        assert stream._lock is None
+
+        executor = ThreadPoolExecutor(1)
+        stream = AsyncRandomStream(FastRand32(1), 100, 0, executor)
+        assert stream._batch == 100
+        assert stream._timeSlice == 0
+        assert stream._executor is executor
+        executor.shutdown()
+
+        with pytest.raises(TypeError):
+            AsyncRandomStream(1)  # type: ignore
+        with pytest.raises(TypeError):
+            AsyncRandomStream(Cwg64(1), 100.0)  # type: ignore
+        with pytest.raises(ValueError):
+            AsyncRandomStream(Cwg64(1), 0)
+        with pytest.raises(ValueError):
+            AsyncRandomStream(Cwg64(1), 100, -0.001)
+        with pytest.raises(ValueError):
+            AsyncRandomStream(Cwg64(1), 100, math.nan)
+        with pytest.raises(ValueError):
+            AsyncRandomStream(Cwg64(1), 100, '0.001')  # type: ignore
+
+    #-------------------------------------------------------------------------
+    def test_anext(self):
+        async def take(stream, n):
+            values = []
+            async for x in stream:
+                values.append(x)
+                if len(values) == n:
+                    return values
+
+        for prngClass in (Cwg64, Cwg128, FastRand32, Mrg287, Squares64, Well44497b, Xoroshiro256):
+            stream = AsyncRandomStream(prngClass(0x0123_4567_89ab_cdef), 100)
+            ref = prngClass(0x0123_4567_89ab_cdef)
+            assert asyncio.run(take(stream, 1_000)) == [ref.random() for _ in range(1_000)]
+            assert stream.prng.getstate() == ref.getstate()
+
+    #-------------------------------------------------------------------------
+    def test_next_n(self):
+        async def run(stream):
+            await stream.__anext__()
+            return [await stream.next_n(n) for n in (20, 79, 0, 1, 250)]
+
+        stream = AsyncRandomStream(FastRand32(0x0123_4567_89ab_cdef), 100)
+        ref = FastRand32(0x0123_4567_89ab_cdef)
+        ref.next()
+        for values, n in zip(asyncio.run(run(stream)), (20, 79, 0, 1, 250)):
+            assert values.typecode == 'I'  # type: ignore
+            assert list(values) == list(ref.next_n(n))
+        assert stream._index == 100
+
+        stream = AsyncRandomStream(Cwg128(1), 10)
+        ref = Cwg128(1)
+        ref.next()
+        for values, n in zip(asyncio.run(run(stream)), (20, 79, 0, 1, 250)):
+            assert values == ref.next_n(n)
+
+        with pytest.raises(AssertionError):
+            asyncio.run(stream.next_n(-1))
+
+    #-------------------------------------------------------------------------
+    def test_random_array(self):
+        async def run(stream):
+            x = await stream.__anext__()
+            return [x] + list(await stream.random_array(1_000)) + [await stream.__anext__()]
+
+        for prngClass in (Cwg64, Cwg128, Mrg287, Well44497b):
+            values = asyncio.run(run(AsyncRandomStream(prngClass(0x0123_4567_89ab_cdef), 100)))
+            ref = prngClass(0x0123_4567_89ab_cdef)
+            assert values == [ref.random() for _ in range(1_002)]
+
+        stream = AsyncRandomStream(Well44497b(1), 100)
+        values = asyncio.run(stream.random_array(10))
+        if PyRandLib.asyncstream.np is not None:
+            assert isinstance(values, PyRandLib.asyncstream.np.ndarray)
+            assert values.dtype == PyRandLib.asyncstream.np.float64
+        assert len(asyncio.run(stream.random_array(0))) == 0
+
+    #-------------------------------------------------------------------------
+    def test_random_array_no_numpy(self, monkeypatch):
+        monkeypatch.setattr(PyRandLib.asyncstream, 'np', None)
+        for prngClass in (Cwg64, Cwg128):
+            values = asyncio.run(AsyncRandomStream(prngClass(1), 100).random_array(150))
+            assert isinstance(values, array)
+            assert values.typecode == 'd'
+            ref = prngClass(1)
+            assert list(values) == [ref.random() for _ in range(150)]
+
+    #-------------------------------------------------------------------------
+    def test_evaluate(self):
+        class Cwg64Counting(Cwg64):
+            def next_n(self, count: int, /):
+                self.counts.append(count)
+                return super().next_n(count)
+
+        class ExecutorCounting(ThreadPoolExecutor):
+            def submit(self, fn, /, *args, **kwargs):
+                self.counts.append(args[0])
+                return super().submit(fn, *args, **kwargs)
+
+        async def run(stream):
+            await stream.__anext__()
+            return list(await stream.random_array(50)) + list(await stream.random_array(10_000))
+
+        ref = Cwg64(1)
+        refValues = [ref.random() for _ in range(10_051)][1:]
+
+        prng = Cwg64Counting(1)
+        prng.counts = []
+        executor = ExecutorCounting(1)
+        executor.counts = []
+        stream = AsyncRandomStream(prng, 100, 10.0, executor)
+        assert asyncio.run(run(stream)) == refValues
+        # the first batch is evaluated in the executor, the time of evaluation of values being unknown
+        assert prng.counts == [100, 10_000 - 49]
+        assert executor.counts == [100]
+        assert 0.0 < stream._valueTime < math.inf
+
+        prng = Cwg64Counting(1)
+        prng.counts = []
+        executor.counts = []
+        stream = AsyncRandomStream(prng, 100, 0.0, executor)
+        assert asyncio.run(run(stream)) == refValues
+        # with a null time slice, every evaluation is run in the executor by chunks of minimal size
+        assert executor.counts == [100, 10_000 - 49]
+        assert prng.counts == [100] + [256] * 38 + [10_000 - 49 - 38 * 256]
+        executor.shutdown()
+
+        stream = AsyncRandomStream(Cwg64(1), 100)
+        assert len(stream._timednext_n(0)) == 0
+        assert stream._valueTime == math.inf
+
+    #-------------------------------------------------------------------------
+    def test_concurrency(self):
+        async def take(stream, n):
+            return [await stream.__anext__() for _ in range(n)]
+
+        async def run(stream):
+            return await asyncio.gather(*[take(stream, 250) for _ in range(8)])
+
+        stream = AsyncRandomStream(Xoroshiro256(1), 100, 0.0)
+        results = asyncio.run(run(stream))
+        ref = Xoroshiro256(1)
+        assert sorted(x for values in results for x in values) == sorted(ref.random() for _ in range(2_000))
+        assert stream.prng.getstate() == ref.getstate()
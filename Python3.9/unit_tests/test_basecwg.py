@@ -53,7 +53,7 @@ class TestBaseCwg:
                 
     #-------------------------------------------------------------------------
     def test_init_list(self):
-        with pytest.raises(TypeError):  ## notice: TypeError here due to a known bug with lists in Python 3.9 (.0, .1, still present with .21 and .23)
+        with pytest.raises(NotImplementedError):
             b_cwg = BaseCWG([0, 1, 0X1234_5678_9abc_def0, 0X1234_5678_9abc_def0])
                 
     #-------------------------------------------------------------------------
@@ -63,8 +63,8 @@ class TestBaseCwg:
 
     #-------------------------------------------------------------------------
     def test_init_list_int(self):
-        with pytest.raises(TypeError):  ## notice: TypeError here due to a known bug with lists in Python 3.9 (.0, .1, still present with .21 and .23)
-            b_cwg = BaseCWG( [0, 1, 0X1234_5678_9abc_def0, 0X1234_5678_9abc_def0] )
+        with pytest.raises(NotImplementedError):
+            b_cwg = BaseCWG( ([0, 1, 0X1234_5678_9abc_def0, 0X1234_5678_9abc_def0], 11))
    
     #-------------------------------------------------------------------------
     def test_getstate(self):
@@ -53,7 +53,7 @@ class TestBaseLcg:
                 
     #-------------------------------------------------------------------------
     def test_init_list(self):
-        with pytest.raises(TypeError):  ## notice: TypeError here due to a known bug with lists in Python 3.9 (.0, .1, still present with .21 and .23)
+        with pytest.raises(NotImplementedError):
             b_lcg = BaseLCG([0, 1, 0X1234_5678_9abc_def0, 0X1234_5678_9abc_def0])  # type: ignore
 
     #-------------------------------------------------------------------------
@@ -63,17 +63,17 @@ class TestBaseLcg:
 
     #-------------------------------------------------------------------------
     def test_init_list_int(self):
-        with pytest.raises(TypeError):  ## notice: TypeError here due to a known bug with lists in Python 3.9 (.0, .1, still present with .21 and .23)
+        with pytest.raises(NotImplementedError):
             b_lcg = BaseLCG( ([0, 1, 0X1234_5678_9abc_def0, 0X1234_5678_9abc_def0], 11))  # type: ignore
 
     #-------------------------------------------------------------------------
     def test_init_tuple_int_2(self):
-        with pytest.raises(TypeError):  ## notice: TypeError here due to a known bug with lists in Python 3.9 (.0, .1, still present with .21 and .23)
+        with pytest.raises(NotImplementedError):
             b_lcg = BaseLCG( [(0, 1, 0X1234_5678_9abc_def0, 0X1234_5678_9abc_def0), 11] )  # type: ignore
 
     #-------------------------------------------------------------------------
     def test_init_list_int_2(self):
-        with pytest.raises(TypeError):  ## notice: TypeError here due to a known bug with lists in Python 3.9 (.0, .1, still present with .21 and .23)
+        with pytest.raises(NotImplementedError):
             b_lcg = BaseLCG( [[0, 1, 0X1234_5678_9abc_def0, 0X1234_5678_9abc_def0], 11] )  # type: ignore
 
     #-------------------------------------------------------------------------
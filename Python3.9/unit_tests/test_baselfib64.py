@@ -84,15 +84,13 @@ class TestBaseLFib64:
     #-------------------------------------------------------------------------
     def test_init_list(self):
         STATE_SIZE = 21
-        with pytest.raises(TypeError):
-            # due to unhashable lists bug in Python 3.9
-            b_lfib = BaseLFib64(STATE_SIZE, [i+1 for i in range(STATE_SIZE)])
-            assert b_lfib._STATE_SIZE == STATE_SIZE
-            assert b_lfib._initRandClass is SplitMix64
-            assert b_lfib.gauss_next is None  # type: ignore
-            assert b_lfib._index == 0
-            assert len( b_lfib._state ) == STATE_SIZE
-            assert all( 0 < s < (1 << 64) for s in b_lfib._state )  # type: ignore
+        b_lfib = BaseLFib64(STATE_SIZE, [i+1 for i in range(STATE_SIZE)])
+        assert b_lfib._STATE_SIZE == STATE_SIZE
+        assert b_lfib._initRandClass is SplitMix64
+        assert b_lfib.gauss_next is None  # type: ignore
+        assert b_lfib._index == 0
+        assert len( b_lfib._state ) == STATE_SIZE
+        assert all( 0 < s < (1 << 64) for s in b_lfib._state )  # type: ignore
                 
     #-------------------------------------------------------------------------
     def test_init_tuple_int(self):
@@ -238,3 +236,10 @@ class TestBaseLFib64:
             b_lfib.setstate([(31, 32, 33, 34, -35), 1])  # type: ignore
         with pytest.raises(ValueError):
             b_lfib.setstate(((31, 32, 33, -34, -35), 1))  # type: ignore
+
+    #-------------------------------------------------------------------------
+    def test_advance(self):
+        STATE_SIZE = 17
+        b_lfib = BaseLFib64(STATE_SIZE)
+        with pytest.raises(AttributeError):
+            b_lfib.advance(STATE_SIZE)
@@ -81,19 +81,16 @@ class TestBaseSquares:
 
     #-------------------------------------------------------------------------
     def test_init_list(self):
-        with pytest.raises(TypeError):  # notice: due to knwon bug about not hashable lists in some patch versions of Python 3.9
-            b_sqr = BaseSquares([23, 162])
-            assert b_sqr.gauss_next is None  # type: ignore
-            assert b_sqr._counter == 23
-            assert b_sqr._key == 163  # i.e. 162 | 1
-            assert b_sqr._NORMALIZE == 1.0 / (1 << 32)
-            assert b_sqr._OUT_BITS == 32
+        b_sqr = BaseSquares([23, 162])
+        assert b_sqr.gauss_next is None  # type: ignore
+        assert b_sqr._counter == 23
+        assert b_sqr._key == 163  # i.e. 162 | 1
+        assert b_sqr._NORMALIZE == 1.0 / (1 << 32)
+        assert b_sqr._OUT_BITS == 32
 
-        with pytest.raises(TypeError):
-            # notice: due to knwon bug about not hashable lists in some patch versions of Python 3.9
+        with pytest.raises(ValueError):
             b_sqr = BaseSquares([23, 162, 3])
-        with pytest.raises(TypeError):
-            # notice: due to knwon bug about not hashable lists in some patch versions of Python 3.9
+        with pytest.raises(ValueError):
             b_sqr = BaseSquares([23])
 
     #-------------------------------------------------------------------------
@@ -104,8 +101,8 @@ class TestBaseSquares:
 
     #-------------------------------------------------------------------------
     def test_init_list_int(self):
-        with pytest.raises(TypeError):
-            # notice: due to knwon bug about not hashable lists in some patch versions of Python 3.9
+        with pytest.raises(ValueError):
+            # notice: no 2 arguments accepted in tuple with base class random.Random constructor since Python 3.11
             b_sqr = BaseSquares(([23, 163], 13))
 
     #-------------------------------------------------------------------------
@@ -217,6 +214,14 @@ class TestBaseSquares:
         with pytest.raises(ValueError):
             b_sqr.setstate((34, 35.1))  # type: ignore
 
+    #-------------------------------------------------------------------------
+    def test_next_array(self):
+        b_sqr = BaseSquares(0x0123_4567_89ab_cdef)
+        with pytest.raises(NotImplementedError):
+            b_sqr.next_array(3)
+        with pytest.raises(NotImplementedError):
+            b_sqr.random_array(3)
+
     #-------------------------------------------------------------------------
     def test__initkey(self):
         b_sqr = BaseSquares()
@@ -84,15 +84,13 @@ class TestBaseWELL:
     #-------------------------------------------------------------------------
     def test_init_list(self):
         STATE_SIZE = 21
-        with pytest.raises(TypeError):
-            # notice: no 2 arguments accepted in tuple with base class random.Random constructor until Python 3.11
-            b_wll = BaseWELL(STATE_SIZE, [i+1 for i in range(STATE_SIZE)])
-            assert b_wll._STATE_SIZE == STATE_SIZE
-            assert b_wll._initRandClass is SplitMix32
-            assert b_wll.gauss_next is None  # type: ignore
-            assert b_wll._index == 0
-            assert len(b_wll._state) == STATE_SIZE
-            assert all(0 < s < (1 << b_wll._OUT_BITS) for s in b_wll._state)  # type: ignore
+        b_wll = BaseWELL(STATE_SIZE, [i+1 for i in range(STATE_SIZE)])
+        assert b_wll._STATE_SIZE == STATE_SIZE
+        assert b_wll._initRandClass is SplitMix32
+        assert b_wll.gauss_next is None  # type: ignore
+        assert b_wll._index == 0
+        assert len(b_wll._state) == STATE_SIZE
+        assert all(0 < s < (1 << b_wll._OUT_BITS) for s in b_wll._state)  # type: ignore
                 
     #-------------------------------------------------------------------------
     def test_init_tuple_int(self):
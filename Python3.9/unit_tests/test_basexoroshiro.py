@@ -84,15 +84,13 @@ class TestBaseXoroshiro:
     #-------------------------------------------------------------------------
     def test_init_list(self):
         STATE_SIZE = 21
-        with pytest.raises(TypeError):
-            # notice: lists are not allowed as a seed in base class random.Random in Python 3.9 (not hashable)
-            b_xrsr = BaseXoroshiro(STATE_SIZE, [i+1 for i in range(STATE_SIZE)])
-            assert b_xrsr._STATE_SIZE == STATE_SIZE
-            assert b_xrsr._initRandClass is SplitMix64
-            assert b_xrsr.gauss_next is None  # type: ignore
-            assert b_xrsr._index == 0
-            assert len( b_xrsr._state ) == STATE_SIZE
-            assert all( 0 < s < (1 << b_xrsr._OUT_BITS) for s in b_xrsr._state )  # type: ignore
+        b_xrsr = BaseXoroshiro(STATE_SIZE, [i+1 for i in range(STATE_SIZE)])
+        assert b_xrsr._STATE_SIZE == STATE_SIZE
+        assert b_xrsr._initRandClass is SplitMix64
+        assert b_xrsr.gauss_next is None  # type: ignore
+        assert b_xrsr._index == 0
+        assert len( b_xrsr._state ) == STATE_SIZE
+        assert all( 0 < s < (1 << b_xrsr._OUT_BITS) for s in b_xrsr._state )  # type: ignore
                 
     #-------------------------------------------------------------------------
     def test_init_tuple_int(self):
@@ -108,6 +106,16 @@ class TestBaseXoroshiro:
             # notice: no 2 arguments accepted in tuple with base class random.Random constructor
             b_xrsr = BaseXoroshiro( STATE_SIZE, tuple(STATE_SIZE-1, [i+1 for i in range(STATE_SIZE)]) )  # type: ignore
 
+    #-------------------------------------------------------------------------
+    def test_jump(self):
+        b_xrsr = BaseXoroshiro(5)
+        with pytest.raises(AttributeError):
+            b_xrsr.jump()
+        with pytest.raises(AttributeError):
+            b_xrsr.long_jump()
+        with pytest.raises(NotImplementedError):
+            b_xrsr._jumpwith((1,))
+
     #-------------------------------------------------------------------------
     def test_seed(self):
         b_xrsr = BaseXoroshiro(5)
@@ -112,6 +112,44 @@ class TestFastRand32:
 
         assert lcg._state == 0xc9434028
 
+    #-------------------------------------------------------------------------
+    def test_next_n(self):
+        lcg = FastRand32(0x0123_4567_89ab_cdef)
+        lcg_ref = FastRand32(0x0123_4567_89ab_cdef)
+        values = lcg.next_n(3_000)
+        assert values.typecode == 'I'  # type: ignore
+        assert list(values) == [lcg_ref.next() for _ in range(3_000)]
+        assert lcg._state == lcg_ref._state
+
+        assert len(lcg.next_n(0)) == 0
+        with pytest.raises(AssertionError):
+            lcg.next_n(-1)
+
+    #-------------------------------------------------------------------------
+    def test_advance(self):
+        lcg = FastRand32(0x0123_4567_89ab_cdef)
+        lcg_ref = FastRand32(0x0123_4567_89ab_cdef)
+        for delta in (0, 1, 2, 3, 17, 1_000):
+            lcg.advance(delta)
+            for _ in range(delta):
+                lcg_ref.next()
+            assert lcg._state == lcg_ref._state
+            assert lcg.next() == lcg_ref.next()
+
+        state = lcg._state
+        lcg.advance(1 << 32)  # i.e. the full period
+        assert lcg._state == state
+        lcg.advance(12_345_678_901)
+        lcg.advance(-12_345_678_901)
+        assert lcg._state == state
+        lcg.advance(-1)
+        assert lcg.next() == state
+
+        with pytest.raises(TypeError):
+            lcg.advance(1.0)  # type: ignore
+        with pytest.raises(TypeError):
+            lcg.advance(None)  # type: ignore
+
     #-------------------------------------------------------------------------
     def test_seed(self):  # Notice: tests seed() and _seed() also
         lcg = FastRand32()
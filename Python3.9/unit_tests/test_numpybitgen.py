@@ -0,0 +1,172 @@
+"""
+Copyright (c) 2025 Philippe Schmouker, ph (dot) schmouker (at) gmail.com
+
+Permission is hereby granted,  free of charge,  to any person obtaining a copy
+of this software and associated documentation files (the "Software"),  to deal
+in the Software without restriction, including  without  limitation the rights
+to use,  copy,  modify,  merge,  publish,  distribute, sublicense, and/or sell
+copies of the Software,  and  to  permit  persons  to  whom  the  Software  is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS",  WITHOUT WARRANTY OF ANY  KIND,  EXPRESS  OR
+IMPLIED,  INCLUDING  BUT  NOT  LIMITED  TO  THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT  SHALL  THE
+AUTHORS  OR  COPYRIGHT  HOLDERS  BE  LIABLE  FOR  ANY CLAIM,  DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT,  TORT OR OTHERWISE, ARISING FROM,
+OUT  OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+#=============================================================================
+import pytest
+
+import PyRandLib.numpybitgen
+from PyRandLib.numpybitgen import NumpyBitGenerator
+from PyRandLib.cwg128      import Cwg128
+from PyRandLib.fastrand63  import FastRand63
+from PyRandLib.mrg1457     import Mrg1457
+from PyRandLib.well512a    import Well512a
+from PyRandLib.xoroshiro256 import Xoroshiro256
+
+np = PyRandLib.numpybitgen.np
+needs_numpy = pytest.mark.skipif(np is None, reason="numpy is not installed")
+
+
+#=============================================================================
+class TestNumpyBitGenerator:
+    """Tests class NumpyBitGenerator.
+    """
+
+    #-------------------------------------------------------------------------
+    @needs_numpy
+    def test_init(self):
+        bitgen = NumpyBitGenerator(Well512a(1))
+        assert isinstance(bitgen, np.random.BitGenerator)
+        assert isinstance(bitgen.prng, Well512a)
+        assert bitgen._block == 4096
+        assert bitgen._buffer == []
+        bitgen = NumpyBitGenerator(Well512a(1), 7)
+        assert bitgen._block == 7
+
+        with pytest.raises(TypeError):
+            NumpyBitGenerator(1)  # type: ignore
+        with pytest.raises(TypeError):
+            NumpyBitGenerator(Well512a(1), 7.0)  # type: ignore
+        with pytest.raises(ValueError):
+            NumpyBitGenerator(Well512a(1), 0)
+
+    #-------------------------------------------------------------------------
+    def test_init_no_numpy(self, monkeypatch):
+        monkeypatch.setattr(PyRandLib.numpybitgen, 'np', None)
+        with pytest.raises(ImportError):
+            NumpyBitGenerator(Well512a(1))
+
+    #-------------------------------------------------------------------------
+    @needs_numpy
+    def test_random_raw(self):
+        # 64-bits output values
+        bitgen = NumpyBitGenerator(Xoroshiro256(1), 5)
+        ref = Xoroshiro256(1)
+        assert bitgen.random_raw() == ref.next()
+        words = bitgen.random_raw(12)
+        assert words.dtype == np.uint64
+        assert list(words) == list(ref.next_n(12))
+        words = bitgen.random_raw((3, 4))
+        assert words.shape == (3, 4)
+        assert list(words.reshape(-1)) == list(ref.next_n(12))
+        assert bitgen.random_raw(output=False) is None
+        assert bitgen.random_raw(3, output=False) is None
+        assert bitgen.random_raw() == ref.next_n(5)[-1]
+
+        # 32-bits output values
+        bitgen = NumpyBitGenerator(Well512a(1), 3)
+        ref = Well512a(1)
+        values = ref.next_n(20)
+        assert list(bitgen.random_raw(10)) == [values[2*i] | (values[2*i+1] << 32) for i in range(10)]
+
+        # 63-bits output values
+        bitgen = NumpyBitGenerator(FastRand63(1), 3)
+        ref = FastRand63(1)
+        values = [v >> 31 for v in ref.next_n(20)]
+        assert list(bitgen.random_raw(10)) == [values[2*i] | (values[2*i+1] << 32) for i in range(10)]
+
+        # 31-bits output values
+        bitgen = NumpyBitGenerator(Mrg1457(1), 3)
+        ref = Mrg1457(1)
+        values = [v >> 15 for v in ref.next_n(40)]
+        assert list(bitgen.random_raw(10)) == [values[4*i] | (values[4*i+1] << 16) | (values[4*i+2] << 32) | (values[4*i+3] << 48)
+                                               for i in range(10)]
+
+        # 128-bits output values
+        bitgen = NumpyBitGenerator(Cwg128(1), 3)
+        ref = Cwg128(1)
+        assert list(bitgen.random_raw(10)) == [v >> 64 for v in ref.next_n(10)]
+
+    #-------------------------------------------------------------------------
+    @needs_numpy
+    def test_next(self):
+        bitgen = NumpyBitGenerator(Xoroshiro256(1), 5)
+        ref = Xoroshiro256(1)
+        value = ref.next()
+        assert bitgen._nextuint32(None) == value & 0xffff_ffff
+        assert bitgen._nextuint32(None) == value >> 32
+        assert bitgen._nextuint64(None) == ref.next()
+        assert bitgen._nextdouble(None) == (ref.next() >> 11) / (1 << 53)
+
+        # through the C structure 'bitgen_t'
+        value = ref.next()
+        assert bitgen._bitgenT.next_uint64(None) == value
+        assert bitgen._bitgenT.next_raw(None) == ref.next()
+        value = ref.next()
+        assert bitgen._bitgenT.next_uint32(None) == value & 0xffff_ffff
+        assert bitgen._bitgenT.next_uint32(None) == value >> 32
+        assert bitgen._bitgenT.next_double(None) == (ref.next() >> 11) / (1 << 53)
+
+    #-------------------------------------------------------------------------
+    @needs_numpy
+    def test_generator(self):
+        gen = np.random.Generator(NumpyBitGenerator(Well512a(0x0123_4567_89ab_cdef)))
+        gen_ref = np.random.Generator(NumpyBitGenerator(Well512a(0x0123_4567_89ab_cdef)))
+        normals = gen.normal(size=100_000)
+        assert list(normals) == list(gen_ref.normal(size=100_000))
+        assert abs(normals.mean()) < 0.02
+        assert abs(normals.std() - 1.0) < 0.02
+        values = gen.integers(0, 10, 100_000)
+        assert list(values) == list(gen_ref.integers(0, 10, 100_000))
+        assert values.min() == 0 and values.max() == 9
+        values = gen.random(100_000)
+        assert list(values) == list(gen_ref.random(100_000))
+        assert 0.0 <= values.min() and values.max() < 1.0
+        assert abs(values.mean() - 0.5) < 0.01
+
+        gen = np.random.Generator(NumpyBitGenerator(Mrg1457(1)))
+        assert abs(gen.standard_exponential(100_000).mean() - 1.0) < 0.02
+
+    #-------------------------------------------------------------------------
+    @needs_numpy
+    def test_state(self):
+        bitgen = NumpyBitGenerator(Well512a(1), 5)
+        bitgen.random_raw(3)
+        bitgen._nextuint32(None)
+        state = bitgen.state
+        assert state['bit_generator'] == 'NumpyBitGenerator'
+        assert state['state'] == bitgen.prng.getstate()
+        assert len(state['buffer']) == 1
+        assert state['has_uint32'] == 1
+        words = bitgen.random_raw(12)
+        value = bitgen._nextuint32(None)
+
+        assert value == state['uinteger']
+
+        bitgen.state = state
+        assert list(bitgen.random_raw(12)) == list(words)
+        assert bitgen._nextuint32(None) == value
+
+        with pytest.raises(TypeError):
+            bitgen.state = 1  # type: ignore
+        with pytest.raises(ValueError):
+            bitgen.state = {'bit_generator': 'PCG64'}
@@ -25,6 +25,7 @@ from typing import Any
 import pytest
 
 from PyRandLib.pcg1024_32 import Pcg1024_32
+from PyRandLib.pcg64_32   import Pcg64_32
 
 
 #=============================================================================
@@ -148,23 +149,17 @@ class TestPcg1024_32:
         assert pcg._state == 3
         assert all(s == t for s, t in zip(pcg._extendedState, (i for i in range(TestPcg1024_32.Pcg1024_32_EXTENDED_STATE_SIZE))))
         
-        with pytest.raises(TypeError):
-            # due to unhashable lists bug in Python 3.9
-            pcg = Pcg1024_32((list(i for i in range(TestPcg1024_32.Pcg1024_32_EXTENDED_STATE_SIZE)), 3))  # type: ignore
-            assert pcg._state == 3
-            assert all(s == t for s, t in zip(pcg._extendedState, (i for i in range(TestPcg1024_32.Pcg1024_32_EXTENDED_STATE_SIZE))))
+        pcg = Pcg1024_32((list(i for i in range(TestPcg1024_32.Pcg1024_32_EXTENDED_STATE_SIZE)), 3))  # type: ignore
+        assert pcg._state == 3
+        assert all(s == t for s, t in zip(pcg._extendedState, (i for i in range(TestPcg1024_32.Pcg1024_32_EXTENDED_STATE_SIZE))))
         
-        with pytest.raises(TypeError):
-            # due to unhashable lists bug in Python 3.9
-            pcg = Pcg1024_32((list(i for i in range(TestPcg1024_32.Pcg1024_32_EXTENDED_STATE_SIZE)), 3))  # type: ignore
-            assert pcg._state == 3
-            assert all(s == t for s, t in zip(pcg._extendedState, (i for i in range(TestPcg1024_32.Pcg1024_32_EXTENDED_STATE_SIZE))))
+        pcg = Pcg1024_32((list(i for i in range(TestPcg1024_32.Pcg1024_32_EXTENDED_STATE_SIZE)), 3))  # type: ignore
+        assert pcg._state == 3
+        assert all(s == t for s, t in zip(pcg._extendedState, (i for i in range(TestPcg1024_32.Pcg1024_32_EXTENDED_STATE_SIZE))))
 
-        with pytest.raises(TypeError):
-            # due to unhashable lists bug in Python 3.9
-            pcg = Pcg1024_32([list(i for i in range(TestPcg1024_32.Pcg1024_32_EXTENDED_STATE_SIZE)), 3])  # type: ignore
-            assert pcg._state == 3
-            assert all(s == t for s, t in zip(pcg._extendedState, (i for i in range(TestPcg1024_32.Pcg1024_32_EXTENDED_STATE_SIZE))))
+        pcg = Pcg1024_32([list(i for i in range(TestPcg1024_32.Pcg1024_32_EXTENDED_STATE_SIZE)), 3])  # type: ignore
+        assert pcg._state == 3
+        assert all(s == t for s, t in zip(pcg._extendedState, (i for i in range(TestPcg1024_32.Pcg1024_32_EXTENDED_STATE_SIZE))))
 
         with pytest.raises(ValueError):
             pcg = Pcg1024_32(((1, 2, 3), 1))  # type: ignore
@@ -178,8 +173,7 @@ class TestPcg1024_32:
             pcg = Pcg1024_32((extended_state, 5))  # type: ignore
 
         extended_state = tuple(i if i != 150 else set() for i in range(TestPcg1024_32.Pcg1024_32_EXTENDED_STATE_SIZE))
-        with pytest.raises(TypeError):
-            # TypeError here due to unhashable set in Python 3.9
+        with pytest.raises(ValueError):
             pcg = Pcg1024_32((extended_state, 5))  # type: ignore
 
         with pytest.raises(TypeError):
@@ -228,6 +222,58 @@ class TestPcg1024_32:
         pcg._state &= 0xffff_ffff_0000_0000
         assert pcg.next() == 0x45a0cf80
 
+    #-------------------------------------------------------------------------
+    def test_next_n(self):
+        pcg = Pcg1024_32(0x0123_4567_89ab_cdef)
+        pcg_ref = Pcg1024_32(0x0123_4567_89ab_cdef)
+        values = pcg.next_n(3_000)
+        assert values.typecode == 'I'  # type: ignore
+        assert list(values) == [pcg_ref.next() for _ in range(3_000)]
+        assert pcg.getstate() == pcg_ref.getstate()
+
+        # forces the evaluation of the extended state table
+        pcg._state = pcg_ref._state = 0x0123_4567_0000_0000
+        assert list(pcg.next_n(5)) == [pcg_ref.next() for _ in range(5)]
+        assert pcg._state == pcg_ref._state
+        assert pcg._extendedState == pcg_ref._extendedState
+
+        assert len(pcg.next_n(0)) == 0
+        with pytest.raises(AssertionError):
+            pcg.next_n(-1)
+
+    #-------------------------------------------------------------------------
+    def test_advance(self):
+        pcg = Pcg1024_32(0x0123_4567_89ab_cdef)
+        pcg_ref = Pcg1024_32(0x0123_4567_89ab_cdef)
+        for delta in (0, 1, 2, 7, 1_000):
+            pcg.advance(delta)
+            pcg_ref.next_n(delta)
+            assert pcg.getstate() == pcg_ref.getstate()
+            assert pcg.next() == pcg_ref.next()
+
+        # forces the evaluation of the extended state table, once then twice
+        state = Pcg64_32._lcgadvance(0x0123_4567_0000_0000, -5, Pcg64_32._A, Pcg64_32._C, Pcg64_32._MODULO)
+        pcg._state = pcg_ref._state = state
+        pcg.advance(5)
+        pcg_ref.next_n(5)
+        assert pcg.getstate() == pcg_ref.getstate()
+        pcg.advance(1)
+        pcg_ref.next_n(1)
+        assert pcg.getstate() == pcg_ref.getstate()
+        assert pcg.next() == pcg_ref.next()
+
+        pcg._state = pcg_ref._state = state
+        pcg.advance(5 + (1 << 32) + 3)
+        pcg_ref.next_n(6)
+        Pcg64_32.advance(pcg_ref, (1 << 32) - 1)
+        pcg_ref.next_n(3)
+        assert pcg.getstate() == pcg_ref.getstate()
+
+        with pytest.raises(ValueError):
+            pcg.advance(-1)
+        with pytest.raises(TypeError):
+            pcg.advance(1.0)  # type: ignore
+
     #-------------------------------------------------------------------------
     def test_seed(self):
         pcg = Pcg1024_32()
@@ -286,6 +332,21 @@ class TestPcg1024_32:
         assert pcg_state[1] == pcg._state
 
 
+    #-------------------------------------------------------------------------
+    def test_restore(self):
+        pcg = Pcg1024_32(1)
+        checkpoint = pcg.getstate()
+        values = [pcg.next() for _ in range(3_000)]
+        for trusted in (True, False):
+            pcg.restore(checkpoint, trusted=trusted)
+            assert pcg.getstate() == checkpoint
+            assert pcg._extendedState is not checkpoint[0]
+            assert [pcg.next() for _ in range(3_000)] == values
+
+        with pytest.raises(ValueError):
+            pcg.restore((checkpoint[0], -1), trusted=False)  # type: ignore
+
+
     #-------------------------------------------------------------------------
     def test_setstate(self):
         pcg = Pcg1024_32()
@@ -385,3 +446,10 @@ class TestPcg1024_32:
         assert pcg._invxrs(0x5124120d, 32, 19) == 0x51241829
         assert pcg._invxrs(0xa24810e9, 32, 19) == 0xa24804a0
         assert pcg._invxrs(0xf36c0fc5, 32, 19) == 0xf36c11a8
+
+    #-------------------------------------------------------------------------
+    def test_lcgdistance(self):
+        a, c, mask = Pcg64_32._A, Pcg64_32._C, Pcg64_32._MODULO
+        for delta in (0, 1, 5, 0x0123_4567, (1 << 64) - 1):
+            state = Pcg64_32._lcgadvance(0x0123_4567_89ab_cdef, delta, a, c, mask)
+            assert Pcg1024_32._lcgdistance(0x0123_4567_89ab_cdef, state, a, c, mask) == delta
@@ -118,6 +118,77 @@ class TestPcg128_64:
 
         assert pcg._state == 0x08ab_2233_cb87_c6d6_2bf1_6123_1d0f_c8d3
 
+    #-------------------------------------------------------------------------
+    def test_next_n(self):
+        pcg = Pcg128_64(0x0123_4567_89ab_cdef)
+        pcg_ref = Pcg128_64(0x0123_4567_89ab_cdef)
+        values = pcg.next_n(3_000)
+        assert values.typecode == 'Q'  # type: ignore
+        assert list(values) == [pcg_ref.next() for _ in range(3_000)]
+        assert pcg.getstate() == pcg_ref.getstate()
+
+        assert len(pcg.next_n(0)) == 0
+        with pytest.raises(AssertionError):
+            pcg.next_n(-1)
+
+    #-------------------------------------------------------------------------
+    def test_stream(self):
+        pcg = Pcg128_64(0x0123_4567_89ab_cdef)
+        assert pcg._inc == Pcg128_64._C
+        assert pcg.getstate() == (pcg._state, Pcg128_64._C)
+
+        pcg_1 = Pcg128_64(0x0123_4567_89ab_cdef, 1)
+        pcg_2 = Pcg128_64(0x0123_4567_89ab_cdef, 2)
+        assert pcg_1._inc == 3
+        assert pcg_2._inc == 5
+        values_1 = pcg_1.next_n(100)
+        assert values_1 != pcg_2.next_n(100)
+        assert values_1 != pcg.next_n(100)
+
+        pcg = Pcg128_64(0x0123_4567_89ab_cdef, 1)
+        assert [pcg.next() for _ in range(100)] == list(values_1)
+
+        pcg_ref = Pcg128_64(pcg_1.getstate())  # type: ignore
+        assert pcg_ref.getstate() == pcg_1.getstate()
+        assert pcg_ref.next_n(10) == pcg_1.next_n(10)
+
+        pcg = Pcg128_64(1, -1)
+        assert pcg._inc == Pcg128_64._MODULO_128
+
+        with pytest.raises(TypeError):
+            pcg = Pcg128_64(1, 1.0)  # type: ignore
+        with pytest.raises(TypeError):
+            pcg = Pcg128_64(1, '1')  # type: ignore
+
+    #-------------------------------------------------------------------------
+    def test_advance(self):
+        for stream in (None, 0x0123_4567):
+            pcg = Pcg128_64(0x0123_4567_89ab_cdef, stream)
+            pcg_ref = Pcg128_64(0x0123_4567_89ab_cdef, stream)
+            for delta in (0, 1, 2, 7, 1_000):
+                pcg.advance(delta)
+                for _ in range(delta):
+                    pcg_ref.next()
+                assert pcg.getstate() == pcg_ref.getstate()
+                assert pcg.next() == pcg_ref.next()
+
+        pcg = Pcg128_64(0x0123_4567_89ab_cdef, 5)
+        state = pcg.getstate()
+        values = pcg.next_n(20)
+        pcg.advance(-20)
+        assert pcg.getstate() == state
+        assert pcg.next_n(20) == values
+
+        pcg.advance(1 << 128)
+        pcg_ref.setstate(state)  # type: ignore
+        pcg_ref.advance(20)
+        assert pcg.getstate() == pcg_ref.getstate()
+
+        with pytest.raises(TypeError):
+            pcg.advance(1.0)  # type: ignore
+        with pytest.raises(TypeError):
+            pcg.advance('1')  # type: ignore
+
     #-------------------------------------------------------------------------
     def test_seed(self):
         pcg = Pcg128_64()
@@ -169,6 +240,22 @@ class TestPcg128_64:
         pcg.setstate(1)  # type: ignore
         assert pcg._state == 0x1_ffff_ffff_ffff_fffe
 
+        inc = pcg._inc
+        pcg.setstate((5, 6))
+        assert pcg._state == 5
+        assert pcg._inc == 7
+        pcg.setstate(2)  # type: ignore
+        assert pcg._inc == 7
+        pcg.setstate([-1, 8])
+        assert pcg._state == Pcg128_64._MODULO_128
+        assert pcg._inc == 9
+        pcg.setstate((1, inc))
+        assert pcg.getstate() == (1, inc)
+
+        with pytest.raises(TypeError):
+            pcg.setstate([1, 2.0])  # type: ignore
+        with pytest.raises(TypeError):
+            pcg.setstate(('1', 2))  # type: ignore
         with pytest.raises(TypeError):
             pcg.setstate(0.1)  # type: ignore
         with pytest.raises(TypeError):
@@ -177,8 +264,6 @@ class TestPcg128_64:
             pcg.setstate((31, 32, 34, 33))  # type: ignore
         with pytest.raises(TypeError):
             pcg.setstate([41, 42, 44, 43])  # type: ignore
-        with pytest.raises(TypeError):
-            pcg.setstate([1, 2])  # type: ignore
         with pytest.raises(TypeError):
             pcg.setstate((1, 2, 3, 4, 5))  # type: ignore
         with pytest.raises(TypeError):
@@ -23,6 +23,9 @@ SOFTWARE.
 #=============================================================================
 import pytest
 
+import PyRandLib.baserandom
+import PyRandLib.basesquares
+import PyRandLib.squares64
 from PyRandLib.squares64 import Squares64
 
 
@@ -104,3 +107,92 @@ class TestSquares64:
 
         assert sqr._counter == len(expected)
         assert sqr._key == 0x2c381b75cd1e96f3
+
+    #-------------------------------------------------------------------------
+    def test_next_n(self):
+        sqr = Squares64(0x0123_4567_89ab_cdef)
+        sqr_ref = Squares64(0x0123_4567_89ab_cdef)
+        values = sqr.next_n(3_000)
+        assert values.typecode == 'Q'  # type: ignore
+        assert list(values) == [sqr_ref.next() for _ in range(3_000)]
+        assert sqr.getstate() == sqr_ref.getstate()
+
+        assert len(sqr.next_n(0)) == 0
+        with pytest.raises(AssertionError):
+            sqr.next_n(-1)
+
+    #-------------------------------------------------------------------------
+    def test_advance(self):
+        sqr = Squares64(0x0123_4567_89ab_cdef)
+        sqr_ref = Squares64(0x0123_4567_89ab_cdef)
+        sqr.advance(1_000)
+        sqr_ref.next_n(1_000)
+        assert sqr.getstate() == sqr_ref.getstate()
+        assert sqr.next() == sqr_ref.next()
+
+        sqr.advance(-1_001)
+        assert sqr._counter == 0
+        sqr.advance(-1)
+        assert sqr._counter == 0xffff_ffff_ffff_ffff
+
+        with pytest.raises(TypeError):
+            sqr.advance(1.0)  # type: ignore
+        with pytest.raises(TypeError):
+            sqr.advance(None)  # type: ignore
+
+    #-------------------------------------------------------------------------
+    def test_next_array(self, monkeypatch):
+        sqr = Squares64(0x0123_4567_89ab_cdef)
+        sqr_ref = Squares64(0x0123_4567_89ab_cdef)
+        values = sqr.next_array(1_000)
+        if PyRandLib.squares64.np is not None:
+            assert values.dtype == PyRandLib.squares64.np.uint64  # type: ignore
+        assert list(values) == [sqr_ref.next() for _ in range(1_000)]
+        assert sqr._counter == sqr_ref._counter == 1_000
+        assert len(sqr.next_array(0)) == 0
+        with pytest.raises(AssertionError):
+            sqr.next_array(-1)
+
+        # counter wrapping around 2^64
+        sqr.setstate((0xffff_ffff_ffff_fff0, sqr._key))
+        sqr_ref.setstate((0xffff_ffff_ffff_fff0, sqr._key))
+        assert list(sqr.next_array(37)) == [sqr_ref.next() for _ in range(37)]
+        assert sqr._counter == sqr_ref._counter == 21
+
+        # no numpy available
+        monkeypatch.setattr(PyRandLib.squares64, 'np', None)
+        values = sqr.next_array(17)
+        assert values.typecode == 'Q'  # type: ignore
+        assert list(values) == [sqr_ref.next() for _ in range(17)]
+
+    #-------------------------------------------------------------------------
+    def test_random_array(self, monkeypatch):
+        sqr = Squares64(0x0123_4567_89ab_cdef)
+        sqr_ref = Squares64(0x0123_4567_89ab_cdef)
+        values = sqr.random_array(1_000)
+        assert list(values) == [sqr_ref.random() for _ in range(1_000)]
+        assert sqr._counter == sqr_ref._counter == 1_000
+
+        # no numpy available
+        monkeypatch.setattr(PyRandLib.basesquares, 'np', None)
+        values = sqr.random_array(17)
+        assert values.typecode == 'd'  # type: ignore
+        assert list(values) == [sqr_ref.random() for _ in range(17)]
+
+        # other precisions are evaluated by the base class
+        values = sqr.random_array(9, 'float64', 20)
+        assert list(values) == [(sqr_ref.next() >> 44) / (1 << 20) for _ in range(9)]
+
+    #-------------------------------------------------------------------------
+    def test_spawn(self, monkeypatch):
+        sqr = Squares64(0x0123_4567_89ab_cdef)
+        children = sqr.spawn(5)
+        assert all(type(child) is Squares64 and child._counter == 0 for child in children)
+        assert len({sqr._key} | {child._key for child in children}) == 6
+        assert [child.getstate() for child in Squares64(0x0123_4567_89ab_cdef).spawn(5)] == [child.getstate() for child in children]
+
+        # colliding keys are derived again
+        monkeypatch.setattr(PyRandLib.baserandom, 'SplitMix64', lambda _seed: (lambda: 1))
+        children = sqr.spawn(3)
+        assert children[0]._key == Squares64(1)._key
+        assert len({sqr._key} | {child._key for child in children}) == 4
@@ -136,12 +136,10 @@ class TestXoroshiro1024:
         assert xrsr.gauss_next is None  # type: ignore
         assert xrsr._state == [i for i in range(TestXoroshiro1024.Xoroshiro1024_STATE_SIZE)]  # type: ignore
 
-        with pytest.raises(TypeError):
-            # due to unhashable lists bug in Python 3.9
-            xrsr = Xoroshiro1024(list(i+10 for i in range(TestXoroshiro1024.Xoroshiro1024_STATE_SIZE)))  # type: ignore
-            assert xrsr._index == 0
-            assert xrsr.gauss_next is None  # type: ignore
-            assert xrsr._state == list(i+10 for i in range(TestXoroshiro1024.Xoroshiro1024_STATE_SIZE))  # type: ignore
+        xrsr = Xoroshiro1024(list(i+10 for i in range(TestXoroshiro1024.Xoroshiro1024_STATE_SIZE)))  # type: ignore
+        assert xrsr._index == 0
+        assert xrsr.gauss_next is None  # type: ignore
+        assert xrsr._state == list(i+10 for i in range(TestXoroshiro1024.Xoroshiro1024_STATE_SIZE))  # type: ignore
 
         with pytest.raises(TypeError):
             xrsr = Xoroshiro1024((1, 2, 3))  # type: ignore
@@ -178,6 +176,40 @@ class TestXoroshiro1024:
         assert xrsr._state[10] == 0xcdb8c9cd9a62da0f
         assert xrsr._state[13] == 0x97f6c69811cfb13b
 
+    #-------------------------------------------------------------------------
+    def test_next_n(self):
+        xrsr = Xoroshiro1024(0x0123_4567_89ab_cdef)
+        xrsr_ref = Xoroshiro1024(0x0123_4567_89ab_cdef)
+        values = xrsr.next_n(3_000)
+        assert values.typecode == 'Q'  # type: ignore
+        assert list(values) == [xrsr_ref.next() for _ in range(3_000)]
+        assert xrsr.getstate() == xrsr_ref.getstate()
+
+        assert len(xrsr.next_n(0)) == 0
+        with pytest.raises(AssertionError):
+            xrsr.next_n(-1)
+
+    #-------------------------------------------------------------------------
+    def test_jump(self):
+        xrsr = Xoroshiro1024(0x0123_4567_89ab_cdef)
+        xrsr.jump()
+        assert list(xrsr.next_n(3)) == [0x49f3_ddd5_5757_80b6, 0x5904_0b86_3dc8_7e21, 0x424c_c4bf_928b_bf12]
+
+        xrsr = Xoroshiro1024(0x0123_4567_89ab_cdef)
+        xrsr.long_jump()
+        assert list(xrsr.next_n(3)) == [0xd925_454b_059b_2f0f, 0x152e_d2df_cf0a_3f6f, 0xabe4_3b9d_b6f3_4c7a]
+
+        # jump polynomial x^k mod charpoly is x^k itself as long as k is less than the state bits count
+        for k in (0, 1, 5, 100, 1023):
+            xrsr = Xoroshiro1024(0x0123_4567_89ab_cdef)
+            xrsr_ref = Xoroshiro1024(0x0123_4567_89ab_cdef)
+            xrsr.next_n(7)
+            jumpPoly = [0] * 16
+            jumpPoly[k // 64] = 1 << (k % 64)
+            xrsr._jumpwith(tuple(jumpPoly))
+            xrsr_ref.next_n(7 + k)
+            assert xrsr.next_n(100) == xrsr_ref.next_n(100)
+
     #-------------------------------------------------------------------------
     def test_seed(self):
         xrsr = Xoroshiro1024()
@@ -300,3 +332,24 @@ class TestXoroshiro1024:
             _state = [i+1 for i in range(TestXoroshiro1024.Xoroshiro1024_STATE_SIZE)]  # type: ignore
             _state[TestXoroshiro1024.Xoroshiro1024_STATE_SIZE - 5] = {1, 2}
             xrsr.setstate(_state)  # type: ignore
+
+    #-------------------------------------------------------------------------
+    def test_spawn(self):
+        xrsr = Xoroshiro1024(0x0123_4567_89ab_cdef)
+        xrsr_ref = Xoroshiro1024(0x0123_4567_89ab_cdef)
+        xrsr.next_n(5)
+        xrsr_ref.next_n(5)
+        children = xrsr.spawn(3)
+        for child in children:
+            assert type(child) is Xoroshiro1024
+            assert child._state is not xrsr._state
+            assert child.getstate() == xrsr_ref.getstate()
+            xrsr_ref.long_jump()
+        assert xrsr.getstate() == xrsr_ref.getstate()
+        assert list(children[0].next_n(10)) != list(children[1].next_n(10))
+        assert xrsr.spawn(0) == []
+
+        with pytest.raises(TypeError):
+            xrsr.spawn(3.0)  # type: ignore
+        with pytest.raises(ValueError):
+            xrsr.spawn(-3)